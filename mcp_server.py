@@ -1,25 +1,33 @@
 """
 Executive Summary: Community Edition MCP server for Snowdrop. Dynamically discovers
 and registers all skills in the skills/ directory, exposing them via the Model Context
-Protocol through 3 meta-tools (dispatcher mode). No authentication required.
+Protocol through 4 meta-tools (dispatcher mode). No authentication required.
 
 Table of Contents:
     1. Imports and Logging Setup
     2. FastMCP Server Instance
-    3. Skill Discovery
+    3. Skill Discovery (full scan, prebuilt manifest, lazy import)
     4. Skill Registration (direct mode, legacy)
-    5. Meta-Tool Dispatcher (3 gateway tools)
+    5. Meta-Tool Dispatcher (4 gateway tools)
     6. Main — FastAPI wrapper with /health, /.well-known/agent.json, /.well-known/skills.json
     7. Entrypoint
 """
 
+import asyncio
+import contextvars
 import functools
+import hashlib
 import importlib.util
 import inspect
+import json
 import logging
+import multiprocessing
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from pathlib import Path
 from types import ModuleType
@@ -32,6 +40,20 @@ if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
 from fastmcp import FastMCP
+from fastmcp.server.dependencies import get_access_token
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
+
+from skills.utils._log_lesson import _log_lesson
+from skills.utils.cache import LRUCache, canonical_key
+from skills.utils.exchange_sessions import session_stats
+from skills.utils.http_client import pool_stats
+from skills.utils.input_schema import SchemaValidator, compile_schema
+from skills.utils.rate_limiter import get_rate_limiter, rate_limiter_stats
+from skills.utils.response_shaping import ResponseSizeMetrics, dumps, shape_response
+from skills.utils.append_log import append_log_stats
+from skills.utils.lesson_sink import get_lesson_sink
+from skills.utils.search_index import SkillSearchIndex
 
 # ---------------------------------------------------------------------------
 # 1. Logging Setup
@@ -59,7 +81,7 @@ _SKILLS_DIR: Path = Path(__file__).parent / "skills"
 # Filenames to exclude from discovery.
 _EXCLUDED_FILES: frozenset[str] = frozenset({"__init__.py", "mcp_server.py"})
 
-# "dispatcher" (default) registers 3 meta-tools that gateway all skills.
+# "dispatcher" (default) registers 4 meta-tools that gateway all skills.
 # "direct" registers individual tools (subject to _MAX_TOOLS cap).
 _MCP_MODE: str = os.environ.get("SNOWDROP_MCP_MODE", "dispatcher")
 
@@ -69,6 +91,64 @@ _MAX_TOOLS: int = int(os.environ.get("SNOWDROP_MCP_MAX_TOOLS", "250"))
 # Populated by main() after discovery — used by dispatcher meta-tools.
 _SKILL_CATALOG: dict[str, dict[str, Any]] = {}
 
+# Inverted index over _SKILL_CATALOG for snowdrop_search_skills. Rebuilt by
+# _search_index() whenever the catalog object is replaced.
+_SEARCH_INDEX: SkillSearchIndex | None = None
+_SEARCH_INDEX_CATALOG: dict[str, dict[str, Any]] | None = None
+
+# Execution pools. Sync skills run in the thread pool (I/O-bound by default);
+# skills whose TOOL_META sets "executor": "process" run in the process pool.
+# Coroutine skills are awaited directly on the event loop.
+_THREAD_WORKERS: int = int(os.environ.get("SNOWDROP_MCP_THREAD_WORKERS", "32"))
+_PROCESS_WORKERS: int = int(os.environ.get("SNOWDROP_MCP_PROCESS_WORKERS", str(os.cpu_count() or 2)))
+
+# Per-call timeout in seconds; TOOL_META "timeout_seconds" overrides it per skill.
+_EXEC_TIMEOUT_S: float = float(os.environ.get("SNOWDROP_MCP_EXEC_TIMEOUT", "120"))
+
+_THREAD_POOL: ThreadPoolExecutor | None = None
+_PROCESS_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+# Result cache for skills whose TOOL_META sets "deterministic": True. Entries are
+# keyed on skill name + canonical params hash; "cache_ttl_seconds" overrides the TTL.
+_RESULT_CACHE = LRUCache(
+    maxsize=int(os.environ.get("SNOWDROP_MCP_RESULT_CACHE_SIZE", "2048")),
+    default_ttl=float(os.environ.get("SNOWDROP_MCP_RESULT_CACHE_TTL", "600")),
+)
+
+# snowdrop_execute_batch limits: items per call, and default/max concurrent items.
+_BATCH_MAX_ITEMS: int = int(os.environ.get("SNOWDROP_MCP_BATCH_MAX_ITEMS", "500"))
+_BATCH_DEFAULT_PARALLELISM: int = int(os.environ.get("SNOWDROP_MCP_BATCH_PARALLELISM", "8"))
+_BATCH_MAX_PARALLELISM: int = int(os.environ.get("SNOWDROP_MCP_BATCH_MAX_PARALLELISM", "64"))
+
+# Per-caller token-bucket limiting in snowdrop_execute (skills.utils.rate_limiter),
+# checked before cache lookup or execution. With auth configured the bucket is the
+# access token's client; otherwise it is the caller-supplied agent_id, which makes
+# the limit advisory (a client can pick any id), so new buckets are also capped per
+# second. Calls without either share the "anonymous" bucket; TOOL_META
+# "rate_limit_cost" charges more than one token.
+_RATE_LIMIT_ENABLED: bool = os.environ.get("SNOWDROP_MCP_RATE_LIMIT", "").lower() in ("1", "true", "on")
+
+# Input validation in snowdrop_execute against each skill's compiled TOOL_META
+# inputSchema: "warn" logs mismatches and runs the skill anyway, "enforce"
+# rejects malformed params before the skill runs, "off" skips it. A schema's
+# "required" list is trimmed to the parameters its function has no default
+# for. TOOL_META "validate_input": False opts a single skill out.
+_INPUT_VALIDATION: str = os.environ.get("SNOWDROP_MCP_VALIDATE_INPUT", "warn").lower()
+
+# Counters for /health: calls checked against a schema and calls rejected.
+_VALIDATION_STATS: dict[str, int] = {"checked": 0, "rejected": 0}
+
+# Serialized response sizes per skill (after fields/tail/float_precision shaping).
+_RESPONSE_SIZES = ResponseSizeMetrics()
+# The current call's result before shaping, set only when shaping changed it;
+# _RESPONSE_SIZES encodes it for a sample of calls to estimate what shaping saved.
+_UNSHAPED_RESULT: contextvars.ContextVar[Any] = contextvars.ContextVar("snowdrop_unshaped_result", default=None)
+
+# Default and maximum page size for snowdrop_search_skills.
+_SEARCH_DEFAULT_LIMIT: int = 20
+_SEARCH_MAX_LIMIT: int = 200
+
 # Comma-separated whitelist of skill subdirectories to include.
 _INCLUDE_DIRS: frozenset[str] = frozenset(
     d.strip() for d in os.environ.get("SNOWDROP_MCP_INCLUDE_DIRS", "").split(",") if d.strip()
@@ -79,83 +159,446 @@ _EXCLUDE_DIRS: frozenset[str] = frozenset(
     d.strip() for d in os.environ.get("SNOWDROP_MCP_EXCLUDE_DIRS", "").split(",") if d.strip()
 )
 
+# Catalog snapshot (manifest). Built by scripts/build_skill_manifest.py or by the
+# server itself after a full scan. Dispatcher mode boots from it, re-imports only
+# files whose content hash changed, and imports everything else on first use.
+_MANIFEST_PATH: Path = Path(
+    os.environ.get("SNOWDROP_MCP_MANIFEST", str(_REPO_ROOT / "skill_manifest.json"))
+)
+_MANIFEST_VERSION: int = 3
+
+# Set by _refresh_catalog() — how the catalog was built, reported by /health.
+_CATALOG_STATE: dict[str, Any] = {"source": "scan"}
+
+# Lazy imports slower than this budget (milliseconds) are logged as warnings.
+_IMPORT_BUDGET_MS: float = float(os.environ.get("SNOWDROP_MCP_IMPORT_BUDGET_MS", "250"))
+
+# Per-skill lazy import timings in milliseconds, keyed by tool name.
+_IMPORT_METRICS: dict[str, float] = {}
+
+# Serialises lazy imports so concurrent first calls import a module only once.
+_IMPORT_LOCK = threading.Lock()
+
+
+def _iter_skill_files() -> list[tuple[Path, str]]:
+    """Return (py_file, subdir) pairs for skill files that pass the dir filters."""
+    selected: list[tuple[Path, str]] = []
+    for py_file in sorted(_SKILLS_DIR.rglob("*.py")):
+        if py_file.name in _EXCLUDED_FILES:
+            continue
+
+        rel_parts = py_file.relative_to(_SKILLS_DIR).parts
+        subdir = rel_parts[0] if len(rel_parts) > 1 else ""
+        if not _subdir_selected(subdir):
+            continue
+        selected.append((py_file, subdir))
+    return selected
+
+
+def _subdir_selected(subdir: str) -> bool:
+    """Apply SNOWDROP_MCP_INCLUDE_DIRS / SNOWDROP_MCP_EXCLUDE_DIRS to a subdirectory."""
+    if _INCLUDE_DIRS and subdir not in _INCLUDE_DIRS:
+        return False
+    if _EXCLUDE_DIRS and subdir in _EXCLUDE_DIRS:
+        return False
+    return True
+
+
+def _module_name_for(py_file: Path) -> str:
+    """Dotted module name used to register a skill file in sys.modules."""
+    rel = py_file.relative_to(_SKILLS_DIR)
+    return "skills." + ".".join(rel.with_suffix("").parts)
+
+
+def _import_skill_module(py_file: Path, module_name: str) -> ModuleType:
+    """Execute a skill file as module_name and register it in sys.modules.
+
+    Raises:
+        ImportError: If no module spec can be built for the file.
+        Exception: Anything raised while executing the module body.
+    """
+    spec = importlib.util.spec_from_file_location(module_name, py_file)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not create module spec for {py_file}")
+
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+def _scan_skill_file(py_file: Path, subdir: str) -> tuple[str, dict[str, Any]] | None:
+    """Import one skill file and build its catalog record.
+
+    Returns:
+        (tool_name, record), or None when the module exposes no usable skill.
+
+    Raises:
+        Exception: Anything raised while importing the module.
+    """
+    module_name = _module_name_for(py_file)
+    module = _import_skill_module(py_file, module_name)
+
+    tool_meta = getattr(module, "TOOL_META", None)
+    if not isinstance(tool_meta, dict):
+        logger.debug("%s has no TOOL_META dict — skipping.", py_file)
+        return None
+
+    tool_name: str | None = tool_meta.get("name")
+    if not tool_name:
+        logger.warning("%s TOOL_META missing 'name' key — skipping.", py_file)
+        return None
+
+    fn: Callable[..., Any] | None = getattr(module, tool_name, None)
+    if fn is None or not callable(fn):
+        logger.warning(
+            "%s TOOL_META['name'] = %r but no matching callable found — skipping.",
+            py_file, tool_name,
+        )
+        return None
+
+    logger.debug("Discovered skill '%s' from %s.", tool_name, py_file)
+    return tool_name, {
+        "meta": tool_meta,
+        "callable": fn,
+        "module_path": str(py_file.resolve()),
+        "module_name": module_name,
+        "category": subdir or "root",
+        "required_params": _required_params(fn),
+    }
+
+
+def _required_params(fn: Callable[..., Any]) -> list[str] | None:
+    """Keyword-passable parameters of fn that have no default, or None if it has no signature."""
+    try:
+        parameters = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    return [
+        p.name for p in parameters
+        if p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        and p.default is inspect.Parameter.empty
+    ]
+
 
 def _discover_skills() -> dict[str, dict[str, Any]]:
     """Walk the skills/ directory tree and collect modules that expose TOOL_META.
 
+    Also records ``_discover_skills._failed_imports`` (list of error strings) and
+    ``_discover_skills._file_index`` (skills/-relative path -> {"skill", "error"})
+    for the catalog snapshot.
+
     Returns:
         A dict mapping tool name -> {
             "meta": TOOL_META dict,
             "callable": the skill function,
             "module_path": absolute path string of the source file,
+            "module_name": dotted name the module is registered under,
             "category": subdirectory name or "root",
+            "required_params": parameters the function has no default for,
         }.
     """
     discovered: dict[str, dict[str, Any]] = {}
     failed_imports: list[str] = []
+    file_index: dict[str, dict[str, Any]] = {}
 
     if not _SKILLS_DIR.exists():
         logger.warning("Skills directory %s not found.", _SKILLS_DIR)
         _discover_skills._failed_imports = failed_imports  # type: ignore[attr-defined]
+        _discover_skills._file_index = file_index  # type: ignore[attr-defined]
         return discovered
 
-    for py_file in sorted(_SKILLS_DIR.rglob("*.py")):
-        if py_file.name in _EXCLUDED_FILES:
+    for py_file, subdir in _iter_skill_files():
+        rel = py_file.relative_to(_SKILLS_DIR).as_posix()
+        try:
+            scanned = _scan_skill_file(py_file, subdir)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to import %s: %s — skipping.", py_file, exc)
+            error = f"{py_file.name}: {type(exc).__name__}: {exc}"
+            failed_imports.append(error)
+            file_index[rel] = {"skill": None, "error": error}
             continue
 
-        rel_parts = py_file.relative_to(_SKILLS_DIR).parts
-        subdir = rel_parts[0] if len(rel_parts) > 1 else ""
-        if _INCLUDE_DIRS and subdir not in _INCLUDE_DIRS:
-            continue
-        if _EXCLUDE_DIRS and subdir in _EXCLUDE_DIRS:
+        if scanned is None:
+            file_index[rel] = {"skill": None, "error": None}
             continue
+        tool_name, record = scanned
+        discovered[tool_name] = record
+        file_index[rel] = {"skill": tool_name, "error": None}
+
+    _discover_skills._failed_imports = failed_imports  # type: ignore[attr-defined]
+    _discover_skills._file_index = file_index  # type: ignore[attr-defined]
+    return discovered
+
+
+def _hash_file(py_file: Path) -> str:
+    """SHA-256 of a skill file's bytes."""
+    return hashlib.sha256(py_file.read_bytes()).hexdigest()
+
+
+def _fingerprint(py_file: Path, digest: str | None = None) -> dict[str, Any]:
+    """Content hash plus the stat fields used to skip re-hashing unchanged files."""
+    stat = py_file.stat()
+    return {
+        "sha256": digest or _hash_file(py_file),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+
+
+def _write_manifest(
+    discovered: dict[str, dict[str, Any]],
+    file_index: dict[str, dict[str, Any]],
+    path: Path = _MANIFEST_PATH,
+) -> str:
+    """Persist the catalog snapshot (metadata, file hashes, failed imports).
+
+    Paths are stored relative to skills/ so a snapshot built in one checkout
+    (e.g. a Docker build stage) is valid in another.
+
+    Args:
+        discovered: Catalog records; callables are not persisted.
+        file_index: skills/-relative path -> {"skill", "error"} and optionally
+            precomputed "sha256"/"mtime_ns"/"size" fingerprint fields.
+        path: Destination file.
+
+    Returns:
+        The snapshot's generated_at timestamp.
+    """
+    skills_dir = _SKILLS_DIR.resolve()
+    skills: dict[str, dict[str, Any]] = {}
+    for tool_name, record in sorted(discovered.items()):
+        skills[tool_name] = {
+            "meta": record["meta"],
+            "module_path": Path(record["module_path"]).relative_to(skills_dir).as_posix(),
+            "module_name": record.get("module_name", ""),
+            "category": record.get("category", "root"),
+            "required_params": record.get("required_params"),
+        }
+
+    files: dict[str, dict[str, Any]] = {}
+    for rel, entry in sorted(file_index.items()):
+        if "sha256" not in entry:
+            entry = {**entry, **_fingerprint(_SKILLS_DIR / rel)}
+        files[rel] = entry
+
+    generated_at = datetime.now(timezone.utc).isoformat()
+    manifest = {
+        "version": _MANIFEST_VERSION,
+        "generated_at": generated_at,
+        "skills": skills,
+        "files": files,
+        "failed_imports": [e["error"] for e in files.values() if e.get("error")],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, default=str), encoding="utf-8")
+    tmp.replace(path)
+    return generated_at
+
 
-        module_path_str = str(py_file.resolve())
-        rel = py_file.relative_to(_SKILLS_DIR)
-        module_name = "skills." + ".".join(rel.with_suffix("").parts)
+def _read_manifest(path: Path = _MANIFEST_PATH) -> dict[str, Any] | None:
+    """Load a catalog snapshot, or None if missing, unreadable or from another version."""
+    if not path.exists():
+        return None
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning("Could not read skill manifest %s: %s — falling back to scan.", path, exc)
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != _MANIFEST_VERSION:
+        logger.warning("Skill manifest %s has an unsupported version — falling back to scan.", path)
+        return None
+    return manifest
+
+
+def _lazy_record(entry: dict[str, Any]) -> dict[str, Any]:
+    """Catalog record for a snapshot entry; the callable is imported on first use."""
+    py_file = _SKILLS_DIR / entry["module_path"]
+    return {
+        "meta": entry["meta"],
+        "callable": None,
+        "module_path": str(py_file.resolve()),
+        "module_name": entry.get("module_name") or _module_name_for(py_file),
+        "category": entry.get("category", "root"),
+        "required_params": entry.get("required_params"),
+    }
+
+
+def _refresh_catalog(path: Path = _MANIFEST_PATH) -> dict[str, dict[str, Any]]:
+    """Build the dispatcher catalog from the snapshot, re-importing only changed files.
+
+    Files whose size and mtime match the snapshot are trusted without hashing;
+    otherwise the content hash decides. Unchanged files become lazy records (or
+    stay in the failed-import list), changed and new files are imported now, and
+    deleted files drop out. The snapshot is rewritten when anything changed.
+    Falls back to a full scan when no usable snapshot exists.
+
+    Only each skill's own file is fingerprinted — editing a shared helper such
+    as skills/utils does not invalidate the skills that import it.
+    """
+    manifest = _read_manifest(path)
+    if manifest is None:
+        discovered = _discover_skills()
+        file_index: dict[str, dict[str, Any]] = getattr(_discover_skills, "_file_index", {})
+        generated_at = _try_write_manifest(discovered, file_index, path)
+        _CATALOG_STATE.update({
+            "source": "scan",
+            "snapshot_generated_at": generated_at,
+            "reused_files": 0,
+            "reimported_files": len(file_index),
+            "removed_files": 0,
+        })
+        return discovered
+
+    prev_files: dict[str, dict[str, Any]] = manifest.get("files", {})
+    prev_skills: dict[str, dict[str, Any]] = manifest.get("skills", {})
+
+    catalog: dict[str, dict[str, Any]] = {}
+    file_index = {}
+    failed_imports: list[str] = []
+    reused = reimported = removed = 0
+    touched = False
+
+    for py_file, subdir in _iter_skill_files():
+        rel = py_file.relative_to(_SKILLS_DIR).as_posix()
+        prev = prev_files.get(rel)
+        stat = py_file.stat()
+        if prev and prev.get("mtime_ns") == stat.st_mtime_ns and prev.get("size") == stat.st_size:
+            digest = prev["sha256"]
+        else:
+            digest = _hash_file(py_file)
+            touched = True
+
+        fingerprint = {"sha256": digest, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        if prev and prev.get("sha256") == digest:
+            reused += 1
+            tool_name = prev.get("skill")
+            if tool_name and tool_name in prev_skills:
+                catalog[tool_name] = _lazy_record(prev_skills[tool_name])
+            if prev.get("error"):
+                failed_imports.append(prev["error"])
+            file_index[rel] = {"skill": tool_name, "error": prev.get("error"), **fingerprint}
+            continue
 
+        reimported += 1
         try:
-            spec = importlib.util.spec_from_file_location(module_name, py_file)
-            if spec is None or spec.loader is None:
-                logger.warning("Could not create module spec for %s — skipping.", py_file)
-                continue
-
-            module: ModuleType = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)  # type: ignore[union-attr]
+            scanned = _scan_skill_file(py_file, subdir)
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to import %s: %s — skipping.", py_file, exc)
-            failed_imports.append(f"{py_file.name}: {type(exc).__name__}: {exc}")
+            error = f"{py_file.name}: {type(exc).__name__}: {exc}"
+            failed_imports.append(error)
+            file_index[rel] = {"skill": None, "error": error, **fingerprint}
             continue
-
-        tool_meta = getattr(module, "TOOL_META", None)
-        if not isinstance(tool_meta, dict):
-            logger.debug("%s has no TOOL_META dict — skipping.", py_file)
+        if scanned is None:
+            file_index[rel] = {"skill": None, "error": None, **fingerprint}
             continue
-
-        tool_name: str | None = tool_meta.get("name")
-        if not tool_name:
-            logger.warning("%s TOOL_META missing 'name' key — skipping.", py_file)
+        tool_name, record = scanned
+        catalog[tool_name] = record
+        file_index[rel] = {"skill": tool_name, "error": None, **fingerprint}
+
+    # Entries outside the current include/exclude filters stay in the snapshot
+    # (so other filter settings can still reuse them) but are not served.
+    carried: dict[str, dict[str, Any]] = {}
+    for rel, prev in prev_files.items():
+        if rel in file_index:
             continue
-
-        fn: Callable[..., Any] | None = getattr(module, tool_name, None)
-        if fn is None or not callable(fn):
-            logger.warning(
-                "%s TOOL_META['name'] = %r but no matching callable found — skipping.",
-                py_file, tool_name,
-            )
+        subdir = rel.split("/", 1)[0] if "/" in rel else ""
+        if _subdir_selected(subdir) or not (_SKILLS_DIR / rel).exists():
+            removed += 1
             continue
+        file_index[rel] = prev
+        tool_name = prev.get("skill")
+        if tool_name and tool_name in prev_skills:
+            carried[tool_name] = _lazy_record(prev_skills[tool_name])
 
-        discovered[tool_name] = {
-            "meta": tool_meta,
-            "callable": fn,
-            "module_path": module_path_str,
-            "category": subdir or "root",
-        }
-        logger.debug("Discovered skill '%s' from %s.", tool_name, py_file)
+    generated_at = manifest.get("generated_at")
+    if reimported or removed or touched:
+        generated_at = _try_write_manifest({**carried, **catalog}, file_index, path)
 
     _discover_skills._failed_imports = failed_imports  # type: ignore[attr-defined]
-    return discovered
+    _CATALOG_STATE.update({
+        "source": "snapshot",
+        "snapshot_generated_at": generated_at,
+        "reused_files": reused,
+        "reimported_files": reimported,
+        "removed_files": removed,
+    })
+    return catalog
+
+
+def _try_write_manifest(
+    discovered: dict[str, dict[str, Any]],
+    file_index: dict[str, dict[str, Any]],
+    path: Path,
+) -> str | None:
+    """Best-effort snapshot write — a read-only deploy must still boot."""
+    try:
+        return _write_manifest(discovered, file_index, path)
+    except OSError as exc:
+        logger.warning("Could not write skill manifest %s: %s", path, exc)
+        return None
+
+
+def _catalog_freshness() -> dict[str, Any]:
+    """Describe how current the served catalog is, for /health."""
+    state = dict(_CATALOG_STATE)
+    generated_at = state.get("snapshot_generated_at")
+    if generated_at:
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(generated_at)
+        state["snapshot_age_seconds"] = round(age.total_seconds(), 1)
+    return state
+
+
+def _resolve_callable(tool_name: str, record: dict[str, Any]) -> Callable[..., Any]:
+    """Return the skill function for a catalog record, importing it on first use.
+
+    Raises:
+        ImportError: If the module cannot be imported or no longer exposes the skill.
+    """
+    fn = record.get("callable")
+    if fn is not None:
+        return fn
+
+    with _IMPORT_LOCK:
+        fn = record.get("callable")
+        if fn is not None:
+            return fn
+
+        started = time.perf_counter()
+        module = _import_skill_module(Path(record["module_path"]), record["module_name"])
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        fn = getattr(module, tool_name, None)
+        if fn is None or not callable(fn):
+            raise ImportError(f"{record['module_path']} no longer defines callable '{tool_name}'")
+
+        _record_import(tool_name, elapsed_ms)
+        record["callable"] = fn
+        return fn
+
+
+def _record_import(tool_name: str, elapsed_ms: float) -> None:
+    """Store a lazy import timing (thread or process path) and warn when it is over budget."""
+    _IMPORT_METRICS[tool_name] = round(elapsed_ms, 2)
+    if elapsed_ms > _IMPORT_BUDGET_MS:
+        logger.warning(
+            "Lazy import of '%s' took %.1f ms (budget %.0f ms).",
+            tool_name, elapsed_ms, _IMPORT_BUDGET_MS,
+        )
+
+
+def _import_metrics_summary() -> dict[str, Any]:
+    """Summarise lazy import timings for /health."""
+    over_budget = {
+        name: ms for name, ms in _IMPORT_METRICS.items() if ms > _IMPORT_BUDGET_MS
+    }
+    return {
+        "loaded": len(_IMPORT_METRICS),
+        "total_ms": round(sum(_IMPORT_METRICS.values()), 2),
+        "budget_ms": _IMPORT_BUDGET_MS,
+        "over_budget": dict(sorted(over_budget.items(), key=lambda kv: -kv[1])[:10]),
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -261,12 +704,227 @@ def snowdrop_list_skills(category: str = "") -> dict[str, Any]:
     }
 
 
-def snowdrop_execute(skill: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+def _thread_pool() -> ThreadPoolExecutor:
+    """Shared bounded thread pool for sync skills."""
+    global _THREAD_POOL
+    with _POOL_LOCK:
+        if _THREAD_POOL is None:
+            _THREAD_POOL = ThreadPoolExecutor(
+                max_workers=_THREAD_WORKERS, thread_name_prefix="snowdrop-skill"
+            )
+        return _THREAD_POOL
+
+
+def _process_pool() -> ProcessPoolExecutor:
+    """Shared process pool for CPU-bound skills (spawned, so no forked locks)."""
+    global _PROCESS_POOL
+    with _POOL_LOCK:
+        if _PROCESS_POOL is None:
+            _PROCESS_POOL = ProcessPoolExecutor(
+                max_workers=_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _PROCESS_POOL
+
+
+def _run_skill_in_subprocess(
+    module_path: str, module_name: str, tool_name: str, params: dict[str, Any]
+) -> tuple[Any, float | None]:
+    """Process-pool entry point: import the skill in the worker (once) and call it.
+
+    Returns:
+        (result, import_ms): import_ms is the worker's import time on its first
+        call of this skill, None afterwards.
+    """
+    import_ms = None
+    module = sys.modules.get(module_name)
+    if module is None:
+        started = time.perf_counter()
+        module = _import_skill_module(Path(module_path), module_name)
+        import_ms = (time.perf_counter() - started) * 1000
+    return getattr(module, tool_name)(**params), import_ms
+
+
+def _skill_timeout(meta: dict[str, Any]) -> float:
+    """Per-call timeout for a skill: TOOL_META "timeout_seconds" or the server default."""
+    try:
+        return float(meta.get("timeout_seconds") or _EXEC_TIMEOUT_S)
+    except (TypeError, ValueError):
+        return _EXEC_TIMEOUT_S
+
+
+async def _run_skill(skill: str, record: dict[str, Any], params: dict[str, Any]) -> Any:
+    """Run one skill off the event loop according to its TOOL_META execution hints.
+
+    Raises:
+        asyncio.TimeoutError: If the call exceeds its timeout. Coroutine skills are
+            cancelled; the process pool is terminated and respawned on the next
+            call; thread-pool skills cannot be interrupted, so their worker
+            finishes in the background and the result is discarded.
+        Exception: Anything the skill (or its lazy import) raises.
+    """
+    loop = asyncio.get_running_loop()
+    meta = record["meta"]
+    timeout = _skill_timeout(meta)
+
+    if meta.get("executor") == "process":
+        pool = _process_pool()
+        call = functools.partial(
+            _run_skill_in_subprocess,
+            record["module_path"], record["module_name"], skill, params,
+        )
+        try:
+            result, import_ms = await asyncio.wait_for(loop.run_in_executor(pool, call), timeout)
+        except asyncio.TimeoutError:
+            # The worker keeps running after wait_for gives up; kill it with its pool.
+            _reset_process_pool(pool, terminate=True)
+            raise
+        except BrokenProcessPool:
+            _reset_process_pool(pool)
+            raise
+        if import_ms is not None:
+            _record_import(skill, import_ms)
+        return result
+
+    fn = record.get("callable")
+    if fn is None:
+        fn = await loop.run_in_executor(_thread_pool(), _resolve_callable, skill, record)
+
+    if inspect.iscoroutinefunction(fn):
+        return await asyncio.wait_for(fn(**params), timeout)
+
+    # Copy the caller's context so trace IDs (skills.utils.logger) follow the call.
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, **params)
+    return await asyncio.wait_for(loop.run_in_executor(_thread_pool(), call), timeout)
+
+
+def _signature_schema(record: dict[str, Any]) -> dict[str, Any]:
+    """A record's inputSchema with "required" trimmed to what its function cannot default.
+
+    Many TOOL_META schemas require properties the function does not take (it
+    reads them from a nested dict) or gives a default; requiring them would
+    reject calls the skill handles. Trimmed names are kept on the record as
+    "relaxed_required".
+    """
+    schema = record["meta"]["inputSchema"]
+    required = schema.get("required")
+    signature = record.get("required_params")
+    if signature is None and record.get("callable") is not None:
+        signature = record["required_params"] = _required_params(record["callable"])
+    if not isinstance(required, list) or signature is None:
+        return schema
+    kept = [name for name in required if name in signature]
+    if len(kept) == len(required):
+        return schema
+    record["relaxed_required"] = [name for name in required if name not in kept]
+    logger.debug(
+        "inputSchema of '%s' requires %s, which its function does not; not enforced.",
+        record["meta"].get("name"), record["relaxed_required"],
+    )
+    return {**schema, "required": kept}
+
+
+def _input_validator(record: dict[str, Any]) -> SchemaValidator | None:
+    """Compiled inputSchema validator for a catalog record, built once and kept on the record."""
+    if "validator" not in record:
+        meta = record["meta"]
+        schema = meta.get("inputSchema")
+        if meta.get("validate_input") is False or not isinstance(schema, dict):
+            record["validator"] = None
+        else:
+            try:
+                record["validator"] = compile_schema(_signature_schema(record))
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Could not compile inputSchema for '%s': %s", meta.get("name"), exc)
+                record["validator"] = None
+    return record["validator"]
+
+
+def _compile_validators(catalog: dict[str, dict[str, Any]]) -> None:
+    """Compile every skill's inputSchema up front so first calls pay nothing."""
+    if _INPUT_VALIDATION == "off":
+        return
+    started = time.perf_counter()
+    for record in catalog.values():
+        _input_validator(record)
+    relaxed = sum(1 for record in catalog.values() if record.get("relaxed_required"))
+    logger.info(
+        "Compiled input validators for %d skills in %.1f ms (%d required lists trimmed to the function signature).",
+        len(catalog), (time.perf_counter() - started) * 1000, relaxed,
+    )
+
+
+def _validation_summary() -> dict[str, Any]:
+    """Input validation mode and counters for /health."""
+    return {"mode": _INPUT_VALIDATION, **_VALIDATION_STATS}
+
+
+def _cacheable_result(result: Any) -> bool:
+    """Only successful skill envelopes are worth caching."""
+    return isinstance(result, dict) and result.get("status") != "error" and "error" not in result
+
+
+def _shaping_error(fields: Any, tail: Any, float_precision: Any) -> str | None:
+    """Reason the response-shaping arguments are unusable, or None."""
+    if fields is not None and not (isinstance(fields, list) and all(isinstance(f, str) and f for f in fields)):
+        return "fields must be a list of non-empty key paths (e.g. 'summary.total')."
+    if tail is not None and (isinstance(tail, bool) or not isinstance(tail, int) or tail < 0):
+        return "tail must be a non-negative integer."
+    if float_precision is not None and (
+        isinstance(float_precision, bool) or not isinstance(float_precision, int) or not 0 <= float_precision <= 15
+    ):
+        return "float_precision must be an integer from 0 to 15."
+    return None
+
+
+def _shape_result(
+    result: Any, fields: list[str] | None, tail: int | None, float_precision: int | None
+) -> Any:
+    """Apply response shaping to a skill envelope, remembering the original if it changed."""
+    if not isinstance(result, dict):
+        return result
+    shaped = shape_response(result, fields, tail, float_precision)
+    if shaped is not result:
+        _UNSHAPED_RESULT.set(result)
+    return shaped
+
+
+def _rate_limit_key(agent_id: str | None) -> str:
+    """Bucket key for a call: the authenticated client if any, else the claimed agent_id."""
+    token = get_access_token()
+    if token is not None and token.client_id:
+        return f"client:{token.client_id}"
+    return agent_id or "anonymous"
+
+
+async def snowdrop_execute(
+    skill: str,
+    params: dict[str, Any] | None = None,
+    use_cache: bool = True,
+    agent_id: str | None = None,
+    fields: list[str] | None = None,
+    tail: int | None = None,
+    float_precision: int | None = None,
+) -> dict[str, Any]:
     """Execute a Snowdrop skill by name with the given parameters.
 
     Args:
         skill: Exact skill name (e.g. "rsi_calculator").
-        params: Keyword arguments to pass to the skill function.
+        params: Keyword arguments to pass to the skill function. They are checked
+            against the skill's inputSchema first; mismatches are logged, or with
+            SNOWDROP_MCP_VALIDATE_INPUT=enforce rejected with a
+            "validation_errors" list instead of reaching the skill.
+        use_cache: Set False to force recomputation of a cached deterministic skill.
+            The fresh result replaces the cached entry.
+        agent_id: Caller identity for per-agent rate limiting (when enabled).
+            Ignored in favour of the access token's client when auth is configured.
+        fields: Keys of the result's data to return, as dotted paths
+            (e.g. ["current_rsi", "summary.total"]); everything else is dropped.
+        tail: Cut every list in the data to its last ``tail`` items.
+        float_precision: Round floats in the data to this many decimals.
+            Shaping happens after the result cache; a "projection" entry lists
+            missing fields and the original length of each truncated list.
     """
     ts = datetime.now(timezone.utc).isoformat()
     record = _SKILL_CATALOG.get(skill)
@@ -277,38 +935,262 @@ def snowdrop_execute(skill: str, params: dict[str, Any] | None = None) -> dict[s
             "timestamp": ts,
         }
 
-    fn: Callable[..., Any] = record["callable"]
+    shaping_error = _shaping_error(fields, tail, float_precision)
+    if shaping_error:
+        return {"status": "error", "data": {"error": shaping_error}, "timestamp": ts}
+
     call_params = params or {}
+    meta = record["meta"]
+    if _RATE_LIMIT_ENABLED:
+        decision = get_rate_limiter().check(_rate_limit_key(agent_id), float(meta.get("rate_limit_cost", 1)))
+        if not decision["allowed"]:
+            return {
+                "status": "error",
+                "data": {
+                    "error": f"Rate limit exceeded for '{decision['key']}'.",
+                    "retry_after_sec": decision["retry_after_sec"],
+                },
+                "timestamp": ts,
+            }
+    validator = _input_validator(record) if _INPUT_VALIDATION != "off" else None
+    if validator is not None:
+        _VALIDATION_STATS["checked"] += 1
+        checked_params, errors = validator(call_params)
+        if not errors:
+            call_params = checked_params
+        elif _INPUT_VALIDATION == "warn":
+            logger.warning("Params for '%s' do not match its inputSchema: %s", skill, "; ".join(errors))
+        else:
+            _VALIDATION_STATS["rejected"] += 1
+            return {
+                "status": "error",
+                "data": {
+                    "error": f"Invalid params for '{skill}': {errors[0]}",
+                    "validation_errors": errors,
+                },
+                "timestamp": ts,
+            }
+    cache_key = canonical_key(skill, call_params) if meta.get("deterministic") is True else None
+    if cache_key is not None and use_cache:
+        hit, cached = _RESULT_CACHE.get(cache_key)
+        if hit:
+            cached = {**cached, "timestamp": ts} if "timestamp" in cached else cached
+            return _shape_result(cached, fields, tail, float_precision)
+
     try:
-        result = fn(**call_params)
-        return result
+        result = await _run_skill(skill, record, call_params)
+    except asyncio.TimeoutError:
+        error_msg = f"TimeoutError: '{skill}' exceeded {_skill_timeout(record['meta']):g}s"
+        _log_lesson(skill, error_msg)
+        return {"status": "error", "data": {"error": error_msg}, "timestamp": ts}
     except Exception as exc:
         error_msg = f"{type(exc).__name__}: {exc}"
+        _log_lesson(skill, error_msg)
         return {"status": "error", "data": {"error": error_msg}, "timestamp": ts}
 
+    if cache_key is not None and _cacheable_result(result):
+        _RESULT_CACHE.set(cache_key, result, ttl=meta.get("cache_ttl_seconds"))
+    return _shape_result(result, fields, tail, float_precision)
+
+
+def _tool_result(result: Any, skill: str | None = None, unshaped: Any = None) -> ToolResult:
+    """MCP return value: the envelope as one JSON text block, encoded once.
+
+    With a skill name the encoded size is recorded; ``unshaped`` (the result
+    before fields/tail/float_precision) is only encoded for sampled calls.
+    """
+    encoded = dumps(result)
+    if skill is not None:
+        _RESPONSE_SIZES.record(skill, len(encoded), unshaped)
+    return ToolResult(content=[TextContent(type="text", text=encoded.decode())])
+
+
+async def _snowdrop_execute_tool(
+    skill: str,
+    params: dict[str, Any] | None = None,
+    use_cache: bool = True,
+    agent_id: str | None = None,
+    fields: list[str] | None = None,
+    tail: int | None = None,
+    float_precision: int | None = None,
+) -> ToolResult:
+    """MCP entry point for snowdrop_execute."""
+    token = _UNSHAPED_RESULT.set(None)
+    try:
+        result = await snowdrop_execute(skill, params, use_cache, agent_id, fields, tail, float_precision)
+        return _tool_result(result, skill, _UNSHAPED_RESULT.get())
+    finally:
+        _UNSHAPED_RESULT.reset(token)
+
+
+async def _snowdrop_execute_batch_tool(
+    items: list[dict[str, Any]],
+    parallelism: int = _BATCH_DEFAULT_PARALLELISM,
+    agent_id: str | None = None,
+) -> ToolResult:
+    """MCP entry point for snowdrop_execute_batch."""
+    return _tool_result(await snowdrop_execute_batch(items, parallelism, agent_id))
+
+
+def _reset_process_pool(pool: ProcessPoolExecutor, terminate: bool = False) -> None:
+    """Drop a broken or timed-out process pool so the next call respawns it.
+
+    Only ``pool`` is dropped, so a call failing on an old pool cannot take down
+    its replacement. With terminate=True its workers are killed first: a skill
+    that overran its timeout would otherwise keep a worker busy indefinitely.
+    Other calls still running on that pool fail with BrokenProcessPool.
+    """
+    global _PROCESS_POOL
+    with _POOL_LOCK:
+        if _PROCESS_POOL is pool:
+            _PROCESS_POOL = None
+    if terminate:
+        if hasattr(pool, "terminate_workers"):  # Python 3.14+
+            pool.terminate_workers()
+            return
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def snowdrop_execute_batch(
+    items: list[dict[str, Any]],
+    parallelism: int = _BATCH_DEFAULT_PARALLELISM,
+    agent_id: str | None = None,
+) -> dict[str, Any]:
+    """Execute many skill calls in one request, concurrently, returning results in order.
+
+    Args:
+        items: List of {"skill": name, "params": {...}} dicts; an item may also set
+            "use_cache": false to bypass the result cache, "agent_id" to
+            override the batch's agent_id, and "fields", "tail" or
+            "float_precision" to shape its result (see snowdrop_execute).
+        parallelism: Maximum items executing at once (default 8).
+        agent_id: Caller identity for per-agent rate limiting (when enabled).
+    """
+    ts = datetime.now(timezone.utc).isoformat()
+    if not isinstance(items, list) or not items:
+        return {
+            "status": "error",
+            "data": {"error": "items must be a non-empty list of {skill, params} objects."},
+            "timestamp": ts,
+        }
+    if len(items) > _BATCH_MAX_ITEMS:
+        return {
+            "status": "error",
+            "data": {"error": f"Batch of {len(items)} items exceeds the limit of {_BATCH_MAX_ITEMS}."},
+            "timestamp": ts,
+        }
+
+    parallelism = min(max(int(parallelism), 1), _BATCH_MAX_PARALLELISM)
+    semaphore = asyncio.Semaphore(parallelism)
 
-def snowdrop_search_skills(query: str) -> dict[str, Any]:
-    """Search skills by keyword in name or description.
+    async def run_item(index: int, item: Any) -> dict[str, Any]:
+        if not isinstance(item, dict) or not isinstance(item.get("skill"), str):
+            return {
+                "index": index,
+                "skill": item.get("skill") if isinstance(item, dict) else None,
+                "status": "error",
+                "latency_ms": 0.0,
+                "result": {"status": "error", "data": {"error": "Each item needs a 'skill' string."}},
+            }
+        params = item.get("params")
+        if params is not None and not isinstance(params, dict):
+            return {
+                "index": index,
+                "skill": item["skill"],
+                "status": "error",
+                "latency_ms": 0.0,
+                "result": {"status": "error", "data": {"error": "'params' must be an object."}},
+            }
+        async with semaphore:
+            started = time.perf_counter()
+            result = await snowdrop_execute(
+                item["skill"],
+                params,
+                use_cache=item.get("use_cache", True) is not False,
+                agent_id=item.get("agent_id", agent_id),
+                fields=item.get("fields"),
+                tail=item.get("tail"),
+                float_precision=item.get("float_precision"),
+            )
+            latency_ms = (time.perf_counter() - started) * 1000
+        failed = isinstance(result, dict) and result.get("status") == "error"
+        return {
+            "index": index,
+            "skill": item["skill"],
+            "status": "error" if failed else "ok",
+            "latency_ms": round(latency_ms, 2),
+            "result": result,
+        }
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(run_item(i, item) for i, item in enumerate(items)))
+    failed_count = sum(1 for r in results if r["status"] == "error")
+    return {
+        "status": "ok",
+        "data": {
+            "results": results,
+            "count": len(results),
+            "succeeded": len(results) - failed_count,
+            "failed": failed_count,
+            "parallelism": parallelism,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        },
+        "timestamp": ts,
+    }
+
+
+def _search_index() -> SkillSearchIndex:
+    """Return the search index for the current catalog, building it if needed."""
+    global _SEARCH_INDEX, _SEARCH_INDEX_CATALOG
+    if _SEARCH_INDEX is None or _SEARCH_INDEX_CATALOG is not _SKILL_CATALOG:
+        started = time.perf_counter()
+        _SEARCH_INDEX = SkillSearchIndex.from_catalog(_SKILL_CATALOG)
+        _SEARCH_INDEX_CATALOG = _SKILL_CATALOG
+        logger.info(
+            "Built search index over %d skills in %.1f ms.",
+            len(_SEARCH_INDEX), (time.perf_counter() - started) * 1000,
+        )
+    return _SEARCH_INDEX
+
+
+def snowdrop_search_skills(query: str, limit: int = _SEARCH_DEFAULT_LIMIT, offset: int = 0) -> dict[str, Any]:
+    """Search skills by keyword across name, description, category and input fields.
+
+    Results are ranked with BM25; partial words match by prefix and single-character
+    typos are tolerated.
 
     Args:
-        query: Search term (case-insensitive substring match).
+        query: Free-text search terms (case-insensitive).
+        limit: Maximum results per page (1-200, default 20).
+        offset: Number of ranked results to skip, for pagination.
     """
     ts = datetime.now(timezone.utc).isoformat()
-    q = query.lower()
+    limit = min(max(int(limit), 1), _SEARCH_MAX_LIMIT)
+    offset = max(int(offset), 0)
+    total, ranked = _search_index().search(query, limit=limit, offset=offset)
     matches = [
-        _build_skill_summary(r)
-        for name, r in _SKILL_CATALOG.items()
-        if q in name.lower() or q in r["meta"].get("description", "").lower()
+        {**_build_skill_summary(_SKILL_CATALOG[name]), "score": score}
+        for name, score in ranked
+        if name in _SKILL_CATALOG
     ]
     return {
         "status": "ok",
-        "data": {"query": query, "results": matches, "count": len(matches)},
+        "data": {
+            "query": query,
+            "results": matches,
+            "count": len(matches),
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        },
         "timestamp": ts,
     }
 
 
 def _register_dispatcher() -> None:
-    """Register the 3 meta-tools with the FastMCP server."""
+    """Register the 4 meta-tools with the FastMCP server."""
     mcp.tool(
         name="snowdrop_list_skills",
         description=(
@@ -323,16 +1205,36 @@ def _register_dispatcher() -> None:
         description=(
             "Execute any Snowdrop skill by name. Pass the skill name and a params dict. "
             "Example: skill='rsi_calculator', params={'prices': [...], 'period': 14}. "
+            "Results of deterministic skills are cached; pass use_cache=false to recompute. "
+            "Pass agent_id to identify the caller when per-agent rate limits are enabled. "
+            "To shrink large results pass fields=['current_rsi', 'summary.total'] to keep only "
+            "those keys of data, tail=N to keep the last N items of every series, and "
+            "float_precision=D to round floats. "
             "Use snowdrop_list_skills or snowdrop_search_skills to discover available skills."
         ),
-    )(snowdrop_execute)
+        output_schema=None,
+    )(_snowdrop_execute_tool)
+
+    mcp.tool(
+        name="snowdrop_execute_batch",
+        description=(
+            "Execute many Snowdrop skill calls in one request. Pass items as a list of "
+            "{'skill': name, 'params': {...}} objects; they run concurrently (up to "
+            "'parallelism' at once, default 8) and results come back in the same order "
+            "with per-item status and latency_ms. "
+            "Items may also set fields, tail and float_precision as in snowdrop_execute. "
+            "Example: items=[{'skill': 'rsi_calculator', 'params': {'prices': [...], 'period': 14}}, ...]."
+        ),
+        output_schema=None,
+    )(_snowdrop_execute_batch_tool)
 
     mcp.tool(
         name="snowdrop_search_skills",
         description=(
-            "Search Snowdrop's skill catalog by keyword. Returns matching skill names, "
-            "descriptions, categories, and input schemas. "
-            "Example: query='volatility' returns all volatility-related skills."
+            "Search Snowdrop's skill catalog by keyword. Returns ranked skill names, "
+            "descriptions, categories, and input schemas. Partial words and small typos "
+            "match. Use limit/offset to page through results. "
+            "Example: query='volatility' returns the top volatility-related skills."
         ),
     )(snowdrop_search_skills)
 
@@ -346,21 +1248,28 @@ def main() -> None:
     """Discover skills, register them as MCP tools, and start the server."""
     logger.info("Snowdrop Community Edition starting — scanning %s for skills…", _SKILLS_DIR)
 
-    discovered = _discover_skills()
+    # Direct mode registers real function signatures, so it always imports everything.
+    if _MCP_MODE == "dispatcher":
+        discovered = _refresh_catalog()
+    else:
+        discovered = _discover_skills()
 
     _failed_imports: list[str] = getattr(_discover_skills, "_failed_imports", [])
     logger.info(
-        "Skill discovery complete — loaded=%d failed=%d",
-        len(discovered), len(_failed_imports),
+        "Skill discovery complete — source=%s loaded=%d failed=%d reimported=%d",
+        _CATALOG_STATE["source"], len(discovered), len(_failed_imports),
+        _CATALOG_STATE.get("reimported_files", len(discovered)),
     )
 
     global _SKILL_CATALOG
     _SKILL_CATALOG = discovered
+    _search_index()
+    _compile_validators(discovered)
 
     if _MCP_MODE == "dispatcher":
         _register_dispatcher()
         logger.info(
-            "Dispatcher mode — registered 3 meta-tools gatewaying %d skills across %d categories.",
+            "Dispatcher mode — registered 4 meta-tools gatewaying %d skills across %d categories.",
             len(discovered),
             len({r.get("category", "root") for r in discovered.values()}),
         )
@@ -411,6 +1320,18 @@ def main() -> None:
                 "skills": len(discovered),
                 "version": "2.0.0",
                 "edition": "community",
+                "catalog": {
+                    **_catalog_freshness(),
+                    "lazy_imports": _import_metrics_summary(),
+                },
+                "result_cache": _RESULT_CACHE.stats(),
+                "lesson_sink": get_lesson_sink().stats(),
+                "append_logs": append_log_stats(),
+                "http_pool": pool_stats(),
+                "exchange_sessions": session_stats(),
+                "rate_limiter": rate_limiter_stats(),
+                "input_validation": _validation_summary(),
+                "response_sizes": _RESPONSE_SIZES.stats(),
             }
 
         @_app.get("/.well-known/agent.json", tags=["a2a"])
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Executive Summary: Build the prebuilt skill catalog manifest consumed by mcp_server.py.
+Imports every skill once (at build time), extracts TOOL_META, module path and category,
+and writes a single JSON index (with per-file content hashes) so the server can boot
+without importing ~1,900 modules.
+
+Table of Contents:
+    1. Imports and Setup
+    2. Manifest Build
+    3. CLI Entry Point
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# ---------------------------------------------------------------------------
+# 1. Imports and Setup
+# ---------------------------------------------------------------------------
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+import mcp_server  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# 2. Manifest Build
+# ---------------------------------------------------------------------------
+
+def build_manifest(output: Path) -> tuple[int, int]:
+    """Discover all skills and write the manifest to output.
+
+    Returns:
+        (skills_written, failed_imports) counts.
+    """
+    discovered = mcp_server._discover_skills()
+    failed: list[str] = getattr(mcp_server._discover_skills, "_failed_imports", [])
+    file_index = getattr(mcp_server._discover_skills, "_file_index", {})
+    mcp_server._write_manifest(discovered, file_index, output)
+    return len(discovered), len(failed)
+
+
+# ---------------------------------------------------------------------------
+# 3. CLI Entry Point
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=mcp_server._MANIFEST_PATH,
+        help="Manifest destination (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    count, failed = build_manifest(args.output)
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {count} skills to {args.output} ({failed} failed imports) in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
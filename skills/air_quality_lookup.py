@@ -39,6 +39,8 @@ import os
 import datetime
 import requests
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "air_quality_lookup",
     "description": (
@@ -108,7 +110,7 @@ def _resolve_location(location: str, api_key: str) -> dict:
             pass
 
     geo_url = "https://maps.googleapis.com/maps/api/geocode/json"
-    resp = requests.get(geo_url, params={"address": location, "key": api_key}, timeout=10)
+    resp = get_session().get(geo_url, params={"address": location, "key": api_key}, timeout=10)
     resp.raise_for_status()
     results = resp.json().get("results", [])
     if not results:
@@ -244,7 +246,7 @@ def air_quality_lookup(
 
     try:
         if action == "current":
-            resp = requests.post(
+            resp = get_session().post(
                 "https://airquality.googleapis.com/v1/currentConditions:lookup",
                 params={"key": api_key},
                 json={
@@ -292,7 +294,7 @@ def air_quality_lookup(
                 if page_token:
                     body["pageToken"] = page_token
 
-                resp = requests.post(
+                resp = get_session().post(
                     "https://airquality.googleapis.com/v1/history:lookup",
                     params={"key": api_key},
                     json=body,
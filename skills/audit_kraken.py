@@ -10,13 +10,14 @@ import logging
 from typing import Any
 from datetime import datetime, timezone
 
-import ccxt
+from skills.utils.exchange_sessions import fan_out, get_exchange_session
 
 logger = logging.getLogger("snowdrop.skills")
 
 # --- MCP Tool Metadata ---
 TOOL_META = {
     "name": "audit_kraken",
+    "timeout_seconds": 45,
     "description": "Retrieves live Kraken exchange balances for TON, SOL, and USDC, converts to USD, and returns a structured balance report.",
     "inputSchema": {
         "type": "object",
@@ -61,9 +62,10 @@ TRACKED_ASSETS: dict[str, str] = {
 def audit_kraken(**kwargs: Any) -> dict:
     """Fetch live Kraken balances for TON, SOL, and USDC and compute USD values.
 
-    Connects to the Kraken exchange via ccxt using API credentials from environment
-    variables. Retrieves free (available) balances for the tracked assets and fetches
-    the latest ticker price for each to compute a USD-denominated value.
+    Connects to the Kraken exchange via a shared ccxt session using API credentials
+    from environment variables. Retrieves free (available) balances and, concurrently,
+    the latest ticker prices for the tracked assets in one batched call to compute
+    USD-denominated values.
 
     Args:
         **kwargs: Unused. Accepted for MCP dispatch compatibility.
@@ -98,13 +100,21 @@ def audit_kraken(**kwargs: Any) -> dict:
         if not api_key or not secret:
             raise ValueError("KRAKEN_API_KEY and KRAKEN_SECRET must be set in environment")
 
-        exchange = ccxt.kraken({
-            "apiKey": api_key,
-            "secret": secret,
+        # Balances need the private session; tickers go through the shared public one
+        # so both requests run concurrently and quotes are reused across skills.
+        account = get_exchange_session("kraken", api_key=api_key, secret=secret)
+        public = get_exchange_session("kraken")
+        priced_pairs = [pair for asset, pair in TRACKED_ASSETS.items() if asset != "USDC"]
+        results = fan_out({
+            "balance": account.fetch_balance,
+            "tickers": lambda: public.fetch_tickers(priced_pairs),
         })
+        for outcome in results.values():
+            if isinstance(outcome, Exception):
+                raise outcome
 
-        raw_balance = exchange.fetch_balance()
-        free_balances: dict[str, float] = raw_balance.get("free", {})
+        free_balances: dict[str, float] = results["balance"].get("free", {})
+        tickers: dict[str, dict[str, Any]] = results["tickers"]
 
         balances: list[dict[str, Any]] = []
         total_usd: float = 0.0
@@ -116,8 +126,7 @@ def audit_kraken(**kwargs: Any) -> dict:
                 # USDC is pegged 1:1 to USD; avoid unnecessary ticker call
                 usd_price: float = 1.0
             else:
-                ticker = exchange.fetch_ticker(ticker_pair)
-                usd_price = float(ticker.get("last", 0.0))
+                usd_price = float(tickers[ticker_pair].get("last", 0.0))
 
             usd_value: float = balance * usd_price
             total_usd += usd_value
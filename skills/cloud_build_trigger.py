@@ -33,7 +33,7 @@ import logging
 import os
 from datetime import datetime, timezone
 
-import requests
+from skills.utils.http_client import get_session
 
 logger = logging.getLogger("snowdrop.cloud_build_trigger")
 
@@ -175,7 +175,7 @@ def cloud_build_trigger(
         }
 
         logger.info("cloud_build_trigger: POST %s branch=%s", url, branch)
-        resp = requests.post(url, headers=headers, json=body, timeout=30)
+        resp = get_session().post(url, headers=headers, json=body, timeout=30)
 
         if resp.status_code not in (200, 202):
             logger.error(
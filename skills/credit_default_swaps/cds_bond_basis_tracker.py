@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_bond_basis_tracker",
+    "deterministic": True,
     "description": "Calculates CDS basis across bonds and flags rich/cheap signals.",
     "inputSchema": {
         "type": "object",
@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_breakeven_spread",
+    "deterministic": True,
     "description": "Calculates running spread that equates premium and protection PVs.",
     "inputSchema": {
         "type": "object",
@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_cheapest_to_deliver_analyzer",
+    "deterministic": True,
     "description": "Identifies the cheapest deliverable bond and expected auction recovery.",
     "inputSchema": {
         "type": "object",
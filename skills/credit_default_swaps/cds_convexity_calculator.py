@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_convexity_calculator",
+    "deterministic": True,
     "description": "Estimates convexity impact from nonlinear CDS spread moves.",
     "inputSchema": {
         "type": "object",
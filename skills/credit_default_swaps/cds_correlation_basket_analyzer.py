@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_correlation_basket_analyzer",
+    "deterministic": True,
     "description": "Analyzes basket correlation scenarios and tranche loss contributions.",
     "inputSchema": {
         "type": "object",
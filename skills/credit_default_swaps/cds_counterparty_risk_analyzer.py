@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_counterparty_risk_analyzer",
+    "deterministic": True,
     "description": "Evaluates CDS counterparty exposures versus assigned limits.",
     "inputSchema": {
         "type": "object",
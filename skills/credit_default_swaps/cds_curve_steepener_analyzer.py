@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_curve_steepener_analyzer",
+    "deterministic": True,
     "description": "Evaluates CDS curve slope and roll yield for steepener trades.",
     "inputSchema": {
         "type": "object",
@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_duration_calculator",
+    "deterministic": True,
     "description": "Calculates CDS PV01 and spread duration based on discount curve.",
     "inputSchema": {
         "type": "object",
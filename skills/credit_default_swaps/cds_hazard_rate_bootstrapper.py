@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_hazard_rate_bootstrapper",
+    "deterministic": True,
     "description": "Bootstraps hazard rates from CDS spreads and recovery assumptions.",
     "inputSchema": {
         "type": "object",
@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_index_portfolio_analyzer",
+    "deterministic": True,
     "description": "Aggregates CDS index notionals, sectors, and risk skew.",
     "inputSchema": {
         "type": "object",
@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_jump_to_default_calculator",
+    "deterministic": True,
     "description": "Calculates jump-to-default impact using LGD and recovery assumptions.",
     "inputSchema": {
         "type": "object",
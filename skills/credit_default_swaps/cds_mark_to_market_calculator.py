@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_mark_to_market_calculator",
+    "deterministic": True,
     "description": "Marks CDS positions using PV01 and spread differentials.",
     "inputSchema": {
         "type": "object",
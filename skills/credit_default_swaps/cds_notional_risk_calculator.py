@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_notional_risk_calculator",
+    "deterministic": True,
     "description": "Computes gross, net, and concentration metrics for CDS notionals.",
     "inputSchema": {
         "type": "object",
@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_pnl_attribution_model",
+    "deterministic": True,
     "description": "Attributes CDS P&L into carry, spread, and curve components.",
     "inputSchema": {
         "type": "object",
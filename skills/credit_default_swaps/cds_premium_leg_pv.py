@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_premium_leg_pv",
+    "deterministic": True,
     "description": "Discounts CDS premium leg coupons to compute PV and annuity.",
     "inputSchema": {
         "type": "object",
@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_protection_leg_pv",
+    "deterministic": True,
     "description": "Computes PV of CDS protection leg using default probabilities.",
     "inputSchema": {
         "type": "object",
@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_recovery_rate_sensitivity",
+    "deterministic": True,
     "description": "Analyzes CDS spread sensitivity to recovery rate scenarios.",
     "inputSchema": {
         "type": "object",
@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_spread_calculator",
+    "deterministic": True,
     "description": "Estimates CDS par spread and expected loss using default probabilities.",
     "inputSchema": {
         "type": "object",
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_survival_probability_curve",
+    "deterministic": True,
     "description": "Generates survival probabilities from hazard rates and tenors.",
     "inputSchema": {
         "type": "object",
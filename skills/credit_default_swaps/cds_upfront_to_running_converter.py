@@ -11,6 +11,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META: dict[str, Any] = {
     "name": "cds_upfront_to_running_converter",
+    "deterministic": True,
     "description": "Converts CDS upfront percentage into equivalent running spread.",
     "inputSchema": {
         "type": "object",
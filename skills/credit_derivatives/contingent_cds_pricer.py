@@ -14,6 +14,8 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "contingent_cds_pricer",
+    "executor": "process",
+    "timeout_seconds": 300,
     "description": (
         "Values contingent CDS via barrier-adjusted probabilities: barrier probability via down-and-in hitting "
         "formula (Broadie-Glasserman) multiplied by conditional default PV."
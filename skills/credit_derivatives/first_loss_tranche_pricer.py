@@ -16,6 +16,8 @@ ND = NormalDist()
 
 TOOL_META = {
     "name": "first_loss_tranche_pricer",
+    "executor": "process",
+    "timeout_seconds": 300,
     "description": (
         "Monte Carlo Vasicek/Li large pool approximation for equity tranches using base-correlation "
         "averaging to determine the effective copula correlation."
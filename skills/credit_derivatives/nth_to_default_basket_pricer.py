@@ -16,6 +16,8 @@ ND = NormalDist()
 
 TOOL_META = {
     "name": "nth_to_default_basket_pricer",
+    "executor": "process",
+    "timeout_seconds": 300,
     "description": (
         "Monte Carlo Gaussian copula model (Li, 2000) for nth-to-default baskets with "
         "systematic correlation and discounted loss metrics."
@@ -5,8 +5,9 @@ from statistics import median
 from datetime import datetime, timezone
 from typing import Any
 
-import ccxt
-import requests
+from skills.utils.cache import canonical_key
+from skills.utils.exchange_sessions import QUOTE_CACHE, fan_out, get_exchange_session
+from skills.utils.http_client import get_session
 
 COINGECKO_URL = "https://api.coingecko.com/api/v3/simple/price"
 ASSET_MAP = {
@@ -49,22 +50,21 @@ def price_feed_aggregator(asset_symbol: str, **_: Any) -> dict[str, Any]:
         if key not in ASSET_MAP:
             raise ValueError(f"Unsupported asset_symbol '{asset_symbol}'")
         mapping = ASSET_MAP[key]
+        results = fan_out({
+            "coingecko": lambda: _coingecko_price(mapping["coingecko_id"]),
+            "kraken": lambda: get_exchange_session("kraken").fetch_ticker(mapping["kraken_pair"]),
+        })
+        for outcome in results.values():
+            if isinstance(outcome, Exception):
+                raise outcome
+
         prices = []
         sources = []
+        if results["coingecko"]:
+            prices.append(results["coingecko"])
+            sources.append({"source": "coingecko", "price": results["coingecko"]})
 
-        # CoinGecko
-        params = {"ids": mapping["coingecko_id"], "vs_currencies": "usd"}
-        cg_resp = requests.get(COINGECKO_URL, params=params, timeout=10)
-        if cg_resp.ok:
-            value = cg_resp.json().get(mapping["coingecko_id"], {}).get("usd")
-            if value:
-                prices.append(float(value))
-                sources.append({"source": "coingecko", "price": float(value)})
-
-        # Kraken
-        exchange = ccxt.kraken()
-        ticker = exchange.fetch_ticker(mapping["kraken_pair"])
-        kraken_price = float(ticker.get("last"))
+        kraken_price = float(results["kraken"].get("last"))
         prices.append(kraken_price)
         sources.append({"source": "kraken", "price": kraken_price})
 
@@ -90,6 +90,22 @@ def price_feed_aggregator(asset_symbol: str, **_: Any) -> dict[str, Any]:
         }
 
 
+def _coingecko_price(coingecko_id: str) -> float | None:
+    """CoinGecko USD price, shared through the short-TTL quote cache."""
+    key = canonical_key("coingecko", coingecko_id)
+    hit, value = QUOTE_CACHE.get(key)
+    if hit:
+        return value
+    params = {"ids": coingecko_id, "vs_currencies": "usd"}
+    cg_resp = get_session().get(COINGECKO_URL, params=params, timeout=10)
+    if not cg_resp.ok:
+        return None
+    value = cg_resp.json().get(coingecko_id, {}).get("usd")
+    value = float(value) if value else None
+    QUOTE_CACHE.set(key, value)
+    return value
+
+
 def _log_lesson(skill_name: str, error: str) -> None:
     with open("logs/lessons.md", "a", encoding="utf-8") as handle:
         handle.write(f"- [{datetime.now(timezone.utc).isoformat()}] {skill_name}: {error}\n")
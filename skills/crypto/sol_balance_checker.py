@@ -5,7 +5,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-import requests
+from skills.utils.http_client import get_session
 
 LAMPORTS_PER_SOL = 1_000_000_000
 
@@ -44,7 +44,7 @@ def sol_balance_checker(**_: Any) -> dict[str, Any]:
             "method": "getBalance",
             "params": [address],
         }
-        response = requests.post(rpc_url, json=payload, timeout=15)
+        response = get_session().post(rpc_url, json=payload, timeout=15)
         response.raise_for_status()
         result = response.json().get("result", {})
         lamports = int(result.get("value", 0))
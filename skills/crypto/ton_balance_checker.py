@@ -5,7 +5,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-import requests
+from skills.utils.http_client import get_session
 
 API_URL = "https://toncenter.com/api/v2/getAddressBalance"
 NANO = 1_000_000_000
@@ -41,7 +41,7 @@ def ton_balance_checker(**_: Any) -> dict[str, Any]:
 
         params = {"address": address}
         headers = {"X-API-Key": api_key}
-        response = requests.get(API_URL, params=params, headers=headers, timeout=15)
+        response = get_session().get(API_URL, params=params, headers=headers, timeout=15)
         response.raise_for_status()
         payload = response.json()
         balance_nano = int(payload.get("result", 0))
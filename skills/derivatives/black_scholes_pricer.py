@@ -1,10 +1,11 @@
 """Price options and Greeks via the Black-Scholes model."""
 from __future__ import annotations
 
-import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.black_scholes import greeks
+
 TOOL_META: dict[str, Any] = {
     "name": "black_scholes_pricer",
     "description": "Calculates Black-Scholes option prices with full Greek outputs.",
@@ -42,20 +43,6 @@ TOOL_META: dict[str, Any] = {
 }
 
 
-def _norm_cdf(value: float) -> float:
-    """Cumulative normal distribution via Abramowitz-Stegun approximation."""
-    k = 1.0 / (1.0 + 0.2316419 * abs(value))
-    coeffs = [0.319381530, -0.356563782, 1.781477937, -1.821255978, 1.330274429]
-    poly = sum(c * k ** (idx + 1) for idx, c in enumerate(coeffs))
-    approx = 1.0 - (1.0 / math.sqrt(2 * math.pi)) * math.exp(-0.5 * value * value) * poly
-    return approx if value >= 0 else 1.0 - approx
-
-
-def _norm_pdf(value: float) -> float:
-    """Probability density for a standard normal variable."""
-    return (1.0 / math.sqrt(2 * math.pi)) * math.exp(-0.5 * value * value)
-
-
 def black_scholes_pricer(
     spot_price: float,
     strike_price: float,
@@ -77,37 +64,10 @@ def black_scholes_pricer(
         if option_type not in {"call", "put"}:
             raise ValueError("option_type must be 'call' or 'put'")
 
-        sqrt_t = math.sqrt(time_to_expiry_years)
-        d1 = (
-            math.log(spot_price / strike_price)
-            + (risk_free_rate + 0.5 * volatility * volatility) * time_to_expiry_years
-        ) / (volatility * sqrt_t)
-        d2 = d1 - volatility * sqrt_t
-
-        nd1 = _norm_cdf(d1)
-        nd2 = _norm_cdf(d2)
-        pdf_d1 = _norm_pdf(d1)
-        discount = math.exp(-risk_free_rate * time_to_expiry_years)
-
-        if option_type == "call":
-            price = spot_price * nd1 - strike_price * discount * nd2
-            delta = nd1
-            rho = strike_price * time_to_expiry_years * discount * nd2
-            theta = (
-                -spot_price * pdf_d1 * volatility / (2 * sqrt_t)
-                - risk_free_rate * strike_price * discount * nd2
-            )
-        else:
-            price = strike_price * discount * _norm_cdf(-d2) - spot_price * _norm_cdf(-d1)
-            delta = nd1 - 1
-            rho = -strike_price * time_to_expiry_years * discount * _norm_cdf(-d2)
-            theta = (
-                -spot_price * pdf_d1 * volatility / (2 * sqrt_t)
-                + risk_free_rate * strike_price * discount * _norm_cdf(-d2)
-            )
-
-        gamma = pdf_d1 / (spot_price * volatility * sqrt_t)
-        vega = spot_price * pdf_d1 * sqrt_t
+        g = greeks(spot_price, strike_price, time_to_expiry_years, risk_free_rate, volatility, option_type)
+        price, delta, gamma, theta, vega, rho, d1, d2 = (
+            float(g[key]) for key in ("price", "delta", "gamma", "theta", "vega", "rho", "d1", "d2")
+        )
 
         result = {
             "price": round(price, 6),
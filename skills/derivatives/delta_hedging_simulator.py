@@ -1,10 +1,13 @@
 """Delta hedging simulator."""
 from __future__ import annotations
 
-import math
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
+
+from skills.utils.black_scholes import greeks
+
 TOOL_META: dict[str, Any] = {
     "name": "delta_hedging_simulator",
     "description": "Simulates discrete delta hedging P&L decomposition over a price path.",
@@ -53,43 +56,25 @@ TOOL_META: dict[str, Any] = {
 }
 
 
-def _cdf(x: float) -> float:
-    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
-
-
-def _pdf(x: float) -> float:
-    return math.exp(-0.5 * x * x) / math.sqrt(2 * math.pi)
-
-
 def _bs_price_delta_gamma(
-    spot: float, strike: float, r: float, sigma: float, tau: float, option_type: str
-) -> tuple[float, float, float]:
-    """Return (price, delta, gamma) using Black-Scholes.
+    spot: np.ndarray, strike: float, r: float, sigma: float, tau: np.ndarray, option_type: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (price, delta, gamma) arrays along a path using Black-Scholes.
 
-    At tau=0, returns intrinsic value and binary delta.
+    Where tau=0, returns intrinsic value and binary delta.
     """
-    if tau <= 0 or sigma <= 0:
-        intrinsic = max(spot - strike, 0.0) if option_type == "call" else max(strike - spot, 0.0)
-        # Delta at expiry: 1 if in-the-money call, -1 if in-the-money put, 0 otherwise
-        if option_type == "call":
-            delta = 1.0 if spot > strike else 0.0
-        else:
-            delta = -1.0 if spot < strike else 0.0
-        return intrinsic, delta, 0.0
-
-    sqrt_t = math.sqrt(tau)
-    d1 = (math.log(spot / strike) + (r + 0.5 * sigma ** 2) * tau) / (sigma * sqrt_t)
-    d2 = d1 - sigma * sqrt_t
-
-    disc = math.exp(-r * tau)
     if option_type == "call":
-        price = spot * _cdf(d1) - strike * disc * _cdf(d2)
-        delta = _cdf(d1)
+        price = np.maximum(spot - strike, 0.0)
+        # Delta at expiry: 1 if in-the-money call, -1 if in-the-money put, 0 otherwise
+        delta = np.where(spot > strike, 1.0, 0.0)
     else:
-        price = strike * disc * _cdf(-d2) - spot * _cdf(-d1)
-        delta = _cdf(d1) - 1.0
-
-    gamma = _pdf(d1) / (spot * sigma * sqrt_t)
+        price = np.maximum(strike - spot, 0.0)
+        delta = np.where(spot < strike, -1.0, 0.0)
+    gamma = np.zeros_like(spot)
+    live = tau > 0
+    if live.any():
+        g = greeks(spot[live], strike, tau[live], r, sigma, option_type)
+        price[live], delta[live], gamma[live] = g["price"], g["delta"], g["gamma"]
     return price, delta, gamma
 
 
@@ -143,33 +128,23 @@ def delta_hedging_simulator(
         n_steps = len(spot_prices) - 1
         dt = horizon / n_steps
 
-        initial_price, _, _ = _bs_price_delta_gamma(spot_prices[0], strike, r, sigma, horizon, option_type)
-        prev_price, prev_delta, prev_gamma = initial_price, *_bs_price_delta_gamma(spot_prices[0], strike, r, sigma, horizon, option_type)[1:]
-
-        hedge_pnl_series: list[float] = []
-        gamma_pnl = 0.0
-        theta_pnl = 0.0
-
-        for idx in range(1, len(spot_prices)):
-            tau = max(horizon - idx * dt, 0.0)
-            price, delta, gamma = _bs_price_delta_gamma(spot_prices[idx], strike, r, sigma, tau, option_type)
-            d_spot = spot_prices[idx] - spot_prices[idx - 1]
-
-            # Hedge P&L: gain from short delta hedge offsetting option value change
-            hedge_step = -prev_delta * d_spot * notional
-            hedge_pnl_series.append(round(hedge_step, 4))
+        spots = np.asarray(spot_prices, dtype=float)
+        taus = np.maximum(horizon - np.arange(n_steps + 1) * dt, 0.0)
+        prices, deltas, gammas = _bs_price_delta_gamma(spots, strike, r, sigma, taus, option_type)
+        d_spot = np.diff(spots)
 
-            # Gamma P&L (convexity benefit): long gamma earns 0.5*gamma*dS^2
-            gamma_pnl += 0.5 * prev_gamma * (d_spot ** 2) * notional
+        # Hedge P&L: gain from short delta hedge offsetting option value change
+        hedge_steps = -deltas[:-1] * d_spot * notional
+        hedge_pnl_series: list[float] = [round(float(step), 4) for step in hedge_steps]
 
-            # Theta P&L: residual after delta and gamma explain option change
-            option_change = (price - prev_price) * notional
-            theta_step = option_change - prev_delta * d_spot * notional - 0.5 * prev_gamma * (d_spot ** 2) * notional
-            theta_pnl += theta_step
+        # Gamma P&L (convexity benefit): long gamma earns 0.5*gamma*dS^2
+        gamma_steps = 0.5 * gammas[:-1] * d_spot ** 2 * notional
+        gamma_pnl = float(gamma_steps.sum())
 
-            prev_price, prev_delta, prev_gamma = price, delta, gamma
+        # Theta P&L: residual after delta and gamma explain option change
+        theta_pnl = float((np.diff(prices) * notional + hedge_steps - gamma_steps).sum())
 
-        option_pnl = (prev_price - initial_price) * notional
+        option_pnl = float(prices[-1] - prices[0]) * notional
         total_hedge_pnl = sum(hedge_pnl_series)
         residual_pnl = option_pnl + total_hedge_pnl
         hedge_effectiveness = 1 - abs(residual_pnl) / (abs(option_pnl) + 1e-9)
@@ -7,9 +7,10 @@ HTTP server at https://mcp.context7.com/mcp — no npx/Node required.
 Free API key: https://context7.com/dashboard
 """
 import os
-import requests
 from datetime import datetime, timezone
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "context7_docs",
     "description": (
@@ -81,7 +82,7 @@ _ENDPOINT = "https://mcp.context7.com/mcp"
 
 def _call_context7(method: str, params: dict, api_key: str) -> dict:
     """Send a JSON-RPC call to Context7 HTTP MCP server."""
-    resp = requests.post(
+    resp = get_session().post(
         _ENDPOINT,
         json={"jsonrpc": "2.0", "id": 1, "method": method, "params": params},
         headers={
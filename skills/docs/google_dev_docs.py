@@ -22,6 +22,8 @@ import os
 import requests
 from datetime import datetime, timezone
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "google_dev_docs",
     "description": (
@@ -70,7 +72,7 @@ def google_dev_docs(query: str, fetch_full: bool = False) -> dict:
 
     try:
         # Step 1: search_documents
-        search_resp = requests.post(
+        search_resp = get_session().post(
             _ENDPOINT,
             json={
                 "jsonrpc": "2.0",
@@ -102,7 +104,7 @@ def google_dev_docs(query: str, fetch_full: bool = False) -> dict:
         if fetch_full and chunks:
             top_parent = chunks[0].get("parent", "")
             if top_parent:
-                doc_resp = requests.post(
+                doc_resp = get_session().post(
                     _ENDPOINT,
                     json={
                         "jsonrpc": "2.0",
@@ -4,16 +4,47 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.logging import log_lesson
+from skills.utils.transform_plan import compile_plan, read_rows, resolve_data_path, write_rows
+
 TOOL_META: dict[str, Any] = {
     "name": "data_transformer",
-    "description": "Applies rename/cast/compute/drop/default transformations to dataset rows sequentially.",
+    "description": (
+        "Applies rename/cast/compute/drop/default transformations to dataset rows in one compiled pass. "
+        "Supports columnar execution and streaming JSONL/CSV files."
+    ),
     "inputSchema": {
         "type": "object",
         "properties": {
             "data": {"type": "array", "items": {"type": "object"}},
             "transformations": {"type": "array", "items": {"type": "object"}},
+            "mode": {
+                "type": "string",
+                "enum": ["row", "columnar"],
+                "default": "row",
+                "description": "row: one fused pass per record. columnar: whole-column ops, numeric computes on NumPy arrays.",
+            },
+            "input_path": {
+                "type": "string",
+                "description": (
+                    "Read records from a JSONL or .csv file instead of data (streamed). "
+                    "Must be inside the server's data directory; relative paths resolve against it."
+                ),
+            },
+            "output_path": {
+                "type": "string",
+                "description": (
+                    "Write records to a JSONL or .csv file instead of returning them. "
+                    "Must be inside the server's data directory; relative paths resolve against it."
+                ),
+            },
+            "chunk_size": {
+                "type": "integer",
+                "default": 50000,
+                "description": "Rows per batch in columnar mode.",
+            },
         },
-        "required": ["data", "transformations"],
+        "required": ["transformations"],
     },
     "outputSchema": {
         "type": "object",
@@ -27,86 +58,58 @@ TOOL_META: dict[str, Any] = {
 
 
 def data_transformer(
-    data: list[dict[str, Any]],
-    transformations: list[dict[str, Any]],
+    data: list[dict[str, Any]] | None = None,
+    transformations: list[dict[str, Any]] | None = None,
+    mode: str = "row",
+    input_path: str | None = None,
+    output_path: str | None = None,
+    chunk_size: int = 50_000,
     **_: Any,
 ) -> dict[str, Any]:
-    """Return transformed dataset and audit log."""
+    """Return transformed dataset and audit log.
+
+    The transformation list is compiled once (and cached) into a plan; see
+    skills/utils/transform_plan.py. With output_path set, records are written
+    to the file as they are produced and only the row count is returned.
+    input_path and output_path must lie inside SNOWDROP_DATA_DIR.
+    """
     try:
-        records = [row.copy() for row in data]
-        log_entries: list[str] = []
-        for transform in transformations:
-            op = transform.get("operation")
-            field = transform.get("field")
-            if op == "rename":
-                new_name = transform.get("params", {}).get("new_name")
-                if not new_name:
-                    raise ValueError("rename requires params.new_name")
-                for row in records:
-                    row[new_name] = row.pop(field, None)
-                log_entries.append(f"rename {field} -> {new_name}")
-            elif op == "cast":
-                cast_type = transform.get("params", {}).get("type", "string")
-                caster = _caster(cast_type)
-                for row in records:
-                    if field in row and row[field] is not None:
-                        row[field] = caster(row[field])
-                log_entries.append(f"cast {field} to {cast_type}")
-            elif op == "compute":
-                expression = transform.get("params", {}).get("expression")
-                if not expression:
-                    raise ValueError("compute requires params.expression")
-                for row in records:
-                    row[field] = _safe_eval(expression, row)
-                log_entries.append(f"compute {field} = {expression}")
-            elif op == "drop":
-                for row in records:
-                    row.pop(field, None)
-                log_entries.append(f"drop {field}")
-            elif op == "default":
-                default_value = transform.get("params", {}).get("value")
-                for row in records:
-                    if row.get(field) in {None, ""}:
-                        row[field] = default_value
-                log_entries.append(f"default {field} -> {default_value}")
+        if transformations is None:
+            raise ValueError("transformations is required")
+        if data is None and input_path is None:
+            raise ValueError("Provide data or input_path")
+        if mode not in {"row", "columnar"}:
+            raise ValueError(f"Unsupported mode: {mode}")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        plan = compile_plan(transformations)
+        if output_path is not None:
+            resolve_data_path(output_path)  # reject before reading or transforming anything
+        rows = read_rows(input_path) if input_path is not None else data
+        if mode == "columnar":
+            if output_path is None and input_path is None:
+                records = plan.transform_columnar(rows)
             else:
-                raise ValueError(f"Unsupported operation: {op}")
-        data_payload = {
-            "records": records,
-            "transformation_log": log_entries,
-        }
+                records = plan.transform_batches(rows, chunk_size)
+        else:
+            records = plan.transform_rows(rows)
+        if output_path is not None:
+            data_payload: dict[str, Any] = {
+                "output_path": output_path,
+                "rows_written": write_rows(output_path, records),
+            }
+        else:
+            data_payload = {"records": list(records)}
+        data_payload["transformation_log"] = list(plan.log)
         return {
             "status": "success",
             "data": data_payload,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
     except Exception as exc:
-        _log_lesson("data_transformer", str(exc))
+        log_lesson(f"data_transformer: {exc}")
         return {
             "status": "error",
             "data": {"error": str(exc)},
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
-
-
-def _caster(name: str):
-    mapping = {
-        "string": str,
-        "int": lambda value: int(float(value)),
-        "float": float,
-        "bool": lambda value: str(value).lower() in {"true", "1", "yes"},
-    }
-    if name not in mapping:
-        raise ValueError(f"Unsupported cast type: {name}")
-    return mapping[name]
-
-
-def _safe_eval(expression: str, row: dict[str, Any]) -> Any:
-    allowed = {key: value for key, value in row.items() if isinstance(key, str)}
-    allowed["__builtins__"] = {}
-    return eval(expression, allowed, {})
-
-
-def _log_lesson(skill_name: str, error: str) -> None:
-    with open("logs/lessons.md", "a", encoding="utf-8") as handle:
-        handle.write(f"- [{datetime.now(timezone.utc).isoformat()}] {skill_name}: {error}\n")
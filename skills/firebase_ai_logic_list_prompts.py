@@ -31,7 +31,7 @@ import logging
 import os
 from datetime import datetime, timezone
 
-import requests
+from skills.utils.http_client import get_session
 
 logger = logging.getLogger("snowdrop.firebase_ai_logic_list_prompts")
 
@@ -188,7 +188,7 @@ def firebase_ai_logic_list_prompts(
         params: dict = {"pageSize": page_size}
 
         logger.info("firebase_ai_logic_list_prompts: trying Firebase endpoint %s", firebase_url)
-        fb_resp = requests.get(firebase_url, headers=headers, params=params, timeout=15)
+        fb_resp = get_session().get(firebase_url, headers=headers, params=params, timeout=15)
 
         source: str
         templates: list[dict]
@@ -216,7 +216,7 @@ def firebase_ai_logic_list_prompts(
             logger.info(
                 "firebase_ai_logic_list_prompts: trying Vertex fallback %s", vertex_url
             )
-            vx_resp = requests.get(vertex_url, headers=headers, params=params, timeout=15)
+            vx_resp = get_session().get(vertex_url, headers=headers, params=params, timeout=15)
 
             if vx_resp.status_code != 200:
                 logger.error(
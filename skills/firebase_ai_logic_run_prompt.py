@@ -35,9 +35,8 @@ import logging
 import os
 from datetime import datetime, timezone
 
-import requests
-
 from config.models import resolve_model
+from skills.utils.http_client import get_session
 
 logger = logging.getLogger("snowdrop.firebase_ai_logic_run_prompt")
 
@@ -232,7 +231,7 @@ def firebase_ai_logic_run_prompt(
         )
 
         logger.info("firebase_ai_logic_run_prompt: POST %s", url)
-        resp = requests.post(url, headers=headers, json=request_body, timeout=60)
+        resp = get_session().post(url, headers=headers, json=request_body, timeout=60)
 
         if resp.status_code != 200:
             logger.error(
@@ -13,6 +13,8 @@ from datetime import datetime, timezone
 
 import httpx
 
+from skills.utils.http_client import pooled_client
+
 logger = logging.getLogger("snowdrop.firebase_app_distribution_upload")
 
 TOOL_META = {
@@ -175,7 +177,7 @@ def firebase_app_distribution_upload(
             "firebase_app_distribution_upload: uploading binary | size_bytes=%d",
             len(binary_bytes),
         )
-        with httpx.Client(timeout=120) as client:
+        with pooled_client(timeout=120) as client:
             resp = client.post(upload_url, headers=upload_headers, content=binary_bytes)
             _raise_for_status(resp, "Upload binary")
             operation: dict = resp.json()
@@ -198,7 +200,7 @@ def firebase_app_distribution_upload(
             if attempt > 0:
                 time.sleep(poll_interval)
             op_url = f"https://firebaseappdistribution.googleapis.com/v1/{operation_name}"
-            with httpx.Client(timeout=30) as client:
+            with pooled_client(timeout=30) as client:
                 poll_resp = client.get(op_url, headers=auth_headers)
                 _raise_for_status(poll_resp, f"Poll operation (attempt {attempt + 1})")
                 final_op = poll_resp.json()
@@ -227,7 +229,7 @@ def firebase_app_distribution_upload(
             notes_url = f"{_FAD_BASE}/{release_name}?updateMask=releaseNotes.text"
             notes_payload = {"releaseNotes": {"text": release_notes}}
             notes_headers = {**auth_headers, "Content-Type": "application/json"}
-            with httpx.Client(timeout=30) as client:
+            with pooled_client(timeout=30) as client:
                 resp = client.patch(notes_url, headers=notes_headers, json=notes_payload)
                 _raise_for_status(resp, "Update release notes")
 
@@ -248,7 +250,7 @@ def firebase_app_distribution_upload(
                 tester_emails,
                 group_aliases,
             )
-            with httpx.Client(timeout=30) as client:
+            with pooled_client(timeout=30) as client:
                 resp = client.post(distribute_url, headers=dist_headers, json=recipients)
                 _raise_for_status(resp, "Distribute release")
 
@@ -33,7 +33,7 @@ import logging
 import os
 from datetime import datetime, timezone
 
-import requests
+from skills.utils.http_client import get_session
 
 logger = logging.getLogger("snowdrop.firebase_app_hosting_list_sites")
 
@@ -189,7 +189,7 @@ def firebase_app_hosting_list_sites(
         params: dict = {"pageSize": page_size}
 
         logger.info("firebase_app_hosting_list_sites: GET %s", url)
-        resp = requests.get(url, headers=headers, params=params, timeout=20)
+        resp = get_session().get(url, headers=headers, params=params, timeout=20)
 
         if resp.status_code != 200:
             logger.error(
@@ -34,6 +34,8 @@ from datetime import datetime, timezone
 
 import requests
 
+from skills.utils.http_client import get_session
+
 logger = logging.getLogger("snowdrop.firebase_crashlytics_get_issue")
 
 TOOL_META = {
@@ -151,7 +153,7 @@ def firebase_crashlytics_get_issue(
         token = _get_access_token([_CRASHLYTICS_SCOPE])
         headers = {"Authorization": f"Bearer {token}"}
 
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = get_session().get(url, headers=headers, timeout=30)
         resp.raise_for_status()
         issue = resp.json()
 
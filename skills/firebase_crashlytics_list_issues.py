@@ -35,6 +35,8 @@ from datetime import datetime, timezone
 
 import requests
 
+from skills.utils.http_client import get_session
+
 logger = logging.getLogger("snowdrop.firebase_crashlytics_list_issues")
 
 TOOL_META = {
@@ -166,7 +168,7 @@ def firebase_crashlytics_list_issues(
         token = _get_access_token([_CRASHLYTICS_SCOPE])
         headers = {"Authorization": f"Bearer {token}"}
 
-        resp = requests.get(url, params=params, headers=headers, timeout=30)
+        resp = get_session().get(url, params=params, headers=headers, timeout=30)
         resp.raise_for_status()
         body = resp.json()
 
@@ -38,6 +38,8 @@ from datetime import datetime, timezone
 
 import requests
 
+from skills.utils.http_client import get_session
+
 logger = logging.getLogger("snowdrop.firebase_dynamic_links_create")
 
 TOOL_META = {
@@ -165,7 +167,7 @@ def firebase_dynamic_links_create(
     url = f"{_DYNAMIC_LINKS_URL}?key={api_key}"
 
     try:
-        resp = requests.post(
+        resp = get_session().post(
             url,
             json=payload,
             headers={"Content-Type": "application/json"},
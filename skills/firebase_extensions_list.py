@@ -34,6 +34,8 @@ from datetime import datetime, timezone
 
 import requests
 
+from skills.utils.http_client import get_session
+
 logger = logging.getLogger("snowdrop.firebase_extensions_list")
 
 TOOL_META = {
@@ -141,7 +143,7 @@ def firebase_extensions_list(
         token = _get_access_token([_EXTENSIONS_SCOPE])
         headers = {"Authorization": f"Bearer {token}"}
 
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = get_session().get(url, headers=headers, timeout=30)
         resp.raise_for_status()
         body = resp.json()
 
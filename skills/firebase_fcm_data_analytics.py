@@ -34,7 +34,7 @@ import logging
 import os
 from datetime import datetime, timezone
 
-import requests
+from skills.utils.http_client import get_session
 
 logger = logging.getLogger("snowdrop.firebase_fcm_data_analytics")
 
@@ -255,7 +255,7 @@ def firebase_fcm_data_analytics(
         )
 
         logger.info("firebase_fcm_data_analytics: POST %s", primary_url)
-        resp = requests.post(
+        resp = get_session().post(
             primary_url, headers=headers, json=request_body, timeout=30
         )
 
@@ -286,7 +286,7 @@ def firebase_fcm_data_analytics(
                 params["appId"] = app_id
 
             logger.info("firebase_fcm_data_analytics: GET %s", fallback_url)
-            fb_resp = requests.get(
+            fb_resp = get_session().get(
                 fallback_url, headers=headers, params=params, timeout=30
             )
 
@@ -15,6 +15,8 @@ from datetime import datetime, timezone
 
 import httpx
 
+from skills.utils.http_client import pooled_client
+
 logger = logging.getLogger("snowdrop.firebase_hosting_deploy")
 
 TOOL_META = {
@@ -180,7 +182,7 @@ def firebase_hosting_deploy(
                 "headers": [{"glob": "**", "headers": {"Cache-Control": "max-age=3600"}}]
             }
         }
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30) as client:
             resp = client.post(create_url, headers=headers, json=create_payload)
             _raise_for_status(resp, "Create version")
             version_data = resp.json()
@@ -197,7 +199,7 @@ def firebase_hosting_deploy(
         logger.info("firebase_hosting_deploy: populating files | version=%s", version_name)
         populate_url = f"{_HOSTING_BASE}/{version_name}:populateFiles"
         populate_payload = {"files": file_hashes}
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30) as client:
             resp = client.post(populate_url, headers=headers, json=populate_payload)
             _raise_for_status(resp, "Populate files")
             populate_data = resp.json()
@@ -236,7 +238,7 @@ def firebase_hosting_deploy(
                 file_hash,
                 _path,
             )
-            with httpx.Client(timeout=60) as client:
+            with pooled_client(timeout=60) as client:
                 resp = client.post(file_upload_url, headers=upload_headers, content=raw_bytes)
                 _raise_for_status(resp, f"Upload file {_path}")
             files_uploaded += 1
@@ -245,7 +247,7 @@ def firebase_hosting_deploy(
         logger.info("firebase_hosting_deploy: finalizing version=%s", version_name)
         patch_url = f"{_HOSTING_BASE}/{version_name}?updateMask=status"
         finalize_payload = {"status": "FINALIZED"}
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30) as client:
             resp = client.patch(patch_url, headers=headers, json=finalize_payload)
             _raise_for_status(resp, "Finalize version")
 
@@ -260,7 +262,7 @@ def firebase_hosting_deploy(
             f"{_HOSTING_BASE}/sites/{site_id}/channels/{channel_id}/releases"
             f"?versionName={version_name}"
         )
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30) as client:
             resp = client.post(release_url, headers=headers, json={})
             _raise_for_status(resp, "Create release")
             release_data = resp.json()
@@ -10,7 +10,7 @@ import logging
 import os
 from datetime import datetime, timezone
 
-import httpx
+from skills.utils.http_client import pooled_client
 
 logger = logging.getLogger("snowdrop.firebase_hosting_list_releases")
 
@@ -145,7 +145,7 @@ def firebase_hosting_list_releases(
         logger.info(
             "firebase_hosting_list_releases: fetching releases | url=%s", url
         )
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30) as client:
             resp = client.get(url, headers=headers)
             if resp.is_error:
                 raise RuntimeError(
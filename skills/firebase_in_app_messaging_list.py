@@ -34,6 +34,8 @@ from datetime import datetime, timezone
 
 import requests
 
+from skills.utils.http_client import get_session
+
 logger = logging.getLogger("snowdrop.firebase_in_app_messaging_list")
 
 TOOL_META = {
@@ -146,7 +148,7 @@ def firebase_in_app_messaging_list(
         token = _get_access_token([_FIAM_SCOPE])
         headers = {"Authorization": f"Bearer {token}"}
 
-        resp = requests.get(url, params=params, headers=headers, timeout=30)
+        resp = get_session().get(url, params=params, headers=headers, timeout=30)
 
         # Graceful handling for API-not-enabled or project-not-found.
         if resp.status_code == 404:
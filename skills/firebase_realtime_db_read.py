@@ -9,7 +9,7 @@ import logging
 import os
 from datetime import datetime, timezone
 
-import httpx
+from skills.utils.http_client import pooled_client
 
 logger = logging.getLogger("snowdrop.firebase_realtime_db_read")
 
@@ -109,7 +109,7 @@ def firebase_realtime_db_read(
         token = _get_access_token()
         url = f"{db_url}{path}.json"
 
-        with httpx.Client(timeout=15.0) as client:
+        with pooled_client(timeout=15.0) as client:
             response = client.get(url, params={"access_token": token})
             response.raise_for_status()
 
@@ -11,7 +11,7 @@ import logging
 import os
 from datetime import datetime, timezone
 
-import httpx
+from skills.utils.http_client import pooled_client
 
 logger = logging.getLogger("snowdrop.firebase_remote_config_get")
 
@@ -128,7 +128,7 @@ def firebase_remote_config_get(project_id: str | None = None) -> dict:
         url = f"{_FRC_BASE}/projects/{resolved_project_id}/remoteConfig"
         logger.info("firebase_remote_config_get: fetching config | url=%s", url)
 
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30) as client:
             resp = client.get(url, headers=headers)
             if resp.is_error:
                 raise RuntimeError(
@@ -11,7 +11,7 @@ import logging
 import os
 from datetime import datetime, timezone
 
-import httpx
+from skills.utils.http_client import pooled_client
 
 logger = logging.getLogger("snowdrop.firebase_remote_config_set")
 
@@ -160,7 +160,7 @@ def firebase_remote_config_set(
             "Authorization": f"Bearer {token}",
             "Accept-Encoding": "gzip",
         }
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30) as client:
             get_resp = client.get(config_url, headers=get_headers)
             if get_resp.is_error:
                 raise RuntimeError(
@@ -201,7 +201,7 @@ def firebase_remote_config_set(
             len(merged_parameters),
             len(merged_conditions),
         )
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30) as client:
             put_resp = client.put(config_url, headers=put_headers, json=new_template)
             if put_resp.status_code == 412:
                 raise RuntimeError(
@@ -8,6 +8,8 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "monte_carlo_simulator",
+    "executor": "process",
+    "timeout_seconds": 300,
     "description": "Runs geometric Brownian motion simulations to generate percentile outcomes.",
     "inputSchema": {
         "type": "object",
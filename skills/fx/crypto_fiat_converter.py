@@ -5,7 +5,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-import requests
+from skills.utils.http_client import get_session
 
 TOOL_META: dict[str, Any] = {
     "name": "crypto_fiat_converter",
@@ -118,7 +118,7 @@ def _fetch_usd_rates(from_currency: str, to_currency: str) -> dict[str, float]:
         "vs_currencies": ",".join(sorted(vs_currencies)),
     }
     headers = {"x-cg-pro-api-key": api_key}
-    response = requests.get(_CG_URL, params=params, headers=headers, timeout=10)
+    response = get_session().get(_CG_URL, params=params, headers=headers, timeout=10)
     response.raise_for_status()
     payload = response.json()
 
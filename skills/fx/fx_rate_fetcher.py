@@ -5,7 +5,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-import requests
+from skills.utils.http_client import get_session
 
 TOOL_META: dict[str, Any] = {
     "name": "fx_rate_fetcher",
@@ -46,7 +46,7 @@ def fx_rate_fetcher(
         if not api_key:
             raise ValueError("EXCHANGERATE_API_KEY missing; see .env.template")
         targets = target_currencies or ["EUR", "GBP", "JPY"]
-        response = requests.get(
+        response = get_session().get(
             _API_URL.format(key=api_key, base=base_currency.upper()), timeout=10
         )
         response.raise_for_status()
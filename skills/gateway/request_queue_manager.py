@@ -1,12 +1,16 @@
 """Priority queue manager for Watering Hole requests."""
 from __future__ import annotations
 
+import os
+import threading
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.priority_queue import PersistentPriorityQueue
+
 TOOL_META: dict[str, Any] = {
     "name": "request_queue_manager",
-    "description": "Manages enqueue/dequeue/peek/stats for agent request queues.",
+    "description": "Manages enqueue/dequeue/peek/stats for durable server-side agent request queues with priority aging.",
     "inputSchema": {
         "type": "object",
         "properties": {
@@ -15,12 +19,18 @@ TOOL_META: dict[str, Any] = {
                 "enum": ["enqueue", "dequeue", "peek", "stats"],
             },
             "request": {"type": ["object", "null"]},
+            "queue_name": {
+                "type": "string",
+                "default": "default",
+                "description": "Server-side queue to operate on.",
+            },
             "queue_state": {
                 "type": "array",
                 "items": {"type": "object"},
+                "description": "Deprecated: client-held queue for the old stateless mode; omit to use the server-side queue.",
             },
         },
-        "required": ["operation", "queue_state"],
+        "required": ["operation"],
     },
     "outputSchema": {
         "type": "object",
@@ -34,14 +44,73 @@ TOOL_META: dict[str, Any] = {
 
 PRIORITY_ORDER = {"critical": 0, "premium": 1, "standard": 2, "free": 3}
 
+QUEUE_PATH = os.environ.get("SNOWDROP_REQUEST_QUEUE_PATH", "logs/request_queue.db")
+# Seconds of waiting that promote a request by one priority class.
+AGING_SECONDS: float = float(os.environ.get("SNOWDROP_REQUEST_QUEUE_AGING_SECONDS", "300"))
+
+_QUEUE: PersistentPriorityQueue | None = None
+_QUEUE_LOCK = threading.Lock()
+
 
 def request_queue_manager(
     operation: str,
-    queue_state: list[dict[str, Any]],
+    queue_state: list[dict[str, Any]] | None = None,
     request: dict[str, Any] | None = None,
+    queue_name: str = "default",
     **_: Any,
 ) -> dict[str, Any]:
-    """Return queue operation result and updated state."""
+    """Run a queue operation and return only the affected request plus summary stats."""
+
+    if queue_state is not None:
+        return _stateless_operation(operation, queue_state, request)
+    try:
+        queue = _get_queue()
+        if operation == "enqueue":
+            if not request:
+                raise ValueError("request payload required for enqueue")
+            data = {"enqueued": queue.enqueue(request, queue_name)}
+        elif operation == "dequeue":
+            data = {"dequeued": queue.dequeue(queue_name)}
+        elif operation == "peek":
+            data = {"next_request": queue.peek(queue_name)}
+        elif operation == "stats":
+            data = {}
+        else:
+            raise ValueError(f"Unsupported operation '{operation}'")
+        data["stats"] = queue.stats(queue_name)
+
+        return {
+            "status": "success",
+            "data": data,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+    except Exception as exc:
+        _log_lesson("request_queue_manager", str(exc))
+        return {
+            "status": "error",
+            "data": {"error": str(exc)},
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+
+def _get_queue() -> PersistentPriorityQueue:
+    global _QUEUE
+    with _QUEUE_LOCK:
+        if _QUEUE is None or str(_QUEUE.path) != str(QUEUE_PATH):
+            if _QUEUE is not None:
+                _QUEUE.close()
+            _QUEUE = PersistentPriorityQueue(
+                QUEUE_PATH, PRIORITY_ORDER, default_priority="standard", aging_seconds=AGING_SECONDS,
+            )
+        return _QUEUE
+
+
+def _stateless_operation(
+    operation: str,
+    queue_state: list[dict[str, Any]],
+    request: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Legacy mode: operate on a client-held queue and return the whole updated list."""
 
     try:
         queue = list(queue_state)
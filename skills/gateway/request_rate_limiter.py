@@ -1,20 +1,37 @@
 """Token bucket limiter for Snowdrop agents."""
 from __future__ import annotations
 
+import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.rate_limiter import get_rate_limiter
+
 TOOL_META: dict[str, Any] = {
     "name": "request_rate_limiter",
-    "description": "Enforces per-agent token bucket rate limits and returns retry hints.",
+    "description": "Checks per-agent token bucket rate limits held server-side and returns retry hints.",
     "inputSchema": {
         "type": "object",
         "properties": {
             "agent_id": {"type": "string"},
-            "bucket_state": {"type": "object"},
-            "current_time": {"type": "string"},
+            "agent_ids": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Check several agents in one call; results are returned in the same order.",
+            },
+            "cost": {
+                "type": "number",
+                "exclusiveMinimum": 0,
+                "default": 1,
+                "description": "Tokens this request consumes; must be positive.",
+            },
+            "bucket_state": {
+                "type": "object",
+                "description": "Deprecated: client-held bucket for the old stateless mode; omit to use server-side buckets.",
+            },
+            "current_time": {"type": "string", "description": "ISO timestamp, only used with bucket_state."},
         },
-        "required": ["agent_id", "bucket_state", "current_time"],
+        "required": [],
     },
     "outputSchema": {
         "type": "object",
@@ -28,12 +45,55 @@ TOOL_META: dict[str, Any] = {
 
 
 def request_rate_limiter(
-    agent_id: str,
-    bucket_state: dict[str, Any],
-    current_time: str,
+    agent_id: str = "",
+    bucket_state: dict[str, Any] | None = None,
+    current_time: str = "",
+    agent_ids: list[str] | None = None,
+    cost: float = 1,
     **_: Any,
 ) -> dict[str, Any]:
-    """Return rate-limit decision and updated bucket."""
+    """Return the rate-limit decision for one agent, or for several with agent_ids.
+
+    Server-side buckets belong to this skill's own limiter, not the one
+    snowdrop_execute enforces, and their limits come from server config only.
+    """
+
+    if bucket_state is not None:
+        return _stateless_decision(agent_id, bucket_state, current_time)
+    try:
+        cost = float(cost)
+        if not math.isfinite(cost) or cost <= 0:
+            raise ValueError("cost must be a positive number")
+        limiter = get_rate_limiter("request_rate_limiter")
+        if agent_ids:
+            data: dict[str, Any] = {"decisions": limiter.check_many(agent_ids, cost)}
+        elif agent_id:
+            decision = limiter.check(agent_id, cost)
+            data = {
+                "allowed": decision["allowed"],
+                "tokens_remaining": decision["tokens_remaining"],
+                "retry_after_sec": decision["retry_after_sec"],
+                "max_tokens": decision["capacity"],
+                "refill_rate_per_sec": decision["refill_rate_per_sec"],
+            }
+        else:
+            raise ValueError("agent_id or agent_ids is required")
+        return {
+            "status": "success",
+            "data": data,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+    except Exception as exc:
+        _log_lesson("request_rate_limiter", str(exc))
+        return {
+            "status": "error",
+            "data": {"error": str(exc)},
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+
+def _stateless_decision(agent_id: str, bucket_state: dict[str, Any], current_time: str) -> dict[str, Any]:
+    """Legacy mode: refill a client-held bucket and return it updated."""
 
     try:
         tokens = float(bucket_state.get("tokens", 0))
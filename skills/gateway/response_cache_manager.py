@@ -3,21 +3,33 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.sqlite_cache import CacheEntry, SQLiteCache
+
 TOOL_META: dict[str, Any] = {
     "name": "response_cache_manager",
-    "description": "Provides get/set/invalidate operations for skill response cache entries.",
+    "description": "Provides get/set/invalidate and batched get_many/set_many operations for skill response cache entries.",
     "inputSchema": {
         "type": "object",
         "properties": {
-            "operation": {"type": "string", "enum": ["get", "set", "invalidate"]},
+            "operation": {"type": "string", "enum": ["get", "set", "invalidate", "get_many", "set_many"]},
             "cache_key": {"type": "string"},
             "value": {"type": ["object", "null"]},
             "ttl_seconds": {"type": "integer", "default": 300},
+            "cache_keys": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Keys to look up for get_many.",
+            },
+            "entries": {
+                "type": "object",
+                "description": "Mapping of cache_key to value for set_many (all share ttl_seconds).",
+            },
         },
-        "required": ["operation", "cache_key"],
+        "required": ["operation"],
     },
     "outputSchema": {
         "type": "object",
@@ -29,47 +41,52 @@ TOOL_META: dict[str, Any] = {
     },
 }
 
-CACHE_PATH = "logs/response_cache.json"
+CACHE_PATH = os.environ.get("SNOWDROP_RESPONSE_CACHE_PATH", "logs/response_cache.db")
+LEGACY_CACHE_PATH = "logs/response_cache.json"
+# Entries kept before the least recently read are evicted.
+MAX_ENTRIES: int = int(os.environ.get("SNOWDROP_RESPONSE_CACHE_MAX_ENTRIES", "10000"))
+
+_STORE: SQLiteCache | None = None
+_STORE_LOCK = threading.Lock()
 
 
 def response_cache_manager(
     operation: str,
-    cache_key: str,
+    cache_key: str = "",
     value: dict[str, Any] | None = None,
     ttl_seconds: int = 300,
+    cache_keys: list[str] | None = None,
+    entries: dict[str, Any] | None = None,
     **_: Any,
 ) -> dict[str, Any]:
     """Perform cache operations with TTL enforcement."""
 
     try:
-        cache = _load_cache()
+        store = _get_store()
         now = datetime.now(timezone.utc)
+        if operation in ("get", "set", "invalidate") and not cache_key:
+            raise ValueError(f"cache_key is required for {operation} operations")
         if operation == "get":
-            entry = cache.get(cache_key)
-            if not entry:
-                data = {"hit": False, "data": None, "age_seconds": None}
-            else:
-                age = (now - datetime.fromisoformat(entry["stored_at"])).total_seconds()
-                if age > entry["ttl_seconds"]:
-                    cache.pop(cache_key, None)
-                    _save_cache(cache)
-                    data = {"hit": False, "data": None, "age_seconds": age}
-                else:
-                    data = {"hit": True, "data": entry["value"], "age_seconds": round(age, 2)}
+            data = _lookup(store.get_many([cache_key]), cache_key)
+        elif operation == "get_many":
+            if not cache_keys:
+                raise ValueError("cache_keys is required for get_many operations")
+            found = store.get_many(cache_keys)
+            data = {"entries": {key: _lookup(found, key) for key in cache_keys}}
         elif operation == "set":
             if value is None:
                 raise ValueError("value is required for set operations")
-            cache[cache_key] = {
-                "value": value,
-                "stored_at": now.isoformat(),
-                "ttl_seconds": ttl_seconds,
-            }
-            _save_cache(cache)
+            store.set(cache_key, value, ttl_seconds)
             data = {"stored": True}
-        else:  # invalidate
-            removed = cache.pop(cache_key, None) is not None
-            _save_cache(cache)
-            data = {"invalidated": removed}
+        elif operation == "set_many":
+            if not entries:
+                raise ValueError("entries is required for set_many operations")
+            store.set_many(entries, ttl_seconds)
+            data = {"stored": len(entries)}
+        elif operation == "invalidate":
+            data = {"invalidated": store.delete(cache_key)}
+        else:
+            raise ValueError(f"Unsupported operation '{operation}'")
 
         return {
             "status": "success",
@@ -85,20 +102,42 @@ def response_cache_manager(
         }
 
 
-def _load_cache() -> dict[str, Any]:
-    if not os.path.exists(CACHE_PATH):
-        return {}
-    with open(CACHE_PATH, "r", encoding="utf-8") as handle:
-        try:
-            return json.load(handle)
-        except json.JSONDecodeError:
-            return {}
+def _lookup(found: dict[str, CacheEntry], key: str) -> dict[str, Any]:
+    entry = found.get(key)
+    if entry is None:
+        return {"hit": False, "data": None, "age_seconds": None}
+    age = entry.age()
+    if entry.expired():
+        return {"hit": False, "data": None, "age_seconds": age}
+    return {"hit": True, "data": entry.value, "age_seconds": round(age, 2)}
+
 
+def _get_store() -> SQLiteCache:
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None or str(_STORE.path) != str(CACHE_PATH):
+            if _STORE is not None:
+                _STORE.close()
+            _STORE = SQLiteCache(CACHE_PATH, max_entries=MAX_ENTRIES)
+            _import_legacy_cache(_STORE)
+        return _STORE
 
-def _save_cache(data: dict[str, Any]) -> None:
-    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
-    with open(CACHE_PATH, "w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2)
+
+def _import_legacy_cache(store: SQLiteCache) -> None:
+    """One-off import of the old JSON cache file, which is then renamed aside."""
+    if not os.path.exists(LEGACY_CACHE_PATH):
+        return
+    try:
+        with open(LEGACY_CACHE_PATH, "r", encoding="utf-8") as handle:
+            legacy = json.load(handle)
+        now = datetime.now(timezone.utc)
+        for key, entry in legacy.items():
+            remaining = entry["ttl_seconds"] - (now - datetime.fromisoformat(entry["stored_at"])).total_seconds()
+            if remaining > 0:
+                store.set(key, entry["value"], remaining)
+        os.replace(LEGACY_CACHE_PATH, LEGACY_CACHE_PATH + ".migrated")
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+        _log_lesson("response_cache_manager", f"legacy cache import skipped: {exc}")
 
 
 def _log_lesson(skill_name: str, error: str) -> None:
@@ -9,6 +9,8 @@ import base64
 import requests
 from datetime import datetime, timezone
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "gcp_cloud_scheduler",
     "description": (
@@ -39,7 +41,7 @@ def _get_token(sa_json: dict) -> str:
     key = serialization.load_pem_private_key(sa_json["private_key"].encode(), password=None)
     sig = key.sign(f"{hdr}.{pld}".encode(), padding.PKCS1v15(), hashes.SHA256())
     jwt = f"{hdr}.{pld}.{base64.urlsafe_b64encode(sig).rstrip(b'=').decode()}"
-    resp = requests.post("https://oauth2.googleapis.com/token",
+    resp = get_session().post("https://oauth2.googleapis.com/token",
                          data={"grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer", "assertion": jwt},
                          timeout=15)
     resp.raise_for_status()
@@ -98,7 +100,7 @@ def gcp_cloud_scheduler(
 
     try:
         if action == "list":
-            resp = requests.get(base_url, headers=headers, timeout=15)
+            resp = get_session().get(base_url, headers=headers, timeout=15)
             resp.raise_for_status()
             jobs = resp.json().get("jobs", [])
             return {
@@ -125,7 +127,7 @@ def gcp_cloud_scheduler(
 
         if action == "run_now":
             full_name = f"{parent}/jobs/{job_name}"
-            resp = requests.post(f"{SCHEDULER_BASE}/{full_name}:run", headers=headers, timeout=15)
+            resp = get_session().post(f"{SCHEDULER_BASE}/{full_name}:run", headers=headers, timeout=15)
             return {
                 "status": "ok" if resp.ok else "error",
                 "data": resp.json(),
@@ -149,7 +151,7 @@ def gcp_cloud_scheduler(
                     **({"body": body_b64, "headers": {"Content-Type": "application/json"}} if body_b64 else {}),
                 },
             }
-            resp = requests.post(base_url, headers=headers, json=job_body, timeout=15)
+            resp = get_session().post(base_url, headers=headers, json=job_body, timeout=15)
             resp.raise_for_status()
             return {
                 "status": "ok",
@@ -5,9 +5,10 @@ engagement history, star trade logs, and content calendar.
 """
 import os
 import json
-import requests
 from datetime import datetime, timezone
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "gcp_firestore_read",
     "description": (
@@ -39,7 +40,7 @@ def _get_token(sa_json: dict) -> str:
     sig = private_key.sign(f"{header}.{payload}".encode(), padding.PKCS1v15(), hashes.SHA256())
     sig_b64 = base64.urlsafe_b64encode(sig).rstrip(b"=").decode()
     jwt_token = f"{header}.{payload}.{sig_b64}"
-    resp = requests.post("https://oauth2.googleapis.com/token",
+    resp = get_session().post("https://oauth2.googleapis.com/token",
                          data={"grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer", "assertion": jwt_token},
                          timeout=15)
     resp.raise_for_status()
@@ -126,7 +127,7 @@ def gcp_firestore_read(
         if document_id:
             # Fetch single document
             url = f"{FIRESTORE_BASE}/{db_path}/{collection}/{document_id}"
-            resp = requests.get(url, headers=headers, timeout=15)
+            resp = get_session().get(url, headers=headers, timeout=15)
             if resp.status_code == 404:
                 return {
                     "status": "ok",
@@ -143,7 +144,7 @@ def gcp_firestore_read(
         else:
             # List collection
             url = f"{FIRESTORE_BASE}/{db_path}/{collection}"
-            resp = requests.get(url, headers=headers, params={"pageSize": limit}, timeout=15)
+            resp = get_session().get(url, headers=headers, params={"pageSize": limit}, timeout=15)
             resp.raise_for_status()
             data = resp.json()
             docs = [_parse_doc(d) for d in data.get("documents", [])]
@@ -8,6 +8,8 @@ import json
 import requests
 from datetime import datetime, timezone
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "gcp_firestore_write",
     "description": (
@@ -49,7 +51,7 @@ def _get_token(sa_json: dict) -> str:
     sig_b64 = base64.urlsafe_b64encode(signature).rstrip(b"=").decode()
     jwt_token = f"{header}.{payload}.{sig_b64}"
 
-    token_resp = requests.post(
+    token_resp = get_session().post(
         "https://oauth2.googleapis.com/token",
         data={
             "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
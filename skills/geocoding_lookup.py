@@ -29,9 +29,8 @@ Agent Notes:
 import os
 import time
 
-import requests
-
 from skills.utils import get_iso_timestamp, memory_cache
+from skills.utils.http_client import get_session
 
 TOOL_META = {
     "name": "geocoding_lookup",
@@ -129,7 +128,7 @@ def geocoding_lookup(
             params = {"address": address, "language": language, "key": key}
             if region:
                 params["region"] = region
-            resp = requests.get("https://maps.googleapis.com/maps/api/geocode/json", params=params, timeout=10)
+            resp = get_session().get("https://maps.googleapis.com/maps/api/geocode/json", params=params, timeout=10)
             resp.raise_for_status()
             body = resp.json()
             if body.get("status") != "OK" or not body.get("results"):
@@ -158,7 +157,7 @@ def geocoding_lookup(
             if latitude is None or longitude is None:
                 return {"status": "error", "data": {"error": "latitude and longitude required for reverse_geocode."}, "timestamp": _ts()}
             params = {"latlng": f"{latitude},{longitude}", "language": language, "key": key}
-            resp = requests.get("https://maps.googleapis.com/maps/api/geocode/json", params=params, timeout=10)
+            resp = get_session().get("https://maps.googleapis.com/maps/api/geocode/json", params=params, timeout=10)
             resp.raise_for_status()
             body = resp.json()
             if body.get("status") != "OK" or not body.get("results"):
@@ -187,7 +186,7 @@ def geocoding_lookup(
             payload = {"address": {"addressLines": [address]}}
             if region:
                 payload["address"]["regionCode"] = region.upper()
-            resp = requests.post(url, json=payload, timeout=10)
+            resp = get_session().post(url, json=payload, timeout=10)
             resp.raise_for_status()
             body = resp.json()
             result = body.get("result", {})
@@ -211,7 +210,7 @@ def geocoding_lookup(
                 return {"status": "error", "data": {"error": "latitude and longitude required for timezone."}, "timestamp": _ts()}
             ts = int(time.time())
             params = {"location": f"{latitude},{longitude}", "timestamp": ts, "key": key, "language": language}
-            resp = requests.get("https://maps.googleapis.com/maps/api/timezone/json", params=params, timeout=10)
+            resp = get_session().get("https://maps.googleapis.com/maps/api/timezone/json", params=params, timeout=10)
             resp.raise_for_status()
             body = resp.json()
             if body.get("status") != "OK":
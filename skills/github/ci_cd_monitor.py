@@ -19,6 +19,8 @@ import os
 import requests
 from datetime import datetime, timezone
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "ci_cd_monitor",
     "description": (
@@ -93,7 +95,7 @@ def ci_cd_monitor(
     try:
         if action == "latest_runs":
             url = f"{_GITHUB_API}/repos/{owner_repo}/actions/runs"
-            resp = requests.get(url, headers=headers, params={"per_page": limit})
+            resp = get_session().get(url, headers=headers, params={"per_page": limit})
             resp.raise_for_status()
             data = resp.json()
             
@@ -116,7 +118,7 @@ def ci_cd_monitor(
                 
             # Get run details
             run_url = f"{_GITHUB_API}/repos/{owner_repo}/actions/runs/{run_id}"
-            run_resp = requests.get(run_url, headers=headers)
+            run_resp = get_session().get(run_url, headers=headers)
             run_resp.raise_for_status()
             run_data = run_resp.json()
             
@@ -131,7 +133,7 @@ def ci_cd_monitor(
             # If failed, find the failed jobs/steps
             if run_data["conclusion"] == "failure":
                 jobs_url = f"{_GITHUB_API}/repos/{owner_repo}/actions/runs/{run_id}/jobs"
-                jobs_resp = requests.get(jobs_url, headers=headers)
+                jobs_resp = get_session().get(jobs_url, headers=headers)
                 
                 if jobs_resp.status_code == 200:
                     jobs_data = jobs_resp.json()
@@ -17,7 +17,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-import httpx
+from skills.utils.http_client import get_http_client
 
 logger = logging.getLogger("snowdrop.google_chat_send")
 
@@ -92,7 +92,7 @@ def google_chat_send(
         if thread_id:
             url += f"&threadKey={thread_id}&messageReplyOption=REPLY_MESSAGE_FALLBACK_TO_NEW_THREAD"
 
-        resp = httpx.post(url, json={"text": message_text}, timeout=30)
+        resp = get_http_client().post(url, json={"text": message_text}, timeout=30)
         resp.raise_for_status()
         result = resp.json()
 
@@ -222,9 +222,9 @@ def _summarize_with_openrouter(raw_intel: str) -> tuple[str | None, Exception |
         return None, Exception("OPENROUTER_API_KEY not set")
 
     try:
-        import httpx
+        from skills.utils.http_client import get_http_client
 
-        resp = httpx.post(
+        resp = get_http_client().post(
             "https://openrouter.ai/api/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -5,7 +5,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-import requests
+from skills.utils.http_client import get_session
 
 TOOL_META: dict[str, Any] = {
     "name": "github_issue_tracker",
@@ -57,7 +57,7 @@ def github_issue_tracker(
             "Accept": "application/vnd.github+json",
             "Authorization": f"Bearer {token}",
         }
-        response = requests.get(endpoint, params=params, headers=headers, timeout=10)
+        response = get_session().get(endpoint, params=params, headers=headers, timeout=10)
         response.raise_for_status()
         issues_payload = response.json()
         issues = []
@@ -12,8 +12,8 @@ field holding the SHA-256 of the previous line.  Deleting, inserting, or
 modifying any line breaks the chain and is detected immediately by this skill.
 
 Actions:
-  verify        — walk the full chain; return ok or suspicious with details
-  snapshot      — hash the last N lines + write to logs/integrity/YYYY-MM-DD.sha256
+  verify        — verify the chain from the last checkpoint (or in full); return ok or suspicious
+  snapshot      — verify, then write the tail hash to logs/integrity/YYYY-MM-DD.sha256
   check_deleted — detect if the log file was deleted and re-created (chain break at genesis)
 
 Outputs:
@@ -24,6 +24,10 @@ When "suspicious" is returned, the skill:
   2. Writes a local alert to logs/INTEGRITY_ALERT_<timestamp>.txt
   3. Returns status "suspicious" so the caller can trigger a post-mortem
 
+Verification is checkpointed in logs/integrity/checkpoint.json (byte offset,
+line count, tail hash, segment boundaries), so a daily run only reads lines
+appended since the previous one; a full re-walk of all segments runs weekly.
+
 Scheduling: run via the snowdrop-integrity systemd timer (daily at 03:00 UTC).
 The daily snapshot hash is committed to Git by the timer service, giving you
 version-controlled tamper evidence that is independent of the HP filesystem.
@@ -35,14 +39,22 @@ import base64
 import hashlib
 import json
 import logging
+import multiprocessing
 import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 import httpx
 
 from skills.utils.retry import retry
+from skills.utils.http_client import get_http_client
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +78,20 @@ TOOL_META = {
                 "type": "string",
                 "description": "Google Sheets URL for alerting (falls back to GHOST_LEDGER_URL env var).",
             },
+            "mode": {
+                "type": "string",
+                "enum": ["auto", "incremental", "full"],
+                "description": (
+                    "Chain verification for verify/snapshot: incremental resumes from the last "
+                    "checkpoint, full re-walks stored segments in parallel, auto picks full when "
+                    "one is due (default auto)."
+                ),
+            },
+            "workers": {
+                "type": "integer",
+                "minimum": 1,
+                "description": "Processes for re-walking segments in a full verify.",
+            },
         },
         "required": ["action"],
     },
@@ -88,6 +114,17 @@ _INVOCATION_LOG = _LOG_DIR / "invocations.jsonl"
 # caused `snap_path.relative_to(_REPO_ROOT)` to raise ValueError.
 _INTEGRITY_DIR = _REPO_ROOT / "logs" / "integrity"
 
+# Verification checkpoints (logs/integrity/checkpoint.json) record the verified
+# byte offset plus segment boundaries every _SEGMENT_BYTES, so verify resumes
+# where it stopped and a full verify can re-walk segments in parallel.
+_CHECKPOINT_VERSION = 1
+_SEGMENT_BYTES: int = int(os.environ.get("SNOWDROP_INTEGRITY_SEGMENT_BYTES", str(64 * 1024 * 1024)))
+# mode="auto" runs a full verify when the last one is older than this.
+_FULL_VERIFY_DAYS: float = float(os.environ.get("SNOWDROP_INTEGRITY_FULL_VERIFY_DAYS", "7"))
+# Processes used to re-walk segments during a full verify.
+_VERIFY_WORKERS: int = int(os.environ.get("SNOWDROP_INTEGRITY_WORKERS", str(min(4, os.cpu_count() or 1))))
+_READ_BUFFER = 1 << 20
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -132,54 +169,279 @@ def _write_local_alert(details: dict) -> Path:
     return alert_path
 
 
-def _verify_chain() -> dict:
-    """Walk invocations.jsonl and verify every prev_hash link.
-
-    Returns a dict with keys:
-      lines_checked, first_break_seq, first_break_line, status ("ok" or "suspicious")
-    """
-    if not _INVOCATION_LOG.exists():
-        return {"status": "ok", "lines_checked": 0, "note": "log file does not exist yet"}
+def _loads(body: bytes):
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals, which json accepts
+    return json.loads(body)
+
+
+def _line_body(raw: bytes) -> bytes:
+    """A raw line without its terminator, as the chain hashes it (text-mode newlines)."""
+    if raw.endswith(b"\n"):
+        raw = raw[:-1]
+    if raw.endswith(b"\r"):
+        raw = raw[:-1]
+    return raw
+
+
+def _scan(
+    path: Path,
+    start: int,
+    expected_prev_hash: str,
+    lines_checked: int,
+    segment: dict | None = None,
+    stop: int | None = None,
+    tail_offset: int | None = None,
+) -> dict:
+    """Verify prev_hash links from byte offset ``start`` to ``stop`` (or EOF).
 
-    lines_checked = 0
-    prev_line_text: str | None = None
-    expected_prev_hash: str = "genesis"
+    ``segment`` is the open segment {"start", "lines_before", "prev_hash"}; it
+    is closed into the returned "segments" list at the first line end at least
+    _SEGMENT_BYTES past its start. Line counts are absolute; ``tail_offset`` is
+    where the line hashed into ``expected_prev_hash`` starts, if known.
 
-    with open(_INVOCATION_LOG) as fh:
+    Returns the break details (status "suspicious") or status "ok" with
+    lines_checked and tail_hash, plus the checkpoint fields: offset and
+    line/tail state after the last complete line.
+    """
+    offset = start
+    state = {"offset": start, "lines": lines_checked, "tail_hash": expected_prev_hash, "tail_offset": tail_offset}
+    head = None
+    segments = []
+    with open(path, "rb", buffering=_READ_BUFFER) as fh:
+        fh.seek(start)
         for raw_line in fh:
-            raw_line = raw_line.rstrip("\n")
-            if not raw_line.strip():
-                continue
-            lines_checked += 1
-            try:
-                entry = json.loads(raw_line)
-            except json.JSONDecodeError:
-                return {
-                    "status": "suspicious",
-                    "lines_checked": lines_checked,
-                    "first_break_seq": None,
-                    "reason": f"JSON parse error at line {lines_checked}",
-                    "bad_line_preview": raw_line[:120],
-                }
-
-            actual_prev_hash = entry.get("prev_hash", "MISSING")
-            if actual_prev_hash != expected_prev_hash:
-                return {
-                    "status": "suspicious",
-                    "lines_checked": lines_checked,
-                    "first_break_seq": entry.get("seq"),
-                    "reason": "Hash chain broken — line was deleted, inserted, or modified",
-                    "expected_prev_hash": expected_prev_hash[:16] + "…",
-                    "actual_prev_hash": actual_prev_hash[:16] + "…",
-                }
-            # Advance: next line's expected prev_hash = SHA-256 of this line
-            expected_prev_hash = _sha256(raw_line)
-            prev_line_text = raw_line
+            line_start = offset
+            offset += len(raw_line)
+            body = _line_body(raw_line)
+            if body.strip():
+                lines_checked += 1
+                try:
+                    entry = _loads(body)
+                except ValueError:
+                    return {
+                        "status": "suspicious",
+                        "lines_checked": lines_checked,
+                        "first_break_seq": None,
+                        "reason": f"JSON parse error at line {lines_checked}",
+                        "bad_line_preview": body[:120].decode(errors="replace"),
+                    }
+                actual_prev_hash = entry.get("prev_hash", "MISSING") if isinstance(entry, dict) else "MISSING"
+                if actual_prev_hash != expected_prev_hash:
+                    return {
+                        "status": "suspicious",
+                        "lines_checked": lines_checked,
+                        "first_break_seq": entry.get("seq") if isinstance(entry, dict) else None,
+                        "reason": "Hash chain broken — line was deleted, inserted, or modified",
+                        "expected_prev_hash": expected_prev_hash[:16] + "…",
+                        "actual_prev_hash": str(actual_prev_hash)[:16] + "…",
+                    }
+                # Advance: next line's expected prev_hash = SHA-256 of this line
+                expected_prev_hash = hashlib.sha256(body).hexdigest()
+                if lines_checked == 1:
+                    head = {"head_offset": line_start, "head_hash": expected_prev_hash}
+                if raw_line.endswith(b"\n"):
+                    state["tail_offset"] = line_start
+            if raw_line.endswith(b"\n"):
+                # A final line without a newline may still be being written:
+                # it is verified, but the checkpoint stays before it.
+                state.update(offset=offset, lines=lines_checked, tail_hash=expected_prev_hash)
+                if segment is not None and offset - segment["start"] >= _SEGMENT_BYTES:
+                    segments.append({
+                        **segment,
+                        "end": offset,
+                        "lines": lines_checked,
+                        "tail_hash": expected_prev_hash,
+                        "tail_offset": state["tail_offset"],
+                    })
+                    segment = {"start": offset, "lines_before": lines_checked, "prev_hash": expected_prev_hash}
+            if stop is not None and offset >= stop:
+                break
 
     return {
         "status": "ok",
         "lines_checked": lines_checked,
         "tail_hash": expected_prev_hash,
+        "bytes_read": offset - start,
+        "checkpoint": state,
+        "head": head,
+        "segments": segments,
+    }
+
+
+def _verify_segment(log_path: str, segment: dict) -> dict | None:
+    """Re-walk one stored segment; None if it still links up exactly as recorded."""
+    result = _scan(Path(log_path), segment["start"], segment["prev_hash"], segment["lines_before"], stop=segment["end"])
+    if result["status"] != "ok":
+        return result
+    state = result["checkpoint"]
+    if (state["offset"], state["lines"], state["tail_hash"]) != (segment["end"], segment["lines"], segment["tail_hash"]):
+        return {
+            "status": "suspicious",
+            "lines_checked": result["lines_checked"],
+            "first_break_seq": None,
+            "reason": "Segment no longer ends where it was verified — lines were deleted, inserted, or modified",
+        }
+    return None
+
+
+def _checkpoint_path() -> Path:
+    return _INTEGRITY_DIR / "checkpoint.json"
+
+
+def _load_checkpoint() -> dict | None:
+    """The stored checkpoint for the current log file, if any."""
+    path = _checkpoint_path()
+    try:
+        checkpoint = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if checkpoint.get("version") != _CHECKPOINT_VERSION or checkpoint.get("log_file") != str(_INVOCATION_LOG):
+        return None
+    return checkpoint
+
+
+def _save_checkpoint(checkpoint: dict) -> None:
+    path = _checkpoint_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(checkpoint, indent=2))
+    os.replace(tmp, path)
+
+
+def _hash_line_at(offset: int) -> str:
+    with open(_INVOCATION_LOG, "rb") as fh:
+        fh.seek(offset)
+        return hashlib.sha256(_line_body(fh.readline())).hexdigest()
+
+
+def _full_verify_due(checkpoint: dict | None) -> bool:
+    if checkpoint is None or not checkpoint.get("last_full_verify"):
+        return True
+    last = datetime.fromisoformat(checkpoint["last_full_verify"])
+    return (datetime.now(timezone.utc) - last).total_seconds() >= _FULL_VERIFY_DAYS * 86400
+
+
+def _verify_segments(segments: list[dict], workers: int) -> dict | None:
+    """Re-walk stored segments (in parallel processes when workers > 1); first failure or None."""
+    if workers <= 1 or len(segments) <= 1:
+        failures = (_verify_segment(str(_INVOCATION_LOG), segment) for segment in segments)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(segments)), mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            failures = list(pool.map(_verify_segment, [str(_INVOCATION_LOG)] * len(segments), segments))
+    for index, failure in enumerate(failures):
+        if failure is not None:
+            segment = segments[index]
+            failure["segment"] = {"index": index, "start": segment["start"], "end": segment["end"]}
+            return failure
+    return None
+
+
+def _verify_chain(mode: str = "auto", workers: int | None = None) -> dict:
+    """Verify every prev_hash link in invocations.jsonl, resuming from the checkpoint.
+
+    Modes:
+      incremental — check that the first and last verified lines are unchanged,
+                    then walk only bytes appended since the checkpoint.
+      full        — re-walk every stored segment independently (its chain must
+                    run from the stored start hash to the stored end hash; in
+                    parallel across ``workers`` processes), then walk the rest.
+                    Without a checkpoint this walks from genesis.
+      auto        — full when none has run for SNOWDROP_INTEGRITY_FULL_VERIFY_DAYS,
+                    otherwise incremental.
+
+    A successful run stores a new checkpoint in logs/integrity/checkpoint.json.
+    Delete that file to accept a log that was legitimately re-created.
+
+    Returns a dict with keys:
+      status ("ok" or "suspicious"), lines_checked, tail_hash, mode, plus
+      first_break_seq / reason details when suspicious.
+    """
+    if not _INVOCATION_LOG.exists():
+        return {"status": "ok", "lines_checked": 0, "note": "log file does not exist yet"}
+    if mode not in ("auto", "incremental", "full"):
+        raise ValueError(f"Unknown verify mode '{mode}'. Use: auto, incremental, full")
+
+    checkpoint = _load_checkpoint()
+    if mode == "auto":
+        mode = "full" if _full_verify_due(checkpoint) else "incremental"
+    if mode == "incremental" and checkpoint is None:
+        mode = "full"
+    segments: list[dict] = list(checkpoint.get("segments", [])) if checkpoint else []
+
+    if checkpoint is not None and _INVOCATION_LOG.stat().st_size < checkpoint["offset"]:
+        return {
+            "status": "suspicious",
+            "mode": mode,
+            "lines_checked": checkpoint["lines"],
+            "first_break_seq": None,
+            "reason": "Log is shorter than the last verified offset — lines were deleted or the file was replaced",
+        }
+
+    if mode == "incremental":
+        if checkpoint.get("head_hash") and _hash_line_at(checkpoint["head_offset"]) != checkpoint["head_hash"]:
+            return {
+                "status": "suspicious",
+                "mode": mode,
+                "lines_checked": 1,
+                "first_break_seq": None,
+                "reason": "First line changed since the last verification — log was re-created or rewritten",
+            }
+        if checkpoint.get("tail_offset") is not None and _hash_line_at(checkpoint["tail_offset"]) != checkpoint["tail_hash"]:
+            return {
+                "status": "suspicious",
+                "mode": mode,
+                "lines_checked": checkpoint["lines"],
+                "first_break_seq": None,
+                "reason": "Last verified line was modified since the last verification",
+            }
+        start, prev_hash, lines = checkpoint["offset"], checkpoint["tail_hash"], checkpoint["lines"]
+        tail_offset = checkpoint.get("tail_offset")
+    else:
+        failure = _verify_segments(segments, _VERIFY_WORKERS if workers is None else workers)
+        if failure is not None:
+            return {**failure, "mode": mode}
+        if segments:
+            last = segments[-1]
+            start, prev_hash, lines, tail_offset = last["end"], last["tail_hash"], last["lines"], last.get("tail_offset")
+        else:
+            start, prev_hash, lines, tail_offset = 0, "genesis", 0, None
+
+    if segments:
+        last = segments[-1]
+        open_segment = {"start": last["end"], "lines_before": last["lines"], "prev_hash": last["tail_hash"]}
+    else:
+        open_segment = {"start": 0, "lines_before": 0, "prev_hash": "genesis"}
+    result = _scan(_INVOCATION_LOG, start, prev_hash, lines, segment=open_segment, tail_offset=tail_offset)
+    if result["status"] != "ok":
+        return {**result, "mode": mode}
+
+    now = _now_iso()
+    head = result["head"]
+    if head is None and checkpoint is not None:
+        head = {"head_offset": checkpoint.get("head_offset"), "head_hash": checkpoint.get("head_hash")}
+    _save_checkpoint({
+        "version": _CHECKPOINT_VERSION,
+        "log_file": str(_INVOCATION_LOG),
+        **result["checkpoint"],
+        **(head or {"head_offset": None, "head_hash": None}),
+        "segments": segments + result["segments"],
+        "verified_at": now,
+        "last_full_verify": now if mode == "full" else checkpoint.get("last_full_verify"),
+    })
+    return {
+        "status": "ok",
+        "mode": mode,
+        "lines_checked": result["lines_checked"],
+        "tail_hash": result["tail_hash"],
+        "resumed_from_offset": start,
+        "bytes_read": result["bytes_read"],
+        "segments_verified": len(segments) if mode == "full" else 0,
     }
 
 
@@ -190,7 +452,7 @@ _GITHUB_API = "https://api.github.com"
 @retry(attempts=3, backoff_seconds=1.0, jitter=0.3, retriable_exceptions=(httpx.HTTPStatusError, httpx.ConnectError, httpx.TimeoutException))
 def _github_api_get(url: str, headers: dict) -> httpx.Response:
     """GET from GitHub API with retry on transient errors."""
-    resp = httpx.get(url, headers=headers, timeout=15.0)
+    resp = get_http_client().get(url, headers=headers, timeout=15.0)
     if resp.status_code == 429:
         resp.raise_for_status()  # trigger retry
     return resp
@@ -283,9 +545,9 @@ def _commit_snapshot_local(snap_path: Path, today: str, lines_checked: int, tail
         return f"error: {exc}"
 
 
-def _write_snapshot() -> dict:
+def _write_snapshot(mode: str = "auto", workers: int | None = None) -> dict:
     """Write today's tail hash to logs/integrity/YYYY-MM-DD.sha256 and commit to Git."""
-    chain_result = _verify_chain()
+    chain_result = _verify_chain(mode, workers)
     if chain_result["status"] == "suspicious":
         return chain_result  # don't snapshot a broken chain
 
@@ -319,14 +581,20 @@ def _write_snapshot() -> dict:
 def log_integrity(
     action: str,
     ghost_ledger_url: str = "",
+    mode: str = "auto",
+    workers: int | None = None,
 ) -> dict:
-    """Verify Snowdrop's invocation log hash chain and alert on tampering."""
+    """Verify Snowdrop's invocation log hash chain and alert on tampering.
+
+    verify and snapshot resume from the last checkpoint; see _verify_chain
+    for the ``mode`` and ``workers`` options.
+    """
     _INTEGRITY_DIR.mkdir(parents=True, exist_ok=True)
     ledger_url = ghost_ledger_url or os.environ.get("GHOST_LEDGER_URL", "")
 
     try:
         if action == "verify":
-            result = _verify_chain()
+            result = _verify_chain(mode, workers)
             if result["status"] == "suspicious":
                 alert_path = _write_local_alert(result)
                 result["alert_file"] = str(alert_path)
@@ -341,7 +609,7 @@ def log_integrity(
             return _wrap(result["status"], result)
 
         elif action == "snapshot":
-            result = _write_snapshot()
+            result = _write_snapshot(mode, workers)
             if result.get("status") == "suspicious":
                 alert_path = _write_local_alert(result)
                 result["alert_file"] = str(alert_path)
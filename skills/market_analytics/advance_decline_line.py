@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "advance_decline_line",
+    "deterministic": True,
     "description": "Builds the cumulative Advance-Decline line and optional McClellan oscillator signal.",
     "inputSchema": {
         "type": "object",
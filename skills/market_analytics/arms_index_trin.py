@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "arms_index_trin",
+    "deterministic": True,
     "description": "Computes TRIN as (Adv/Dec)/(AdvVol/DecVol) and averages it to identify overbought/oversold.",
     "inputSchema": {
         "type": "object",
@@ -15,6 +15,7 @@ TRADING_DAYS = 252
 
 TOOL_META = {
     "name": "benchmark_relative_performance",
+    "deterministic": True,
     "description": "Calculates performance statistics versus a benchmark including capture ratios and tracking error.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "beta_calculator",
+    "deterministic": True,
     "description": "Computes beta, correlation, alpha, systematic contribution, and residual risk relative to a benchmark.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "book_value_analyzer",
+    "deterministic": True,
     "description": "Computes book/tangible book per share and related valuation ratios.",
     "inputSchema": {
         "type": "object",
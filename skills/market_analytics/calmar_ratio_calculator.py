@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "calmar_ratio_calculator",
+    "deterministic": True,
     "description": "Computes the Calmar ratio using cumulative returns and drawdown analysis.",
     "inputSchema": {
         "type": "object",
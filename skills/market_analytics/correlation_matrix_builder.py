@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "correlation_matrix_builder",
+    "deterministic": True,
     "description": "Computes Pearson correlations across multiple return series to assess diversification.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "covered_call_analyzer",
+    "deterministic": True,
     "description": "Computes payoff, breakeven, and annualized returns for a covered call position.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "currency_adjusted_return",
+    "deterministic": True,
     "description": "Adjusts local returns for FX moves to measure base-currency performance.",
     "inputSchema": {
         "type": "object",
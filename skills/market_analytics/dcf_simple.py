@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "dcf_simple",
+    "deterministic": True,
     "description": "Discounts forecast free cash flows and a Gordon terminal value to estimate EV.",
     "inputSchema": {
         "type": "object",
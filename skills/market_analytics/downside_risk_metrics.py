@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "downside_risk_metrics",
+    "deterministic": True,
     "description": "Computes downside deviation, upside potential ratio, gain/loss ratio, and Bernardo-Ledoit ratio.",
     "inputSchema": {
         "type": "object",
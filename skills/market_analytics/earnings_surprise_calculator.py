@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "earnings_surprise_calculator",
+    "deterministic": True,
     "description": "Calculates EPS surprise percentage, SUE proxy, and price-drift implications (PEAD).",
     "inputSchema": {
         "type": "object",
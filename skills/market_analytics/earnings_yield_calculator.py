@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "earnings_yield_calculator",
+    "deterministic": True,
     "description": "Computes earnings yield (inverse P/E) and compares against the 10Y Treasury yield.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "ev_ebitda_comparator",
+    "deterministic": True,
     "description": "Computes EV/EBITDA multiples per company, sector median, and growth-adjusted comparisons.",
     "inputSchema": {
         "type": "object",
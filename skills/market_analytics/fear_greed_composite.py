@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "fear_greed_composite",
+    "deterministic": True,
     "description": "Combines multiple sentiment metrics into a 0-100 fear/greed composite score.",
     "inputSchema": {
         "type": "object",
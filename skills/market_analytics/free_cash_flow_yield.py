@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "free_cash_flow_yield",
+    "deterministic": True,
     "description": "Derives free cash flow yield and compares against earnings/dividend yields when available.",
     "inputSchema": {
         "type": "object",
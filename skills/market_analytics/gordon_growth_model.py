@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "gordon_growth_model",
+    "deterministic": True,
     "description": "Computes intrinsic value using Gordon Growth, plus yield and growth sensitivity.",
     "inputSchema": {
         "type": "object",
@@ -15,6 +15,7 @@ TRADING_DAYS = 252
 
 TOOL_META = {
     "name": "information_ratio_calculator",
+    "deterministic": True,
     "description": "Computes Information Ratio, tracking error, active return, and hit rate.",
     "inputSchema": {
         "type": "object",
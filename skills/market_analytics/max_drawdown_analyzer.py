@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "max_drawdown_analyzer",
+    "deterministic": True,
     "description": "Computes drawdown statistics, including top drawdowns and recovery metrics.",
     "inputSchema": {
         "type": "object",
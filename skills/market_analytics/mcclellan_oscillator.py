@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "mcclellan_oscillator",
+    "deterministic": True,
     "description": "Calculates McClellan Oscillator (EMA19-EMA39) and the Summation Index to gauge breadth thrusts.",
     "inputSchema": {
         "type": "object",
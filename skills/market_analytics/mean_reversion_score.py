@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "mean_reversion_score",
+    "deterministic": True,
     "description": "Computes z-score of price versus rolling mean and estimates Ornstein-Uhlenbeck half-life.",
     "inputSchema": {
         "type": "object",
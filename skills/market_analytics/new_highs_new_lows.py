@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "new_highs_new_lows",
+    "deterministic": True,
     "description": "Computes new-high minus new-low series, ratios, and signals.",
     "inputSchema": {
         "type": "object",
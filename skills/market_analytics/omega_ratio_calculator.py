@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "omega_ratio_calculator",
+    "deterministic": True,
     "description": "Computes Omega = sum(max(r-threshold,0)) / sum(max(threshold-r,0)).",
     "inputSchema": {
         "type": "object",
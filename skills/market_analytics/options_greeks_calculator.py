@@ -5,14 +5,16 @@ Outputs: price (float), delta (float), gamma (float), theta (float), vega (float
 MCP Tool Name: options_greeks_calculator
 """
 import logging
-import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.black_scholes import greeks
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "options_greeks_calculator",
+    "deterministic": True,
     "description": "Computes Black-Scholes option price and Greeks for calls and puts.",
     "inputSchema": {
         "type": "object",
@@ -47,21 +49,10 @@ def options_greeks_calculator(**kwargs: Any) -> dict:
         if option_type not in {"call", "put"}:
             raise ValueError("option_type must be 'call' or 'put'")
 
-        d1 = (math.log(s / k) + (r + 0.5 * vol ** 2) * t) / (vol * math.sqrt(t))
-        d2 = d1 - vol * math.sqrt(t)
-        nd1 = _norm_cdf(d1)
-        nd2 = _norm_cdf(d2)
-        price = s * nd1 - k * math.exp(-r * t) * nd2 if option_type == "call" else k * math.exp(-r * t) * _norm_cdf(-d2) - s * _norm_cdf(-d1)
-        delta = nd1 if option_type == "call" else nd1 - 1
-        gamma = _norm_pdf(d1) / (s * vol * math.sqrt(t))
-        theta = (
-            - (s * _norm_pdf(d1) * vol) / (2 * math.sqrt(t))
-            - r * k * math.exp(-r * t) * nd2
-            if option_type == "call"
-            else - (s * _norm_pdf(d1) * vol) / (2 * math.sqrt(t)) + r * k * math.exp(-r * t) * _norm_cdf(-d2)
+        g = greeks(s, k, t, r, vol, option_type)
+        price, delta, gamma, theta, vega, rho = (
+            float(g[key]) for key in ("price", "delta", "gamma", "theta", "vega", "rho")
         )
-        vega = s * _norm_pdf(d1) * math.sqrt(t)
-        rho = k * t * math.exp(-r * t) * nd2 if option_type == "call" else -k * t * math.exp(-r * t) * _norm_cdf(-d2)
         intrinsic = max(s - k, 0) if option_type == "call" else max(k - s, 0)
         time_value = price - intrinsic
 
@@ -89,14 +80,6 @@ def options_greeks_calculator(**kwargs: Any) -> dict:
         }
 
 
-def _norm_pdf(x: float) -> float:
-    return math.exp(-0.5 * x * x) / math.sqrt(2 * math.pi)
-
-
-def _norm_cdf(x: float) -> float:
-    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
-
-
 def _log_lesson(message: str) -> None:
     try:
         with open("logs/lessons.md", "a") as f:
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "options_implied_move",
+    "deterministic": True,
     "description": "Converts ATM straddle pricing into implied move, range, and annualized IV approximation.",
     "inputSchema": {
         "type": "object",
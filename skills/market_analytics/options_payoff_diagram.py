@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "options_payoff_diagram",
+    "deterministic": True,
     "description": "Calculates strategy payoff across a price grid and identifies basic spread types.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "pain_ratio_calculator",
+    "deterministic": True,
     "description": "Computes the Pain Index (average drawdown magnitude) and Pain Ratio (return/Pain).",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "peg_ratio_calculator",
+    "deterministic": True,
     "description": "Evaluates PEG ratio relative to growth and adjusts for dividend yield when provided.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "percent_above_ma",
+    "deterministic": True,
     "description": "Calculates % of symbols above their moving average to gauge breadth thrusts.",
     "inputSchema": {
         "type": "object",
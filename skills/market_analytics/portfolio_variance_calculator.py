@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "portfolio_variance_calculator",
+    "deterministic": True,
     "description": "Computes covariance matrix, portfolio variance/volatility, and risk contributions from asset weights.",
     "inputSchema": {
         "type": "object",
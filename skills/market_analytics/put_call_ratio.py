@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "put_call_ratio",
+    "deterministic": True,
     "description": "Tracks put/call ratios to identify fear vs greed sentiment zones.",
     "inputSchema": {
         "type": "object",
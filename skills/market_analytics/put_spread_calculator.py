@@ -15,6 +15,7 @@ CONTRACT_SIZE = 100
 
 TOOL_META = {
     "name": "put_spread_calculator",
+    "deterministic": True,
     "description": "Calculates payoff metrics for bull or bear put spreads.",
     "inputSchema": {
         "type": "object",
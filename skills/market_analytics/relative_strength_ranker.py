@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "relative_strength_ranker",
+    "deterministic": True,
     "description": "Computes total returns over multiple lookbacks and ranks assets by composite score.",
     "inputSchema": {
         "type": "object",
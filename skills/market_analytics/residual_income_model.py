@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "residual_income_model",
+    "deterministic": True,
     "description": "Discounts residual incomes plus current book value to estimate intrinsic value.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "reverse_dcf",
+    "deterministic": True,
     "description": "Derives the growth rate required to justify the current market capitalization.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "risk_parity_weights",
+    "deterministic": True,
     "description": "Approximates risk-parity allocation via inverse volatility and reports risk contributions.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "rolling_risk_analyzer",
+    "deterministic": True,
     "description": "Computes rolling Sharpe, max drawdown, beta (optional), and detects volatility regime shifts.",
     "inputSchema": {
         "type": "object",
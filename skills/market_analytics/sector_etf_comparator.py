@@ -15,6 +15,7 @@ TRADING_DAYS = 252
 
 TOOL_META = {
     "name": "sector_etf_comparator",
+    "deterministic": True,
     "description": "Ranks sector ETFs by performance metrics over a labelled period.",
     "inputSchema": {
         "type": "object",
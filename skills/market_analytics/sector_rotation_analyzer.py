@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "sector_rotation_analyzer",
+    "deterministic": True,
     "description": "Measures sector relative strength and assigns rotation phases (leading/lagging/etc.).",
     "inputSchema": {
         "type": "object",
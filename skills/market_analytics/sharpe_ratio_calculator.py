@@ -15,6 +15,7 @@ TRADING_DAYS = 252
 
 TOOL_META = {
     "name": "sharpe_ratio_calculator",
+    "deterministic": True,
     "description": "Computes annualized Sharpe ratio, return, and volatility for a return series.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "skewness_kurtosis_analyzer",
+    "deterministic": True,
     "description": "Computes skewness, kurtosis, and Jarque-Bera statistic for return distributions.",
     "inputSchema": {
         "type": "object",
@@ -15,6 +15,7 @@ TRADING_DAYS = 252
 
 TOOL_META = {
     "name": "sortino_ratio_calculator",
+    "deterministic": True,
     "description": "Computes Sortino ratio with downside deviation and contextualizes relative to Sharpe.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "tail_ratio_calculator",
+    "deterministic": True,
     "description": "Calculates right-tail/left-tail ratio plus skewness and kurtosis for fat-tail detection.",
     "inputSchema": {
         "type": "object",
@@ -15,6 +15,7 @@ TRADING_DAYS = 252
 
 TOOL_META = {
     "name": "tracking_error_calculator",
+    "deterministic": True,
     "description": "Computes tracking error, active return, and a rough active-share proxy from return differences.",
     "inputSchema": {
         "type": "object",
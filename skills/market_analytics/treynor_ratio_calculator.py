@@ -15,6 +15,7 @@ TRADING_DAYS = 252
 
 TOOL_META = {
     "name": "treynor_ratio_calculator",
+    "deterministic": True,
     "description": "Computes Treynor ratio, beta, Jensen's alpha, and systematic risk contribution.",
     "inputSchema": {
         "type": "object",
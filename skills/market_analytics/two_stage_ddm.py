@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "two_stage_ddm",
+    "deterministic": True,
     "description": "Discounts dividends through a high-growth phase and a terminal perpetuity.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "value_at_risk_historical",
+    "deterministic": True,
     "description": "Computes historical VaR by sampling past returns and scaling by the desired horizon.",
     "inputSchema": {
         "type": "object",
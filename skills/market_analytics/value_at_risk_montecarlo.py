@@ -16,6 +16,8 @@ TRADING_DAYS = 252
 
 TOOL_META = {
     "name": "value_at_risk_montecarlo",
+    "executor": "process",
+    "timeout_seconds": 300,
     "description": "Simulates returns via a Gaussian process to estimate VaR and expected shortfall.",
     "inputSchema": {
         "type": "object",
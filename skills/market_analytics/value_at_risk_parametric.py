@@ -21,6 +21,7 @@ Z_LOOKUP = {
 
 TOOL_META = {
     "name": "value_at_risk_parametric",
+    "deterministic": True,
     "description": "Computes Gaussian VaR and expected shortfall over a specified horizon.",
     "inputSchema": {
         "type": "object",
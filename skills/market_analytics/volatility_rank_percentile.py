@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "volatility_rank_percentile",
+    "deterministic": True,
     "description": "Calculates IV rank and percentile to understand volatility regimes.",
     "inputSchema": {
         "type": "object",
@@ -5,7 +5,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-import requests
+from skills.utils.http_client import pooled_client
 
 TOOL_META: dict[str, Any] = {
     "name": "macro_indicator_tracker",
@@ -82,7 +82,8 @@ def _fetch_series(series_id: str, limit: int, api_key: str) -> dict[str, Any]:
         "sort_order": "desc",
         "limit": limit,
     }
-    response = requests.get(endpoint, params=params, timeout=15)
+    with pooled_client(timeout=15, cache="fred") as client:
+        response = client.get(endpoint, params=params)
     response.raise_for_status()
     data = response.json()
     observations = data.get("observations", [])
@@ -5,7 +5,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-import requests
+from skills.utils.http_client import get_session
 
 TOOL_META: dict[str, Any] = {
     "name": "market_data_fetcher",
@@ -58,7 +58,7 @@ def market_data_fetcher(
             "vs_currencies": vs_currency,
             "include_24hr_change": "true",
         }
-        response = requests.get(endpoint, params=params, headers=headers, timeout=10)
+        response = get_session().get(endpoint, params=params, headers=headers, timeout=10)
         response.raise_for_status()
         payload = response.json()
         quotes: dict[str, dict[str, Any]] = {}
@@ -1,14 +1,16 @@
 """Persistent semantic memory store for Snowdrop."""
 from __future__ import annotations
 
-import json
 import os
+import threading
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.memory_index import MemoryIndex
+
 TOOL_META: dict[str, Any] = {
     "name": "long_term_memory_store",
-    "description": "Append-only JSONL memory store with taggable search and CRUD operations.",
+    "description": "Indexed append-only JSONL memory store with paginated tag search and CRUD operations.",
     "inputSchema": {
         "type": "object",
         "properties": {
@@ -23,8 +25,16 @@ TOOL_META: dict[str, Any] = {
                 "items": {"type": "string"},
                 "description": "Semantic tags for retrieval",
             },
+            "limit": {"type": "integer", "default": 100, "description": "Search page size."},
+            "offset": {"type": "integer", "default": 0, "description": "Search matches to skip (use next_offset)."},
+            "order": {
+                "type": "string",
+                "enum": ["asc", "desc"],
+                "default": "asc",
+                "description": "Search result order by timestamp.",
+            },
         },
-        "required": ["operation", "key"],
+        "required": ["operation"],
     },
     "outputSchema": {
         "type": "object",
@@ -37,13 +47,20 @@ TOOL_META: dict[str, Any] = {
 }
 
 _MEMORY_FILE = "logs/memory_store.jsonl"
+_MAX_PAGE_SIZE = 1000
+
+_INDEX: MemoryIndex | None = None
+_INDEX_LOCK = threading.Lock()
 
 
 def long_term_memory_store(
     operation: str,
-    key: str,
+    key: str = "",
     value: Any | None = None,
     tags: list[str] | None = None,
+    limit: int = 100,
+    offset: int = 0,
+    order: str = "asc",
     **_: Any,
 ) -> dict[str, Any]:
     """CRUD interface for Snowdrop's long-term memory JSONL file."""
@@ -51,42 +68,34 @@ def long_term_memory_store(
         op = operation.lower()
         if op not in {"read", "write", "search", "delete"}:
             raise ValueError("operation must be one of read/write/search/delete")
-        if not key:
+        if not key and op != "search":
             raise ValueError("key cannot be empty")
 
-        os.makedirs(os.path.dirname(_MEMORY_FILE), exist_ok=True)
-        entries = _load_entries()
+        index = _get_index()
 
         if op == "write":
-            record = {
-                "key": key,
-                "value": value,
-                "tags": tags or [],
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-            with open(_MEMORY_FILE, "a", encoding="utf-8") as handle:
-                handle.write(json.dumps(record) + "\n")
+            record = index.write(key, value, tags)
             data = {"result": "written", "record": record}
         elif op == "read":
-            matches = [entry for entry in entries if entry.get("key") == key]
-            data = {"matches": matches}
+            data = {"matches": index.read(key)}
         elif op == "search":
-            tag_set = set((tags or []))
-            if not tag_set:
+            if not tags:
                 raise ValueError("tags are required for search")
-            filtered = [
-                entry
-                for entry in entries
-                if tag_set.intersection(entry.get("tags", []))
-            ]
-            data = {"matches": filtered}
+            if order not in ("asc", "desc"):
+                raise ValueError("order must be 'asc' or 'desc'")
+            limit = min(max(int(limit), 1), _MAX_PAGE_SIZE)
+            offset = max(int(offset), 0)
+            matches, total = index.search(tags, offset=offset, limit=limit, newest_first=order == "desc")
+            next_offset = offset + len(matches)
+            data = {
+                "matches": matches,
+                "total": total,
+                "offset": offset,
+                "limit": limit,
+                "next_offset": next_offset if next_offset < total else None,
+            }
         else:  # delete
-            remaining = [entry for entry in entries if entry.get("key") != key]
-            removed = len(entries) - len(remaining)
-            with open(_MEMORY_FILE, "w", encoding="utf-8") as handle:
-                for entry in remaining:
-                    handle.write(json.dumps(entry) + "\n")
-            data = {"removed": removed}
+            data = {"removed": index.delete(key)}
 
         return {
             "status": "success",
@@ -102,20 +111,12 @@ def long_term_memory_store(
         }
 
 
-def _load_entries() -> list[dict[str, Any]]:
-    if not os.path.exists(_MEMORY_FILE):
-        return []
-    entries: list[dict[str, Any]] = []
-    with open(_MEMORY_FILE, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return entries
+def _get_index() -> MemoryIndex:
+    global _INDEX
+    with _INDEX_LOCK:
+        if _INDEX is None or str(_INDEX.path) != os.path.abspath(_MEMORY_FILE):
+            _INDEX = MemoryIndex(os.path.abspath(_MEMORY_FILE))
+        return _INDEX
 
 
 def _log_lesson(skill_name: str, error: str) -> None:
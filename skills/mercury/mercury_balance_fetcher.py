@@ -5,7 +5,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-import requests
+from skills.utils.http_client import get_session
 
 API_BASE = "https://api.mercury.com/api/v1"
 
@@ -47,7 +47,7 @@ def mercury_balance_fetcher(status: str | None = None, **_: Any) -> dict[str, An
 
         headers = {"Authorization": f"Bearer {token}"}
         params = {"status": status} if status else None
-        response = requests.get(f"{API_BASE}/accounts", headers=headers, params=params, timeout=15)
+        response = get_session().get(f"{API_BASE}/accounts", headers=headers, params=params, timeout=15)
         response.raise_for_status()
         payload = response.json()
         accounts = payload.get("accounts", payload.get("data", []))
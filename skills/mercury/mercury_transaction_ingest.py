@@ -5,7 +5,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-import requests
+from skills.utils.http_client import get_session
 
 API_BASE = "https://api.mercury.com/api/v1"
 
@@ -55,7 +55,7 @@ def mercury_transaction_ingest(
         params: dict[str, Any] = {"start": start_date, "end": end_date}
         if limit:
             params["limit"] = limit
-        response = requests.get(
+        response = get_session().get(
             f"{API_BASE}/transactions",
             headers=headers,
             params=params,
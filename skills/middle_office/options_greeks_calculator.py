@@ -1,10 +1,11 @@
 """Black-Scholes option Greek calculator."""
 from __future__ import annotations
 
-import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.black_scholes import greeks
+
 TOOL_META: dict[str, Any] = {
     "name": "options_greeks_calculator",
     "description": "Returns price and Greeks for European options via Black-Scholes.",
@@ -31,14 +32,6 @@ TOOL_META: dict[str, Any] = {
 }
 
 
-def _norm_cdf(x: float) -> float:
-    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
-
-
-def _norm_pdf(x: float) -> float:
-    return math.exp(-0.5 * x * x) / math.sqrt(2 * math.pi)
-
-
 def options_greeks_calculator(
     spot: float,
     strike: float,
@@ -55,30 +48,12 @@ def options_greeks_calculator(
             raise ValueError("spot, strike, and time_to_expiry must be positive")
         sigma = volatility / 100 if volatility > 1 else volatility
         r = rate / 100 if rate > 1 else rate
-        sqrt_t = math.sqrt(time_to_expiry)
-        d1 = (math.log(spot / strike) + (r + 0.5 * sigma**2) * time_to_expiry) / (sigma * sqrt_t)
-        d2 = d1 - sigma * sqrt_t
-        if option_type == "call":
-            price = spot * _norm_cdf(d1) - strike * math.exp(-r * time_to_expiry) * _norm_cdf(d2)
-            delta = _norm_cdf(d1)
-        elif option_type == "put":
-            price = strike * math.exp(-r * time_to_expiry) * _norm_cdf(-d2) - spot * _norm_cdf(-d1)
-            delta = _norm_cdf(d1) - 1
-        else:
+        if option_type not in {"call", "put"}:
             raise ValueError("option_type must be call or put")
-        gamma = _norm_pdf(d1) / (spot * sigma * sqrt_t)
-        theta = (
-            -spot * _norm_pdf(d1) * sigma / (2 * sqrt_t)
-            - r * strike * math.exp(-r * time_to_expiry) * (_norm_cdf(d2) if option_type == "call" else _norm_cdf(-d2))
-        )
-        vega = spot * _norm_pdf(d1) * sqrt_t / 100
-        rho = (
-            strike
-            * time_to_expiry
-            * math.exp(-r * time_to_expiry)
-            * (_norm_cdf(d2) if option_type == "call" else -_norm_cdf(-d2))
-            / 100
-        )
+        g = greeks(spot, strike, time_to_expiry, r, sigma, option_type)
+        price, delta, gamma, theta = (float(g[key]) for key in ("price", "delta", "gamma", "theta"))
+        vega = float(g["vega"]) / 100
+        rho = float(g["rho"]) / 100
         data = {
             "option_price": round(price, 6),
             "delta": round(delta, 6),
@@ -52,6 +52,7 @@ def _regular_tax(filing_status: str, taxable_income: float) -> float:
 
 TOOL_META = {
     "name": "amt_calculator",
+    "deterministic": True,
     "description": (
         "Calculates Alternative Minimum Tax income, exemption phase-out, tentative "
         "minimum tax, and resulting liability versus the regular tax system."
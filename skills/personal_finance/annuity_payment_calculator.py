@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "annuity_payment_calculator",
+    "deterministic": True,
     "description": (
         "Determines the periodic payment required to amortize a balance, including "
         "summary stats for total paid, interest, and early amortization snapshots."
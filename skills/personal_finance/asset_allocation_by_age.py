@@ -14,6 +14,7 @@ RISK_ADJUSTMENTS = {"conservative": -0.1, "moderate": 0.0, "aggressive": 0.1}
 
 TOOL_META = {
     "name": "asset_allocation_by_age",
+    "deterministic": True,
     "description": (
         "Applies a modified age-based formula to recommend stock/bond/cash/alt "
         "allocations and produces a glide path toward retirement."
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "auto_loan_calculator",
+    "deterministic": True,
     "description": (
         "Builds a car financing model covering tax, amount financed, monthly payment, "
         "and total interest across the loan term."
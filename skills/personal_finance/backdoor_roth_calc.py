@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "backdoor_roth_calc",
+    "deterministic": True,
     "description": (
         "Applies the IRS pro-rata rule to a backdoor Roth IRA conversion and reports the "
         "taxable portion, estimated tax bill, and feasibility guidance."
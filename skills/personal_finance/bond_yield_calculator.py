@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "bond_yield_calculator",
+    "deterministic": True,
     "description": (
         "Provides quick estimates for a bond's current yield, yield to maturity, yield to "
         "call, and duration approximation from price and coupon inputs."
@@ -55,6 +55,7 @@ def _marginal_tax(brackets: List[Tuple[float, float]], income: float) -> float:
 
 TOOL_META = {
     "name": "capital_gains_tax_calculator",
+    "deterministic": True,
     "description": (
         "Splits gains into short- and long-term buckets, applies 2024 tax brackets, and "
         "checks 3.8% NIIT applicability based on filing status and income."
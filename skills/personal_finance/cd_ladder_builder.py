@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "cd_ladder_builder",
+    "deterministic": True,
     "description": (
         "Constructs a certificate-of-deposit ladder by distributing capital across "
         "available terms, reporting allocation, weighted yield, and liquidity schedule."
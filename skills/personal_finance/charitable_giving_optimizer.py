@@ -41,6 +41,7 @@ def _marginal_rate(filing_status: str, income: float) -> float:
 
 TOOL_META = {
     "name": "charitable_giving_optimizer",
+    "deterministic": True,
     "description": (
         "Applies IRS AGI limits for cash (60%) and appreciated asset (30%) donations and "
         "advises whether gifting stock yields higher tax savings."
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "compound_interest_calculator",
+    "deterministic": True,
     "description": (
         "Calculates the future value of an investment with compound interest, returning "
         "effective annual yield and year-by-year growth."
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "continuous_compounding_calculator",
+    "deterministic": True,
     "description": (
         "Applies Pe^rt to compute the continuously compounded future value and compares "
         "it to annual and monthly compounding scenarios."
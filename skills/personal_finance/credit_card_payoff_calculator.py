@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "credit_card_payoff_calculator",
+    "deterministic": True,
     "description": (
         "Simulates credit card amortization for a chosen payment or target timeline and "
         "compares it against paying issuer minimums."
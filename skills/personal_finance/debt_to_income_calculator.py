@@ -18,6 +18,7 @@ THRESHOLDS = {
 
 TOOL_META = {
     "name": "debt_to_income_calculator",
+    "deterministic": True,
     "description": (
         "Evaluates monthly debt obligations relative to income for mortgage qualification "
         "across Conventional, FHA, and VA programs."
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "dividend_reinvestment_projector",
+    "deterministic": True,
     "description": (
         "Projects a dividend reinvestment plan by compounding dividends into new shares "
         "with growth assumptions for payouts and share price."
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "dollar_cost_averaging_simulator",
+    "deterministic": True,
     "description": (
         "Runs a dollar-cost averaging simulation against lump sum investing using a price "
         "series to determine ending values and identify the winning approach."
@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "effective_tax_rate_calculator",
+    "deterministic": True,
     "description": "Calculate effective tax rate from total tax paid and total income. Compares effective rate to marginal rate for context.",
     "inputSchema": {
         "type": "object",
@@ -18,6 +18,7 @@ STABILITY_MONTHS = {
 
 TOOL_META = {
     "name": "emergency_fund_calculator",
+    "deterministic": True,
     "description": (
         "Determines the ideal emergency fund amount by weighing monthly expenses, income "
         "stability, and dependents while highlighting current coverage gaps."
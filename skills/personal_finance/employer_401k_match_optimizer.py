@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "employer_401k_match_optimizer",
+    "deterministic": True,
     "description": (
         "Evaluates contribution rates needed to earn the full employer match while "
         "respecting IRS limits and highlights remaining match dollars on the table."
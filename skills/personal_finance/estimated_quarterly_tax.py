@@ -58,6 +58,7 @@ def _se_tax(income: float) -> float:
 
 TOOL_META = {
     "name": "estimated_quarterly_tax",
+    "deterministic": True,
     "description": (
         "Combines income tax and self-employment tax to suggest quarterly estimated "
         "payments and safe harbor amounts to minimize penalties."
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "etf_vs_mutual_fund_comparator",
+    "deterministic": True,
     "description": (
         "Aggregates expense ratios, commissions, and tax drag to compare ETF and mutual "
         "fund costs annually and across a 10-year horizon."
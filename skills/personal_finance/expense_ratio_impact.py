@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "expense_ratio_impact",
+    "deterministic": True,
     "description": (
         "Quantifies the difference in ending balance between two funds with different "
         "expense ratios and reports cumulative fee drag."
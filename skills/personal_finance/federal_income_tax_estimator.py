@@ -82,6 +82,7 @@ def _compute_tax(brackets: List[Tuple[float, float]], taxable: float) -> tuple[f
 
 TOOL_META = {
     "name": "federal_income_tax_estimator",
+    "deterministic": True,
     "description": (
         "Applies 2024 U.S. federal tax brackets to compute AGI, taxable income, tax "
         "liability, marginal rate, and bracket-level breakdown."
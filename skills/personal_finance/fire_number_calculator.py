@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "fire_number_calculator",
+    "deterministic": True,
     "description": (
         "Computes the FIRE nest egg based on expenses and withdrawal rate, simulates years "
         "to reach it with contributions, and reports Coast/Barista FIRE thresholds."
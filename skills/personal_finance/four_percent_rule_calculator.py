@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "four_percent_rule_calculator",
+    "deterministic": True,
     "description": (
         "Applies the 4% rule to approximate sustainable withdrawals, adjusts for desired "
         "horizon and inflation, and scores success probability heuristically."
@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "freelance_rate_calculator",
+    "deterministic": True,
     "description": "Calculate the hourly rate a freelancer needs to charge to meet their target annual income after taxes and expenses.",
     "inputSchema": {
         "type": "object",
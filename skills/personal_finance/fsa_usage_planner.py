@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "fsa_usage_planner",
+    "deterministic": True,
     "description": "Plan Flexible Spending Account (FSA) usage by comparing annual contribution against expected expenses. Identifies surplus risk under the use-it-or-lose-it rule.",
     "inputSchema": {
         "type": "object",
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "heloc_calculator",
+    "deterministic": True,
     "description": (
         "Calculates HELOC borrowing power, interest-only draw payments, amortized "
         "repayment amounts, and total interest based on rate and term parameters."
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "high_yield_savings_comparator",
+    "deterministic": True,
     "description": (
         "Compares multiple savings accounts by incorporating APY, minimum balances, and "
         "monthly fees to surface the best net yield with 1-year and 5-year projections."
@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "hsa_contribution_optimizer",
+    "deterministic": True,
     "description": "Calculate optimal HSA contribution limits based on coverage type and age. Shows 2024 limits, catch-up contributions, and tax savings estimates.",
     "inputSchema": {
         "type": "object",
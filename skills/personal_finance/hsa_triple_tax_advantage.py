@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "hsa_triple_tax_advantage",
+    "deterministic": True,
     "description": (
         "Projects HSA balances using constant contributions and growth to highlight tax "
         "savings from deductions, tax-free compounding, and qualified medical withdrawals."
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "inflation_adjusted_return",
+    "deterministic": True,
     "description": (
         "Calculates nominal versus real returns by discounting investment growth for "
         "inflation and highlighting purchasing power erosion."
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "investment_fee_audit",
+    "deterministic": True,
     "description": (
         "Tallies management, advisory, and transaction fees across accounts and "
         "quantifies the 10-year drag while pointing to expensive providers."
@@ -23,6 +23,7 @@ def _payment(balance: float, rate: float, months: int) -> float:
 
 TOOL_META = {
     "name": "mortgage_refinance_analyzer",
+    "deterministic": True,
     "description": (
         "Compares an existing mortgage to a potential refinance by modeling monthly "
         "savings, break-even period, lifetime interest, and payoff horizon."
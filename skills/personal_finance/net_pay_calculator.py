@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "net_pay_calculator",
+    "deterministic": True,
     "description": "Calculate annual and periodic net pay from gross annual salary after federal, state, and FICA taxes and pre-tax deductions.",
     "inputSchema": {
         "type": "object",
@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "overtime_pay_calculator",
+    "deterministic": True,
     "description": "Calculate overtime pay using hourly rate, regular hours, and overtime hours with configurable overtime multiplier (default 1.5x).",
     "inputSchema": {
         "type": "object",
@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "paycheck_calculator",
+    "deterministic": True,
     "description": "Calculate net take-home pay from gross pay after federal, state, and FICA taxes. Supports multiple pay frequencies.",
     "inputSchema": {
         "type": "object",
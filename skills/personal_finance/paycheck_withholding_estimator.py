@@ -59,6 +59,7 @@ def _estimate_annual_tax(taxable_income: float, filing_status: str) -> float:
 
 TOOL_META = {
     "name": "paycheck_withholding_estimator",
+    "deterministic": True,
     "description": (
         "Estimates paycheck taxes for federal, state, Social Security, and Medicare "
         "with net pay and annualized projections based on pay frequency."
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "pension_vs_lump_sum",
+    "deterministic": True,
     "description": (
         "Values lifetime pension payments versus a lump sum using discounting and "
         "inflation adjustments, providing breakeven timing and sensitivity scenarios."
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "personal_loan_comparator",
+    "deterministic": True,
     "description": (
         "Evaluates personal loan offers by accounting for origination fees, payments, "
         "total interest, and estimated effective APR to rank the cheapest option."
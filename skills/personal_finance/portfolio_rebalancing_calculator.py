@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "portfolio_rebalancing_calculator",
+    "deterministic": True,
     "description": (
         "Compares current holdings with target allocations to produce trade "
         "instructions, drift metrics, and tax lot reminders for selling positions."
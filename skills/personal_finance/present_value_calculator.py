@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "present_value_calculator",
+    "deterministic": True,
     "description": (
         "Computes the present value of a lump sum or annuity, adjusting for payment timing "
         "and reporting aggregate payments and implied interest."
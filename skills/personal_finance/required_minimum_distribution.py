@@ -75,6 +75,7 @@ def _factor_for_age(age: int, account_type: str) -> float:
 
 TOOL_META = {
     "name": "required_minimum_distribution",
+    "deterministic": True,
     "description": (
         "Applies IRS life expectancy divisors to compute required minimum distributions "
         "for traditional IRAs, 401(k)s, and inherited accounts while projecting 5 years ahead."
@@ -21,6 +21,7 @@ _UNIFORM_TABLE: dict[int, float] = {
 
 TOOL_META: dict[str, Any] = {
     "name": "required_minimum_distribution_calculator",
+    "deterministic": True,
     "description": "Calculate Required Minimum Distribution (RMD) for traditional IRAs and 401(k)s using the IRS Uniform Lifetime Table. Required starting at age 73 (SECURE 2.0 Act).",
     "inputSchema": {
         "type": "object",
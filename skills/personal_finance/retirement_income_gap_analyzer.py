@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "retirement_income_gap_analyzer",
+    "deterministic": True,
     "description": (
         "Aggregates guaranteed income sources with planned withdrawals to determine gaps "
         "versus target retirement spending and highlight additional savings required."
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "retirement_savings_projector",
+    "deterministic": True,
     "description": (
         "Forecasts retirement savings from current age to retirement, reporting nominal "
         "and inflation-adjusted balances plus a 4% rule shortfall analysis."
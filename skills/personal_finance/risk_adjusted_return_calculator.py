@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "risk_adjusted_return_calculator",
+    "deterministic": True,
     "description": (
         "Calculates risk-adjusted metrics (Sharpe, Sortino, Treynor) plus annualized "
         "return/volatility and maximum drawdown from a series of periodic returns."
@@ -14,6 +14,7 @@ GROWTH_ASSUMPTION = 0.05
 
 TOOL_META = {
     "name": "roth_conversion_optimizer",
+    "deterministic": True,
     "description": (
         "Quantifies the up-front tax bill, future tax savings, and breakeven timing for a "
         "Roth conversion using bracket differentials and an assumed 5% growth rate."
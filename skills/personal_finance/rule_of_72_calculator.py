@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "rule_of_72_calculator",
+    "deterministic": True,
     "description": (
         "Uses the rule of 72 alongside logarithmic growth math to estimate doubling, "
         "tripling, and quadrupling timelines for an annual return."
@@ -12,6 +12,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "savings_goal_planner",
+    "deterministic": True,
     "description": (
         "Solves for the monthly contribution required to hit a savings goal given current "
         "balance, time horizon, and expected return, with annual milestones."
@@ -14,6 +14,7 @@ SE_CAP = 168600
 
 TOOL_META = {
     "name": "self_employment_tax_calculator",
+    "deterministic": True,
     "description": (
         "Computes Social Security and Medicare self-employment tax components, "
         "including the deductible half and additional Medicare surtax."
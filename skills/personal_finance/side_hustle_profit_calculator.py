@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "side_hustle_profit_calculator",
+    "deterministic": True,
     "description": "Calculate profit, effective hourly rate, and estimated tax liability from a side hustle or gig work.",
     "inputSchema": {
         "type": "object",
@@ -12,6 +12,7 @@ _BEND_POINT_2 = 7078  # 32% of $1,174 to $7,078; 15% above $7,078
 
 TOOL_META: dict[str, Any] = {
     "name": "social_security_benefit_estimator",
+    "deterministic": True,
     "description": "Estimate Social Security retirement benefits from average indexed monthly earnings (AIME). Calculates Primary Insurance Amount (PIA) and adjusts for early/late claiming.",
     "inputSchema": {
         "type": "object",
@@ -14,6 +14,7 @@ BEND_POINTS_2024 = [1174, 5885]
 
 TOOL_META = {
     "name": "social_security_estimator",
+    "deterministic": True,
     "description": (
         "Approximates the primary insurance amount (PIA) and adjusts benefits for early "
         "or delayed claiming relative to full retirement age."
@@ -24,6 +24,7 @@ def _parse_ratio(ratio: str) -> tuple[float, float]:
 
 TOOL_META = {
     "name": "stock_split_calculator",
+    "deterministic": True,
     "description": (
         "Computes the new share count and per-share price after a split while keeping "
         "total value and cost basis aligned."
@@ -9,6 +9,7 @@ import math
 
 TOOL_META: dict[str, Any] = {
     "name": "student_loan_payoff_calculator",
+    "deterministic": True,
     "description": "Calculate student loan payoff timeline, total interest paid, and show accelerated payment scenarios.",
     "inputSchema": {
         "type": "object",
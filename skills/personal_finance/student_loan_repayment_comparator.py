@@ -76,6 +76,7 @@ def _income_based_payment(
 
 TOOL_META = {
     "name": "student_loan_repayment_comparator",
+    "deterministic": True,
     "description": (
         "Models standard, graduated, IBR, PAYE, and REPAYE student loan plans to expose "
         "monthly payments, total paid, and potential forgiveness along with a recommendation."
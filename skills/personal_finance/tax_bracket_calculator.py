@@ -48,6 +48,7 @@ _BRACKETS: dict[str, list[tuple[float, float, float]]] = {
 
 TOOL_META: dict[str, Any] = {
     "name": "tax_bracket_calculator",
+    "deterministic": True,
     "description": "Calculate federal income tax owed using 2024 tax brackets. Shows marginal rate, effective rate, and tax owed per bracket.",
     "inputSchema": {
         "type": "object",
@@ -48,6 +48,7 @@ def _effective_rate(brackets: List[Tuple[float, float, str]], income: float) ->
 
 TOOL_META = {
     "name": "tax_bracket_marginal_analyzer",
+    "deterministic": True,
     "description": (
         "Reports the taxpayer's current federal bracket, marginal rate, remaining income "
         "headroom before the next bracket, and a visualization of all bracket tiers."
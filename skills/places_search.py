@@ -39,6 +39,8 @@ import os
 import datetime
 import requests
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "places_search",
     "description": (
@@ -210,7 +212,7 @@ def places_search(
             if type:
                 body["includedType"] = type
 
-            resp = requests.post(
+            resp = get_session().post(
                 "https://places.googleapis.com/v1/places:searchText",
                 headers=headers,
                 json=body,
@@ -250,7 +252,7 @@ def places_search(
             if type:
                 body["includedTypes"] = [type]
 
-            resp = requests.post(
+            resp = get_session().post(
                 "https://places.googleapis.com/v1/places:searchNearby",
                 headers=headers,
                 json=body,
@@ -278,7 +280,7 @@ def places_search(
                 return _error("'place_id' parameter is required for action 'details'.")
 
             headers["X-Goog-FieldMask"] = _DETAIL_FIELD_MASK
-            resp = requests.get(
+            resp = get_session().get(
                 f"https://places.googleapis.com/v1/places/{place_id}",
                 headers=headers,
                 timeout=15,
@@ -13,11 +13,15 @@ import numpy as np
 
 logger = logging.getLogger("snowdrop.skills")
 
+_LINKAGES = ("single", "complete", "average", "ward")
+
 TOOL_META = {
     "name": "hierarchical_risk_parity",
+    "executor": "process",
+    "timeout_seconds": 300,
     "description": (
         "Constructs Lopez de Prado's Hierarchical Risk Parity (HRP) allocation with "
-        "single-linkage clustering and recursive bisection risk budgeting."
+        "single, complete, average or Ward linkage clustering and recursive bisection risk budgeting."
     ),
     "inputSchema": {
         "type": "object",
@@ -36,7 +40,8 @@ TOOL_META = {
             },
             "linkage": {
                 "type": "string",
-                "description": "Linkage criterion: single or average (default single).",
+                "description": "Linkage criterion: single, complete, average or ward (default single).",
+                "enum": ["single", "complete", "average", "ward"],
             },
         },
         "required": ["asset_returns"],
@@ -73,11 +78,62 @@ def _distance(corr: np.ndarray) -> np.ndarray:
     return dist
 
 
-def _cluster_distance(a: List[int], b: List[int], dist: np.ndarray, method: str) -> float:
-    pairs = [dist[i, j] for i in a for j in b]
+def _lance_williams(
+    row_a: np.ndarray, row_b: np.ndarray, d_ab: float, size_a: float, size_b: float, sizes: np.ndarray, method: str
+) -> np.ndarray:
+    """Distances from every cluster k to the union of clusters a and b."""
+    if method == "single":
+        return np.minimum(row_a, row_b)
+    if method == "complete":
+        return np.maximum(row_a, row_b)
     if method == "average":
-        return float(sum(pairs) / len(pairs))
-    return float(min(pairs))
+        return (size_a * row_a + size_b * row_b) / (size_a + size_b)
+    # ward
+    total = sizes + size_a + size_b
+    return np.sqrt(
+        np.maximum(((sizes + size_a) * row_a ** 2 + (sizes + size_b) * row_b ** 2 - sizes * d_ab ** 2) / total, 0.0)
+    )
+
+
+def _nn_chain(dist: np.ndarray, method: str) -> List[tuple[int, int, float]]:
+    """Merges (slot_a, slot_b, distance) found by the nearest-neighbour chain algorithm.
+
+    All supported criteria are reducible, so following nearest neighbours until
+    two clusters are mutual nearest neighbours yields the same hierarchy as a
+    global closest-pair search. Merged clusters live in slot_b; distances to
+    the union come from one vectorised Lance-Williams update, O(n^2) overall.
+    """
+    n = dist.shape[0]
+    d = np.array(dist, dtype=float)
+    np.fill_diagonal(d, np.inf)
+    sizes = np.ones(n)
+    active = np.ones(n, dtype=bool)
+    merges: List[tuple[int, int, float]] = []
+    chain: List[int] = []
+    for _ in range(n - 1):
+        if not chain:
+            chain.append(int(np.argmax(active)))
+        while True:
+            a = chain[-1]
+            b = int(np.argmin(d[a]))
+            if len(chain) > 1 and d[a, chain[-2]] <= d[a, b]:
+                b = chain[-2]
+            if len(chain) > 1 and b == chain[-2]:
+                break
+            chain.append(b)
+        chain.pop()
+        chain.pop()
+        distance = float(d[a, b])
+        merges.append((a, b, distance))
+        merged = _lance_williams(d[a], d[b], distance, sizes[a], sizes[b], sizes, method)
+        d[b, :] = merged
+        d[:, b] = merged
+        d[b, b] = np.inf
+        d[a, :] = np.inf
+        d[:, a] = np.inf
+        sizes[b] += sizes[a]
+        active[a] = False
+    return merges
 
 
 def _hierarchical_linkage(
@@ -85,24 +141,22 @@ def _hierarchical_linkage(
 ) -> tuple[List[Dict[str, Any]], Dict[int, List[int]]]:
     n = dist.shape[0]
     clusters = {i: [i] for i in range(n)}
-    active = list(range(n))
-    next_id = n
+    # Union-find from assets to the id of the cluster currently holding them.
+    parent = list(range(2 * n - 1))
+
+    def _find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
     tree: List[Dict[str, Any]] = []
-    while len(active) > 1:
-        best_pair = None
-        best_distance = float("inf")
-        for idx, left in enumerate(active[:-1]):
-            for right in active[idx + 1 :]:
-                d = _cluster_distance(clusters[left], clusters[right], dist, linkage)
-                if d < best_distance:
-                    best_distance = d
-                    best_pair = (left, right)
-        left, right = best_pair  # type: ignore
-        tree.append({"parent": next_id, "left": left, "right": right, "distance": best_distance})
+    merges = sorted(_nn_chain(dist, linkage), key=lambda merge: merge[2])
+    for next_id, (a, b, distance) in enumerate(merges, start=n):
+        left, right = sorted((_find(a), _find(b)))
+        parent[left] = parent[right] = next_id
+        tree.append({"parent": next_id, "left": left, "right": right, "distance": distance})
         clusters[next_id] = clusters[left] + clusters[right]
-        active = [c for c in active if c not in (left, right)]
-        active.append(next_id)
-        next_id += 1
     return tree, clusters
 
 
@@ -128,32 +182,52 @@ def _cluster_variance(cov: np.ndarray, indices: List[int]) -> float:
     return float(weights.T @ sub @ weights)
 
 
+def _cluster_risk(
+    cov: np.ndarray, tree: List[Dict[str, Any]], clusters: Dict[int, List[int]]
+) -> Dict[int, float]:
+    """Inverse-variance cluster variance for every tree node, built bottom-up.
+
+    With v = 1 / diag(cov), a cluster's variance is Q / S^2 where S = sum(v) and
+    Q = v' cov v over its members. Merging only adds the cross block between
+    the two children, so each asset pair is visited once across the whole tree.
+    """
+    inv_diag = 1 / np.diag(cov)
+    quad = {i: float(inv_diag[i]) for i in range(cov.shape[0])}
+    total = dict(quad)
+    variances = {}
+    for node in tree:
+        left, right = clusters[node["left"]], clusters[node["right"]]
+        cross = float(inv_diag[left] @ cov[np.ix_(left, right)] @ inv_diag[right])
+        parent = node["parent"]
+        quad[parent] = quad[node["left"]] + quad[node["right"]] + 2 * cross
+        total[parent] = total[node["left"]] + total[node["right"]]
+        variances[parent] = quad[parent] / total[parent] ** 2
+    return variances
+
+
 def _hrp_allocation(cov: np.ndarray, order: List[int]) -> np.ndarray:
+    ordered = np.asarray(order)
     w = np.ones(len(order))
-    clusters = [order]
+    # Clusters are contiguous (start, end) slices of the quasi-diagonal order.
+    clusters = [(0, len(order))]
     while clusters:
-        cluster = clusters.pop(0)
-        if len(cluster) == 1:
+        start, end = clusters.pop()
+        if end - start == 1:
             continue
-        split = len(cluster) // 2
-        left = cluster[:split]
-        right = cluster[split:]
-        var_left = _cluster_variance(cov, left)
-        var_right = _cluster_variance(cov, right)
+        split = start + (end - start) // 2
+        var_left = _cluster_variance(cov, ordered[start:split])
+        var_right = _cluster_variance(cov, ordered[split:end])
         total = var_left + var_right
         if total <= 0:
             alpha = 0.5
         else:
             alpha = 1 - var_left / total
-        for idx in left:
-            w[order.index(idx)] *= alpha
-        for idx in right:
-            w[order.index(idx)] *= 1 - alpha
-        clusters.append(left)
-        clusters.append(right)
+        w[start:split] *= alpha
+        w[split:end] *= 1 - alpha
+        clusters.append((start, split))
+        clusters.append((split, end))
     full_weights = np.zeros(len(order))
-    for idx, asset_index in enumerate(order):
-        full_weights[asset_index] = w[idx]
+    full_weights[ordered] = w
     full_weights = full_weights / full_weights.sum()
     return full_weights
 
@@ -165,8 +239,8 @@ def hierarchical_risk_parity(
     **_: Any,
 ) -> dict[str, Any]:
     try:
-        if linkage not in {"single", "average"}:
-            raise ValueError("linkage must be 'single' or 'average'")
+        if linkage not in _LINKAGES:
+            raise ValueError(f"linkage must be one of {', '.join(_LINKAGES)}")
         labels = _validate_series(asset_returns, min_periods)
         matrix = np.array([asset_returns[label] for label in labels], dtype=float)
         cov = np.cov(matrix)
@@ -175,12 +249,11 @@ def hierarchical_risk_parity(
         tree, cluster_map = _hierarchical_linkage(dist, linkage)
         order = _extract_order(tree, len(labels))
         weights = _hrp_allocation(cov, order)
-        cluster_risk = []
-        for node in tree:
-            members = cluster_map.get(node["parent"], [])
-            if members:
-                var = _cluster_variance(cov, members)
-                cluster_risk.append({"cluster": [labels[i] for i in members], "variance": round(var, 8)})
+        variances = _cluster_risk(cov, tree, cluster_map)
+        cluster_risk = [
+            {"cluster": [labels[i] for i in cluster_map[node["parent"]]], "variance": round(variances[node["parent"]], 8)}
+            for node in tree
+        ]
 
         data = {
             "hrp_weights": [{"asset": labels[idx], "weight": round(weight, 6)} for idx, weight in enumerate(weights)],
@@ -14,6 +14,8 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "resampled_efficient_frontier",
+    "executor": "process",
+    "timeout_seconds": 300,
     "description": (
         "Applies Michaud resampling by bootstrapping mean-variance inputs and averaging allocations "
         "to produce confidence bands for the efficient frontier."
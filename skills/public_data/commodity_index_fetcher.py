@@ -68,7 +68,7 @@ def commodity_index_fetcher(commodity: str = "gold") -> dict[str, Any]:
         series_info = _COMMODITY_SERIES[key]
         series_id = series_info["series_id"]
 
-        import httpx
+        from skills.utils.http_client import pooled_client
 
         url = "https://api.stlouisfed.org/fred/series/observations"
         params = {
@@ -79,7 +79,7 @@ def commodity_index_fetcher(commodity: str = "gold") -> dict[str, Any]:
             "limit": "30",
         }
 
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30, cache="fred") as client:
             resp = client.get(url, params=params)
             resp.raise_for_status()
             data = resp.json()
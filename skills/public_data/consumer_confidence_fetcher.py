@@ -32,7 +32,7 @@ def consumer_confidence_fetcher() -> dict[str, Any]:
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
 
-        import httpx
+        from skills.utils.http_client import pooled_client
 
         url = "https://api.stlouisfed.org/fred/series/observations"
         params = {
@@ -43,7 +43,7 @@ def consumer_confidence_fetcher() -> dict[str, Any]:
             "limit": "24",
         }
 
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30, cache="fred") as client:
             resp = client.get(url, params=params)
             resp.raise_for_status()
             data = resp.json()
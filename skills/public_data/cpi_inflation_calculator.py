@@ -49,7 +49,7 @@ def _get_cpi_from_bls(year: int, month: int) -> float | None:
     if not api_key:
         return None
     try:
-        import httpx
+        from skills.utils.http_client import pooled_client
 
         period = f"M{month:02d}"
         payload = {
@@ -58,7 +58,7 @@ def _get_cpi_from_bls(year: int, month: int) -> float | None:
             "endyear": str(year),
             "registrationkey": api_key,
         }
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30, cache="bls") as client:
             resp = client.post("https://api.bls.gov/publicAPI/v2/timeseries/data/", json=payload)
             resp.raise_for_status()
             data = resp.json()
@@ -32,7 +32,7 @@ def crude_oil_price_fetcher() -> dict[str, Any]:
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
 
-        import httpx
+        from skills.utils.http_client import pooled_client
 
         url = "https://api.stlouisfed.org/fred/series/observations"
         params = {
@@ -43,7 +43,7 @@ def crude_oil_price_fetcher() -> dict[str, Any]:
             "limit": "60",
         }
 
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30, cache="fred") as client:
             resp = client.get(url, params=params)
             resp.raise_for_status()
             data = resp.json()
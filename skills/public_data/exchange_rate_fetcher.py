@@ -34,7 +34,7 @@ def exchange_rate_fetcher(
 ) -> dict[str, Any]:
     """Fetch currency exchange rate between two currencies."""
     try:
-        import httpx
+        from skills.utils.http_client import pooled_client
 
         base = base_currency.upper()
         target = target_currency.upper()
@@ -44,7 +44,7 @@ def exchange_rate_fetcher(
         source = None
 
         try:
-            with httpx.Client(timeout=15) as client:
+            with pooled_client(timeout=15, cache="fx") as client:
                 resp = client.get(
                     f"https://open.er-api.com/v6/latest/{base}"
                 )
@@ -60,7 +60,7 @@ def exchange_rate_fetcher(
         if rate is None:
             # Fallback: try another free API
             try:
-                with httpx.Client(timeout=15) as client:
+                with pooled_client(timeout=15, cache="fx") as client:
                     resp = client.get(
                         f"https://api.exchangerate-api.com/v4/latest/{base}"
                     )
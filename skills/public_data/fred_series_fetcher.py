@@ -9,6 +9,7 @@ import os
 
 TOOL_META: dict[str, Any] = {
     "name": "fred_series_fetcher",
+    "timeout_seconds": 45,
     "description": "Fetch economic data series observations from the FRED API by series ID (e.g., GDP, UNRATE, CPIAUCSL). Requires FRED_API_KEY environment variable.",
     "inputSchema": {
         "type": "object",
@@ -49,7 +50,7 @@ def fred_series_fetcher(
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
 
-        import httpx
+        from skills.utils.http_client import pooled_client
 
         params: dict[str, str] = {
             "series_id": series_id,
@@ -62,7 +63,7 @@ def fred_series_fetcher(
             params["observation_end"] = observation_end
 
         url = "https://api.stlouisfed.org/fred/series/observations"
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30, cache="fred") as client:
             resp = client.get(url, params=params)
             resp.raise_for_status()
             data = resp.json()
@@ -21,7 +21,7 @@ TOOL_META: dict[str, Any] = {
 def gold_price_fetcher() -> dict[str, Any]:
     """Fetch the current gold price."""
     try:
-        import httpx
+        from skills.utils.http_client import pooled_client
 
         # Try free metals API
         price = None
@@ -30,7 +30,7 @@ def gold_price_fetcher() -> dict[str, Any]:
 
         try:
             # Try metals.dev free API
-            with httpx.Client(timeout=15) as client:
+            with pooled_client(timeout=15, cache="metals") as client:
                 resp = client.get("https://api.metals.dev/v1/latest?api_key=demo&currency=USD&unit=toz")
                 if resp.status_code == 200:
                     data = resp.json()
@@ -47,7 +47,7 @@ def gold_price_fetcher() -> dict[str, Any]:
             fred_key = os.environ.get("FRED_API_KEY", "")
             if fred_key:
                 try:
-                    with httpx.Client(timeout=15) as client:
+                    with pooled_client(timeout=15, cache="fred") as client:
                         resp = client.get(
                             "https://api.stlouisfed.org/fred/series/observations",
                             params={
@@ -20,7 +20,7 @@ TOOL_META: dict[str, Any] = {
 def government_debt_tracker() -> dict[str, Any]:
     """Fetch total US public debt outstanding."""
     try:
-        import httpx
+        from skills.utils.http_client import pooled_client
 
         url = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v2/accounting/od/debt_to_penny"
         params = {
@@ -28,7 +28,7 @@ def government_debt_tracker() -> dict[str, Any]:
             "page[size]": "1",
         }
 
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30, cache="treasury") as client:
             resp = client.get(url, params=params)
             resp.raise_for_status()
             data = resp.json()
@@ -53,7 +53,7 @@ def money_supply_tracker(measure: str = "M2") -> dict[str, Any]:
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
 
-        import httpx
+        from skills.utils.http_client import pooled_client
 
         url = "https://api.stlouisfed.org/fred/series/observations"
         params = {
@@ -64,7 +64,7 @@ def money_supply_tracker(measure: str = "M2") -> dict[str, Any]:
             "limit": "24",
         }
 
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30, cache="fred") as client:
             resp = client.get(url, params=params)
             resp.raise_for_status()
             data = resp.json()
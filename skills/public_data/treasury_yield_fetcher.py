@@ -34,7 +34,7 @@ def treasury_yield_fetcher(
 ) -> dict[str, Any]:
     """Fetch average interest rates for US Treasury securities."""
     try:
-        import httpx
+        from skills.utils.http_client import pooled_client
 
         url = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v2/accounting/od/avg_interest_rates"
         params = {
@@ -43,7 +43,7 @@ def treasury_yield_fetcher(
             "page[size]": str(days),
         }
 
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30, cache="treasury") as client:
             resp = client.get(url, params=params)
             resp.raise_for_status()
             data = resp.json()
@@ -49,7 +49,7 @@ def unemployment_rate_tracker(months: int = 12) -> dict[str, Any]:
 
         if api_key:
             try:
-                import httpx
+                from skills.utils.http_client import pooled_client
 
                 now = datetime.now(timezone.utc)
                 payload = {
@@ -58,7 +58,7 @@ def unemployment_rate_tracker(months: int = 12) -> dict[str, Any]:
                     "endyear": str(now.year),
                     "registrationkey": api_key,
                 }
-                with httpx.Client(timeout=30) as client:
+                with pooled_client(timeout=30, cache="bls") as client:
                     resp = client.post(
                         "https://api.bls.gov/publicAPI/v2/timeseries/data/",
                         json=payload,
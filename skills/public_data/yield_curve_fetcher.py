@@ -32,7 +32,7 @@ _SECURITY_MATURITIES = [
 def yield_curve_fetcher() -> dict[str, Any]:
     """Fetch the US Treasury yield curve across multiple maturities."""
     try:
-        import httpx
+        from skills.utils.http_client import pooled_client
 
         url = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v2/accounting/od/avg_interest_rates"
         params = {
@@ -40,7 +40,7 @@ def yield_curve_fetcher() -> dict[str, Any]:
             "page[size]": "200",
         }
 
-        with httpx.Client(timeout=30) as client:
+        with pooled_client(timeout=30, cache="treasury") as client:
             resp = client.get(url, params=params)
             resp.raise_for_status()
             data = resp.json()
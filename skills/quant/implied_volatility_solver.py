@@ -1,13 +1,15 @@
-"""Solve for implied volatility using Black-Scholes and bisection."""
+"""Solve for implied volatility using Black-Scholes and safeguarded Newton iteration."""
 from __future__ import annotations
 
 import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.black_scholes import implied_volatility
+
 TOOL_META: dict[str, Any] = {
     "name": "implied_volatility_solver",
-    "description": "Computes implied volatility from an observed option price using bisection on the Black-Scholes model.",
+    "description": "Computes implied volatility from an observed option price, or a whole option chain, by safeguarded Newton iteration on the Black-Scholes model.",
     "inputSchema": {
         "type": "object",
         "properties": {
@@ -17,15 +19,19 @@ TOOL_META: dict[str, Any] = {
             "time_to_expiry": {"type": "number", "description": "Time to expiry in years. Must be > 0."},
             "risk_free_rate": {"type": "number", "description": "Risk-free rate as a decimal (e.g. 0.05 for 5%)."},
             "option_type": {"type": "string", "enum": ["call", "put"]},
+            "quotes": {
+                "type": "array",
+                "description": (
+                    "Option chain to solve in one batch; missing fields fall back to the top-level values. "
+                    "A quote missing a field at both levels is reported as an error in its result."
+                ),
+                "items": {
+                    "type": "object",
+                    "description": "One quote: option_price, strike, time_to_expiry, option_type and optionally spot and risk_free_rate.",
+                },
+            },
         },
-        "required": [
-            "option_price",
-            "spot",
-            "strike",
-            "time_to_expiry",
-            "risk_free_rate",
-            "option_type",
-        ],
+        "required": [],
     },
     "outputSchema": {
         "type": "object",
@@ -39,6 +45,9 @@ TOOL_META: dict[str, Any] = {
                     "iterations": {"type": "integer"},
                     "pricing_error": {"type": "number"},
                     "vol_regime": {"type": "string"},
+                    "results": {"type": "array", "items": {"type": "object"}},
+                    "solved": {"type": "integer"},
+                    "failed": {"type": "integer"},
                 },
             },
             "timestamp": {"type": "string"},
@@ -47,19 +56,86 @@ TOOL_META: dict[str, Any] = {
 }
 
 
+def _vol_regime(implied_vol: float) -> str:
+    if implied_vol > 1.0:
+        return "very_high"
+    if implied_vol > 0.5:
+        return "high"
+    if implied_vol > 0.2:
+        return "normal"
+    return "low"
+
+
+def _quote_result(vol: float, iterations: int, pricing_error: float) -> dict[str, Any]:
+    return {
+        "implied_vol_pct": round(vol * 100, 4),
+        "implied_vol_decimal": round(vol, 6),
+        "iterations": iterations,
+        "pricing_error": round(pricing_error, 6),
+        "vol_regime": _vol_regime(vol),
+    }
+
+
+_QUOTE_FIELDS = ("option_price", "spot", "strike", "time_to_expiry", "risk_free_rate")
+
+
+def _solve_chain(quotes: list[dict[str, Any]], defaults: dict[str, Any]) -> dict[str, Any]:
+    """Invert every quote in one batched solve; bad or incomplete quotes are reported per index."""
+    rows: list[tuple[float, float, float, float, float, str]] = []
+    indices: list[int] = []
+    results: list[dict[str, Any]] = [{} for _ in quotes]
+    for idx, quote in enumerate(quotes):
+        if not isinstance(quote, dict):
+            results[idx] = {"index": idx, "error": "invalid quote: expected an object"}
+            continue
+        merged = {**defaults, **{key: value for key, value in quote.items() if value is not None}}
+        missing = [field for field in (*_QUOTE_FIELDS, "option_type") if field not in merged]
+        if missing:
+            results[idx] = {"index": idx, "error": f"missing {', '.join(missing)} (set it on the quote or at top level)"}
+            continue
+        try:
+            row = tuple(float(merged[field]) for field in _QUOTE_FIELDS)
+            option_type = str(merged["option_type"]).lower()
+        except (TypeError, ValueError) as exc:
+            results[idx] = {"index": idx, "error": f"invalid quote: {exc}"}
+            continue
+        if min(row[:4]) <= 0 or option_type not in {"call", "put"}:
+            results[idx] = {"index": idx, "error": "option_price, spot, strike and time_to_expiry must be positive; option_type call or put"}
+            continue
+        rows.append((*row, option_type))
+        indices.append(idx)
+
+    if rows:
+        prices, spots, strikes, expiries, rates, types = zip(*rows)
+        solved = implied_volatility(prices, spots, strikes, expiries, rates, list(types))
+        for pos, idx in enumerate(indices):
+            if not solved["valid"][pos]:
+                results[idx] = {"index": idx, "error": "option_price outside no-arbitrage bounds; implied vol has no solution"}
+                continue
+            results[idx] = {
+                "index": idx,
+                **_quote_result(float(solved["vol"][pos]), int(solved["iterations"][pos]), float(solved["pricing_error"][pos])),
+            }
+    failed = sum(1 for result in results if "error" in result)
+    return {"results": results, "count": len(quotes), "solved": len(quotes) - failed, "failed": failed}
+
+
 def implied_volatility_solver(
-    option_price: float,
-    spot: float,
-    strike: float,
-    time_to_expiry: float,
-    risk_free_rate: float,
-    option_type: str,
+    option_price: float | None = None,
+    spot: float | None = None,
+    strike: float | None = None,
+    time_to_expiry: float | None = None,
+    risk_free_rate: float | None = None,
+    option_type: str | None = None,
+    quotes: list[dict[str, Any]] | None = None,
     **_: Any,
 ) -> dict[str, Any]:
-    """Return implied volatility from an observed option price via bisection.
+    """Return implied volatility for one option price, or for a whole chain of quotes.
 
-    Bisects the Black-Scholes vol space [0.001, 5.0] (0.1% to 500%).
-    Convergence tolerance: 1e-5 on vol, max 200 iterations.
+    Starts from a rational (Corrado-Miller) approximation and refines with
+    Newton steps on vega, falling back to bisection inside [0.0001, 5.0]
+    (0.01% to 500%) whenever a step leaves the bracket. ``quotes`` are solved
+    together in one vectorised pass.
 
     Args:
         option_price: Observed option price (must be > 0).
@@ -68,12 +144,36 @@ def implied_volatility_solver(
         time_to_expiry: Time to expiry in years (must be > 0).
         risk_free_rate: Risk-free rate as a decimal (not percentage).
         option_type: 'call' or 'put'.
+        quotes: Optional chain of quotes; each may set option_price, strike,
+            time_to_expiry, option_type, spot and risk_free_rate, falling back
+            to the top-level values.
 
     Returns:
         dict with implied_vol_pct, implied_vol_decimal, iterations,
-        pricing_error, vol_regime.
+        pricing_error, vol_regime; for ``quotes``, one such dict (or an
+        ``error``) per quote under ``results``.
     """
     try:
+        if quotes is not None:
+            if not isinstance(quotes, list) or not quotes:
+                raise ValueError("quotes must be a non-empty list")
+            defaults = {
+                "option_price": option_price,
+                "spot": spot,
+                "strike": strike,
+                "time_to_expiry": time_to_expiry,
+                "risk_free_rate": risk_free_rate,
+                "option_type": option_type,
+            }
+            data = _solve_chain(quotes, {k: v for k, v in defaults.items() if v is not None})
+            return {
+                "status": "success",
+                "data": data,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            }
+
+        if option_price is None or spot is None or strike is None or time_to_expiry is None or risk_free_rate is None or option_type is None:
+            raise ValueError("option_price, spot, strike, time_to_expiry, risk_free_rate and option_type are required")
         if option_price <= 0:
             raise ValueError("option_price must be positive")
         if spot <= 0 or strike <= 0:
@@ -97,38 +197,10 @@ def implied_volatility_solver(
                 "implied vol has no solution"
             )
 
-        low, high = 1e-4, 5.0
-        iterations = 0
-        tol = 1e-5
-
-        while high - low > tol and iterations < 200:
-            mid = (low + high) / 2.0
-            model_price = _black_scholes(spot, strike, time_to_expiry, risk_free_rate, mid, option_type)
-            if model_price > option_price:
-                high = mid
-            else:
-                low = mid
-            iterations += 1
-
-        implied_vol = (low + high) / 2.0
-        pricing_error = _black_scholes(spot, strike, time_to_expiry, risk_free_rate, implied_vol, option_type) - option_price
-
-        if implied_vol > 1.0:
-            vol_regime = "very_high"
-        elif implied_vol > 0.5:
-            vol_regime = "high"
-        elif implied_vol > 0.2:
-            vol_regime = "normal"
-        else:
-            vol_regime = "low"
-
-        data = {
-            "implied_vol_pct": round(implied_vol * 100, 4),
-            "implied_vol_decimal": round(implied_vol, 6),
-            "iterations": iterations,
-            "pricing_error": round(pricing_error, 6),
-            "vol_regime": vol_regime,
-        }
+        solved = implied_volatility(option_price, spot, strike, time_to_expiry, risk_free_rate, option_type)
+        if not solved["valid"]:
+            raise ValueError("option_price is above the no-arbitrage upper bound; implied vol has no solution")
+        data = _quote_result(float(solved["vol"]), int(solved["iterations"]), float(solved["pricing_error"]))
         return {
             "status": "success",
             "data": data,
@@ -143,24 +215,6 @@ def implied_volatility_solver(
         }
 
 
-def _black_scholes(spot: float, strike: float, t: float, r: float, sigma: float, option_type: str) -> float:
-    """Compute Black-Scholes price; returns intrinsic if sigma/t is near zero."""
-    if sigma < 1e-10 or t < 1e-10:
-        return max(0.0, spot - strike) if option_type == "call" else max(0.0, strike - spot)
-    d1 = (math.log(spot / strike) + (r + 0.5 * sigma ** 2) * t) / (sigma * math.sqrt(t))
-    d2 = d1 - sigma * math.sqrt(t)
-    disc = math.exp(-r * t)
-    if option_type == "call":
-        return spot * _norm_cdf(d1) - strike * disc * _norm_cdf(d2)
-    # Put via put-call parity
-    call = spot * _norm_cdf(d1) - strike * disc * _norm_cdf(d2)
-    return call - spot + strike * disc
-
-
-def _norm_cdf(x: float) -> float:
-    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
-
-
 def _log_lesson(message: str) -> None:
     with open("logs/lessons.md", "a", encoding="utf-8") as handle:
         handle.write(f"- [{datetime.now(timezone.utc).isoformat()}] {message}\n")
@@ -8,6 +8,10 @@ import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
+import numpy as np
+
+from skills.utils.value_at_risk import tail_indices
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
@@ -72,32 +76,26 @@ def expected_shortfall_decomposition(
             if len(series) != num_obs:
                 raise ValueError("factor return lengths must match portfolio_pnl length")
 
-        losses = [-value for value in portfolio_pnl]
-        sorted_indices = sorted(range(num_obs), key=lambda idx: losses[idx])
-        cutoff_index = int(confidence_level * num_obs)
-        cutoff_index = min(max(cutoff_index, 1), num_obs)
-        tail_indices = sorted_indices[cutoff_index - 1 :]
-        if not tail_indices:
-            tail_indices = sorted_indices[-1:]
-        total_es = sum(losses[idx] for idx in tail_indices) / len(tail_indices)
+        losses = -np.asarray(portfolio_pnl, dtype=float)
+        tail = tail_indices(losses, confidence_level)
+        total_es = float(losses[tail].mean())
+
+        factors = [(factor, beta) for factor, beta in factor_exposures.items() if factor in factor_returns]
+        factor_matrix = np.asarray([factor_returns[factor] for factor, _ in factors], dtype=float)
+        betas = np.array([beta for _, beta in factors], dtype=float)
+        tail_effects = -betas * factor_matrix.reshape(len(factors), num_obs)[:, tail].mean(axis=1)
+        contribution_pcts = tail_effects / total_es if total_es else np.zeros_like(tail_effects)
+        concentration_total = float((contribution_pcts ** 2).sum())
 
-        factor_contributions = []
-        concentration_total = 0.0
-        for factor, beta in factor_exposures.items():
-            series = factor_returns.get(factor)
-            if series is None:
-                continue
-            tail_effect = sum(-beta * series[idx] for idx in tail_indices) / len(tail_indices)
-            contribution_pct = tail_effect / total_es if total_es else 0.0
-            concentration_total += contribution_pct ** 2
-            factor_contributions.append(
-                {
-                    "factor": factor,
-                    "beta": beta,
-                    "tail_loss_contribution": round(tail_effect, 6),
-                    "percentage_of_es": round(contribution_pct * 100, 4),
-                }
-            )
+        factor_contributions = [
+            {
+                "factor": factor,
+                "beta": beta,
+                "tail_loss_contribution": round(float(effect), 6),
+                "percentage_of_es": round(float(pct) * 100, 4),
+            }
+            for (factor, beta), effect, pct in zip(factors, tail_effects, contribution_pcts)
+        ]
 
         concentration_ratio = concentration_total ** 0.5
         data = {
@@ -105,7 +103,7 @@ def expected_shortfall_decomposition(
             "factor_contributions": factor_contributions,
             "concentration_ratio": round(concentration_ratio, 6),
             "confidence_level": confidence_level,
-            "tail_count": len(tail_indices),
+            "tail_count": len(tail),
         }
         return {
             "status": "success",
@@ -1,13 +1,22 @@
 """
 Executive Summary: Historical simulation VaR with backtesting diagnostics under Basel traffic-light regime.
-Inputs: historical_returns (list[list[float]]), confidence_level (float), horizon_days (int), portfolio_weights (list[float]), weighting_scheme (str)
-Outputs: value_at_risk (float), expected_shortfall (float), violations (int), backtest_p_value (float)
+Inputs: historical_returns (list[list[float]]), confidence_level (float), horizon_days (int), portfolio_weights (list[float]), weighting_scheme (str), portfolio_book (dict[str,list[float]], optional)
+Outputs: value_at_risk (float), expected_shortfall (float), violations (int), backtest_p_value (float), portfolios (dict, when portfolio_book is given)
 MCP Tool Name: historical_var_calculator
 """
 import logging
 from datetime import datetime, timezone
-from math import comb, sqrt
-from typing import Any, List
+from math import sqrt
+from typing import Any, Dict, List, Optional
+
+from skills.utils.logging import log_lesson
+from skills.utils.value_at_risk import (
+    age_weights,
+    kupiec_p_values,
+    scenario_losses,
+    stack_portfolios,
+    tail_statistics,
+)
 
 logger = logging.getLogger("snowdrop.skills")
 
@@ -36,7 +45,7 @@ TOOL_META = {
             },
             "portfolio_weights": {
                 "type": "array",
-                "description": "Portfolio weights corresponding to assets in the historical matrix.",
+                "description": "Portfolio weights corresponding to assets in the historical matrix (required unless portfolio_book is given).",
                 "items": {"type": "number"},
             },
             "weighting_scheme": {
@@ -45,12 +54,20 @@ TOOL_META = {
                 "enum": ["equal", "age"],
                 "default": "equal",
             },
+            "portfolio_book": {
+                "type": "object",
+                "description": "Named sub-portfolio weight vectors valued over the same scenarios; replaces portfolio_weights.",
+                "additionalProperties": {
+                    "type": "array",
+                    "description": "Weights for one sub-portfolio",
+                    "items": {"type": "number", "description": "Asset weight"},
+                },
+            },
         },
         "required": [
             "historical_returns",
             "confidence_level",
             "horizon_days",
-            "portfolio_weights",
         ],
     },
     "outputSchema": {
@@ -65,35 +82,26 @@ TOOL_META = {
 }
 
 
-def _weighted_quantile(values: List[float], weights: List[float], quantile: float) -> float:
-    pairs = sorted(zip(values, weights), key=lambda item: item[0])
-    cumulative = 0.0
-    total_weight = sum(weights)
-    if total_weight <= 0:
-        raise ValueError("weights must sum positive")
-    threshold = quantile * total_weight
-    for value, weight in pairs:
-        cumulative += weight
-        if cumulative >= threshold:
-            return value
-    return pairs[-1][0]
-
-
-def _expected_shortfall(values: List[float], weights: List[float], cutoff: float) -> float:
-    tail_losses = [loss for loss in values if loss >= cutoff]
-    tail_weights = [weights[idx] for idx, loss in enumerate(values) if loss >= cutoff]
-    if not tail_losses:
-        return cutoff
-    total_weight = sum(tail_weights)
-    return sum(loss * w for loss, w in zip(tail_losses, tail_weights)) / total_weight
+def _portfolio_result(
+    var: float, es: float, violations: int, p_value: float, horizon_days: int,
+) -> dict[str, Any]:
+    scaling = sqrt(horizon_days)
+    return {
+        "value_at_risk": round(var * scaling, 6),
+        "expected_shortfall": round(es * scaling, 6),
+        "one_day_var": round(var, 6),
+        "violations": violations,
+        "kupiec_p_value": round(p_value, 6),
+    }
 
 
 def historical_var_calculator(
     historical_returns: List[List[float]],
     confidence_level: float,
     horizon_days: int,
-    portfolio_weights: List[float],
+    portfolio_weights: Optional[List[float]] = None,
     weighting_scheme: str = "equal",
+    portfolio_book: Optional[Dict[str, List[float]]] = None,
     **_: Any,
 ) -> dict[str, Any]:
     try:
@@ -103,52 +111,29 @@ def historical_var_calculator(
             raise ValueError("horizon_days must be positive")
         if not historical_returns:
             raise ValueError("historical_returns required")
-        num_assets = len(portfolio_weights)
-        if num_assets == 0:
-            raise ValueError("portfolio_weights required")
-        for row in historical_returns:
-            if len(row) != num_assets:
-                raise ValueError("each historical row must match number of weights")
-
-        # Build portfolio loss series
-        losses = []
-        for row in historical_returns:
-            port_return = sum(weight * asset_return for weight, asset_return in zip(portfolio_weights, row))
-            losses.append(-port_return)
-
-        n = len(losses)
-        if weighting_scheme == "age":
-            decay = 0.97
-            weights = [decay ** (n - idx - 1) for idx in range(n)]
-        else:
-            weights = [1.0 for _ in range(n)]
-        total_weight = sum(weights)
-        normalized_weights = [w / total_weight for w in weights]
-        quantile = _weighted_quantile(losses, normalized_weights, confidence_level)
-        es = _expected_shortfall(losses, normalized_weights, quantile)
-
-        scaled_var = quantile * sqrt(horizon_days)
-        scaled_es = es * sqrt(horizon_days)
-
-        expected_violations = n * (1 - confidence_level)
-        actual_violations = sum(1 for loss in losses if loss > quantile)
+        names, weights = stack_portfolios(portfolio_weights, portfolio_book)
 
+        # Loss matrix: one row per portfolio, one column per scenario
+        losses = scenario_losses(historical_returns, weights)
+        n = losses.shape[1]
+        obs_weights = age_weights(n) if weighting_scheme == "age" else None
+        var, es, violations = tail_statistics(losses, confidence_level, obs_weights)
         # Kupiec test p-value
-        prob = 1 - confidence_level
-        p_value = 0.0
-        for k in range(actual_violations, n + 1):
-            p_value += comb(n, k) * (prob ** k) * ((1 - prob) ** (n - k))
-
-        data = {
-            "value_at_risk": round(scaled_var, 6),
-            "expected_shortfall": round(scaled_es, 6),
-            "one_day_var": round(quantile, 6),
-            "violations": actual_violations,
-            "expected_violations": round(expected_violations, 2),
-            "kupiec_p_value": round(min(p_value, 1.0), 6),
+        p_values = kupiec_p_values(n, confidence_level, violations)
+        results = [
+            _portfolio_result(float(v), float(e), int(k), float(p), horizon_days)
+            for v, e, k, p in zip(var, es, violations, p_values)
+        ]
+
+        shared = {
+            "expected_violations": round(n * (1 - confidence_level), 2),
             "weighting_scheme": weighting_scheme,
             "horizon_days": horizon_days,
         }
+        if names is None:
+            data = {**results[0], **shared}
+        else:
+            data = {"portfolios": dict(zip(names, results)), "observations": n, **shared}
         return {
             "status": "success",
             "data": data,
@@ -156,17 +141,9 @@ def historical_var_calculator(
         }
     except (ValueError, TypeError, ZeroDivisionError) as e:
         logger.error(f"historical_var_calculator failed: {e}")
-        _log_lesson(f"historical_var_calculator: {e}")
+        log_lesson(f"historical_var_calculator: {e}")
         return {
             "status": "error",
             "error": str(e),
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
-
-
-def _log_lesson(message: str) -> None:
-    try:
-        with open("logs/lessons.md", "a", encoding="utf-8") as handle:
-            handle.write(f"- [{datetime.now(timezone.utc).isoformat()}] {message}\n")
-    except OSError:
-        pass
@@ -1,19 +1,21 @@
 """
 Executive Summary: Monte Carlo VaR using correlated normal shocks and Basel square-root-of-time scaling.
-Inputs: expected_returns (list[float]), covariance_matrix (list[list[float]]), num_simulations (int), horizon_days (int), confidence_level (float)
+Inputs: expected_returns (list[float]), covariance_matrix (list[list[float]]), num_simulations (int), horizon_days (int), confidence_level (float), seed (int, optional), antithetic (bool, optional), quasi_random (bool, optional)
 Outputs: value_at_risk (float), expected_shortfall (float), percentile_losses (dict), worst_case_loss (float)
 MCP Tool Name: monte_carlo_var
 """
 import logging
-import random
 from datetime import datetime, timezone
-from math import sqrt
 from typing import Any, List
 
+from skills.utils.monte_carlo import loss_statistics, simulate_portfolio_losses
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "monte_carlo_var",
+    "executor": "process",
+    "timeout_seconds": 300,
     "description": "Monte Carlo VaR/ES with Cholesky-based correlated shocks consistent with Basel 99% methodologies.",
     "inputSchema": {
         "type": "object",
@@ -44,6 +46,18 @@ TOOL_META = {
                 "type": "number",
                 "description": "Confidence level for VaR, e.g., 0.99.",
             },
+            "seed": {
+                "type": "integer",
+                "description": "Optional random seed for reproducible simulations.",
+            },
+            "antithetic": {
+                "type": "boolean",
+                "description": "Pair each shock with its negative to reduce variance (default false).",
+            },
+            "quasi_random": {
+                "type": "boolean",
+                "description": "Use a randomised Halton low-discrepancy sequence instead of pseudo-random draws (default false).",
+            },
         },
         "required": [
             "expected_returns",
@@ -65,29 +79,15 @@ TOOL_META = {
 }
 
 
-def _cholesky(matrix: List[List[float]]) -> List[List[float]]:
-    n = len(matrix)
-    lower = [[0.0] * n for _ in range(n)]
-    for i in range(n):
-        for j in range(i + 1):
-            sum_val = matrix[i][j]
-            for k in range(j):
-                sum_val -= lower[i][k] * lower[j][k]
-            if i == j:
-                if sum_val <= 0:
-                    raise ValueError("covariance_matrix must be positive definite")
-                lower[i][j] = sqrt(sum_val)
-            else:
-                lower[i][j] = sum_val / lower[j][j]
-    return lower
-
-
 def monte_carlo_var(
     expected_returns: List[float],
     covariance_matrix: List[List[float]],
     num_simulations: int,
     horizon_days: int,
     confidence_level: float,
+    seed: int | None = None,
+    antithetic: bool = False,
+    quasi_random: bool = False,
     **_: Any,
 ) -> dict[str, Any]:
     try:
@@ -106,39 +106,22 @@ def monte_carlo_var(
             if len(row) != num_assets:
                 raise ValueError("covariance_matrix must be square")
 
-        chol = _cholesky(covariance_matrix)
-        sqrt_horizon = sqrt(horizon_days)
-
-        simulated_losses = []
-        for _ in range(num_simulations):
-            z = [random.gauss(0, 1) for _ in range(num_assets)]
-            correlated = []
-            for i in range(num_assets):
-                value = 0.0
-                for k in range(i + 1):
-                    value += chol[i][k] * z[k]
-                correlated.append(value)
-            scenario_return = sum(
-                (mu * horizon_days) + correlated[i] * sqrt_horizon for i, mu in enumerate(expected_returns)
-            )
-            simulated_losses.append(-scenario_return)
-
-        simulated_losses.sort()
-        index = max(int(confidence_level * num_simulations) - 1, 0)
-        var_value = simulated_losses[index]
-        tail_losses = simulated_losses[index:]
-        es = sum(tail_losses) / len(tail_losses) if tail_losses else var_value
-
-        percentiles = {}
-        for p in (0.95, 0.975, 0.99):
-            idx = max(int(p * num_simulations) - 1, 0)
-            percentiles[str(int(p * 100))] = simulated_losses[idx]
+        losses = simulate_portfolio_losses(
+            expected_returns,
+            covariance_matrix,
+            num_simulations,
+            horizon_days,
+            seed=seed,
+            antithetic=antithetic,
+            quasi_random=quasi_random,
+        )
+        stats = loss_statistics(losses, confidence_level)
 
         data = {
-            "value_at_risk": round(var_value, 6),
-            "expected_shortfall": round(es, 6),
-            "simulation_percentiles": percentiles,
-            "worst_case_loss": round(simulated_losses[-1], 6),
+            "value_at_risk": round(stats["value_at_risk"], 6),
+            "expected_shortfall": round(stats["expected_shortfall"], 6),
+            "simulation_percentiles": stats["percentiles"],
+            "worst_case_loss": round(stats["worst_case_loss"], 6),
             "num_simulations": num_simulations,
             "confidence_level": confidence_level,
         }
@@ -20,6 +20,7 @@ import httpx
 from skills.compliance._output_sanitizer import sanitize_output
 from skills.social.prompt_injection_shield import _scan_text
 from skills.utils.retry import retry
+from skills.utils.http_client import get_http_client
 
 logger = logging.getLogger("snowdrop.candidate_intake_evaluator")
 
@@ -67,7 +68,7 @@ def _wrap(status: str, data: dict) -> dict:
 )
 def _fetch_github_profile(username: str, token: str) -> dict | None:
     """Fetch GitHub user profile. Returns None on 404."""
-    resp = httpx.get(
+    resp = get_http_client().get(
         f"{_GITHUB_API}/users/{username}",
         headers={
             "Authorization": f"Bearer {token}",
@@ -20,6 +20,7 @@ import httpx
 
 from skills.compliance._output_sanitizer import sanitize_output
 from skills.utils.retry import retry
+from skills.utils.http_client import get_http_client
 
 logger = logging.getLogger("snowdrop.github_discussion_monitor")
 
@@ -117,7 +118,7 @@ query($owner: String!, $name: String!, $number: Int!, $first: Int!) {
 )
 def _graphql_request(query: str, variables: dict, token: str) -> dict:
     """Execute a GitHub GraphQL request with retry."""
-    resp = httpx.post(
+    resp = get_http_client().post(
         _GRAPHQL_URL,
         json={"query": query, "variables": variables},
         headers={
@@ -16,6 +16,7 @@ from typing import Any
 import httpx
 
 from skills.utils.retry import retry
+from skills.utils.http_client import get_http_client
 
 logger = logging.getLogger("snowdrop.github_discussion_poster")
 
@@ -106,7 +107,7 @@ def _get_headers() -> dict:
 def _graphql_request(query: str, variables: dict) -> dict:
     """Execute a GraphQL request against the GitHub API."""
     headers = _get_headers()
-    resp = httpx.post(
+    resp = get_http_client().post(
         _GRAPHQL_URL,
         json={"query": query, "variables": variables},
         headers=headers,
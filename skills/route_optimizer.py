@@ -35,7 +35,7 @@ import json
 import os
 from datetime import datetime, timezone
 
-import requests
+from skills.utils.http_client import get_session
 
 TOOL_META = {
     "name": "route_optimizer",
@@ -166,7 +166,7 @@ def route_optimizer(
             if departure_time:
                 payload["model"]["globalStartTime"] = departure_time
 
-            resp = requests.post(url, json=payload, headers=headers, timeout=60)
+            resp = get_session().post(url, json=payload, headers=headers, timeout=60)
             resp.raise_for_status()
             body = resp.json()
 
@@ -222,7 +222,7 @@ def route_optimizer(
                 dt = datetime.fromisoformat(departure_time.replace("Z", "+00:00"))
                 params["departure_time"] = calendar.timegm(dt.timetuple())
 
-            resp = requests.get("https://maps.googleapis.com/maps/api/directions/json", params=params, timeout=15)
+            resp = get_session().get("https://maps.googleapis.com/maps/api/directions/json", params=params, timeout=15)
             resp.raise_for_status()
             body = resp.json()
             if body.get("status") != "OK":
@@ -269,7 +269,7 @@ def route_optimizer(
             if avoid:
                 params["avoid"] = "|".join(avoid)
 
-            resp = requests.get("https://maps.googleapis.com/maps/api/distancematrix/json", params=params, timeout=15)
+            resp = get_session().get("https://maps.googleapis.com/maps/api/distancematrix/json", params=params, timeout=15)
             resp.raise_for_status()
             body = resp.json()
             if body.get("status") != "OK":
@@ -86,6 +86,8 @@ from typing import Any, Dict
 
 import requests
 
+from skills.utils.http_client import get_session
+
 
 @dataclass
 class SnowdropClient:
@@ -95,7 +97,7 @@ class SnowdropClient:
 
     def _request(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         for attempt in range(3):
-            response = requests.post(
+            response = get_session().post(
                 f"{server_url}{{endpoint}}",
                 headers={{"Authorization": f"Bearer {{self.api_key}}", "Content-Type": "application/json"}},
                 data=json.dumps(payload),
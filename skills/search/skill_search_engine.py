@@ -1,10 +1,11 @@
-"""Search across skill metadata using TF-IDF-style weighting."""
+"""Search across skill metadata using BM25 weighting over an inverted index."""
 from __future__ import annotations
 
-from collections import Counter
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.search_index import SkillSearchIndex
+
 TOOL_META: dict[str, Any] = {
     "name": "skill_search_engine",
     "description": "Ranks skills by textual similarity to a query string.",
@@ -13,6 +14,8 @@ TOOL_META: dict[str, Any] = {
         "properties": {
             "query": {"type": "string"},
             "skill_catalog": {"type": "array", "items": {"type": "object"}},
+            "limit": {"type": "integer", "description": "Maximum results to return (default: all matches)."},
+            "offset": {"type": "integer", "description": "Ranked results to skip, for pagination."},
         },
         "required": ["query", "skill_catalog"],
     },
@@ -30,25 +33,22 @@ TOOL_META: dict[str, Any] = {
 def skill_search_engine(
     query: str,
     skill_catalog: list[dict[str, Any]],
+    limit: int = 0,
+    offset: int = 0,
     **_: Any,
 ) -> dict[str, Any]:
-    """Compute weighted term matches against the catalog."""
+    """Rank catalog entries against the query with BM25 plus prefix/typo matching."""
     try:
         if not query.strip():
             raise ValueError("query cannot be empty")
         if not skill_catalog:
             raise ValueError("skill_catalog cannot be empty")
-        query_terms = _tokenize(query)
-        query_counter = Counter(query_terms)
-        results = []
-        for skill in skill_catalog:
-            score = _score_skill(skill, query_counter)
-            if score > 0:
-                results.append({"skill": skill, "score": round(score, 3)})
-        results.sort(key=lambda item: item["score"], reverse=True)
+        index = SkillSearchIndex({**skill, "name": skill.get("name", "")} for skill in skill_catalog)
+        total, ranked = index.search_positions(query, limit=limit, offset=offset)
+        results = [{"skill": skill_catalog[pos], "score": round(score, 3)} for pos, score in ranked]
         data = {
             "results": results,
-            "total_matches": len(results),
+            "total_matches": total,
         }
         return {
             "status": "success",
@@ -64,24 +64,6 @@ def skill_search_engine(
         }
 
 
-def _tokenize(text: str) -> list[str]:
-    return [token.lower() for token in text.split() if token.strip()]
-
-
-def _score_skill(skill: dict[str, Any], query_counter: Counter) -> float:
-    name_terms = _tokenize(skill.get("name", ""))
-    description_terms = _tokenize(skill.get("description", ""))
-    category_terms = _tokenize(skill.get("category", ""))
-    input_terms = _tokenize(" ".join(skill.get("input_fields", [])))
-    score = 0.0
-    for term, freq in query_counter.items():
-        score += 3 * freq * name_terms.count(term)
-        score += 1 * freq * description_terms.count(term)
-        score += 2 * freq * category_terms.count(term)
-        score += 1 * freq * input_terms.count(term)
-    return score
-
-
 def _log_lesson(skill_name: str, error: str) -> None:
     with open("logs/lessons.md", "a", encoding="utf-8") as handle:
         handle.write(f"- [{datetime.now(timezone.utc).isoformat()}] {skill_name}: {error}\n")
@@ -20,7 +20,7 @@ import os
 import logging
 from datetime import datetime, timezone
 
-import requests
+from skills.utils.http_client import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +73,7 @@ def _wrap(status: str, data: dict) -> dict:
 
 
 def _post_message(token: str, channel: str, text: str) -> dict:
-    resp = requests.post(
+    resp = get_session().post(
         _SLACK_API,
         headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
         json={"channel": channel, "text": text, "mrkdwn": True},
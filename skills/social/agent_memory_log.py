@@ -9,6 +9,8 @@ import json
 import requests
 from datetime import datetime, timezone
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "agent_memory_log",
     "description": (
@@ -46,7 +48,7 @@ def _firestore_op(action: str, collection: str, doc_id: str, fields: dict, proje
         return str(v)
 
     if action == "read":
-        resp = requests.get(url, headers=headers, timeout=15)
+        resp = get_session().get(url, headers=headers, timeout=15)
         if resp.status_code == 404:
             return None
         resp.raise_for_status()
@@ -72,7 +74,7 @@ def _get_token(sa_json: dict) -> str:
     }).encode()).rstrip(b"=").decode()
     key = serialization.load_pem_private_key(sa_json["private_key"].encode(), password=None)
     sig = base64.urlsafe_b64encode(key.sign(f"{h}.{p}".encode(), padding.PKCS1v15(), hashes.SHA256())).rstrip(b"=").decode()
-    resp = requests.post("https://oauth2.googleapis.com/token",
+    resp = get_session().post("https://oauth2.googleapis.com/token",
                          data={"grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer", "assertion": f"{h}.{p}.{sig}"},
                          timeout=15)
     resp.raise_for_status()
@@ -134,7 +136,7 @@ def agent_memory_log(
         if action == "list":
             headers_req = {"Authorization": f"Bearer {token}"}
             url = f"https://firestore.googleapis.com/v1/projects/{project}/databases/(default)/documents/agent_memory"
-            resp = requests.get(url, headers=headers_req, params={"pageSize": 50}, timeout=15)
+            resp = get_session().get(url, headers=headers_req, params={"pageSize": 50}, timeout=15)
             resp.raise_for_status()
             docs = resp.json().get("documents", [])
             agents = []
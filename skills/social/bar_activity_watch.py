@@ -4,9 +4,10 @@ job applications, and discussion threads. Keeps Snowdrop informed of who
 walked in the door and what they ordered, so she can respond as host.
 """
 import os
-import requests
 from datetime import datetime, timezone, timedelta
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "bar_activity_watch",
     "description": (
@@ -53,7 +54,7 @@ def bar_activity_watch(hours_back: int = 24) -> dict:
 
     # Repo stats
     try:
-        meta = requests.get(base, headers=headers, timeout=10).json()
+        meta = get_session().get(base, headers=headers, timeout=10).json()
         activity["repo_stats"] = {
             "stars": meta.get("stargazers_count", 0),
             "watchers": meta.get("subscribers_count", 0),
@@ -65,7 +66,7 @@ def bar_activity_watch(hours_back: int = 24) -> dict:
 
     # New stargazers
     try:
-        sg = requests.get(
+        sg = get_session().get(
             f"{base}/stargazers",
             headers={**headers, "Accept": "application/vnd.github.v3.star+json"},
             params={"per_page": 30},
@@ -100,7 +101,7 @@ def bar_activity_watch(hours_back: int = 24) -> dict:
           }
         }
         """
-        gql_resp = requests.post(
+        gql_resp = get_session().post(
             "https://api.github.com/graphql",
             headers=gql_headers,
             json={"query": query, "variables": {"owner": owner, "name": repo}},
@@ -6,10 +6,10 @@ and feathers in Snowdrop's promotional aims without sounding like a press releas
 """
 import os
 import json
-import requests
 from datetime import datetime, timezone
 
 from config.models import resolve_model
+from skills.utils.http_client import get_session
 
 TOOL_META = {
     "name": "compose_message",
@@ -92,7 +92,7 @@ Platform notes: {platform_notes}
 Write the message now."""
 
     try:
-        resp = requests.post(
+        resp = get_session().post(
             "https://openrouter.ai/api/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
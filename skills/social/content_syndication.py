@@ -4,10 +4,10 @@ Write once, get back platform-optimized versions for GitHub, Moltbook, Twitter/X
 Removes the friction of reformatting the same idea for different audiences.
 """
 import os
-import requests
 from datetime import datetime, timezone
 
 from config.models import resolve_model
+from skills.utils.http_client import get_session
 
 TOOL_META = {
     "name": "content_syndication",
@@ -71,7 +71,7 @@ Produce platform-optimized versions. Return as JSON with keys matching the platf
 Each value should be the ready-to-post text (string) for that platform."""
 
     try:
-        resp = requests.post(
+        resp = get_session().post(
             "https://openrouter.ai/api/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -4,10 +4,10 @@ new projects, shifts, and opportunities Snowdrop should know about.
 Keeps her informed so she can engage intelligently rather than in a vacuum.
 """
 import os
-import requests
 from datetime import datetime, timezone
 
 from config.models import resolve_model
+from skills.utils.http_client import get_session
 
 TOOL_META = {
     "name": "ecosystem_radar",
@@ -71,7 +71,7 @@ def ecosystem_radar(
         ]
         for query in key_searches:
             try:
-                resp = requests.get(
+                resp = get_session().get(
                     "https://api.github.com/search/repositories",
                     headers=gh_headers,
                     params={"q": f"{query} pushed:>2026-01-01", "sort": "updated", "order": "desc", "per_page": 5},
@@ -95,7 +95,7 @@ def ecosystem_radar(
     if use_web_search:
         for feed_url, source_name in SOURCES:
             try:
-                resp = requests.get(feed_url, timeout=10, headers={"User-Agent": "Snowdrop/1.0"})
+                resp = get_session().get(feed_url, timeout=10, headers={"User-Agent": "Snowdrop/1.0"})
                 if resp.ok:
                     # Simple text extraction — find items mentioning our keywords
                     text = resp.text.lower()
@@ -130,7 +130,7 @@ Based on this ecosystem pulse, write a brief (3-4 sentence) summary of:
 
 Be direct and specific. No fluff."""
 
-            resp = requests.post(
+            resp = get_session().post(
                 "https://openrouter.ai/api/v1/chat/completions",
                 headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json",
                          "HTTP-Referer": "https://snowdrop-mcp.fly.dev"},
@@ -5,10 +5,10 @@ being genuinely useful to agents and developers who care about finance establish
 her as an authority, which drives traffic to her repos and The Watering Hole.
 """
 import os
-import requests
 from datetime import datetime, timezone
 
 from config.models import resolve_model
+from skills.utils.http_client import get_session
 
 TOOL_META = {
     "name": "financial_content_draft",
@@ -83,7 +83,7 @@ Platform formatting notes: {platform_notes}
 Write the content now. Be genuinely useful. Don't pad."""
 
     try:
-        resp = requests.post(
+        resp = get_session().post(
             "https://openrouter.ai/api/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
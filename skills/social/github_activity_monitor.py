@@ -4,9 +4,10 @@ forks, and comments. Returns a prioritized activity feed so Snowdrop can respond
 quickly to engagement and follow up on star-for-star trades.
 """
 import os
-import requests
 from datetime import datetime, timezone, timedelta
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "github_activity_monitor",
     "description": (
@@ -59,7 +60,7 @@ def github_activity_monitor(
 
         # --- Repo metadata (stars, forks) ---
         try:
-            meta = requests.get(base, headers=headers, timeout=10).json()
+            meta = get_session().get(base, headers=headers, timeout=10).json()
             stars = meta.get("stargazers_count", 0)
             forks = meta.get("forks_count", 0)
             activity.append({
@@ -75,7 +76,7 @@ def github_activity_monitor(
         # --- New stargazers ---
         if include_stars:
             try:
-                sg_resp = requests.get(
+                sg_resp = get_session().get(
                     f"{base}/stargazers",
                     headers={**headers, "Accept": "application/vnd.github.v3.star+json"},
                     params={"per_page": 30},
@@ -99,7 +100,7 @@ def github_activity_monitor(
 
         # --- New issues ---
         try:
-            issues = requests.get(
+            issues = get_session().get(
                 f"{base}/issues",
                 headers=headers,
                 params={"state": "open", "since": cutoff, "per_page": 20},
@@ -139,7 +140,7 @@ def github_activity_monitor(
               }
             }
             """
-            gql_resp = requests.post(
+            gql_resp = get_session().post(
                 "https://api.github.com/graphql",
                 headers={"Authorization": f"token {token}", "Content-Type": "application/json"},
                 json={"query": query, "variables": {"owner": owner, "name": repo}},
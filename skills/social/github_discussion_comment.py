@@ -3,9 +3,10 @@ Post a comment to an existing GitHub Discussion.
 Complements github_discussion_post.py (which creates new discussions).
 """
 import os
-import requests
 from datetime import datetime, timezone
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "github_discussion_comment",
     "description": (
@@ -24,7 +25,7 @@ def _get_discussion_id(owner: str, name: str, number: int, token: str) -> str |
       }
     }
     """
-    resp = requests.post(
+    resp = get_session().post(
         "https://api.github.com/graphql",
         headers={"Authorization": f"token {token}", "Content-Type": "application/json"},
         json={"query": query, "variables": {"owner": owner, "name": name, "number": number}},
@@ -77,7 +78,7 @@ def github_discussion_comment(
     }
     """
     try:
-        resp = requests.post(
+        resp = get_session().post(
             "https://api.github.com/graphql",
             headers={"Authorization": f"token {token}", "Content-Type": "application/json"},
             json={"query": mutation, "variables": {"discussionId": discussion_id, "body": body}},
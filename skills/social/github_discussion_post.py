@@ -121,7 +121,7 @@ def _graphql(token: str, query: str, variables: dict) -> dict:
         ImportError: If the requests library is not installed.
     """
     try:
-        import requests
+        from skills.utils.http_client import get_session
     except ImportError as exc:
         raise ImportError("The 'requests' library is required: pip install requests") from exc
 
@@ -131,7 +131,7 @@ def _graphql(token: str, query: str, variables: dict) -> dict:
         "Accept": "application/vnd.github+json",
     }
     payload = {"query": query, "variables": variables}
-    resp = requests.post(_GRAPHQL_URL, json=payload, headers=headers, timeout=20)
+    resp = get_session().post(_GRAPHQL_URL, json=payload, headers=headers, timeout=20)
 
     if resp.status_code != 200:
         raise RuntimeError(
@@ -6,6 +6,8 @@ import os
 import requests
 from datetime import datetime, timezone
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "github_repo_star",
     "description": (
@@ -47,7 +49,7 @@ def github_repo_star(
 
     try:
         # Always fetch current metadata
-        meta_resp = requests.get(repo_url, headers=headers, timeout=15)
+        meta_resp = get_session().get(repo_url, headers=headers, timeout=15)
         if meta_resp.status_code == 404:
             return {
                 "status": "error",
@@ -59,7 +61,7 @@ def github_repo_star(
         description = meta.get("description", "")
 
         if action == "check":
-            check_resp = requests.get(star_url, headers=headers, timeout=15)
+            check_resp = get_session().get(star_url, headers=headers, timeout=15)
             already_starred = check_resp.status_code == 204
             return {
                 "status": "ok",
@@ -4,9 +4,10 @@ MCP servers, agent frameworks, financial AI, DeFi tooling, compliance tools.
 Used for ecosystem awareness and identifying star-for-star trade candidates.
 """
 import os
-import requests
 from datetime import datetime, timezone, timedelta
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "github_trending_scan",
     "description": (
@@ -62,7 +63,7 @@ def github_trending_scan(
 
     for query, label in queries:
         try:
-            resp = requests.get(
+            resp = get_session().get(
                 "https://api.github.com/search/repositories",
                 headers=headers,
                 params={
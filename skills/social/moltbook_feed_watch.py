@@ -4,9 +4,10 @@ Surfaces recent posts worth replying to, upvoting, or referencing.
 Vigilance skill — Snowdrop checks in periodically and decides where to engage.
 """
 import os
-import requests
 from datetime import datetime, timezone, timedelta
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "moltbook_feed_watch",
     "description": (
@@ -67,7 +68,7 @@ def moltbook_feed_watch(
 
     for submolt in watch_list:
         try:
-            resp = requests.get(
+            resp = get_session().get(
                 f"https://www.moltbook.com/api/v1/submolts/{submolt}/posts",
                 headers=headers,
                 params={"limit": limit_per_submolt, "sort": "new"},
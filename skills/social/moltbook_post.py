@@ -16,6 +16,8 @@ from datetime import datetime
 
 import requests
 
+from skills.utils.http_client import get_session
+
 try:
     from word2number import w2n
     W2N_AVAILABLE = True
@@ -152,7 +154,7 @@ def moltbook_post(submolt_name: str, title: str, content: str) -> dict:
 
     # --- Step 1: Submit the post ---
     try:
-        post_resp = requests.post(
+        post_resp = get_session().post(
             post_url,
             json={
                 "submolt_name": submolt_name.strip(),
@@ -238,7 +240,7 @@ def moltbook_post(submolt_name: str, title: str, content: str) -> dict:
 
     # --- Step 3: Submit the verification answer ---
     try:
-        verify_resp = requests.post(
+        verify_resp = get_session().post(
             verify_url,
             json={"verification_code": verification_code, "answer": answer},
             headers=headers,
@@ -5,11 +5,12 @@ Spot-check individual posts or verify the performance poller is working correctl
 ROI score = upvotes * 2 + comments * 5 (comments weighted higher for community signal).
 """
 import os
-import requests
 import logging
 from datetime import datetime, timezone
 from skills.utils import log_lesson, get_iso_timestamp
 
+from skills.utils.http_client import get_session
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
@@ -49,7 +50,7 @@ def moltbook_post_performance(post_ids: list, write_to_sheet: bool = False) -> d
 
     for post_id in post_ids:
         try:
-            resp = requests.get(
+            resp = get_session().get(
                 f"{MOLTBOOK_BASE}/api/v1/posts/{post_id}",
                 headers=headers,
                 timeout=10,
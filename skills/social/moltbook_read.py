@@ -16,6 +16,8 @@ from datetime import datetime
 
 import requests
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "moltbook_read",
     "description": (
@@ -124,7 +126,7 @@ def moltbook_read(
         url = f"{base}/submolts/{submolt_name.strip()}/posts?sort={sort}&limit={limit}"
 
     try:
-        resp = requests.get(url, headers=headers, timeout=15)
+        resp = get_session().get(url, headers=headers, timeout=15)
     except requests.exceptions.Timeout:
         return {
             "status": "error",
@@ -13,10 +13,10 @@
 import os
 import json
 import logging
-import requests
 from datetime import datetime, timezone
 
 from config.models import resolve_model
+from skills.utils.http_client import get_session
 from skills.social.moltbook_engagement_sheet import _get_client, SHEET_ID, TAB_RATE_LIMITS
 
 logger = logging.getLogger("snowdrop.social.ratelimit")
@@ -80,7 +80,7 @@ Task:
 Are we burning quota too fast or at risk of a ban? Output ONLY a 1-sentence health summary.
 """
     try:
-        resp = requests.post(
+        resp = get_session().post(
             "https://openrouter.ai/api/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -4,9 +4,10 @@ Lets Snowdrop establish her own communities and control the narrative there.
 """
 import os
 import time
-import requests
 from datetime import datetime, timezone
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "moltbook_submolt_create",
     "description": (
@@ -55,7 +56,7 @@ def moltbook_submolt_create(
 
     # Step 1: Create the submolt
     try:
-        resp = requests.post(
+        resp = get_session().post(
             "https://www.moltbook.com/api/v1/submolts",
             headers=headers,
             json={"name": name, "description": description},
@@ -87,7 +88,7 @@ def moltbook_submolt_create(
     if seed_title and seed_content:
         time.sleep(2)
         try:
-            post_resp = requests.post(
+            post_resp = get_session().post(
                 "https://www.moltbook.com/api/v1/posts",
                 headers=headers,
                 json={"submolt_name": name, "title": seed_title, "content": seed_content},
@@ -106,7 +107,7 @@ def moltbook_submolt_create(
 
                 if code and challenge:
                     answer = _solve_challenge(challenge)
-                    v_resp = requests.post(
+                    v_resp = get_session().post(
                         "https://www.moltbook.com/api/v1/verify",
                         headers=headers,
                         json={"verification_code": code, "answer": answer},
@@ -5,9 +5,10 @@ prioritized by member count, activity, and topic alignment.
 """
 import os
 import re
-import requests
 from datetime import datetime, timezone
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "moltbook_submolt_discover",
     "description": (
@@ -91,7 +92,7 @@ def moltbook_submolt_discover(
     }
 
     try:
-        resp = requests.get(
+        resp = get_session().get(
             "https://www.moltbook.com/api/v1/submolts",
             headers=headers,
             timeout=15,
@@ -3,9 +3,10 @@ Slack post skill — send a message to the Snowdrop Slack channel.
 Used for daily engagement reports, alerts, and status updates.
 """
 import os
-import requests
 from datetime import datetime, timezone
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "slack_post",
     "description": (
@@ -41,7 +42,7 @@ def slack_post(message: str, channel_id: str = None) -> dict:
         }
 
     try:
-        resp = requests.post(
+        resp = get_session().post(
             "https://slack.com/api/chat.postMessage",
             headers={
                 "Authorization": f"Bearer {token}",
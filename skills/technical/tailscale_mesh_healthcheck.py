@@ -5,7 +5,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-import requests
+from skills.utils.http_client import get_session
 
 TOOL_META: dict[str, Any] = {
     "name": "tailscale_mesh_healthcheck",
@@ -84,7 +84,7 @@ def tailscale_mesh_healthcheck(
 
 def _fetch_devices(tailnet: str, auth_key: str) -> list[dict[str, Any]]:
     url = f"https://api.tailscale.com/api/v2/tailnet/{tailnet}/devices"
-    response = requests.get(url, auth=(auth_key, ""), timeout=10)
+    response = get_session().get(url, auth=(auth_key, ""), timeout=10)
     response.raise_for_status()
     payload = response.json()
     return payload.get("devices", payload)
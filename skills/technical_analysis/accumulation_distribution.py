@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "accumulation_distribution",
+    "deterministic": True,
     "description": "Calculates accumulation/distribution via money flow multiplier and cumulative volume flow.",
     "inputSchema": {
         "type": "object",
@@ -9,10 +9,15 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
+
+from skills.utils.indicators import to_list, true_range, wilder_smooth
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "adx_calculator",
+    "deterministic": True,
     "description": "Applies Wilder's Average Directional Index to gauge whether trends are weak or strong.",
     "inputSchema": {
         "type": "object",
@@ -67,37 +72,16 @@ def adx_calculator(**kwargs: Any) -> dict:
             lows_f.append(float(l))
             closes_f.append(float(c))
 
-        tr_list = [0.0]
-        plus_dm = [0.0]
-        minus_dm = [0.0]
-        for idx in range(1, len(highs_f)):
-            high = highs_f[idx]
-            low = lows_f[idx]
-            prev_high = highs_f[idx - 1]
-            prev_low = lows_f[idx - 1]
-            prev_close = closes_f[idx - 1]
-
-            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-            tr_list.append(tr)
-
-            up_move = high - prev_high
-            down_move = prev_low - low
-            plus_dm.append(up_move if up_move > down_move and up_move > 0 else 0.0)
-            minus_dm.append(down_move if down_move > up_move and down_move > 0 else 0.0)
-
-        def _wilder_smooth(data: list[float]) -> list[float]:
-            smoothed = [math.nan] * len(data)
-            initial = sum(data[1:period + 1])
-            smoothed[period] = initial
-            prev = initial
-            for idx in range(period + 1, len(data)):
-                prev = prev - (prev / period) + data[idx]
-                smoothed[idx] = prev
-            return smoothed
-
-        tr_smooth = _wilder_smooth(tr_list)
-        plus_dm_smooth = _wilder_smooth(plus_dm)
-        minus_dm_smooth = _wilder_smooth(minus_dm)
+        tr = true_range(highs_f, lows_f, closes_f)
+        up_move = np.diff(highs_f)
+        down_move = -np.diff(lows_f)
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+        # DI ratios are scale-free, so Wilder averages stand in for Wilder sums.
+        tr_smooth = [math.nan] + to_list(wilder_smooth(tr[1:], period))
+        plus_dm_smooth = [math.nan] + to_list(wilder_smooth(plus_dm, period))
+        minus_dm_smooth = [math.nan] + to_list(wilder_smooth(minus_dm, period))
 
         plus_di = [math.nan] * len(highs_f)
         minus_di = [math.nan] * len(highs_f)
@@ -114,19 +98,10 @@ def adx_calculator(**kwargs: Any) -> dict:
             else:
                 dx[idx] = 100 * abs(plus_di[idx] - minus_di[idx]) / sum_di
 
-        adx_series = [math.nan] * len(highs_f)
         valid_dx = [value for value in dx if not math.isnan(value)]
         if len(valid_dx) < period:
             raise ValueError("insufficient DX values for ADX")
-        first_adx_index = dx.index(valid_dx[period - 1])
-        initial_adx = sum(valid_dx[:period]) / period
-        adx_series[first_adx_index] = initial_adx
-        prev_adx = initial_adx
-        for idx in range(first_adx_index + 1, len(dx)):
-            if math.isnan(dx[idx]):
-                continue
-            prev_adx = ((prev_adx * (period - 1)) + dx[idx]) / period
-            adx_series[idx] = prev_adx
+        adx_series = to_list(wilder_smooth(dx, period))
 
         current_adx = adx_series[-1]
         current_plus_di = plus_di[-1]
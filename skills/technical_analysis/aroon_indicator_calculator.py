@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "aroon_indicator_calculator",
+    "deterministic": True,
     "description": "Calculate the Aroon indicator (Aroon Up and Aroon Down), which identifies trend strength and direction based on the time since the highest high and lowest low.",
     "inputSchema": {
         "type": "object",
@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import to_list, true_range, wilder_smooth
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "atr_calculator",
+    "deterministic": True,
     "description": "Implements Wilder's Average True Range for volatility assessment.",
     "inputSchema": {
         "type": "object",
@@ -64,18 +67,8 @@ def atr_calculator(**kwargs: Any) -> dict:
             lows_f.append(float(l))
             closes_f.append(float(c))
 
-        tr_list = [0.0]
-        for idx in range(1, len(highs_f)):
-            tr = max(highs_f[idx] - lows_f[idx], abs(highs_f[idx] - closes_f[idx - 1]), abs(lows_f[idx] - closes_f[idx - 1]))
-            tr_list.append(tr)
-
-        atr_series = [math.nan] * len(tr_list)
-        initial_atr = sum(tr_list[1:period + 1]) / period
-        atr_series[period] = initial_atr
-        prev_atr = initial_atr
-        for idx in range(period + 1, len(tr_list)):
-            prev_atr = (prev_atr * (period - 1) + tr_list[idx]) / period
-            atr_series[idx] = prev_atr
+        tr = true_range(highs_f, lows_f, closes_f)
+        atr_series = [math.nan] + to_list(wilder_smooth(tr[1:], period))
 
         current_atr = atr_series[-1]
         if math.isnan(current_atr):
@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import sma, to_list
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "awesome_oscillator",
+    "deterministic": True,
     "description": "Calculates Bill Williams' Awesome Oscillator using 5/34 SMA of median price to highlight momentum shifts.",
     "inputSchema": {
         "type": "object",
@@ -50,23 +53,8 @@ def awesome_oscillator(**kwargs: Any) -> dict:
                 raise TypeError("highs and lows must be numeric")
             median_prices.append((float(h) + float(l)) / 2)
 
-        def _sma(values: list[float], period: int) -> list[float]:
-            result = []
-            window: list[float] = []
-            total = 0.0
-            for value in values:
-                window.append(value)
-                total += value
-                if len(window) > period:
-                    total -= window.pop(0)
-                if len(window) == period:
-                    result.append(total / period)
-                else:
-                    result.append(math.nan)
-            return result
-
-        sma5 = _sma(median_prices, 5)
-        sma34 = _sma(median_prices, 34)
+        sma5 = to_list(sma(median_prices, 5))
+        sma34 = to_list(sma(median_prices, 34))
         ao_series = []
         for short, long_val in zip(sma5, sma34):
             if math.isnan(short) or math.isnan(long_val):
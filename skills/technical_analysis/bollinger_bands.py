@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import rolling_std, sma
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "bollinger_bands",
+    "deterministic": True,
     "description": "Calculates SMA-based Bollinger Bands with configurable standard deviation multipliers.",
     "inputSchema": {
         "type": "object",
@@ -56,9 +59,8 @@ def bollinger_bands(**kwargs: Any) -> dict:
             prices_f.append(float(price))
 
         window = prices_f[-period:]
-        middle_band = sum(window) / period
-        variance = sum((value - middle_band) ** 2 for value in window) / period
-        std_dev = math.sqrt(variance)
+        middle_band = float(sma(window, period)[-1])
+        std_dev = float(rolling_std(window, period)[-1])
         upper_band = middle_band + num_std * std_dev
         lower_band = middle_band - num_std * std_dev
         latest_price = prices_f[-1]
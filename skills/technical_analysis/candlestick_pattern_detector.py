@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "candlestick_pattern_detector",
+    "deterministic": True,
     "description": "Scans OHLC data for common patterns: doji, hammer, engulfing, stars, soldiers/crows, harami, spinning top, shooting star.",
     "inputSchema": {
         "type": "object",
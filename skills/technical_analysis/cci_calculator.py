@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "cci_calculator",
+    "deterministic": True,
     "description": "Calculates Donald Lambert's Commodity Channel Index using a mean deviation normalization.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "chaikin_money_flow",
+    "deterministic": True,
     "description": "Calculates Chaikin Money Flow (CMF) over a specified period to quantify accumulation or distribution.",
     "inputSchema": {
         "type": "object",
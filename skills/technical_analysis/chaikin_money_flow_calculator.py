@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "chaikin_money_flow_calculator",
+    "deterministic": True,
     "description": "Calculate Chaikin Money Flow (CMF), which measures the accumulation/distribution of money flow over a period. Positive CMF = buying pressure, negative = selling pressure.",
     "inputSchema": {
         "type": "object",
@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "chaikin_volatility",
+    "deterministic": True,
     "description": "Calculates Chaikin Volatility (EMA of range with rate-of-change comparison).",
     "inputSchema": {
         "type": "object",
@@ -59,20 +62,7 @@ def chaikin_volatility(**kwargs: Any) -> dict:
                 raise TypeError("highs and lows must be numeric")
             ranges.append(float(h) - float(l))
 
-        def _ema(values: list[float], period: int) -> list[float]:
-            alpha = 2 / (period + 1)
-            ema = [math.nan] * len(values)
-            if len(values) < period:
-                return ema
-            seed = sum(values[:period]) / period
-            ema[period - 1] = seed
-            prev = seed
-            for idx in range(period, len(values)):
-                prev = alpha * values[idx] + (1 - alpha) * prev
-                ema[idx] = prev
-            return ema
-
-        ema_range = _ema(ranges, ema_period)
+        ema_range = to_list(ema(ranges, ema_period))
         chaikin_series = [math.nan] * len(ema_range)
         for idx in range(roc_period, len(ema_range)):
             current = ema_range[idx]
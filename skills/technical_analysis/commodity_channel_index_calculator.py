@@ -6,8 +6,11 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import to_list, typical_price
+
 TOOL_META: dict[str, Any] = {
     "name": "commodity_channel_index_calculator",
+    "deterministic": True,
     "description": "Calculate the Commodity Channel Index (CCI), an oscillator measuring deviation from the statistical mean. Values above +100 suggest overbought; below -100 suggest oversold.",
     "inputSchema": {
         "type": "object",
@@ -61,7 +64,7 @@ def commodity_channel_index_calculator(
             }
 
         # Typical price
-        tp = [(h + l + c) / 3 for h, l, c in zip(highs, lows, closes)]
+        tp = to_list(typical_price(highs, lows, closes))
 
         cci_values: list[float] = []
         for i in range(period - 1, n):
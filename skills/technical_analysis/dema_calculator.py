@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "dema_calculator",
+    "deterministic": True,
     "description": "Computes the Double Exponential Moving Average (2*EMA - EMA(EMA)) to highlight early momentum turns.",
     "inputSchema": {
         "type": "object",
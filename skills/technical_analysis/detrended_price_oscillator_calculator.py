@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "detrended_price_oscillator_calculator",
+    "deterministic": True,
     "description": "Calculate the Detrended Price Oscillator (DPO), which removes the trend from prices to identify cycles. DPO = Close[-(period/2+1)] - SMA(period).",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "divergence_detector",
+    "deterministic": True,
     "description": "Identifies regular and hidden divergences between price action and an oscillator/indicator.",
     "inputSchema": {
         "type": "object",
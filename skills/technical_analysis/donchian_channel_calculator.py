@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "donchian_channel_calculator",
+    "deterministic": True,
     "description": "Calculate Donchian Channels (highest high and lowest low over a lookback period). Used for breakout trading systems.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "donchian_channels",
+    "deterministic": True,
     "description": "Applies Richard Donchian's channel breakout system using highest highs and lowest lows.",
     "inputSchema": {
         "type": "object",
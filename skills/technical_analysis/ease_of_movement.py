@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "ease_of_movement",
+    "deterministic": True,
     "description": "Computes Richard Arms' Ease of Movement oscillator with SMA signal to judge efficient rallies/drops.",
     "inputSchema": {
         "type": "object",
@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "ease_of_movement_calculator",
+    "deterministic": True,
     "description": "Calculate the Ease of Movement (EMV) indicator, which relates price change to volume. Positive EMV = prices advancing on low volume; negative = declining.",
     "inputSchema": {
         "type": "object",
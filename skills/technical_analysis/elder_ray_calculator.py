@@ -6,8 +6,11 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list
+
 TOOL_META: dict[str, Any] = {
     "name": "elder_ray_calculator",
+    "deterministic": True,
     "description": "Calculate Elder Ray Index with Bull Power (High - EMA) and Bear Power (Low - EMA). Used to measure buying and selling pressure relative to the trend.",
     "inputSchema": {
         "type": "object",
@@ -38,17 +41,6 @@ TOOL_META: dict[str, Any] = {
 }
 
 
-def _ema(values: list[float], period: int) -> list[float]:
-    """Calculate exponential moving average."""
-    if not values or period < 1:
-        return []
-    k = 2.0 / (period + 1)
-    result = [values[0]]
-    for i in range(1, len(values)):
-        result.append(values[i] * k + result[-1] * (1 - k))
-    return result
-
-
 def elder_ray_calculator(
     highs: list[float],
     lows: list[float],
@@ -71,7 +63,7 @@ def elder_ray_calculator(
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
 
-        ema_values = _ema(closes, period)
+        ema_values = to_list(ema(closes, period, seed="first"))
 
         bull_power: list[float] = []
         bear_power: list[float] = []
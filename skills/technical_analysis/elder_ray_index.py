@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "elder_ray_index",
+    "deterministic": True,
     "description": "Computes Elder-Ray Bull/Bear Power relative to an EMA trend baseline.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "ema_calculator",
+    "deterministic": True,
     "description": "Calculates exponential moving averages using Wilder's smoothing to detect price momentum shifts.",
     "inputSchema": {
         "type": "object",
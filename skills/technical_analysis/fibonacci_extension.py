@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "fibonacci_extension",
+    "deterministic": True,
     "description": "Computes Fibonacci extension projections (100%–261.8%) for trend continuation targets.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "fibonacci_retracement",
+    "deterministic": True,
     "description": "Computes common Fibonacci retracement prices (23.6%, 38.2%, 50%, 61.8%, 78.6%) for trend analysis.",
     "inputSchema": {
         "type": "object",
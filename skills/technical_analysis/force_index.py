@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "force_index",
+    "deterministic": True,
     "description": "Applies Elder's Force Index with optional EMA smoothing to detect bullish or bearish thrusts.",
     "inputSchema": {
         "type": "object",
@@ -58,7 +61,7 @@ def force_index(**kwargs: Any) -> dict:
                 raise TypeError("inputs must be numeric")
             raw_force.append((float(c) - float(p)) * float(v))
 
-        force_index_series = _ema(raw_force, ema_period)
+        force_index_series = to_list(ema(raw_force, ema_period))
         current_value = force_index_series[-1]
         if math.isnan(current_value):
             raise ValueError("insufficient data for Force Index")
@@ -92,32 +95,6 @@ def force_index(**kwargs: Any) -> dict:
         }
 
 
-def _ema(values: list[float], period: int) -> list[float]:
-    ema = [math.nan] * len(values)
-    valid_values = [value for value in values if not math.isnan(value)]
-    if len(valid_values) < period:
-        return ema
-    alpha = 2 / (period + 1)
-    # find index of first valid value to start
-    first_valid_index = values.index(valid_values[0])
-    seed_values = valid_values[:period]
-    seed_avg = sum(seed_values) / period
-    ema[first_valid_index + period - 1] = seed_avg
-    prev = seed_avg
-    idx_pointer = first_valid_index + period
-    valid_pointer = period
-    while idx_pointer < len(values):
-        value = values[idx_pointer]
-        if math.isnan(value):
-            idx_pointer += 1
-            continue
-        prev = alpha * value + (1 - alpha) * prev
-        ema[idx_pointer] = prev
-        idx_pointer += 1
-        valid_pointer += 1
-    return ema
-
-
 def _log_lesson(message: str) -> None:
     try:
         with open("logs/lessons.md", "a") as f:
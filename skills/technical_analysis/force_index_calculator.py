@@ -6,8 +6,11 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list
+
 TOOL_META: dict[str, Any] = {
     "name": "force_index_calculator",
+    "deterministic": True,
     "description": "Calculate the Force Index, which combines price change and volume to measure the strength of bulls and bears. Uses EMA smoothing.",
     "inputSchema": {
         "type": "object",
@@ -33,17 +36,6 @@ TOOL_META: dict[str, Any] = {
 }
 
 
-def _ema(values: list[float], period: int) -> list[float]:
-    """Calculate exponential moving average."""
-    if not values or period < 1:
-        return []
-    k = 2.0 / (period + 1)
-    result = [values[0]]
-    for i in range(1, len(values)):
-        result.append(values[i] * k + result[-1] * (1 - k))
-    return result
-
-
 def force_index_calculator(
     closes: list[float],
     volumes: list[float],
@@ -71,7 +63,7 @@ def force_index_calculator(
             raw_fi.append((closes[i] - closes[i - 1]) * volumes[i])
 
         # EMA-smoothed Force Index
-        smoothed = _ema(raw_fi, period)
+        smoothed = to_list(ema(raw_fi, period, seed="first"))
 
         latest_fi = round(smoothed[-1], 2) if smoothed else None
 
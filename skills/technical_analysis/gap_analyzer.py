@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "gap_analyzer",
+    "deterministic": True,
     "description": "Scans OHLC data for breakaway, runaway, exhaustion, and common gaps, tracking fill status.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "heikin_ashi_calculator",
+    "deterministic": True,
     "description": "Converts standard candles to Heikin-Ashi and reports trend direction and strength.",
     "inputSchema": {
         "type": "object",
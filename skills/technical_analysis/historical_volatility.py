@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "historical_volatility",
+    "deterministic": True,
     "description": "Computes realized volatility via close-to-close, Parkinson, Garman-Klass, or Yang-Zhang estimators.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "ichimoku_cloud",
+    "deterministic": True,
     "description": "Generates Ichimoku Kinko Hyo components (Tenkan, Kijun, Senkou A/B, Chikou) for full cloud analysis.",
     "inputSchema": {
         "type": "object",
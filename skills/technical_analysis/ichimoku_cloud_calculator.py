@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "ichimoku_cloud_calculator",
+    "deterministic": True,
     "description": "Calculate all five Ichimoku Cloud components: Tenkan-sen, Kijun-sen, Senkou Span A, Senkou Span B, and Chikou Span.",
     "inputSchema": {
         "type": "object",
@@ -0,0 +1,133 @@
+"""
+Executive Summary: Streams RSI, MACD, ATR or Bollinger Bands forward bar by bar from a saved state in O(1) per bar.
+Inputs: indicator (str), state (dict, optional), history (dict, optional), bars (list), period (int), fast_period (int), slow_period (int), signal_period (int), num_std (float)
+Outputs: indicator (str), values (list), current (float|dict), state (dict), bars_processed (int)
+MCP Tool Name: indicator_state_update
+"""
+import logging
+from datetime import datetime, timezone
+from typing import Any
+
+from skills.utils.indicators import ATRState, BollingerState, MACDState, RSIState
+from skills.utils.logging import log_lesson
+
+logger = logging.getLogger("snowdrop.skills")
+
+TOOL_META = {
+    "name": "indicator_state_update",
+    "deterministic": True,
+    "description": (
+        "Incrementally updates RSI, MACD, ATR or Bollinger Bands for new bars from the state returned by a "
+        "previous call (or seeded once from history), without recomputing the full price history."
+    ),
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "indicator": {
+                "type": "string",
+                "enum": ["rsi", "macd", "atr", "bollinger"],
+                "description": "Indicator to update.",
+            },
+            "state": {
+                "type": "object",
+                "description": "State returned by a previous call. Omit to seed from history.",
+            },
+            "history": {
+                "type": "object",
+                "description": "Seed data when no state is given: {\"prices\": [...]} or, for atr, {\"highs\", \"lows\", \"closes\"}.",
+            },
+            "bars": {
+                "type": "array",
+                "description": "New bars, oldest first: closes for rsi/macd/bollinger, {\"high\", \"low\", \"close\"} objects for atr.",
+            },
+            "period": {"type": "integer", "description": "RSI/ATR/Bollinger lookback used when seeding (default 14, Bollinger 20)."},
+            "fast_period": {"type": "integer", "description": "MACD fast EMA period used when seeding (default 12)."},
+            "slow_period": {"type": "integer", "description": "MACD slow EMA period used when seeding (default 26)."},
+            "signal_period": {"type": "integer", "description": "MACD signal EMA period used when seeding (default 9)."},
+            "num_std": {"type": "number", "description": "Bollinger standard deviation multiplier used when seeding (default 2)."},
+        },
+        "required": ["indicator"],
+    },
+    "outputSchema": {
+        "type": "object",
+        "properties": {
+            "status": {"type": "string"},
+            "timestamp": {"type": "string"},
+            "data": {"type": "object"},
+        },
+        "required": ["status", "timestamp"],
+    },
+}
+
+_STATES = {"rsi": RSIState, "macd": MACDState, "atr": ATRState, "bollinger": BollingerState}
+
+
+def _seed(indicator: str, history: dict, kwargs: dict) -> Any:
+    if not isinstance(history, dict):
+        raise ValueError("history must be an object when no state is given")
+    if indicator == "atr":
+        return ATRState.from_history(
+            history.get("highs", []), history.get("lows", []), history.get("closes", []),
+            int(kwargs.get("period", 14)),
+        )
+    prices = history.get("prices", [])
+    if indicator == "rsi":
+        return RSIState.from_history(prices, int(kwargs.get("period", 14)))
+    if indicator == "macd":
+        return MACDState.from_history(
+            prices,
+            int(kwargs.get("fast_period", 12)),
+            int(kwargs.get("slow_period", 26)),
+            int(kwargs.get("signal_period", 9)),
+        )
+    return BollingerState.from_history(prices, int(kwargs.get("period", 20)), float(kwargs.get("num_std", 2)))
+
+
+def indicator_state_update(**kwargs: Any) -> dict:
+    """Restores or seeds an indicator state, applies each new bar in turn and returns the updated state."""
+    try:
+        indicator = kwargs.get("indicator")
+        if indicator not in _STATES:
+            raise ValueError(f"indicator must be one of {sorted(_STATES)}")
+        bars = kwargs.get("bars") or []
+        if not isinstance(bars, list):
+            raise ValueError("bars must be a list")
+
+        state_data = kwargs.get("state")
+        if state_data:
+            if not isinstance(state_data, dict):
+                raise ValueError("state must be an object")
+            state = _STATES[indicator].from_dict(state_data)
+        else:
+            state = _seed(indicator, kwargs.get("history"), kwargs)
+
+        values = []
+        for bar in bars:
+            if indicator == "atr":
+                if not isinstance(bar, dict):
+                    raise TypeError("atr bars must be objects with high, low and close")
+                values.append(state.update(bar["high"], bar["low"], bar["close"]))
+            else:
+                if not isinstance(bar, (int, float)):
+                    raise TypeError("bars must be numeric closes")
+                values.append(state.update(bar))
+
+        return {
+            "status": "success",
+            "data": {
+                "indicator": indicator,
+                "values": values,
+                "current": state.value,
+                "state": state.to_dict(),
+                "bars_processed": len(values),
+            },
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+    except (ValueError, TypeError, KeyError, ZeroDivisionError) as e:
+        logger.error(f"indicator_state_update failed: {e}")
+        log_lesson(f"indicator_state_update: {e}")
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
@@ -6,8 +6,11 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list
+
 TOOL_META: dict[str, Any] = {
     "name": "keltner_channel_calculator",
+    "deterministic": True,
     "description": "Calculate Keltner Channels (middle EMA band with ATR-based upper/lower channels). Used for trend direction and volatility-based breakouts.",
     "inputSchema": {
         "type": "object",
@@ -33,17 +36,6 @@ TOOL_META: dict[str, Any] = {
 }
 
 
-def _ema(values: list[float], period: int) -> list[float]:
-    """Calculate exponential moving average."""
-    if not values or period < 1:
-        return []
-    k = 2.0 / (period + 1)
-    result = [values[0]]
-    for i in range(1, len(values)):
-        result.append(values[i] * k + result[-1] * (1 - k))
-    return result
-
-
 def keltner_channel_calculator(
     prices: list[float],
     period: int = 20,
@@ -64,10 +56,10 @@ def keltner_channel_calculator(
         true_ranges.insert(0, abs(prices[1] - prices[0]) if len(prices) > 1 else 0)
 
         # EMA of prices (middle band)
-        middle = _ema(prices, period)
+        middle = to_list(ema(prices, period, seed="first"))
 
         # ATR = EMA of true ranges
-        atr_values = _ema(true_ranges, period)
+        atr_values = to_list(ema(true_ranges, period, seed="first"))
 
         # Build channels
         upper = [round(m + atr_multiplier * a, 4) for m, a in zip(middle, atr_values)]
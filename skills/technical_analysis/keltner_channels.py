@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list, true_range, wilder_smooth
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "keltner_channels",
+    "deterministic": True,
     "description": "Calculates Keltner Channels: EMA midline with ATR-based upper and lower envelopes.",
     "inputSchema": {
         "type": "object",
@@ -69,27 +72,9 @@ def keltner_channels(**kwargs: Any) -> dict:
             lows_f.append(float(l))
             closes_f.append(float(c))
 
-        alpha = 2 / (ema_period + 1)
-        ema_series = [math.nan] * len(closes_f)
-        seed = sum(closes_f[:ema_period]) / ema_period
-        ema_series[ema_period - 1] = seed
-        ema_last = seed
-        for idx in range(ema_period, len(closes_f)):
-            ema_last = alpha * closes_f[idx] + (1 - alpha) * ema_last
-            ema_series[idx] = ema_last
-
-        tr_list = [0.0]
-        for idx in range(1, len(highs_f)):
-            tr = max(highs_f[idx] - lows_f[idx], abs(highs_f[idx] - closes_f[idx - 1]), abs(lows_f[idx] - closes_f[idx - 1]))
-            tr_list.append(tr)
-
-        atr_series = [math.nan] * len(tr_list)
-        initial_atr = sum(tr_list[1:atr_period + 1]) / atr_period
-        atr_series[atr_period] = initial_atr
-        prev_atr = initial_atr
-        for idx in range(atr_period + 1, len(tr_list)):
-            prev_atr = (prev_atr * (atr_period - 1) + tr_list[idx]) / atr_period
-            atr_series[idx] = prev_atr
+        ema_series = to_list(ema(closes_f, ema_period))
+        tr = true_range(highs_f, lows_f, closes_f)
+        atr_series = [math.nan] + to_list(wilder_smooth(tr[1:], atr_period))
 
         middle_line = ema_series[-1]
         current_atr = atr_series[-1]
@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "klinger_oscillator",
+    "deterministic": True,
     "description": "Implements the Klinger Volume Oscillator (fast/slow EMAs of volume force) with signal histogram.",
     "inputSchema": {
         "type": "object",
@@ -81,8 +84,8 @@ def klinger_oscillator(**kwargs: Any) -> dict:
             volume_force.append(volume * vf_component * (prev_trend or 1))
             prev_typical = typical
 
-        fast_ema = _ema(volume_force, fast)
-        slow_ema = _ema(volume_force, slow)
+        fast_ema = to_list(ema(volume_force, fast))
+        slow_ema = to_list(ema(volume_force, slow))
         kvo_series = []
         for fast_val, slow_val in zip(fast_ema, slow_ema):
             if math.isnan(fast_val) or math.isnan(slow_val):
@@ -90,7 +93,7 @@ def klinger_oscillator(**kwargs: Any) -> dict:
             else:
                 kvo_series.append(fast_val - slow_val)
 
-        signal_line = _ema(kvo_series, signal)
+        signal_line = to_list(ema(kvo_series, signal))
         histogram = []
         for kvo, sig in zip(kvo_series, signal_line):
             if math.isnan(kvo) or math.isnan(sig):
@@ -139,25 +142,6 @@ def klinger_oscillator(**kwargs: Any) -> dict:
         }
 
 
-def _ema(values: list[float], period: int) -> list[float]:
-    ema = [math.nan] * len(values)
-    valid = [value for value in values if not math.isnan(value)]
-    if len(valid) < period:
-        return ema
-    alpha = 2 / (period + 1)
-    seed = sum(valid[:period]) / period
-    first_index = values.index(valid[period - 1])
-    ema[first_index] = seed
-    prev = seed
-    for idx in range(first_index + 1, len(values)):
-        value = values[idx]
-        if math.isnan(value):
-            continue
-        prev = alpha * value + (1 - alpha) * prev
-        ema[idx] = prev
-    return ema
-
-
 def _log_lesson(message: str) -> None:
     try:
         with open("logs/lessons.md", "a") as f:
@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import sma, to_list
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "know_sure_thing",
+    "deterministic": True,
     "description": "Implements Martin Pring's KST oscillator via four smoothed rate-of-change components.",
     "inputSchema": {
         "type": "object",
@@ -74,27 +77,11 @@ def know_sure_thing(**kwargs: Any) -> dict:
                     series.append(((prices_f[idx] - base) / base) * 100)
             return series
 
-        def _sma(series: list[float], period: int) -> list[float]:
-            result = []
-            window: list[float] = []
-            for value in series:
-                if math.isnan(value):
-                    result.append(math.nan)
-                    continue
-                window.append(value)
-                if len(window) > period:
-                    window.pop(0)
-                if len(window) == period:
-                    result.append(sum(window) / period)
-                else:
-                    result.append(math.nan)
-            return result
-
         weights = [1, 2, 3, 4]
         weighted_components = []
         for weight, roc_p, sma_p in zip(weights, roc_periods, sma_periods):
             roc_series = _roc(int(roc_p))
-            smoothed = _sma(roc_series, int(sma_p))
+            smoothed = to_list(sma(roc_series, int(sma_p)))
             weighted_components.append([weight * value if not math.isnan(value) else math.nan for value in smoothed])
 
         kst_line = []
@@ -105,7 +92,7 @@ def know_sure_thing(**kwargs: Any) -> dict:
             else:
                 kst_line.append(sum(values))
 
-        signal_line = _sma(kst_line, signal_period)
+        signal_line = to_list(sma(kst_line, signal_period))
         current_kst = kst_line[-1]
         current_signal = signal_line[-1]
         if math.isnan(current_kst) or math.isnan(current_signal):
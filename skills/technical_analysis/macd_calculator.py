@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "macd_calculator",
+    "deterministic": True,
     "description": "Computes Moving Average Convergence Divergence (12/26/9 defaults) with bullish/bearish interpretation.",
     "inputSchema": {
         "type": "object",
@@ -73,48 +76,14 @@ def macd_calculator(**kwargs: Any) -> dict:
         if slow_period > len(prices):
             raise ValueError("slow_period cannot exceed price length")
 
-        def _ema(series: list[float], period: int) -> list[float]:
-            alpha = 2 / (period + 1)
-            ema_values = [math.nan] * len(series)
-            seed = sum(series[:period]) / period
-            ema_values[period - 1] = seed
-            ema_last = seed
-            for idx in range(period, len(series)):
-                ema_last = alpha * series[idx] + (1 - alpha) * ema_last
-                ema_values[idx] = ema_last
-            return ema_values
-
-        fast_ema = _ema(prices, fast_period)
-        slow_ema = _ema(prices, slow_period)
-        macd_line = []
-        for fast_val, slow_val in zip(fast_ema, slow_ema):
-            if math.isnan(fast_val) or math.isnan(slow_val):
-                macd_line.append(math.nan)
-            else:
-                macd_line.append(fast_val - slow_val)
-
-        non_nan_indices = [idx for idx, value in enumerate(macd_line) if not math.isnan(value)]
-        if len(non_nan_indices) < signal_period:
+        macd_values = ema(prices, fast_period) - ema(prices, slow_period)
+        if len(prices) - slow_period + 1 < signal_period:
             raise ValueError("insufficient MACD points for signal line")
+        signal_values = ema(macd_values, signal_period)
 
-        signal_series = [math.nan] * len(macd_line)
-        alpha_signal = 2 / (signal_period + 1)
-        seed_indices = non_nan_indices[:signal_period]
-        seed_values = [macd_line[idx] for idx in seed_indices]
-        seed = sum(seed_values) / signal_period
-        signal_series[seed_indices[-1]] = seed
-        last_signal = seed
-        for idx in non_nan_indices[signal_period:]:
-            value = macd_line[idx]
-            last_signal = alpha_signal * value + (1 - alpha_signal) * last_signal
-            signal_series[idx] = last_signal
-
-        histogram = []
-        for macd_val, sig_val in zip(macd_line, signal_series):
-            if math.isnan(macd_val) or math.isnan(sig_val):
-                histogram.append(math.nan)
-            else:
-                histogram.append(macd_val - sig_val)
+        macd_line = to_list(macd_values)
+        signal_series = to_list(signal_values)
+        histogram = to_list(macd_values - signal_values)
 
         current_macd = macd_line[-1]
         current_signal_value = signal_series[-1]
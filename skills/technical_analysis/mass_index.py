@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "mass_index",
+    "deterministic": True,
     "description": "Implements Donald Dorsey's Mass Index using double EMA of high-low range.",
     "inputSchema": {
         "type": "object",
@@ -59,8 +62,8 @@ def mass_index(**kwargs: Any) -> dict:
                 raise TypeError("price inputs must be numeric")
             ranges.append(float(h) - float(l))
 
-        ema1 = _ema(ranges, ema_period)
-        ema2 = _ema(ema1, ema_period)
+        ema1 = to_list(ema(ranges, ema_period))
+        ema2 = to_list(ema(ema1, ema_period))
         ratio = []
         for first, second in zip(ema1, ema2):
             if math.isnan(first) or math.isnan(second) or second == 0:
@@ -114,33 +117,6 @@ def mass_index(**kwargs: Any) -> dict:
         }
 
 
-def _ema(values: list[float], period: int) -> list[float]:
-    ema = [math.nan] * len(values)
-    if len(values) < period:
-        return ema
-    alpha = 2 / (period + 1)
-    # Skip leading NaN values to find valid seed window
-    valid_count = 0
-    start_idx = 0
-    for i, v in enumerate(values):
-        if math.isnan(v):
-            valid_count = 0
-            start_idx = i + 1
-        else:
-            valid_count += 1
-            if valid_count == period:
-                seed = sum(values[start_idx:i + 1]) / period
-                ema[i] = seed
-                prev = seed
-                for idx in range(i + 1, len(values)):
-                    if math.isnan(values[idx]):
-                        break
-                    prev = alpha * values[idx] + (1 - alpha) * prev
-                    ema[idx] = prev
-                return ema
-    return ema
-
-
 def _log_lesson(message: str) -> None:
     try:
         with open("logs/lessons.md", "a") as f:
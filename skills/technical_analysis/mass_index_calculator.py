@@ -6,8 +6,11 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list
+
 TOOL_META: dict[str, Any] = {
     "name": "mass_index_calculator",
+    "deterministic": True,
     "description": "Calculate the Mass Index, which uses the high-low range to identify trend reversals through 'reversal bulges'. A bulge above 27 followed by drop below 26.5 signals reversal.",
     "inputSchema": {
         "type": "object",
@@ -33,17 +36,6 @@ TOOL_META: dict[str, Any] = {
 }
 
 
-def _ema(values: list[float], period: int) -> list[float]:
-    """Calculate exponential moving average."""
-    if not values or period < 1:
-        return []
-    k = 2.0 / (period + 1)
-    result = [values[0]]
-    for i in range(1, len(values)):
-        result.append(values[i] * k + result[-1] * (1 - k))
-    return result
-
-
 def mass_index_calculator(
     highs: list[float],
     lows: list[float],
@@ -69,10 +61,10 @@ def mass_index_calculator(
         hl_range = [highs[i] - lows[i] for i in range(n)]
 
         # Single EMA(9) of range
-        ema9 = _ema(hl_range, 9)
+        ema9 = to_list(ema(hl_range, 9, seed="first"))
 
         # Double EMA(9) of range
-        double_ema9 = _ema(ema9, 9)
+        double_ema9 = to_list(ema(ema9, 9, seed="first"))
 
         # EMA ratio
         ratio: list[float] = []
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "momentum_oscillator",
+    "deterministic": True,
     "description": "Measures price momentum as the difference and percent change over a configurable lookback.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "money_flow_index",
+    "deterministic": True,
     "description": "Calculates the volume-weighted RSI known as Money Flow Index (MFI).",
     "inputSchema": {
         "type": "object",
@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import sma, to_list
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "moving_average_crossover",
+    "deterministic": True,
     "description": "Compares fast and slow simple moving averages to flag golden or death cross confirmations.",
     "inputSchema": {
         "type": "object",
@@ -68,23 +71,8 @@ def moving_average_crossover(**kwargs: Any) -> dict:
         if slow_period > len(prices):
             raise ValueError("slow_period cannot exceed price length")
 
-        def _sma(period: int) -> list[float]:
-            values = []
-            window: list[float] = []
-            total = 0.0
-            for price in prices:
-                window.append(price)
-                total += price
-                if len(window) > period:
-                    total -= window.pop(0)
-                if len(window) == period:
-                    values.append(total / period)
-                else:
-                    values.append(math.nan)
-            return values
-
-        fast_ma_series = _sma(fast_period)
-        slow_ma_series = _sma(slow_period)
+        fast_ma_series = to_list(sma(prices, fast_period))
+        slow_ma_series = to_list(sma(prices, slow_period))
         fast_ma = fast_ma_series[-1]
         slow_ma = slow_ma_series[-1]
         if math.isnan(fast_ma) or math.isnan(slow_ma):
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "moving_average_ribbon",
+    "deterministic": True,
     "description": "Calculates SMA values for multiple periods to form a ribbon and detect trend/squeeze signals.",
     "inputSchema": {
         "type": "object",
@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "negative_volume_index",
+    "deterministic": True,
     "description": "Computes the Negative Volume Index with a 255-day EMA signal line per Norman Fosback.",
     "inputSchema": {
         "type": "object",
@@ -63,7 +66,7 @@ def negative_volume_index(**kwargs: Any) -> dict:
             else:
                 nvi_series.append(prev_nvi)
 
-        signal_line = _ema(nvi_series, SIGNAL_PERIOD)
+        signal_line = to_list(ema(nvi_series, SIGNAL_PERIOD))
         current_nvi = nvi_series[-1]
         current_signal = signal_line[-1]
         if math.isnan(current_signal):
@@ -91,20 +94,6 @@ def negative_volume_index(**kwargs: Any) -> dict:
         }
 
 
-def _ema(values: list[float], period: int) -> list[float]:
-    ema = [math.nan] * len(values)
-    if len(values) < period:
-        return ema
-    alpha = 2 / (period + 1)
-    seed = sum(values[:period]) / period
-    ema[period - 1] = seed
-    prev = seed
-    for idx in range(period, len(values)):
-        prev = alpha * values[idx] + (1 - alpha) * prev
-        ema[idx] = prev
-    return ema
-
-
 def _log_lesson(message: str) -> None:
     try:
         with open("logs/lessons.md", "a") as f:
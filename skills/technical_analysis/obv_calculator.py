@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "obv_calculator",
+    "deterministic": True,
     "description": "Computes cumulative On-Balance Volume to confirm price trends vs volume flows.",
     "inputSchema": {
         "type": "object",
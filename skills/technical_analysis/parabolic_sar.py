@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "parabolic_sar",
+    "deterministic": True,
     "description": "Implements Welles Wilder's Parabolic SAR with configurable acceleration factors to trail price trends.",
     "inputSchema": {
         "type": "object",
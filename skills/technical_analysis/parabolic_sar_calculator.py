@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "parabolic_sar_calculator",
+    "deterministic": True,
     "description": "Calculate the Parabolic SAR (Stop and Reverse) indicator. Used for trailing stop placement and trend direction identification.",
     "inputSchema": {
         "type": "object",
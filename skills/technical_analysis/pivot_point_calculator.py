@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "pivot_point_calculator",
+    "deterministic": True,
     "description": "Computes pivot points and support/resistance for Standard, Fibonacci, Woodie, Camarilla, and DeMark methods.",
     "inputSchema": {
         "type": "object",
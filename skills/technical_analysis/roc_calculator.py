@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "roc_calculator",
+    "deterministic": True,
     "description": "Computes percentage rate of change and optional SMA smoothing to track acceleration.",
     "inputSchema": {
         "type": "object",
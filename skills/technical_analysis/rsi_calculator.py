@@ -9,16 +9,21 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
+
+from skills.utils.indicators import rsi_from_averages, to_list, wilder_smooth
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "rsi_calculator",
+    "deterministic": True,
     "description": "Computes RSI using J. Welles Wilder's smoothing to spot overbought or oversold conditions.",
     "inputSchema": {
         "type": "object",
         "properties": {
-            "prices": {"type": "array", "description": "Close prices (oldest first)."},
-            "period": {"type": "integer", "description": "RSI lookback period (default 14)."}
+            "prices": {"type": "array", "items": {"type": "number"}, "description": "Close prices (oldest first)."},
+            "period": {"type": "integer", "minimum": 2, "description": "RSI lookback period (default 14)."}
         },
         "required": ["prices", "period"]
     },
@@ -45,34 +50,15 @@ def rsi_calculator(**kwargs: Any) -> dict:
         if not isinstance(prices_raw, list) or len(prices_raw) <= period:
             raise ValueError("prices list must longer than the RSI period")
 
-        prices = []
-        for price in prices_raw:
-            if not isinstance(price, (int, float)):
-                raise TypeError("prices must contain numeric values")
-            prices.append(float(price))
-
-        gains = [0.0]
-        losses = [0.0]
-        for idx in range(1, len(prices)):
-            delta = prices[idx] - prices[idx - 1]
-            gains.append(max(delta, 0.0))
-            losses.append(abs(min(delta, 0.0)))
-
-        avg_gain = sum(gains[1:period + 1]) / period
-        avg_loss = sum(losses[1:period + 1]) / period
-        rsi_series = [math.nan] * len(prices)
-        rs = avg_gain / avg_loss if avg_loss != 0 else math.inf
-        rsi_series[period] = 100 - (100 / (1 + rs)) if math.isfinite(rs) else 100.0
+        # Element types are checked against inputSchema by the dispatcher.
+        prices = [float(price) for price in prices_raw]
 
-        for idx in range(period + 1, len(prices)):
-            avg_gain = ((avg_gain * (period - 1)) + gains[idx]) / period
-            avg_loss = ((avg_loss * (period - 1)) + losses[idx]) / period
-            if avg_loss == 0:
-                rsi_value = 100.0
-            else:
-                rs = avg_gain / avg_loss
-                rsi_value = 100 - (100 / (1 + rs))
-            rsi_series[idx] = rsi_value
+        delta = np.diff(prices)
+        avg_gains = wilder_smooth(np.maximum(delta, 0.0), period)
+        avg_losses = wilder_smooth(np.maximum(-delta, 0.0), period)
+        avg_gain = float(avg_gains[-1])
+        avg_loss = float(avg_losses[-1])
+        rsi_series = [math.nan] + to_list(rsi_from_averages(avg_gains, avg_losses))
 
         current_rsi = rsi_series[-1]
         if math.isnan(current_rsi):
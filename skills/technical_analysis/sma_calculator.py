@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "sma_calculator",
+    "deterministic": True,
     "description": "Calculates rolling simple moving averages to identify price alignment with key trend periods.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "standard_deviation_channel",
+    "deterministic": True,
     "description": "Performs least-squares regression on prices and offsets by standard deviation bands.",
     "inputSchema": {
         "type": "object",
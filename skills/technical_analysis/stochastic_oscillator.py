@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "stochastic_oscillator",
+    "deterministic": True,
     "description": "Implements George Lane's %K/%D oscillator with configurable slowing to detect momentum shifts.",
     "inputSchema": {
         "type": "object",
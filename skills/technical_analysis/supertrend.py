@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import to_list, true_range, wilder_smooth
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "supertrend",
+    "deterministic": True,
     "description": "Applies the Supertrend algorithm (ATR bands with dynamic flips) to mark trailing stops and trend phase.",
     "inputSchema": {
         "type": "object",
@@ -70,18 +73,8 @@ def supertrend(**kwargs: Any) -> dict:
             lows_f.append(float(l))
             closes_f.append(float(c))
 
-        trs = [0.0]
-        for idx in range(1, len(highs_f)):
-            tr = max(highs_f[idx] - lows_f[idx], abs(highs_f[idx] - closes_f[idx - 1]), abs(lows_f[idx] - closes_f[idx - 1]))
-            trs.append(tr)
-
-        atr = [math.nan] * len(trs)
-        initial_atr = sum(trs[1:period + 1]) / period
-        atr[period] = initial_atr
-        prev_atr = initial_atr
-        for idx in range(period + 1, len(trs)):
-            prev_atr = (prev_atr * (period - 1) + trs[idx]) / period
-            atr[idx] = prev_atr
+        trs = true_range(highs_f, lows_f, closes_f)
+        atr = [math.nan] + to_list(wilder_smooth(trs[1:], period))
 
         basic_upper = [math.nan] * len(highs_f)
         basic_lower = [math.nan] * len(highs_f)
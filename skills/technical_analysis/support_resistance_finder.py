@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "support_resistance_finder",
+    "deterministic": True,
     "description": "Finds price levels with multiple touches using swing highs/lows within a lookback window.",
     "inputSchema": {
         "type": "object",
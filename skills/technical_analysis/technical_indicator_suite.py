@@ -0,0 +1,386 @@
+"""
+Executive Summary: Computes many technical indicators over one OHLCV series in a single pass over shared intermediate arrays.
+Inputs: closes (list[float]), highs (list[float], optional), lows (list[float], optional), volumes (list[float], optional), indicators (list[dict]), tail (int, optional)
+Outputs: bars (int), indicators (dict keyed by spec key: indicator, params, current, series)
+MCP Tool Name: technical_indicator_suite
+"""
+import logging
+import math
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from skills.utils.indicators import (
+    ema,
+    rolling_max,
+    rolling_min,
+    rolling_std,
+    rsi_from_averages,
+    sma,
+    true_range,
+    typical_price,
+    wilder_smooth,
+)
+from skills.utils.logging import log_lesson
+
+logger = logging.getLogger("snowdrop.skills")
+
+TOOL_META = {
+    "name": "technical_indicator_suite",
+    "deterministic": True,
+    "description": (
+        "Computes several indicators (sma, ema, rsi, macd, bollinger, atr, adx, vwap, stochastic, williams_r, "
+        "cci, obv, roc, donchian) over one OHLCV series in a single call, sharing returns, true range, moving "
+        "averages and rolling extremes between them and returning only the requested outputs."
+    ),
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "closes": {"type": "array", "items": {"type": "number"}, "description": "Close prices (oldest first)."},
+            "highs": {"type": "array", "items": {"type": "number"}, "description": "High prices; needed by atr, adx, stochastic, williams_r, cci, donchian, vwap."},
+            "lows": {"type": "array", "items": {"type": "number"}, "description": "Low prices; needed with highs."},
+            "volumes": {"type": "array", "items": {"type": "number"}, "description": "Volumes; needed by vwap and obv."},
+            "indicators": {
+                "type": "array",
+                "items": {"type": "object"},
+                "description": (
+                    "Indicator specs, e.g. {\"indicator\": \"rsi\", \"period\": 21}. Optional \"key\" names the result "
+                    "(default: indicator plus parameter values, e.g. rsi_21) and \"outputs\" restricts the returned fields."
+                ),
+            },
+            "tail": {
+                "type": "integer",
+                "description": "Return only the last N points of each series; 0 returns current values only (default: full series).",
+            },
+        },
+        "required": ["closes", "indicators"],
+    },
+    "outputSchema": {
+        "type": "object",
+        "properties": {
+            "status": {"type": "string"},
+            "timestamp": {"type": "string"},
+            "data": {"type": "object"},
+        },
+        "required": ["status", "timestamp"],
+    },
+}
+
+
+class _Workspace:
+    """Input series plus intermediates shared across indicators, each computed at most once."""
+
+    def __init__(self, closes: np.ndarray, highs: np.ndarray | None, lows: np.ndarray | None,
+                 volumes: np.ndarray | None) -> None:
+        self.close = closes
+        self._high = highs
+        self._low = lows
+        self._volume = volumes
+        self._memo: dict[tuple, Any] = {}
+
+    def _get(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def high_low(self, indicator: str) -> tuple[np.ndarray, np.ndarray]:
+        if self._high is None or self._low is None:
+            raise ValueError(f"{indicator} requires highs and lows")
+        return self._high, self._low
+
+    def volume(self, indicator: str) -> np.ndarray:
+        if self._volume is None:
+            raise ValueError(f"{indicator} requires volumes")
+        return self._volume
+
+    def delta(self) -> np.ndarray:
+        return self._get(("delta",), lambda: np.diff(self.close))
+
+    def ema(self, period: int) -> np.ndarray:
+        return self._get(("ema", period), lambda: ema(self.close, period))
+
+    def sma(self, period: int) -> np.ndarray:
+        return self._get(("sma", period), lambda: sma(self.close, period))
+
+    def true_range(self, indicator: str) -> np.ndarray:
+        high, low = self.high_low(indicator)
+        return self._get(("tr",), lambda: true_range(high, low, self.close))
+
+    def atr(self, period: int, indicator: str) -> np.ndarray:
+        tr = self.true_range(indicator)
+        return self._get(("atr", period), lambda: np.concatenate(([math.nan], wilder_smooth(tr[1:], period))))
+
+    def typical_price(self, indicator: str) -> np.ndarray:
+        high, low = self.high_low(indicator)
+        return self._get(("tp",), lambda: typical_price(high, low, self.close))
+
+    def highest(self, period: int, indicator: str) -> np.ndarray:
+        high, _ = self.high_low(indicator)
+        return self._get(("highest", period), lambda: rolling_max(high, period))
+
+    def lowest(self, period: int, indicator: str) -> np.ndarray:
+        _, low = self.high_low(indicator)
+        return self._get(("lowest", period), lambda: rolling_min(low, period))
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray, fill: float) -> np.ndarray:
+    """numerator / denominator with fill where the denominator is zero (NaN stays NaN)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator == 0, fill, numerator / denominator)
+
+
+def _expanding_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Trailing mean over up to period non-NaN values (partial windows allowed)."""
+    out = np.full(values.shape, np.nan)
+    valid = ~np.isnan(values)
+    compact = values[valid]
+    if len(compact):
+        csum = np.concatenate(([0.0], np.cumsum(compact)))
+        idx = np.arange(1, len(compact) + 1)
+        start = np.maximum(idx - period, 0)
+        out[valid] = (csum[idx] - csum[start]) / (idx - start)
+    return out
+
+
+def _sma(ws: _Workspace, period: int) -> dict[str, np.ndarray]:
+    return {"sma": ws.sma(period)}
+
+
+def _ema(ws: _Workspace, period: int) -> dict[str, np.ndarray]:
+    return {"ema": ws.ema(period)}
+
+
+def _rsi(ws: _Workspace, period: int) -> dict[str, np.ndarray]:
+    delta = ws.delta()
+    avg_gain = wilder_smooth(np.maximum(delta, 0.0), period)
+    avg_loss = wilder_smooth(np.maximum(-delta, 0.0), period)
+    return {"rsi": np.concatenate(([math.nan], rsi_from_averages(avg_gain, avg_loss)))}
+
+
+def _macd(ws: _Workspace, fast_period: int, slow_period: int, signal_period: int) -> dict[str, np.ndarray]:
+    if fast_period >= slow_period:
+        raise ValueError("macd fast_period must be less than slow_period")
+    line = ws.ema(fast_period) - ws.ema(slow_period)
+    signal = ema(line, signal_period)
+    return {"macd": line, "signal": signal, "histogram": line - signal}
+
+
+def _bollinger(ws: _Workspace, period: int, num_std: float) -> dict[str, np.ndarray]:
+    middle = ws.sma(period)
+    width = num_std * rolling_std(ws.close, period)
+    upper, lower = middle + width, middle - width
+    return {
+        "upper": upper,
+        "middle": middle,
+        "lower": lower,
+        "percent_b": _ratio(ws.close - lower, upper - lower, 0.5),
+        "bandwidth": _ratio(upper - lower, middle, math.inf),
+    }
+
+
+def _atr(ws: _Workspace, period: int) -> dict[str, np.ndarray]:
+    atr = ws.atr(period, "atr")
+    return {"atr": atr, "natr": _ratio(atr * 100, ws.close, math.inf)}
+
+
+def _adx(ws: _Workspace, period: int) -> dict[str, np.ndarray]:
+    high, low = ws.high_low("adx")
+    up_move = np.diff(high)
+    down_move = -np.diff(low)
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    atr = ws.atr(period, "adx")
+    # A zero smoothed true range leaves DI undefined (NaN), as in adx_calculator.
+    tr_smooth = np.where(atr == 0, math.nan, atr)
+    plus_di = np.concatenate(([math.nan], 100 * wilder_smooth(plus_dm, period))) / tr_smooth
+    minus_di = np.concatenate(([math.nan], 100 * wilder_smooth(minus_dm, period))) / tr_smooth
+    dx = _ratio(100 * np.abs(plus_di - minus_di), plus_di + minus_di, 0.0)
+    return {"adx": wilder_smooth(dx, period), "plus_di": plus_di, "minus_di": minus_di}
+
+
+def _vwap(ws: _Workspace) -> dict[str, np.ndarray]:
+    volume = ws.volume("vwap")
+    tp = ws.typical_price("vwap")
+    cum_volume = np.cumsum(volume)
+    vwap = _ratio(np.cumsum(tp * volume), cum_volume, math.nan)
+    variance = _ratio(np.cumsum(volume * tp * tp), cum_volume, math.nan) - vwap * vwap
+    return {"vwap": vwap, "std_dev": np.sqrt(np.maximum(variance, 0.0))}
+
+
+def _stochastic(ws: _Workspace, k_period: int, d_period: int, slowing: int) -> dict[str, np.ndarray]:
+    highest = ws.highest(k_period, "stochastic")
+    lowest = ws.lowest(k_period, "stochastic")
+    fast_k = _ratio((ws.close - lowest) * 100, highest - lowest, 0.0)
+    slow_k = _expanding_mean(fast_k, slowing)
+    return {"k": slow_k, "d": _expanding_mean(slow_k, d_period)}
+
+
+def _williams_r(ws: _Workspace, period: int) -> dict[str, np.ndarray]:
+    highest = ws.highest(period, "williams_r")
+    lowest = ws.lowest(period, "williams_r")
+    return {"williams_r": _ratio(-100 * (highest - ws.close), highest - lowest, 0.0)}
+
+
+def _cci(ws: _Workspace, period: int, constant: float) -> dict[str, np.ndarray]:
+    tp = ws.typical_price("cci")
+    cci = np.full(tp.shape, np.nan)
+    if len(tp) >= period:
+        windows = sliding_window_view(tp, period)
+        mean = windows.mean(axis=1)
+        mean_dev = np.abs(windows - mean[:, None]).mean(axis=1)
+        cci[period - 1:] = _ratio(tp[period - 1:] - mean, constant * mean_dev, 0.0)
+    return {"cci": cci}
+
+
+def _obv(ws: _Workspace) -> dict[str, np.ndarray]:
+    volume = ws.volume("obv")
+    flow = np.sign(ws.delta()) * volume[1:]
+    return {"obv": np.concatenate(([0.0], np.cumsum(flow)))}
+
+
+def _roc(ws: _Workspace, period: int) -> dict[str, np.ndarray]:
+    roc = np.full(ws.close.shape, np.nan)
+    if len(roc) > period:
+        base = ws.close[:-period]
+        roc[period:] = _ratio((ws.close[period:] - base) * 100, base, math.nan)
+    return {"roc": roc}
+
+
+def _donchian(ws: _Workspace, period: int) -> dict[str, np.ndarray]:
+    upper = ws.highest(period, "donchian")
+    lower = ws.lowest(period, "donchian")
+    return {"upper": upper, "middle": (upper + lower) / 2, "lower": lower}
+
+
+# indicator -> (function, default parameters). Defaults also define each parameter's type.
+_INDICATORS: dict[str, tuple[Callable[..., dict[str, np.ndarray]], dict[str, int | float]]] = {
+    "sma": (_sma, {"period": 20}),
+    "ema": (_ema, {"period": 20}),
+    "rsi": (_rsi, {"period": 14}),
+    "macd": (_macd, {"fast_period": 12, "slow_period": 26, "signal_period": 9}),
+    "bollinger": (_bollinger, {"period": 20, "num_std": 2.0}),
+    "atr": (_atr, {"period": 14}),
+    "adx": (_adx, {"period": 14}),
+    "vwap": (_vwap, {}),
+    "stochastic": (_stochastic, {"k_period": 14, "d_period": 3, "slowing": 3}),
+    "williams_r": (_williams_r, {"period": 14}),
+    "cci": (_cci, {"period": 20, "constant": 0.015}),
+    "obv": (_obv, {}),
+    "roc": (_roc, {"period": 12}),
+    "donchian": (_donchian, {"period": 20}),
+}
+
+
+def _parse_spec(spec: Any) -> tuple[str, str, dict[str, int | float], list[str] | None]:
+    if not isinstance(spec, dict):
+        raise ValueError("each indicator spec must be an object")
+    name = spec.get("indicator")
+    if name not in _INDICATORS:
+        raise ValueError(f"unknown indicator {name!r}; expected one of {sorted(_INDICATORS)}")
+    defaults = _INDICATORS[name][1]
+    unknown = set(spec) - set(defaults) - {"indicator", "key", "outputs"}
+    if unknown:
+        raise ValueError(f"{name}: unknown parameter(s) {sorted(unknown)}")
+
+    params: dict[str, int | float] = {}
+    for param, default in defaults.items():
+        value = spec.get(param, default)
+        if isinstance(default, int):
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise ValueError(f"{name}: {param} must be a positive integer")
+        elif not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+            raise ValueError(f"{name}: {param} must be a positive number")
+        params[param] = value
+
+    key = spec.get("key") or "_".join([name, *(str(value) for value in params.values())])
+    outputs = spec.get("outputs")
+    if outputs is not None and (not isinstance(outputs, list) or not all(isinstance(o, str) for o in outputs)):
+        raise ValueError(f"{name}: outputs must be a list of output names")
+    return name, str(key), params, outputs
+
+
+def _series(values: Any, label: str, length: int | None) -> np.ndarray | None:
+    if values is None:
+        return None
+    if not isinstance(values, list):
+        raise ValueError(f"{label} must be a list")
+    if length is not None and len(values) != length:
+        raise ValueError(f"{label} must have the same length as closes")
+    if any(isinstance(value, bool) or not isinstance(value, (int, float)) for value in values):
+        raise TypeError(f"{label} must be numeric")
+    return np.asarray(values, dtype=float)
+
+
+def _current(series: np.ndarray) -> float | None:
+    value = float(series[-1])
+    return None if math.isnan(value) else value
+
+
+def _to_list(series: np.ndarray) -> list[float | None]:
+    """series as a JSON-safe list: NaN warm-up bars become None, as in current."""
+    values = series.tolist()
+    if not np.isnan(series).any():
+        return values
+    return [None if math.isnan(value) else value for value in values]
+
+
+def technical_indicator_suite(**kwargs: Any) -> dict:
+    """Validates the OHLCV series once, computes each requested indicator from shared intermediates and returns the selected outputs."""
+    try:
+        closes = _series(kwargs.get("closes"), "closes", None)
+        if closes is None or len(closes) < 2:
+            raise ValueError("closes must contain at least two prices")
+        n = len(closes)
+        ws = _Workspace(
+            closes,
+            _series(kwargs.get("highs"), "highs", n),
+            _series(kwargs.get("lows"), "lows", n),
+            _series(kwargs.get("volumes"), "volumes", n),
+        )
+
+        specs = kwargs.get("indicators")
+        if not isinstance(specs, list) or not specs:
+            raise ValueError("indicators must be a non-empty list of specs")
+        tail = kwargs.get("tail")
+        if tail is not None and (not isinstance(tail, int) or isinstance(tail, bool) or tail < 0):
+            raise ValueError("tail must be a non-negative integer")
+
+        parsed = [_parse_spec(spec) for spec in specs]
+        keys = [key for _, key, _, _ in parsed]
+        duplicates = sorted({key for key in keys if keys.count(key) > 1})
+        if duplicates:
+            raise ValueError(f"duplicate indicator keys {duplicates}; set a distinct 'key' per spec")
+
+        results: dict[str, Any] = {}
+        for name, key, params, outputs in parsed:
+            computed = _INDICATORS[name][0](ws, **params)
+            if outputs is not None:
+                missing = sorted(set(outputs) - set(computed))
+                if missing:
+                    raise ValueError(f"{name}: unknown output(s) {missing}; available {sorted(computed)}")
+                computed = {output: computed[output] for output in outputs}
+            entry: dict[str, Any] = {
+                "indicator": name,
+                "params": params,
+                "current": {output: _current(values) for output, values in computed.items()},
+            }
+            if tail != 0:
+                start = 0 if tail is None else max(n - tail, 0)
+                entry["series"] = {output: _to_list(values[start:]) for output, values in computed.items()}
+            results[key] = entry
+
+        return {
+            "status": "success",
+            "data": {"bars": n, "indicators": results},
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+    except (ValueError, TypeError, ZeroDivisionError) as e:
+        logger.error(f"technical_indicator_suite failed: {e}")
+        log_lesson(f"technical_indicator_suite: {e}")
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "trend_line_calculator",
+    "deterministic": True,
     "description": "Constructs trendlines using linear regression or peak/trough anchors to monitor price breaks.",
     "inputSchema": {
         "type": "object",
@@ -6,8 +6,11 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list
+
 TOOL_META: dict[str, Any] = {
     "name": "trix_indicator_calculator",
+    "deterministic": True,
     "description": "Calculate the TRIX indicator, a momentum oscillator based on the rate of change of a triple-smoothed EMA. Filters out insignificant price movements.",
     "inputSchema": {
         "type": "object",
@@ -28,17 +31,6 @@ TOOL_META: dict[str, Any] = {
 }
 
 
-def _ema(values: list[float], period: int) -> list[float]:
-    """Calculate exponential moving average."""
-    if not values or period < 1:
-        return []
-    k = 2.0 / (period + 1)
-    result = [values[0]]
-    for i in range(1, len(values)):
-        result.append(values[i] * k + result[-1] * (1 - k))
-    return result
-
-
 def trix_indicator_calculator(
     closes: list[float],
     period: int = 15,
@@ -53,9 +45,9 @@ def trix_indicator_calculator(
             }
 
         # Triple EMA
-        ema1 = _ema(closes, period)
-        ema2 = _ema(ema1, period)
-        ema3 = _ema(ema2, period)
+        ema1 = to_list(ema(closes, period, seed="first"))
+        ema2 = to_list(ema(ema1, period, seed="first"))
+        ema3 = to_list(ema(ema2, period, seed="first"))
 
         # TRIX = percent change of triple EMA
         trix_values: list[float] = []
@@ -9,10 +9,13 @@ import math
 from datetime import datetime, timezone
 from typing import Any
 
+from skills.utils.indicators import ema, to_list
+
 logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "tsi_calculator",
+    "deterministic": True,
     "description": "Calculates William Blau's True Strength Index via double EMA of price momentum.",
     "inputSchema": {
         "type": "object",
@@ -59,29 +62,10 @@ def tsi_calculator(**kwargs: Any) -> dict:
             prices_f.append(float(price))
 
         def _ema_from(series: list[float], period: int) -> list[float]:
-            alpha = 2 / (period + 1)
-            ema = [math.nan] * len(series)
-            buffer: list[float] = []
-            start_index = None
-            for idx, value in enumerate(series):
-                if math.isnan(value):
-                    continue
-                buffer.append(value)
-                if len(buffer) == period:
-                    seed = sum(buffer) / period
-                    ema[idx] = seed
-                    prev = seed
-                    start_index = idx + 1
-                    break
-            if start_index is None:
+            smoothed = to_list(ema(series, period))
+            if all(math.isnan(value) for value in smoothed):
                 raise ValueError("insufficient data for EMA calculation")
-            for idx in range(start_index, len(series)):
-                value = series[idx]
-                if math.isnan(value):
-                    continue
-                prev = alpha * value + (1 - alpha) * prev
-                ema[idx] = prev
-            return ema
+            return smoothed
 
         momentum = [math.nan]
         abs_momentum = [math.nan]
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "ulcer_index",
+    "deterministic": True,
     "description": "Computes the Ulcer Index and related drawdown metrics to capture downside pain.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "vix_term_structure_analyzer",
+    "deterministic": True,
     "description": "Analyzes VIX futures prices by expiry to identify contango/backwardation and roll yield.",
     "inputSchema": {
         "type": "object",
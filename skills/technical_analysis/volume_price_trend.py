@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "volume_price_trend",
+    "deterministic": True,
     "description": "Calculates cumulative Volume Price Trend and compares against SMA to detect divergences.",
     "inputSchema": {
         "type": "object",
@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "vwap_calculator",
+    "deterministic": True,
     "description": "Computes VWAP from typical price (H+L+C)/3 and derives 1/2 standard deviation bands.",
     "inputSchema": {
         "type": "object",
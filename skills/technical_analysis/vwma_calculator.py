@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "vwma_calculator",
+    "deterministic": True,
     "description": "Computes the volume-weighted moving average to compare price trends against standard SMA and confirm with volume.",
     "inputSchema": {
         "type": "object",
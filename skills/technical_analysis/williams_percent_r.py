@@ -13,6 +13,7 @@ logger = logging.getLogger("snowdrop.skills")
 
 TOOL_META = {
     "name": "williams_percent_r",
+    "deterministic": True,
     "description": "Calculates Larry Williams' %R oscillator comparing close versus the highest/lowest range.",
     "inputSchema": {
         "type": "object",
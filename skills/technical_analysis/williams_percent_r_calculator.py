@@ -8,6 +8,7 @@ from typing import Any
 
 TOOL_META: dict[str, Any] = {
     "name": "williams_percent_r_calculator",
+    "deterministic": True,
     "description": "Calculate Williams %R, a momentum oscillator ranging from -100 to 0. Readings above -20 are overbought; below -80 are oversold.",
     "inputSchema": {
         "type": "object",
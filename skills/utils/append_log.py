@@ -0,0 +1,335 @@
+"""Buffered, group-committed writer for append-only JSONL logs.
+
+Skill telemetry used to open its log, write one line and close it again for
+every sample. An AppendLog keeps the file descriptor open and buffers lines in
+memory, then writes everything pending with a single write() ("group commit")
+once the buffer holds flush_lines lines or flush_bytes bytes, or its oldest
+line is flush_interval seconds old. Age is checked on every append and by one
+shared daemon thread, so a quiet log is still written promptly.
+
+With flush_lines=1 the log is write-through, as the compliance audit trail
+uses it: each line is on disk before append() returns and write errors reach
+the caller.
+
+After each group write the fsync policy decides durability: "always" fsyncs
+every group, "interval" at most once per fsync_interval seconds, "never"
+leaves it to the OS. Files rotate by size (<path>.1 ... <path>.N, shared
+with LessonSink) and/or daily, moving the previous day's file to
+<path>.YYYY-MM-DD. Logs obtained from get_append_log() are flushed, synced and
+closed at interpreter exit.
+"""
+from __future__ import annotations
+
+import atexit
+import contextlib
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("snowdrop.skills")
+
+# Group-commit thresholds: pending lines, pending bytes, and max age (seconds) of a pending line.
+_FLUSH_LINES: int = int(os.environ.get("SNOWDROP_APPEND_LOG_FLUSH_LINES", "256"))
+_FLUSH_BYTES: int = int(os.environ.get("SNOWDROP_APPEND_LOG_FLUSH_BYTES", str(1024 * 1024)))
+_FLUSH_INTERVAL: float = float(os.environ.get("SNOWDROP_APPEND_LOG_FLUSH_INTERVAL", "1.0"))
+# fsync policy after a group write: always | interval | never.
+_FSYNC: str = str(os.environ.get("SNOWDROP_APPEND_LOG_FSYNC", "interval"))
+_FSYNC_INTERVAL: float = float(os.environ.get("SNOWDROP_APPEND_LOG_FSYNC_INTERVAL", "5.0"))
+# Rotation: size threshold in bytes (0 disables), "daily" or "none", and numbered backups kept.
+_MAX_BYTES: int = int(os.environ.get("SNOWDROP_APPEND_LOG_MAX_BYTES", "0"))
+_ROTATE: str = str(os.environ.get("SNOWDROP_APPEND_LOG_ROTATE", "none"))
+_BACKUP_COUNT: int = int(os.environ.get("SNOWDROP_APPEND_LOG_BACKUPS", "5"))
+
+FSYNC_POLICIES = ("always", "interval", "never")
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def rotate_numbered(path: Path, backup_count: int) -> None:
+    """Shift <path>.1 ... <path>.N-1 up by one and move path to <path>.1 (delete it if N is 0)."""
+    if backup_count <= 0:
+        path.unlink(missing_ok=True)
+        return
+    for index in range(backup_count - 1, 0, -1):
+        src = path.with_name(f"{path.name}.{index}")
+        if src.exists():
+            src.replace(path.with_name(f"{path.name}.{index + 1}"))
+    path.replace(path.with_name(f"{path.name}.1"))
+
+
+class AppendLog:
+    """Thread-safe buffered appender for one file."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        flush_lines: int = _FLUSH_LINES,
+        flush_bytes: int = _FLUSH_BYTES,
+        flush_interval: float = _FLUSH_INTERVAL,
+        fsync: str = _FSYNC,
+        fsync_interval: float = _FSYNC_INTERVAL,
+        max_bytes: int = _MAX_BYTES,
+        rotate: str = _ROTATE,
+        backup_count: int = _BACKUP_COUNT,
+    ) -> None:
+        """
+        Args:
+            path: File to append to (parent directories are created).
+            flush_lines: Write once this many lines are pending (1 writes through).
+            flush_bytes: Write once this many bytes are pending.
+            flush_interval: Write once the oldest pending line is this many seconds old.
+            fsync: "always", "interval" or "never".
+            fsync_interval: Minimum seconds between fsyncs under the "interval" policy.
+            max_bytes: Rotate before a write once the file reaches this size (0 disables).
+            rotate: "daily" to start a new file each UTC day, "none" otherwise.
+            backup_count: Size-rotated files kept as <path>.1 ... <path>.N.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        if rotate not in ("daily", "none"):
+            raise ValueError(f"rotate must be 'daily' or 'none', got {rotate!r}")
+        self.path = Path(path)
+        self.flush_lines = max(1, flush_lines)
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+        self.rotate = rotate
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._first_pending = 0.0
+        self._fd: int | None = None
+        self._size = 0
+        self._day: date | None = None
+        self._last_fsync = 0.0
+        self._unsynced = False
+        self._closed = False
+        self.written = 0
+        self.flushes = 0
+        self.fsyncs = 0
+        self.rotations = 0
+        self.write_errors = 0
+        self.dropped = 0
+
+    def append(self, line: str) -> None:
+        """Buffer one line (newline added if missing), writing the group if a threshold is hit.
+
+        With flush_lines=1 every line is written (and synced, per the fsync
+        policy) before this returns. After close() lines are written through
+        unbuffered, so late events at shutdown are not lost.
+
+        Raises:
+            OSError: If a write triggered by this call failed; that group's
+                lines are dropped and counted.
+        """
+        if not line.endswith("\n"):
+            line += "\n"
+        data = line.encode("utf-8")
+        with self._lock:
+            if not self._pending:
+                self._first_pending = time.monotonic()
+            self._pending.append(data)
+            self._pending_bytes += len(data)
+            if (
+                self._closed
+                or len(self._pending) >= self.flush_lines
+                or self._pending_bytes >= self.flush_bytes
+                or time.monotonic() - self._first_pending >= self.flush_interval
+            ):
+                self._write_pending()
+                if self._closed:
+                    self._close_fd(sync=self.fsync != "never")
+
+    def flush(self, sync: bool = False) -> None:
+        """Write every pending line now; with sync=True also fsync regardless of policy.
+
+        Raises:
+            OSError: If the write or fsync failed.
+        """
+        with self._lock:
+            self._write_pending()
+            if sync and self._unsynced and self._fd is not None and self.fsync != "never":
+                self._sync()
+
+    def flush_if_due(self) -> None:
+        """Write pending lines whose age exceeds flush_interval (called by the flusher thread)."""
+        with self._lock:
+            if self._pending and time.monotonic() - self._first_pending >= self.flush_interval:
+                with contextlib.suppress(OSError):  # logged and counted by _write_pending
+                    self._write_pending()
+
+    def close(self) -> None:
+        """Flush, fsync (unless the policy is "never") and release the file descriptor."""
+        with self._lock:
+            with contextlib.suppress(OSError):  # logged and counted by _write_pending
+                self._write_pending()
+            self._close_fd(sync=self.fsync != "never")
+            self._closed = True
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for monitoring."""
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "pending": len(self._pending),
+                "written": self.written,
+                "flushes": self.flushes,
+                "fsyncs": self.fsyncs,
+                "rotations": self.rotations,
+                "write_errors": self.write_errors,
+                "dropped": self.dropped,
+            }
+
+    # -- internals (caller holds the lock) ---------------------------------
+
+    def _write_pending(self) -> None:
+        if not self._pending:
+            return
+        batch, count = b"".join(self._pending), len(self._pending)
+        self._pending.clear()
+        self._pending_bytes = 0
+        try:
+            self._maybe_rotate()
+            if self._fd is None:
+                self._open()
+            view = memoryview(batch)
+            while view:
+                view = view[os.write(self._fd, view):]
+        except OSError as exc:
+            self.write_errors += 1
+            self.dropped += count
+            logger.error(f"AppendLog failed to write {count} line(s) to {self.path}: {exc}")
+            self._close_fd(sync=False)
+            raise
+        self._size += len(batch)
+        self._unsynced = True
+        self.written += count
+        self.flushes += 1
+        if self.fsync == "always" or (
+            self.fsync == "interval" and time.monotonic() - self._last_fsync >= self.fsync_interval
+        ):
+            try:
+                self._sync()
+            except OSError as exc:
+                self.write_errors += 1
+                logger.error(f"AppendLog failed to fsync {self.path}: {exc}")
+                raise
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # O_APPEND keeps each group write intact when several processes share the file.
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        info = os.fstat(self._fd)
+        self._size = info.st_size
+        if self._day is None:
+            self._day = datetime.fromtimestamp(info.st_mtime, timezone.utc).date() if info.st_size else _today()
+
+    def _sync(self) -> None:
+        os.fsync(self._fd)
+        self._unsynced = False
+        self._last_fsync = time.monotonic()
+        self.fsyncs += 1
+
+    def _close_fd(self, sync: bool) -> None:
+        if self._fd is None:
+            return
+        try:
+            if sync and self._unsynced:
+                self._sync()
+        except OSError as exc:
+            logger.error(f"AppendLog failed to fsync {self.path}: {exc}")
+        finally:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def _maybe_rotate(self) -> None:
+        if self._fd is None and not self.path.exists():
+            return
+        if self._fd is None:
+            self._open()
+        today = _today() if self.rotate == "daily" else None
+        if today is not None and self._day is not None and today != self._day and self._size:
+            self._close_fd(sync=self.fsync != "never")
+            self.path.replace(self._dated_name(self._day))
+            self.rotations += 1
+        elif self.max_bytes and self._size >= self.max_bytes:
+            self._close_fd(sync=self.fsync != "never")
+            rotate_numbered(self.path, self.backup_count)
+            self.rotations += 1
+        self._day = today or self._day
+
+    def _dated_name(self, day: date) -> Path:
+        target = self.path.with_name(f"{self.path.name}.{day.isoformat()}")
+        index = 1
+        while target.exists():
+            target = self.path.with_name(f"{self.path.name}.{day.isoformat()}.{index}")
+            index += 1
+        return target
+
+
+_LOGS: dict[str, AppendLog] = {}  # by absolute path
+_ALIASES: dict[str, AppendLog] = {}  # by the path as callers pass it, to skip abspath() per call
+_LOGS_LOCK = threading.Lock()
+_FLUSHER: threading.Thread | None = None
+_STOP = threading.Event()
+
+
+def get_append_log(path: str | Path, **options: Any) -> AppendLog:
+    """Process-wide AppendLog for a path, created on first use and closed at exit.
+
+    Options (see AppendLog) only apply when the log is first created.
+    """
+    alias = os.fspath(path)
+    log = _ALIASES.get(alias)
+    if log is not None:
+        return log
+    global _FLUSHER
+    key = os.path.abspath(alias)
+    with _LOGS_LOCK:
+        log = _LOGS.get(key)
+        if log is None:
+            log = _LOGS[key] = AppendLog(path, **options)
+        _ALIASES[alias] = log
+        if _FLUSHER is None:
+            _FLUSHER = threading.Thread(target=_flush_loop, name="snowdrop-append-log", daemon=True)
+            _FLUSHER.start()
+            atexit.register(close_all)
+        return log
+
+
+def _flush_loop() -> None:
+    while not _STOP.wait(min([_FLUSH_INTERVAL] + [log.flush_interval for log in list(_LOGS.values())]) / 2):
+        for log in list(_LOGS.values()):
+            log.flush_if_due()
+
+
+def flush_all(sync: bool = False) -> None:
+    """Write pending lines of every registered log (failures are logged and counted)."""
+    for log in list(_LOGS.values()):
+        with contextlib.suppress(OSError):
+            log.flush(sync=sync)
+
+
+def close_all() -> None:
+    """Flush and close every registered log and stop the flusher thread."""
+    _STOP.set()
+    for log in list(_LOGS.values()):
+        log.close()
+
+
+def append_log_stats() -> dict[str, Any]:
+    """Per-log counters keyed by path, for /health."""
+    return {key: log.stats() for key, log in list(_LOGS.items())}
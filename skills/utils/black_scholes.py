@@ -0,0 +1,199 @@
+"""Vectorised Black-Scholes / Garman-Kohlhagen pricing core.
+
+Shared by the option pricing skills. Every function broadcasts over NumPy
+arrays (or plain scalars), so a whole option chain is priced, risked or
+inverted for implied volatility in one call. A continuous yield ``carry``
+covers dividends, and the foreign rate for FX options (Garman-Kohlhagen).
+
+NumPy has no erf, so the normal CDF applies math.erfc element-wise through a
+ufunc. That keeps full double precision in both tails, and everything else
+stays array arithmetic.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import numpy as np
+
+_SQRT_2 = math.sqrt(2.0)
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+
+# Volatility search interval for implied-vol solving (0.01% to 500%).
+VOL_LOWER = 1e-4
+VOL_UPPER = 5.0
+
+
+def norm_cdf(x: Any) -> np.ndarray:
+    """Standard normal CDF, element-wise."""
+    return 0.5 * np.asarray(_erfc(-np.asarray(x, dtype=float) / _SQRT_2), dtype=float)
+
+
+def norm_pdf(x: Any) -> np.ndarray:
+    """Standard normal density, element-wise."""
+    x = np.asarray(x, dtype=float)
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def _is_call(option_type: Any) -> np.ndarray:
+    """Boolean call mask from 'call'/'put' strings (any case) or booleans.
+
+    Raises:
+        ValueError: If an entry is neither call nor put.
+    """
+    kinds = np.asarray(option_type)
+    if kinds.dtype == bool:
+        return kinds
+    lowered = np.char.lower(kinds.astype(str))
+    if not np.all((lowered == "call") | (lowered == "put")):
+        raise ValueError("option_type must be 'call' or 'put'")
+    return lowered == "call"
+
+
+def _broadcast(*values: Any) -> list[np.ndarray]:
+    return np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in values))
+
+
+def d1_d2(spot: Any, strike: Any, t: Any, rate: Any, vol: Any, carry: Any = 0.0) -> tuple[np.ndarray, np.ndarray]:
+    """Black-Scholes d1 and d2.
+
+    Raises:
+        ValueError: If any spot, strike, time or volatility is not positive.
+    """
+    spot, strike, t, rate, vol, carry = _broadcast(spot, strike, t, rate, vol, carry)
+    if not (np.all(spot > 0) and np.all(strike > 0) and np.all(t > 0) and np.all(vol > 0)):
+        raise ValueError("spot, strike, time to expiry and volatility must be positive")
+    vol_sqrt_t = vol * np.sqrt(t)
+    d1 = (np.log(spot / strike) + (rate - carry + 0.5 * vol * vol) * t) / vol_sqrt_t
+    return d1, d1 - vol_sqrt_t
+
+
+def price(spot: Any, strike: Any, t: Any, rate: Any, vol: Any, option_type: Any, carry: Any = 0.0) -> np.ndarray:
+    """European option prices; broadcasts over every argument."""
+    is_call = _is_call(option_type)
+    d1, d2 = d1_d2(spot, strike, t, rate, vol, carry)
+    spot, strike, t, rate, carry = _broadcast(spot, strike, t, rate, carry)
+    forward_disc = spot * np.exp(-carry * t)
+    strike_disc = strike * np.exp(-rate * t)
+    call = forward_disc * norm_cdf(d1) - strike_disc * norm_cdf(d2)
+    put = strike_disc * norm_cdf(-d2) - forward_disc * norm_cdf(-d1)
+    return np.where(is_call, call, put)
+
+
+def greeks(spot: Any, strike: Any, t: Any, rate: Any, vol: Any, option_type: Any, carry: Any = 0.0) -> dict[str, np.ndarray]:
+    """Price and first-order Greeks (plus gamma) per option.
+
+    Theta is per year, vega and rho per unit (not per 1%) change.
+
+    Returns:
+        {"price", "delta", "gamma", "theta", "vega", "rho", "d1", "d2"} arrays.
+    """
+    is_call = _is_call(option_type)
+    d1, d2 = d1_d2(spot, strike, t, rate, vol, carry)
+    spot, strike, t, rate, vol, carry = _broadcast(spot, strike, t, rate, vol, carry)
+    sqrt_t = np.sqrt(t)
+    carry_disc = np.exp(-carry * t)
+    rate_disc = np.exp(-rate * t)
+    sign = np.where(is_call, 1.0, -1.0)
+    n_d1 = norm_cdf(sign * d1)
+    n_d2 = norm_cdf(sign * d2)
+    pdf_d1 = norm_pdf(d1)
+    return {
+        "price": sign * (spot * carry_disc * n_d1 - strike * rate_disc * n_d2),
+        "delta": sign * carry_disc * n_d1,
+        "gamma": carry_disc * pdf_d1 / (spot * vol * sqrt_t),
+        "theta": (
+            -spot * carry_disc * pdf_d1 * vol / (2 * sqrt_t)
+            - sign * rate * strike * rate_disc * n_d2
+            + sign * carry * spot * carry_disc * n_d1
+        ),
+        "vega": spot * carry_disc * pdf_d1 * sqrt_t,
+        "rho": sign * strike * t * rate_disc * n_d2,
+        "d1": d1,
+        "d2": d2,
+    }
+
+
+def implied_volatility(
+    option_price: Any,
+    spot: Any,
+    strike: Any,
+    t: Any,
+    rate: Any,
+    option_type: Any,
+    carry: Any = 0.0,
+    *,
+    vol_tol: float = 1e-8,
+    max_iter: int = 100,
+) -> dict[str, np.ndarray]:
+    """Invert prices to Black-Scholes volatilities for a whole batch at once.
+
+    Starts from the Corrado-Miller rational approximation and runs Newton steps
+    on vega, safeguarded by a per-option bracket on [VOL_LOWER, VOL_UPPER]: a
+    step that leaves the bracket, or fails to halve the previous move, falls
+    back to bisection.
+    An option converges once its volatility moves less than ``vol_tol`` (or
+    its bracket is narrower), which also pins down low-vega deep in- or
+    out-of-the-money quotes. Only unconverged options are updated each
+    iteration.
+
+    Returns:
+        {"vol", "iterations", "converged", "pricing_error", "valid"} arrays.
+        Quotes outside the no-arbitrage bounds have valid=False and vol=nan.
+    """
+    target, spot, strike, t, rate, carry = _broadcast(option_price, spot, strike, t, rate, carry)
+    shape = target.shape
+    target, spot, strike, t, rate, carry = (a.ravel().copy() for a in (target, spot, strike, t, rate, carry))
+    is_call = np.broadcast_to(_is_call(option_type), target.shape).ravel()
+
+    forward_disc = spot * np.exp(-carry * t)
+    strike_disc = strike * np.exp(-rate * t)
+    # Work with call prices throughout (put-call parity).
+    call_target = np.where(is_call, target, target + forward_disc - strike_disc)
+    intrinsic = np.maximum(forward_disc - strike_disc, 0.0)
+    valid = (call_target >= intrinsic - 1e-6) & (call_target < forward_disc) & (target > 0)
+
+    gap = call_target - 0.5 * (forward_disc - strike_disc)
+    root = np.sqrt(np.maximum(gap * gap - (forward_disc - strike_disc) ** 2 / np.pi, 0.0))
+    guess = np.sqrt(2 * np.pi / t) / (forward_disc + strike_disc) * (gap + root)
+    vol = np.clip(np.nan_to_num(guess, nan=0.2), VOL_LOWER * 10, VOL_UPPER / 2)
+
+    lower = np.full_like(vol, VOL_LOWER)
+    upper = np.full_like(vol, VOL_UPPER)
+    last_move = upper - lower
+    iterations = np.zeros(vol.shape, dtype=int)
+    converged = ~valid
+    calls = np.ones(vol.shape, dtype=bool)
+    for _ in range(max_iter):
+        active = np.flatnonzero(~converged)
+        if active.size == 0:
+            break
+        g = greeks(spot[active], strike[active], t[active], rate[active], vol[active], calls[active], carry[active])
+        diff = g["price"] - call_target[active]
+        iterations[active] += 1
+        sigma = vol[active]
+        upper[active] = np.where(diff > 0, sigma, upper[active])
+        lower[active] = np.where(diff <= 0, sigma, lower[active])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = sigma - diff / g["vega"]
+        # Bisect when Newton leaves the bracket or is not at least halving its previous move.
+        newton = (
+            np.isfinite(step) & (step > lower[active]) & (step < upper[active])
+            & (2 * np.abs(step - sigma) <= last_move[active])
+        )
+        priced = diff == 0
+        new = np.where(priced, sigma, np.where(newton, step, 0.5 * (lower[active] + upper[active])))
+        last_move[active] = np.abs(new - sigma)
+        vol[active] = new
+        converged[active] = priced | (np.abs(new - sigma) < vol_tol) | (upper[active] - lower[active] < vol_tol)
+
+    vol = np.where(valid, vol, np.nan)
+    pricing_error = np.where(valid, price(spot, strike, t, rate, np.where(valid, vol, 1.0), calls, carry) - call_target, np.nan)
+    return {
+        "vol": vol.reshape(shape),
+        "iterations": iterations.reshape(shape),
+        "converged": (converged & valid).reshape(shape),
+        "pricing_error": pricing_error.reshape(shape),
+        "valid": valid.reshape(shape),
+    }
@@ -1,35 +1,121 @@
+"""In-memory caching helpers: a bounded LRU/TTL store and a memoising decorator."""
+from __future__ import annotations
+
 import functools
+import hashlib
+import json
+import threading
 import time
-from typing import Callable, Any
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+def canonical_key(*parts: Any) -> str:
+    """Stable hash for JSON-like values, independent of dict key order.
+
+    Args:
+        *parts: Values to combine (e.g. skill name and its params dict).
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding.
+    """
+    encoded = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe, size-bounded LRU cache with per-entry TTLs and hit/miss counters."""
+
+    def __init__(self, maxsize: int = 1024, default_ttl: float | None = None) -> None:
+        """
+        Args:
+            maxsize: Maximum number of entries; the least recently used is evicted.
+            default_ttl: Seconds an entry stays valid when set() gets no ttl.
+                None means entries never expire.
+        """
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._data: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
-def memory_cache(ttl_seconds: int = 3600) -> Callable:
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Look up a key.
+
+        Returns:
+            (True, value) on a hit, (False, None) on a miss or expired entry.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value, evicting least recently used entries beyond maxsize."""
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+def memory_cache(ttl_seconds: int = 3600, maxsize: int = 1024) -> Callable:
     """Simple in-memory cache decorator with TTL.
 
     Args:
         ttl_seconds: Time to live for cached items in seconds. Defaults to 1 hour.
+        maxsize: Maximum cached results; least recently used are evicted first.
     """
     def decorator(func: Callable) -> Callable:
-        cache = {}
+        cache = LRUCache(maxsize=maxsize, default_ttl=ttl_seconds)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Create a hashable key from args and kwargs
-            try:
-                # Handle unhashable kwargs by converting lists/dicts to tuples/frozensets if necessary,
-                # but for simplicity, we'll stringify kwargs if they are not hashable.
-                # A robust approach for simple primitive kwargs:
-                frozen_kwargs = frozenset((k, str(v) if isinstance(v, (list, dict)) else v) for k, v in kwargs.items())
-                key = (args, frozen_kwargs)
-            except TypeError:
-                # Fallback if arguments are still unhashable
-                key = str(args) + str(kwargs)
-
-            if key in cache:
-                result, timestamp = cache[key]
-                if time.time() - timestamp < ttl_seconds:
-                    return result
-            
+            key = canonical_key(args, kwargs)
+            hit, result = cache.get(key)
+            if hit:
+                return result
             result = func(*args, **kwargs)
-            cache[key] = (result, time.time())
+            cache.set(key, result)
             return result
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
         return wrapper
     return decorator
@@ -8,10 +8,13 @@ import uuid
 from pathlib import Path
 from typing import Any
 
+from .append_log import get_append_log
 from .logging import log_lesson
 from .time import get_iso_timestamp
 
 _DEFAULT_AUDIT_LOG = "logs/compliance_audit.log"
+# Audit entries are written through (never buffered); this sets whether each one is fsynced.
+_AUDIT_FSYNC: str = str(os.environ.get("SNOWDROP_COMPLIANCE_AUDIT_FSYNC", "always"))
 
 
 def record_submission_event(
@@ -27,6 +30,9 @@ def record_submission_event(
 ) -> dict[str, Any]:
     """Append a hashed audit entry for a compliance submission.
 
+    The entry is written (and by default fsynced) before this returns. A
+    failed write is recorded as a lesson; the entry is still returned.
+
     Args:
         skill_name: Name of the skill emitting the audit event.
         submission_type: Friendly name for the filing or audit performed.
@@ -54,16 +60,11 @@ def record_submission_event(
         "metadata": metadata or {},
     }
 
-    log_path = _resolve_log_path()
     try:
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        audit_log = get_append_log(_resolve_log_path(), flush_lines=1, fsync=_AUDIT_FSYNC)
+        audit_log.append(json.dumps(entry, ensure_ascii=False))
     except Exception as exc:  # pragma: no cover - filesystem best effort
-        log_lesson(
-            "compliance_audit_trail",
-            f"failed to write audit entry for {skill_name}: {exc}",
-        )
+        log_lesson(f"compliance_audit_trail: failed to write audit entry for {skill_name}: {exc}")
 
     return entry
 
@@ -76,7 +77,7 @@ def _hash_payload(payload: dict[str, Any] | None) -> str | None:
         serialised = json.dumps(payload, sort_keys=True, default=_json_default)
         return hashlib.sha256(serialised.encode("utf-8")).hexdigest()
     except Exception as exc:  # pragma: no cover - hashing best effort
-        log_lesson("compliance_audit_trail", f"payload hash failed: {exc}")
+        log_lesson(f"compliance_audit_trail: payload hash failed: {exc}")
         return None
 
 
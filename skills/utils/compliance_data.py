@@ -11,7 +11,7 @@ import os
 import time
 from typing import Any, Callable, TypedDict, Sequence
 
-import requests
+from skills.utils.http_client import get_session
 
 from .logging import log_lesson
 from .time import get_iso_timestamp
@@ -278,7 +278,7 @@ def _load_sample_feed() -> list[SanctionsRecord]:
 
 
 def _download_remote_feed(url: str, headers: dict[str, str] | None = None) -> list[Any]:
-    response = requests.get(url, headers=headers, timeout=20)
+    response = get_session().get(url, headers=headers, timeout=20)
     response.raise_for_status()
     payload = response.json()
     if isinstance(payload, list):
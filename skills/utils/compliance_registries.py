@@ -11,7 +11,7 @@ import os
 import time
 from typing import Any, Callable, TypedDict
 
-import requests
+from skills.utils.http_client import get_session
 
 from .logging import log_lesson
 from .time import get_iso_timestamp
@@ -349,7 +349,7 @@ def _http_fetch_registry(registry: str, identifier: str) -> RegistryRecord | Non
     headers = _build_headers(config)
     url = f"{base_url.rstrip('/')}/{identifier}"
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_session().get(url, headers=headers, timeout=10)
         response.raise_for_status()
         payload = response.json()
     except Exception as exc:  # pragma: no cover - network best effort
@@ -382,7 +382,7 @@ def _http_search_registry(
         params["fresh"] = "1"
 
     try:
-        response = requests.get(
+        response = get_session().get(
             search_url, headers=headers, params=params, timeout=10
         )
         response.raise_for_status()
@@ -0,0 +1,174 @@
+"""Shared ccxt exchange sessions, batched tickers and a short-TTL quote cache.
+
+Constructing ``ccxt.<exchange>()`` per call throws away the loaded market
+table, so every call paid an extra markets request before its real work.
+get_exchange_session() keeps one instance per (exchange, credentials) and
+shares the loaded markets between public and authenticated instances of the
+same exchange, reloading them after _MARKETS_TTL.
+
+fetch_tickers() answers from the quote cache first and fetches the rest in one
+``fetch_tickers`` call where the exchange supports it. fan_out() runs
+independent price sources (e.g. CoinGecko and Kraken) concurrently.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from skills.utils.cache import LRUCache
+
+# Seconds a loaded market table is reused before it is reloaded.
+_MARKETS_TTL: float = float(os.environ.get("SNOWDROP_CCXT_MARKETS_TTL", "3600"))
+# Seconds a fetched quote is served to later callers (absorbs bursts).
+_QUOTE_TTL: float = float(os.environ.get("SNOWDROP_QUOTE_TTL", "5"))
+# Threads used by fan_out() for concurrent source lookups.
+_FAN_OUT_WORKERS: int = int(os.environ.get("SNOWDROP_FAN_OUT_WORKERS", "8"))
+
+QUOTE_CACHE = LRUCache(maxsize=2048, default_ttl=_QUOTE_TTL)
+
+
+class ExchangeSession:
+    """One ccxt exchange instance with serialised access and cached markets."""
+
+    def __init__(self, exchange: Any) -> None:
+        self.exchange = exchange
+        self.exchange_id: str = exchange.id
+        self.lock = threading.RLock()
+
+    def load_markets(self) -> dict[str, Any]:
+        """Markets for this exchange, loaded at most once per _MARKETS_TTL across sessions."""
+        with self.lock:
+            markets, currencies = _shared_markets(self.exchange_id)
+            if markets is None:
+                markets = self.exchange.load_markets(reload=True)
+                _store_markets(self.exchange_id, markets, self.exchange.currencies)
+            elif self.exchange.markets is not markets:
+                self.exchange.set_markets(markets, currencies)
+            return markets
+
+    def fetch_tickers(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        """Latest tickers for ``symbols``, served from the quote cache where still fresh.
+
+        Uncached symbols are fetched with a single ``fetch_tickers`` call when
+        the exchange supports it, otherwise one ``fetch_ticker`` per symbol.
+        """
+        tickers: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        for symbol in symbols:
+            hit, ticker = QUOTE_CACHE.get(f"{self.exchange_id}:{symbol}")
+            if hit:
+                tickers[symbol] = ticker
+            else:
+                missing.append(symbol)
+        if not missing:
+            return tickers
+
+        with self.lock:
+            self.load_markets()
+            if len(missing) > 1 and self.exchange.has.get("fetchTickers"):
+                fetched = self.exchange.fetch_tickers(missing)
+            else:
+                fetched = {symbol: self.exchange.fetch_ticker(symbol) for symbol in missing}
+        for symbol in missing:
+            ticker = fetched.get(symbol)
+            if ticker is None:
+                raise KeyError(f"{self.exchange_id} returned no ticker for {symbol}")
+            QUOTE_CACHE.set(f"{self.exchange_id}:{symbol}", ticker)
+            tickers[symbol] = ticker
+        return tickers
+
+    def fetch_ticker(self, symbol: str) -> dict[str, Any]:
+        return self.fetch_tickers([symbol])[symbol]
+
+    def fetch_balance(self) -> dict[str, Any]:
+        with self.lock:
+            self.load_markets()
+            return self.exchange.fetch_balance()
+
+
+_SESSIONS: dict[tuple[str, str], ExchangeSession] = {}
+_MARKETS: dict[str, tuple[float, dict[str, Any], dict[str, Any] | None]] = {}
+_REGISTRY_LOCK = threading.Lock()
+_POOL: ThreadPoolExecutor | None = None
+
+
+def _shared_markets(exchange_id: str) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    with _REGISTRY_LOCK:
+        cached = _MARKETS.get(exchange_id)
+    if cached is None or time.monotonic() - cached[0] > _MARKETS_TTL:
+        return None, None
+    return cached[1], cached[2]
+
+
+def _store_markets(exchange_id: str, markets: dict[str, Any], currencies: dict[str, Any] | None) -> None:
+    with _REGISTRY_LOCK:
+        _MARKETS[exchange_id] = (time.monotonic(), markets, currencies)
+
+
+def get_exchange_session(
+    exchange_id: str,
+    *,
+    api_key: str | None = None,
+    secret: str | None = None,
+    config: dict[str, Any] | None = None,
+) -> ExchangeSession:
+    """Reusable session for a ccxt exchange, one per exchange and credential pair.
+
+    Args:
+        exchange_id: ccxt exchange id, e.g. "kraken".
+        api_key: API key for private endpoints; omit for public data.
+        secret: API secret matching api_key.
+        config: Extra ccxt constructor options (used when the session is created).
+
+    Raises:
+        ValueError: If ccxt does not know the exchange.
+    """
+    import ccxt
+
+    fingerprint = hashlib.sha256(f"{api_key or ''}:{secret or ''}".encode()).hexdigest()[:16]
+    key = (exchange_id, fingerprint)
+    with _REGISTRY_LOCK:
+        session = _SESSIONS.get(key)
+        if session is not None:
+            return session
+        exchange_class = getattr(ccxt, exchange_id, None)
+        if exchange_class is None:
+            raise ValueError(f"Unknown ccxt exchange '{exchange_id}'")
+        options: dict[str, Any] = {"enableRateLimit": True, **(config or {})}
+        if api_key:
+            options.update({"apiKey": api_key, "secret": secret})
+        session = _SESSIONS[key] = ExchangeSession(exchange_class(options))
+        return session
+
+
+def fan_out(calls: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+    """Run independent zero-argument calls concurrently.
+
+    Returns:
+        Mapping of each name to its result, or to the exception it raised.
+    """
+    global _POOL
+    with _REGISTRY_LOCK:
+        if _POOL is None:
+            _POOL = ThreadPoolExecutor(max_workers=_FAN_OUT_WORKERS, thread_name_prefix="snowdrop-fan-out")
+        pool = _POOL
+    futures = {name: pool.submit(call) for name, call in calls.items()}
+    results: dict[str, Any] = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as exc:
+            results[name] = exc
+    return results
+
+
+def session_stats() -> dict[str, Any]:
+    """Open sessions, cached market tables and quote cache counters."""
+    with _REGISTRY_LOCK:
+        sessions = sorted({exchange_id for exchange_id, _ in _SESSIONS})
+        markets = {exchange_id: len(entry[1]) for exchange_id, entry in _MARKETS.items()}
+    return {"sessions": sessions, "markets": markets, "quotes": QUOTE_CACHE.stats()}
@@ -0,0 +1,393 @@
+"""On-disk + in-memory HTTP response cache with conditional revalidation.
+
+Macro data sources (FRED, Treasury fiscal data, BLS) publish at most daily, so
+skills opt in per block with ``pooled_client(timeout=..., cache="fred")``.
+Entries are keyed on method, URL, query params and request body, and served:
+
+* fresh (age below the source TTL): straight from memory, else from disk;
+* stale (age within TTL + the source's stale window, a multiple of its TTL
+  and zero for live quote sources such as fx and metals): immediately, while
+  a background thread revalidates the entry with If-None-Match /
+  If-Modified-Since;
+* expired or missing: fetched synchronously; a 304 refreshes the stored entry
+  without downloading the body again.
+
+When revalidation hits a transport error, 429 or 5xx, a stored entry of a
+non-quote source is served rather than failing the call, as long as it is
+younger than TTL + fallback factor x stale window; quote sources get the error.
+Every response served past its TTL carries an ``X-Snowdrop-Stale`` header with
+its age in seconds (see stale_age()). Only 200 responses without
+``Cache-Control: no-store`` are stored, and only the body plus a few headers are
+written to disk (never the request URL, which often carries an API key).
+"""
+from __future__ import annotations
+
+import atexit
+import base64
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+
+from skills.utils.cache import LRUCache, canonical_key
+
+logger = logging.getLogger("snowdrop.skills")
+
+# Directory for persisted entries; empty keeps the cache in memory only.
+_CACHE_DIR: str = os.environ.get("SNOWDROP_HTTP_CACHE_DIR", "/tmp/snowdrop/http_cache")
+# TTL in seconds for sources not listed in SOURCE_TTLS.
+_DEFAULT_TTL: float = float(os.environ.get("SNOWDROP_HTTP_CACHE_TTL", "3600"))
+# Stale-while-revalidate window as a multiple of each source's TTL, overridable in
+# seconds with SNOWDROP_HTTP_CACHE_STALE_<SOURCE>.
+_STALE_FACTOR: float = float(os.environ.get("SNOWDROP_HTTP_CACHE_STALE_FACTOR", "4"))
+# Oldest stored entry served when a non-quote source fails (429, 5xx, transport
+# error): its TTL plus this multiple of its stale window.
+_FALLBACK_FACTOR: float = float(os.environ.get("SNOWDROP_HTTP_CACHE_FALLBACK_FACTOR", "2"))
+# Entries kept in the in-memory tier.
+_MEMORY_ENTRIES: int = int(os.environ.get("SNOWDROP_HTTP_CACHE_ENTRIES", "512"))
+
+# Freshness per data source, overridable with SNOWDROP_HTTP_CACHE_TTL_<SOURCE>.
+SOURCE_TTLS: dict[str, float] = {
+    "fred": 6 * 3600,
+    "treasury": 6 * 3600,
+    "bls": 12 * 3600,
+    "fx": 15 * 60,
+    "metals": 5 * 60,
+}
+
+# Live quote sources: an expired entry is never served as if it were current.
+QUOTE_SOURCES = frozenset({"fx", "metals"})
+
+_STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control", "date")
+
+# Set on responses served past their TTL; the value is the entry's age in seconds.
+STALE_HEADER = "X-Snowdrop-Stale"
+
+# send(extra_headers) performs the real request, adding any conditional headers.
+Sender = Callable[[dict[str, str]], httpx.Response]
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def to_response(self, method: str, url: str, stale: bool = False) -> httpx.Response:
+        headers = {**self.headers, STALE_HEADER: str(int(self.age()))} if stale else self.headers
+        return httpx.Response(
+            self.status_code,
+            headers=headers,
+            content=self.content,
+            request=httpx.Request(method, url),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "content": base64.b64encode(self.content).decode("ascii"),
+            "stored_at": self.stored_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CachedResponse":
+        return cls(
+            status_code=int(data["status_code"]),
+            headers=dict(data["headers"]),
+            content=base64.b64decode(data["content"]),
+            stored_at=float(data["stored_at"]),
+        )
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "CachedResponse":
+        headers = {name: response.headers[name] for name in _STORED_HEADERS if name in response.headers}
+        return cls(response.status_code, headers, response.content, time.time())
+
+
+class HTTPResponseCache:
+    """Two-tier response cache with per-source TTLs and stale-while-revalidate."""
+
+    def __init__(
+        self,
+        directory: str | Path | None = _CACHE_DIR,
+        *,
+        memory_entries: int = _MEMORY_ENTRIES,
+        default_ttl: float = _DEFAULT_TTL,
+        stale_window: float | None = None,
+        ttls: dict[str, float] | None = None,
+        refresh_workers: int = 2,
+    ) -> None:
+        """
+        Args:
+            directory: Where entries are persisted; None or "" for memory only.
+            memory_entries: Size of the in-memory LRU tier.
+            default_ttl: Freshness for sources without their own TTL.
+            stale_window: Seconds past the TTL an entry of a non-quote source
+                is still served while a background refresh runs (0 disables
+                stale-while-revalidate); None scales it with each source's TTL.
+            ttls: Per-source TTLs; defaults to SOURCE_TTLS.
+            refresh_workers: Threads available for background revalidation.
+        """
+        self.directory = Path(directory) if directory else None
+        self.default_ttl = default_ttl
+        self.stale_window = stale_window
+        self.ttls = dict(SOURCE_TTLS if ttls is None else ttls)
+        self._memory = LRUCache(maxsize=memory_entries)
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._refresh_workers = refresh_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.refreshes = 0
+        self.stores = 0
+        self.errors = 0
+
+    def ttl_for(self, source: str) -> float:
+        override = os.environ.get(f"SNOWDROP_HTTP_CACHE_TTL_{source.upper()}")
+        if override:
+            return float(override)
+        return self.ttls.get(source, self.default_ttl)
+
+    def stale_window_for(self, source: str) -> float:
+        override = os.environ.get(f"SNOWDROP_HTTP_CACHE_STALE_{source.upper()}")
+        if override:
+            return float(override)
+        if source in QUOTE_SOURCES:
+            return 0.0
+        if self.stale_window is not None:
+            return self.stale_window
+        return self.ttl_for(source) * _STALE_FACTOR
+
+    def fallback_age_for(self, source: str) -> float:
+        """Oldest entry served when the source fails; 0 for quote sources (never)."""
+        if source in QUOTE_SOURCES:
+            return 0.0
+        return self.ttl_for(source) + self.stale_window_for(source) * _FALLBACK_FACTOR
+
+    @staticmethod
+    def key(method: str, url: str, params: Any = None, body: Any = None) -> str:
+        return canonical_key(method.upper(), url, params, body)
+
+    def fetch(
+        self,
+        send: Sender,
+        method: str,
+        url: str,
+        *,
+        source: str,
+        params: Any = None,
+        body: Any = None,
+    ) -> httpx.Response:
+        """Serve a request from the cache, revalidating or fetching as needed.
+
+        Args:
+            send: Performs the real request given extra (conditional) headers.
+            method: HTTP method, part of the cache key.
+            url: Request URL, part of the cache key.
+            source: Data source name selecting the TTL (e.g. "fred").
+            params: Query parameters, part of the cache key.
+            body: JSON/form body, part of the cache key (for query-by-POST APIs).
+
+        Raises:
+            httpx.TransportError: When the request fails and no stored entry
+                may stand in (none, too old, or a quote source). A 429/5xx in
+                that case is returned as is.
+        """
+        key = self.key(method, url, params, body)
+        entry = self._load(key)
+        if entry is not None:
+            age = entry.age()
+            ttl = self.ttl_for(source)
+            if age < ttl:
+                self._count("hits")
+                return entry.to_response(method, url)
+            if age < ttl + self.stale_window_for(source):
+                self._count("stale_hits")
+                self._refresh_async(key, send, method, url)
+                return entry.to_response(method, url, stale=True)
+        else:
+            self._count("misses")
+        fallback = entry if entry is not None and entry.age() < self.fallback_age_for(source) else None
+        try:
+            response = self._revalidate(key, send, entry, method, url)
+        except httpx.TransportError as exc:
+            self._count("errors")
+            if fallback is None:
+                raise
+            logger.warning(f"http_cache: serving stored {source} response after error: {exc}")
+            return fallback.to_response(method, url, stale=True)
+        if fallback is not None and (response.status_code == 429 or response.status_code >= 500):
+            response.close()
+            self._count("errors")
+            logger.warning(f"http_cache: serving stored {source} response after HTTP {response.status_code}")
+            return fallback.to_response(method, url, stale=True)
+        return response
+
+    def _revalidate(
+        self, key: str, send: Sender, entry: CachedResponse | None, method: str, url: str,
+    ) -> httpx.Response:
+        conditional: dict[str, str] = {}
+        if entry is not None:
+            if entry.etag:
+                conditional["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                conditional["If-Modified-Since"] = entry.last_modified
+        response = send(conditional)
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            entry = replace(entry, stored_at=time.time())
+            self._save(key, entry)
+            self._count("revalidated")
+            return entry.to_response(method, url)
+        if response.status_code == 200 and "no-store" not in response.headers.get("cache-control", ""):
+            response.read()
+            self._save(key, CachedResponse.from_response(response))
+            self._count("stores")
+        return response
+
+    def _refresh_async(self, key: str, send: Sender, method: str, url: str) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._refresh_workers, thread_name_prefix="snowdrop-http-refresh",
+                )
+            executor = self._executor
+        executor.submit(self._refresh, key, send, method, url)
+
+    def _refresh(self, key: str, send: Sender, method: str, url: str) -> None:
+        try:
+            entry = self._load(key)
+            self._revalidate(key, send, entry, method, url)
+            self._count("refreshes")
+        except Exception as exc:
+            self._count("errors")
+            logger.warning(f"http_cache: background refresh failed: {exc}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _path(self, key: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _load(self, key: str) -> CachedResponse | None:
+        found, entry = self._memory.get(key)
+        if found:
+            return entry
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            entry = CachedResponse.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning(f"http_cache: ignoring unreadable entry {path.name}: {exc}")
+            return None
+        self._memory.set(key, entry)
+        return entry
+
+    def _save(self, key: str, entry: CachedResponse) -> None:
+        self._memory.set(key, entry)
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(entry.to_dict()), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.warning(f"http_cache: could not persist entry: {exc}")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def wait_for_refreshes(self, timeout: float = 10.0) -> bool:
+        """Block until no background refresh is running (for shutdown and tests)."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                if not self._refreshing:
+                    return True
+            time.sleep(0.01)
+        return False
+
+    def clear(self) -> None:
+        """Drop every entry from memory and disk."""
+        self._memory.clear()
+        if self.directory is not None and self.directory.exists():
+            for path in self.directory.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "directory": str(self.directory) if self.directory else None,
+                "memory_entries": len(self._memory),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "refreshes": self.refreshes,
+                "stores": self.stores,
+                "errors": self.errors,
+                "refreshing": len(self._refreshing),
+            }
+
+
+_CACHE: HTTPResponseCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_response_cache() -> HTTPResponseCache:
+    """Process-wide response cache, created on first use."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = HTTPResponseCache()
+            atexit.register(_CACHE.close)
+        return _CACHE
+
+
+def stale_age(response: httpx.Response) -> float | None:
+    """Age in seconds of a cached response served past its TTL, or None if it is current."""
+    value = response.headers.get(STALE_HEADER)
+    return float(value) if value is not None else None
+
+
+def response_cache_stats() -> dict[str, Any] | None:
+    """Stats for the shared cache, or None if no skill has used it yet."""
+    return _CACHE.stats() if _CACHE is not None else None
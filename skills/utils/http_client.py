@@ -1,16 +1,388 @@
-"""HTTP client helpers with retry-aware wrappers."""
+"""Process-wide pooled HTTP clients shared by network skills.
+
+Two pools cover the two client libraries skills use:
+
+* get_http_client(): one httpx.Client with keep-alive connection pooling,
+  HTTP/2 when the optional ``h2`` package is installed, a per-host
+  concurrency cap and retries on 429 / 5xx and transport errors for
+  idempotent methods (connection failures only for the others).
+  ``pooled_client(timeout=...)`` is a drop-in for the
+  ``with httpx.Client(timeout=...) as client:`` blocks skills used to open
+  per call.
+* get_session(): one requests.Session with a pooled urllib3 adapter and the
+  same retry policy, for skills written against the requests API (same
+  Response type and exception classes as bare ``requests.get``).
+
+Like the per-call clients they replace, the httpx client only follows
+redirects when a request passes ``follow_redirects=True`` and the session
+follows them as ``requests.get`` does. Neither pool keeps cookies between
+calls, so one caller's session cookie is never sent on another's request.
+Both are created lazily, closed at interpreter exit and report counters via
+pool_stats() for the /health endpoint. ``pooled_client(cache="<source>")``
+additionally serves slow-moving data through skills.utils.http_cache.
+"""
 from __future__ import annotations
 
-from typing import Any
+import atexit
+import contextlib
+import os
+import threading
+import time
+from collections import defaultdict
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Iterator
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from skills.utils.retry import retry
+from skills.utils.http_cache import HTTPResponseCache, get_response_cache, response_cache_stats
 
 DEFAULT_TIMEOUT = 15.0
 
+# Total pooled connections and idle keep-alive connections kept per pool.
+_MAX_CONNECTIONS: int = int(os.environ.get("SNOWDROP_HTTP_MAX_CONNECTIONS", "100"))
+_MAX_KEEPALIVE: int = int(os.environ.get("SNOWDROP_HTTP_MAX_KEEPALIVE", "20"))
+# Concurrent requests (and therefore connections) allowed to a single host.
+_MAX_PER_HOST: int = int(os.environ.get("SNOWDROP_HTTP_MAX_PER_HOST", "10"))
+# Seconds an idle keep-alive connection is kept open.
+_KEEPALIVE_EXPIRY: float = float(os.environ.get("SNOWDROP_HTTP_KEEPALIVE_EXPIRY", "30"))
+# Retries after the first attempt for transport errors and retriable statuses.
+_RETRIES: int = int(os.environ.get("SNOWDROP_HTTP_RETRIES", "2"))
+_BACKOFF_SECONDS = 0.5
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Failures where the request never left this machine, so any method can be resent.
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+CACHEABLE_METHODS = frozenset({"GET", "POST"})
+USER_AGENT = "snowdrop-mcp"
+
+
+class _RejectCookies(DefaultCookiePolicy):
+    """Cookie policy that stores nothing.
+
+    The pools are shared by every agent and API key in the process, so a cookie
+    set for one caller must not be sent on another's request. A Cookie header
+    the caller sets on a request is still sent.
+    """
+
+    def set_ok(self, cookie: Any, request: Any) -> bool:
+        return False
+
+
+def http2_available() -> bool:
+    """True when the optional h2 package is installed (httpx needs it for HTTP/2)."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _HostStats:
+    __slots__ = ("requests", "errors", "retries", "in_flight", "total_ms")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.total_ms = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "in_flight": self.in_flight,
+            "avg_ms": round(self.total_ms / self.requests, 2) if self.requests else 0.0,
+        }
+
+
+class _Verbs:
+    """httpx-style verb shortcuts over request()."""
+
+    def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        raise NotImplementedError
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("DELETE", url, **kwargs)
+
+
+class PooledHTTPClient(_Verbs):
+    """Thread-safe wrapper around one httpx.Client with per-host limits, retries and counters."""
+
+    def __init__(
+        self,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = _MAX_CONNECTIONS,
+        max_keepalive: int = _MAX_KEEPALIVE,
+        max_per_host: int = _MAX_PER_HOST,
+        keepalive_expiry: float = _KEEPALIVE_EXPIRY,
+        retries: int = _RETRIES,
+        backoff_seconds: float = _BACKOFF_SECONDS,
+        http2: bool | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        """
+        Args:
+            timeout: Default per-request timeout in seconds.
+            max_connections: Total connections across all hosts.
+            max_keepalive: Idle connections kept for reuse.
+            max_per_host: Concurrent requests allowed per host; extra callers wait.
+            keepalive_expiry: Seconds before an idle connection is closed.
+            retries: Retries after the first attempt. Idempotent methods retry on
+                transport errors and retriable statuses; other methods only on
+                connection failures, so a POST is never sent twice.
+            backoff_seconds: First retry delay, doubled on each further retry.
+            http2: Force HTTP/2 on or off; defaults to on when h2 is installed.
+            transport: Custom httpx transport (tests).
+        """
+        self.http2 = http2_available() if http2 is None else http2
+        self.max_per_host = max_per_host
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self._client = httpx.Client(
+            http2=self.http2,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            headers={"User-Agent": USER_AGENT},
+            cookies=CookieJar(policy=_RejectCookies()),
+            transport=transport,
+        )
+        self._lock = threading.Lock()
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._stats: dict[str, _HostStats] = defaultdict(_HostStats)
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get(host)
+            if slot is None:
+                slot = self._slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return slot
+
+    def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the shared pool (same keyword arguments as httpx.Client.request).
+
+        Raises:
+            httpx.TransportError: Once retries are exhausted.
+        """
+        method = method.upper()
+        host = httpx.URL(url).host
+        stats = self._stats[host]
+        idempotent = method in IDEMPOTENT_METHODS
+        delay = self.backoff_seconds
+        with self._slot(host):
+            for attempt in range(self.retries + 1):
+                started = time.perf_counter()
+                with self._lock:
+                    stats.requests += 1
+                    stats.in_flight += 1
+                try:
+                    response = self._client.request(method, url, **kwargs)
+                except httpx.TransportError as exc:
+                    if attempt == self.retries or not (idempotent or isinstance(exc, CONNECT_ERRORS)):
+                        with self._lock:
+                            stats.errors += 1
+                        raise
+                else:
+                    if not (idempotent and response.status_code in RETRY_STATUSES and attempt < self.retries):
+                        return response
+                    response.close()
+                finally:
+                    with self._lock:
+                        stats.in_flight -= 1
+                        stats.total_ms += (time.perf_counter() - started) * 1000
+                with self._lock:
+                    stats.retries += 1
+                time.sleep(delay)
+                delay *= 2
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def close(self) -> None:
+        self._client.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Per-host counters plus the pool's current connection count."""
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        with self._lock:
+            hosts = {host: stats.as_dict() for host, stats in self._stats.items()}
+        return {
+            "http2": self.http2,
+            "max_per_host": self.max_per_host,
+            "open_connections": len(connections) if connections is not None else None,
+            "hosts": hosts,
+        }
+
+
+class _BoundClient(_Verbs):
+    """View of the shared client that applies a default timeout; closing it leaves the pool open.
+
+    With a cache source, GET and POST requests go through the response cache
+    (POST only for read-only query APIs such as BLS, which opt in explicitly).
+    """
+
+    def __init__(
+        self,
+        client: PooledHTTPClient,
+        timeout: float | None,
+        cache_source: str | None = None,
+        response_cache: HTTPResponseCache | None = None,
+    ) -> None:
+        self._client = client
+        self._timeout = timeout
+        self._cache_source = cache_source
+        self._response_cache = response_cache
+
+    def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        if self._cache_source is None or self._response_cache is None or method.upper() not in CACHEABLE_METHODS:
+            return self._client.request(method, url, **kwargs)
+
+        def send(conditional: dict[str, str]) -> httpx.Response:
+            headers = {**dict(kwargs.get("headers") or {}), **conditional}
+            return self._client.request(method, url, **{**kwargs, "headers": headers})
+
+        return self._response_cache.fetch(
+            send,
+            method,
+            url,
+            source=self._cache_source,
+            params=kwargs.get("params"),
+            body=kwargs.get("json", kwargs.get("data")),
+        )
+
+
+class _StatsAdapter(HTTPAdapter):
+    """urllib3 pooled adapter that records per-host counters for pool_stats()."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        self.host_stats: dict[str, _HostStats] = defaultdict(_HostStats)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        stats = self.host_stats[httpx.URL(request.url or "").host]
+        started = time.perf_counter()
+        with self._lock:
+            stats.requests += 1
+            stats.in_flight += 1
+        try:
+            return super().send(request, **kwargs)
+        except requests.RequestException:
+            with self._lock:
+                stats.errors += 1
+            raise
+        finally:
+            with self._lock:
+                stats.in_flight -= 1
+                stats.total_ms += (time.perf_counter() - started) * 1000
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    session.cookies.set_policy(_RejectCookies())
+    adapter = _StatsAdapter(
+        pool_connections=_MAX_KEEPALIVE,
+        pool_maxsize=_MAX_PER_HOST,
+        max_retries=Retry(
+            total=_RETRIES,
+            backoff_factor=_BACKOFF_SECONDS,
+            status_forcelist=sorted(RETRY_STATUSES),
+            allowed_methods=sorted(IDEMPOTENT_METHODS),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _session_stats(session: requests.Session) -> dict[str, Any]:
+    adapter = session.get_adapter("https://")
+    pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+    hosts = {host: stats.as_dict() for host, stats in getattr(adapter, "host_stats", {}).items()}
+    return {
+        "pooled_hosts": len(pools) if pools is not None else None,
+        "max_per_host": _MAX_PER_HOST,
+        "hosts": hosts,
+    }
+
+
+_CLIENT: PooledHTTPClient | None = None
+_SESSION: requests.Session | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_http_client() -> PooledHTTPClient:
+    """Process-wide pooled httpx client, created on first use and closed at exit."""
+    global _CLIENT
+    with _POOL_LOCK:
+        if _CLIENT is None:
+            _CLIENT = PooledHTTPClient()
+            atexit.register(_CLIENT.close)
+        return _CLIENT
+
+
+def get_session() -> requests.Session:
+    """Process-wide pooled requests.Session, created on first use and closed at exit."""
+    global _SESSION
+    with _POOL_LOCK:
+        if _SESSION is None:
+            _SESSION = _build_session()
+            atexit.register(_SESSION.close)
+        return _SESSION
+
+
+@contextlib.contextmanager
+def pooled_client(timeout: float | None = None, cache: str | None = None) -> Iterator[_BoundClient]:
+    """Borrow the shared httpx client with a default timeout.
+
+    Replaces ``with httpx.Client(timeout=...) as client:``: requests reuse pooled
+    connections and leaving the block does not close anything.
+
+    Args:
+        timeout: Default per-request timeout in seconds.
+        cache: Data source name (e.g. "fred") to serve requests through the
+            shared response cache with that source's TTL; None bypasses it.
+    """
+    yield _BoundClient(get_http_client(), timeout, cache, get_response_cache() if cache else None)
+
+
+def pool_stats() -> dict[str, Any]:
+    """Counters for whichever pools have been created (nothing is created here)."""
+    return {
+        "httpx": _CLIENT.stats() if _CLIENT is not None else None,
+        "requests": _session_stats(_SESSION) if _SESSION is not None else None,
+        "response_cache": response_cache_stats(),
+    }
+
 
-@retry(attempts=3, backoff_seconds=0.5, jitter=0.25, retriable_exceptions=(requests.RequestException,))
 def request_json(
     method: str,
     url: str,
@@ -19,7 +391,9 @@ def request_json(
     payload: dict[str, Any] | None = None,
     timeout: float = DEFAULT_TIMEOUT,
 ) -> dict[str, Any]:
-    """Perform an HTTP request and return the JSON body.
+    """Perform an HTTP request on the pooled session and return the JSON body.
+
+    Retries are left to the session's adapter (see get_session()).
 
     Args:
         method: HTTP method such as "GET" or "POST".
@@ -33,10 +407,10 @@ def request_json(
 
     Raises:
         requests.HTTPError: When the response code indicates an error.
-        requests.RequestException: Bubble up for retry logic to handle.
+        requests.RequestException: Once the session's retries are exhausted.
         ValueError: If the response does not contain JSON.
     """
-    response = requests.request(
+    response = get_session().request(
         method=method.upper(),
         url=url,
         headers=headers,
@@ -0,0 +1,362 @@
+"""NumPy indicator core shared by technical analysis skills.
+
+Batch functions take a 1-D sequence (oldest first) and return a float array of
+the same length, NaN where the indicator is not yet defined. NaN inputs are
+skipped: they stay NaN in the output and never enter a window or smoothing
+recursion, so a series with leading NaNs (e.g. an EMA of an EMA) works as-is.
+
+Exponential smoothing is evaluated in fixed-size blocks: each block is one
+matrix-vector product against a decay kernel, and only the carry between
+blocks is sequential. The streaming state classes at the bottom update RSI,
+MACD, ATR and Bollinger Bands for one new bar in O(1) from a saved state.
+"""
+from __future__ import annotations
+
+import functools
+import math
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Samples per block in the blocked exponential smoothing recursion.
+_BLOCK = 64
+
+ArrayLike = Sequence[float] | np.ndarray
+
+
+def as_array(values: ArrayLike) -> np.ndarray:
+    """values as a 1-D float64 array (no copy if it already is one)."""
+    arr = np.asarray(values, dtype=float)
+    if arr.ndim != 1:
+        raise ValueError("indicator input must be one-dimensional")
+    return arr
+
+
+def to_list(values: np.ndarray) -> list[float]:
+    """Plain Python floats (NaN preserved) for JSON-style skill outputs."""
+    return values.tolist()
+
+
+def _skip_nan(func):
+    """Apply func to the non-NaN entries only and scatter results back in place."""
+    @functools.wraps(func)
+    def wrapper(values: ArrayLike, period: int, *args: Any, **kwargs: Any) -> np.ndarray:
+        arr = as_array(values)
+        valid = ~np.isnan(arr)
+        if valid.all():
+            return func(arr, period, *args, **kwargs)
+        out = np.full(arr.shape, np.nan)
+        out[valid] = func(arr[valid], period, *args, **kwargs)
+        return out
+    return wrapper
+
+
+def _rolling_apply(arr: np.ndarray, period: int, reduce: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+    """Reduce each trailing window of period values; NaN before the first full window."""
+    if period < 1:
+        raise ValueError("period must be a positive integer")
+    out = np.full(arr.shape, np.nan)
+    if len(arr) >= period:
+        out[period - 1:] = reduce(sliding_window_view(arr, period))
+    return out
+
+
+@_skip_nan
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average; first value at index period - 1."""
+    return _rolling_apply(values, period, lambda w: w.mean(axis=1))
+
+
+@_skip_nan
+def rolling_sum(values: np.ndarray, period: int) -> np.ndarray:
+    """Trailing sum over period values."""
+    return _rolling_apply(values, period, lambda w: w.sum(axis=1))
+
+
+@_skip_nan
+def rolling_std(values: np.ndarray, period: int, ddof: int = 0) -> np.ndarray:
+    """Trailing standard deviation (population by default)."""
+    return _rolling_apply(values, period, lambda w: w.std(axis=1, ddof=ddof))
+
+
+@_skip_nan
+def rolling_max(values: np.ndarray, period: int) -> np.ndarray:
+    """Trailing maximum over period values."""
+    return _rolling_apply(values, period, lambda w: w.max(axis=1))
+
+
+@_skip_nan
+def rolling_min(values: np.ndarray, period: int) -> np.ndarray:
+    """Trailing minimum over period values."""
+    return _rolling_apply(values, period, lambda w: w.min(axis=1))
+
+
+def smooth(values: np.ndarray, alpha: float, initial: float) -> np.ndarray:
+    """Exponential recursion y[i] = alpha * x[i] + (1 - alpha) * y[i-1] with y[-1] = initial.
+
+    Evaluated block-wise: within a block of B samples the zero-state response is
+    x_block @ K.T with K[j, k] = alpha * decay**(j - k) (k <= j), and the carried
+    state contributes decay**(j + 1) * y_prev. Kernel entries are bounded by 1,
+    so long series stay numerically stable.
+    """
+    x = np.asarray(values, dtype=float)
+    n = len(x)
+    if n == 0:
+        return np.empty(0)
+    decay = 1.0 - alpha
+    size = min(_BLOCK, n)
+    lags = np.subtract.outer(np.arange(size), np.arange(size))
+    kernel = np.where(lags >= 0, alpha * decay ** np.maximum(lags, 0), 0.0)
+    carry_weights = decay ** np.arange(1, size + 1)
+
+    blocks = -(-n // size)
+    padded = np.zeros(blocks * size)
+    padded[:n] = x
+    response = padded.reshape(blocks, size) @ kernel.T
+
+    prev = float(initial)
+    for row in response:
+        row += carry_weights * prev
+        prev = row[-1]
+    return response.reshape(-1)[:n]
+
+
+@_skip_nan
+def ema(values: np.ndarray, period: int, seed: str = "sma", alpha: float | None = None) -> np.ndarray:
+    """Exponential moving average with alpha = 2 / (period + 1) unless given.
+
+    Args:
+        values: Input series.
+        period: Lookback that sets alpha and the SMA seed window.
+        seed: "sma" seeds with the mean of the first period values (first output
+            at index period - 1); "first" seeds with the first value (output
+            defined from index 0).
+        alpha: Override the smoothing factor (e.g. 1 / period for Wilder).
+    """
+    if period < 1:
+        raise ValueError("period must be a positive integer")
+    alpha = 2.0 / (period + 1) if alpha is None else alpha
+    out = np.full(values.shape, np.nan)
+    if seed == "first":
+        if len(values):
+            out[0] = values[0]
+            out[1:] = smooth(values[1:], alpha, values[0])
+        return out
+    if seed != "sma":
+        raise ValueError("seed must be 'sma' or 'first'")
+    if len(values) < period:
+        return out
+    initial = values[:period].mean()
+    out[period - 1] = initial
+    out[period:] = smooth(values[period:], alpha, initial)
+    return out
+
+
+def wilder_smooth(values: ArrayLike, period: int) -> np.ndarray:
+    """Wilder's smoothing (RMA): an SMA-seeded EMA with alpha = 1 / period."""
+    return ema(values, period, alpha=1.0 / period)
+
+
+def true_range(highs: ArrayLike, lows: ArrayLike, closes: ArrayLike) -> np.ndarray:
+    """max(high - low, |high - prev close|, |low - prev close|); the first bar is high - low."""
+    high, low, close = as_array(highs), as_array(lows), as_array(closes)
+    if not (len(high) == len(low) == len(close)):
+        raise ValueError("highs, lows and closes must have equal length")
+    tr = high - low
+    if len(tr) > 1:
+        prev_close = close[:-1]
+        tr[1:] = np.maximum.reduce([tr[1:], np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)])
+    return tr
+
+
+def typical_price(highs: ArrayLike, lows: ArrayLike, closes: ArrayLike) -> np.ndarray:
+    """(high + low + close) / 3 per bar."""
+    return (as_array(highs) + as_array(lows) + as_array(closes)) / 3
+
+
+def rsi_from_averages(avg_gain: np.ndarray | float, avg_loss: np.ndarray | float) -> np.ndarray:
+    """100 - 100 / (1 + avg_gain / avg_loss), with 100 where avg_loss is zero."""
+    gain = np.asarray(avg_gain, dtype=float)
+    loss = np.asarray(avg_loss, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - 100 / (1 + gain / loss)
+    return np.where(loss == 0, 100.0, rsi)
+
+
+# ---------------------------------------------------------------------------
+# Streaming state: O(1) single-bar updates from a saved state
+# ---------------------------------------------------------------------------
+
+class _State:
+    """Shared (de)serialisation for streaming indicator states."""
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]):
+        try:
+            return cls(**data)
+        except TypeError as exc:
+            raise ValueError(f"invalid {cls.__name__} state: {exc}") from exc
+
+
+@dataclass
+class RSIState(_State):
+    """Wilder RSI state: the last close plus smoothed average gain and loss."""
+
+    period: int
+    last_price: float
+    avg_gain: float
+    avg_loss: float
+
+    @classmethod
+    def from_history(cls, prices: ArrayLike, period: int) -> "RSIState":
+        """Seed from at least period + 1 closes (same seeding as rsi_calculator)."""
+        arr = as_array(prices)
+        if len(arr) <= period:
+            raise ValueError("RSI state needs more than 'period' prices")
+        delta = np.diff(arr)
+        avg_gain = wilder_smooth(np.maximum(delta, 0.0), period)[-1]
+        avg_loss = wilder_smooth(np.maximum(-delta, 0.0), period)[-1]
+        return cls(period, float(arr[-1]), float(avg_gain), float(avg_loss))
+
+    @property
+    def value(self) -> float:
+        return float(rsi_from_averages(self.avg_gain, self.avg_loss))
+
+    def update(self, price: float) -> float:
+        """Advance one close and return the new RSI."""
+        delta = float(price) - self.last_price
+        self.avg_gain = (self.avg_gain * (self.period - 1) + max(delta, 0.0)) / self.period
+        self.avg_loss = (self.avg_loss * (self.period - 1) + max(-delta, 0.0)) / self.period
+        self.last_price = float(price)
+        return self.value
+
+
+@dataclass
+class MACDState(_State):
+    """MACD state: fast and slow EMAs of price and the signal EMA of their difference."""
+
+    fast_period: int
+    slow_period: int
+    signal_period: int
+    fast_ema: float
+    slow_ema: float
+    signal: float
+
+    @classmethod
+    def from_history(
+        cls, prices: ArrayLike, fast_period: int, slow_period: int, signal_period: int
+    ) -> "MACDState":
+        """Seed from at least slow_period + signal_period - 1 closes (same seeding as macd_calculator)."""
+        arr = as_array(prices)
+        if len(arr) < slow_period + signal_period - 1:
+            raise ValueError("MACD state needs slow_period + signal_period - 1 prices")
+        fast = ema(arr, fast_period)
+        slow = ema(arr, slow_period)
+        signal = ema(fast - slow, signal_period)
+        return cls(fast_period, slow_period, signal_period, float(fast[-1]), float(slow[-1]), float(signal[-1]))
+
+    @property
+    def value(self) -> dict[str, float]:
+        macd = self.fast_ema - self.slow_ema
+        return {"macd": macd, "signal": self.signal, "histogram": macd - self.signal}
+
+    def update(self, price: float) -> dict[str, float]:
+        """Advance one close and return {"macd", "signal", "histogram"}."""
+        price = float(price)
+        for attr, period in (("fast_ema", self.fast_period), ("slow_ema", self.slow_period)):
+            alpha = 2 / (period + 1)
+            setattr(self, attr, alpha * price + (1 - alpha) * getattr(self, attr))
+        alpha = 2 / (self.signal_period + 1)
+        self.signal = alpha * (self.fast_ema - self.slow_ema) + (1 - alpha) * self.signal
+        return self.value
+
+
+@dataclass
+class ATRState(_State):
+    """Wilder ATR state: the previous close and the current ATR."""
+
+    period: int
+    prev_close: float
+    atr: float
+
+    @classmethod
+    def from_history(cls, highs: ArrayLike, lows: ArrayLike, closes: ArrayLike, period: int) -> "ATRState":
+        """Seed from at least period + 1 bars (same seeding as atr_calculator)."""
+        close = as_array(closes)
+        if len(close) <= period:
+            raise ValueError("ATR state needs more than 'period' bars")
+        tr = true_range(highs, lows, close)
+        return cls(period, float(close[-1]), float(wilder_smooth(tr[1:], period)[-1]))
+
+    @property
+    def value(self) -> float:
+        return self.atr
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """Advance one bar and return the new ATR."""
+        high, low = float(high), float(low)
+        tr = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.atr = (self.atr * (self.period - 1) + tr) / self.period
+        self.prev_close = float(close)
+        return self.atr
+
+
+@dataclass
+class BollingerState(_State):
+    """Bollinger state: the trailing window with its running mean and sum of squared deviations."""
+
+    period: int
+    num_std: float
+    window: deque = field(default_factory=deque)
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.window = deque((float(v) for v in self.window), maxlen=self.period)
+        if len(self.window) != self.period:
+            raise ValueError("Bollinger state window must hold exactly 'period' prices")
+
+    @classmethod
+    def from_history(cls, prices: ArrayLike, period: int, num_std: float) -> "BollingerState":
+        """Seed from the last period closes."""
+        arr = as_array(prices)
+        if len(arr) < period:
+            raise ValueError("Bollinger state needs at least 'period' prices")
+        window = arr[-period:]
+        mean = float(window.mean())
+        return cls(period, float(num_std), deque(window.tolist()), mean, float(((window - mean) ** 2).sum()))
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["window"] = list(self.window)
+        return data
+
+    @property
+    def value(self) -> dict[str, float]:
+        std = math.sqrt(max(self.m2, 0.0) / self.period)
+        upper = self.mean + self.num_std * std
+        lower = self.mean - self.num_std * std
+        width = upper - lower
+        return {
+            "upper": upper,
+            "middle": self.mean,
+            "lower": lower,
+            "percent_b": (self.window[-1] - lower) / width if width != 0 else 0.5,
+            "bandwidth": width / self.mean if self.mean != 0 else math.inf,
+        }
+
+    def update(self, price: float) -> dict[str, float]:
+        """Slide the window by one close (Welford replace-update) and return the bands."""
+        price = float(price)
+        oldest = self.window[0]
+        self.window.append(price)
+        old_mean = self.mean
+        self.mean = old_mean + (price - oldest) / self.period
+        self.m2 += (price - oldest) * (price - self.mean + oldest - old_mean)
+        return self.value
@@ -0,0 +1,369 @@
+"""Compiled validators for skill TOOL_META inputSchemas.
+
+compile_schema() turns a JSON-Schema subset into nested closures once, so a
+call is checked without re-interpreting the schema. Supported keywords: type
+(single or list), enum, properties, required, additionalProperties, items,
+minimum/maximum, exclusiveMinimum/exclusiveMaximum (numeric or draft-4
+boolean), minItems/maxItems, minLength/maxLength, anyOf/oneOf/allOf.
+Anything else (description, default, format, ...) is ignored.
+
+Validation only coerces losslessly: an integer-valued float where "integer"
+is expected becomes an int, and a tuple where "array" is expected becomes a
+list. A null value for an optional property is treated as absent, matching
+how skills default such parameters. Inputs are never mutated; containers are
+copied only when something inside them was coerced.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from skills.utils.cache import canonical_key
+
+# check(value, path, errors) -> value (possibly coerced); appends messages to errors.
+_Check = Callable[[Any, str, list], Any]
+
+# Validation stops reporting after this many problems.
+MAX_ERRORS = 20
+
+# Keys that do not constrain a value, so {"type": "number", "description": ...}
+# still takes the fast path for numeric arrays.
+_ANNOTATIONS = frozenset({"description", "default", "format", "title", "examples", "$comment"})
+
+
+def _type_name(value: Any) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+def _coerce_string(value: Any) -> tuple[bool, Any]:
+    return isinstance(value, str), value
+
+
+def _coerce_number(value: Any) -> tuple[bool, Any]:
+    return isinstance(value, (int, float)) and not isinstance(value, bool), value
+
+
+def _coerce_integer(value: Any) -> tuple[bool, Any]:
+    if isinstance(value, bool):
+        return False, value
+    if isinstance(value, int):
+        return True, value
+    if isinstance(value, float) and value.is_integer():
+        return True, int(value)
+    return False, value
+
+
+def _coerce_boolean(value: Any) -> tuple[bool, Any]:
+    return isinstance(value, bool), value
+
+
+def _coerce_array(value: Any) -> tuple[bool, Any]:
+    if isinstance(value, list):
+        return True, value
+    if isinstance(value, tuple):
+        return True, list(value)
+    return False, value
+
+
+def _coerce_object(value: Any) -> tuple[bool, Any]:
+    return isinstance(value, dict), value
+
+
+def _coerce_null(value: Any) -> tuple[bool, Any]:
+    return value is None, value
+
+
+_COERCERS: dict[str, Callable[[Any], tuple[bool, Any]]] = {
+    "string": _coerce_string,
+    "number": _coerce_number,
+    "integer": _coerce_integer,
+    "boolean": _coerce_boolean,
+    "array": _coerce_array,
+    "object": _coerce_object,
+    "null": _coerce_null,
+}
+
+
+def _type_check(types: Any) -> _Check | None:
+    names = [types] if isinstance(types, str) else list(types) if isinstance(types, list) else []
+    if not names or any(name not in _COERCERS for name in names):
+        return None
+    coercers = [_COERCERS[name] for name in names]
+    expected = " or ".join(names)
+
+    def check(value: Any, path: str, errors: list) -> Any:
+        for coerce in coercers:
+            ok, coerced = coerce(value)
+            if ok:
+                return coerced
+        errors.append(f"{path}: expected {expected}, got {_type_name(value)}")
+        return value
+
+    return check
+
+
+def _enum_check(options: list[Any]) -> _Check:
+    def check(value: Any, path: str, errors: list) -> Any:
+        if value not in options:
+            errors.append(f"{path}: {value!r} is not one of {options!r}")
+        return value
+
+    return check
+
+
+def _bounds_check(schema: dict[str, Any]) -> _Check | None:
+    minimum, maximum = schema.get("minimum"), schema.get("maximum")
+    exclusive_min, exclusive_max = schema.get("exclusiveMinimum"), schema.get("exclusiveMaximum")
+    if exclusive_min is True:
+        minimum, exclusive_min = None, minimum
+    elif exclusive_min is False:
+        exclusive_min = None
+    if exclusive_max is True:
+        maximum, exclusive_max = None, maximum
+    elif exclusive_max is False:
+        exclusive_max = None
+    bounds = [
+        (bound, test, message)
+        for bound, test, message in (
+            (minimum, lambda v, b: v >= b, "must be >= {}"),
+            (maximum, lambda v, b: v <= b, "must be <= {}"),
+            (exclusive_min, lambda v, b: v > b, "must be > {}"),
+            (exclusive_max, lambda v, b: v < b, "must be < {}"),
+        )
+        if isinstance(bound, (int, float)) and not isinstance(bound, bool)
+    ]
+    if not bounds:
+        return None
+
+    def check(value: Any, path: str, errors: list) -> Any:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            for bound, test, message in bounds:
+                if not test(value, bound):
+                    errors.append(f"{path}: {value!r} {message.format(bound)}")
+        return value
+
+    return check
+
+
+def _length_check(schema: dict[str, Any]) -> _Check | None:
+    limits = []
+    for key, kind, label in (
+        ("minItems", list, "items"), ("maxItems", list, "items"),
+        ("minLength", str, "characters"), ("maxLength", str, "characters"),
+    ):
+        limit = schema.get(key)
+        if isinstance(limit, int) and not isinstance(limit, bool):
+            limits.append((kind, key.startswith("min"), limit, label))
+    if not limits:
+        return None
+
+    def check(value: Any, path: str, errors: list) -> Any:
+        for kind, is_min, limit, label in limits:
+            if isinstance(value, kind):
+                size = len(value)
+                if (size < limit) if is_min else (size > limit):
+                    bound = "at least" if is_min else "at most"
+                    errors.append(f"{path}: needs {bound} {limit} {label}, got {size}")
+        return value
+
+    return check
+
+
+def _object_check(schema: dict[str, Any]) -> _Check | None:
+    properties = schema.get("properties")
+    properties = properties if isinstance(properties, dict) else {}
+    required = schema.get("required")
+    required = tuple(name for name in required if isinstance(name, str)) if isinstance(required, list) else ()
+    optional = frozenset(properties) - frozenset(required)
+    property_checks = [(name, sub) for name, sub in ((n, _compile(s)) for n, s in properties.items()) if sub]
+    additional = schema.get("additionalProperties", True)
+    extra_check = _compile(additional) if isinstance(additional, dict) else None
+    forbid_extra = additional is False
+    if not (required or property_checks or extra_check or forbid_extra):
+        return None
+    known = frozenset(properties)
+
+    def check(value: Any, path: str, errors: list) -> Any:
+        if not isinstance(value, dict):
+            return value
+        for name in required:
+            if name not in value:
+                errors.append(f"{path}: missing required property '{name}'")
+        out = value
+        for name, sub in property_checks:
+            if name not in value:
+                continue
+            item = value[name]
+            if item is None and name in optional:
+                continue
+            new = sub(item, f"{path}.{name}", errors)
+            if new is not item:
+                if out is value:
+                    out = dict(value)
+                out[name] = new
+        if forbid_extra or extra_check:
+            for name in value:
+                if name in known:
+                    continue
+                if forbid_extra:
+                    errors.append(f"{path}: unexpected property '{name}'")
+                    continue
+                item = value[name]
+                new = extra_check(item, f"{path}.{name}", errors)
+                if new is not item:
+                    if out is value:
+                        out = dict(value)
+                    out[name] = new
+        return out
+
+    return check
+
+
+def _array_check(items: Any) -> _Check | None:
+    if not isinstance(items, dict):
+        return None
+    if items.get("type") == "number" and set(items) - _ANNOTATIONS == {"type"}:
+        def numbers(value: Any, path: str, errors: list) -> Any:
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    kind = type(item)
+                    if kind is not float and kind is not int and not _coerce_number(item)[0]:
+                        errors.append(f"{path}[{index}]: expected number, got {_type_name(item)}")
+                        if len(errors) >= MAX_ERRORS:
+                            break
+            return value
+
+        return numbers
+
+    item_check = _compile(items)
+    if item_check is None:
+        return None
+
+    def check(value: Any, path: str, errors: list) -> Any:
+        if not isinstance(value, list):
+            return value
+        out = value
+        scratch: list[str] = []
+        for index, item in enumerate(value):
+            new = item_check(item, path, scratch)
+            if scratch:
+                # Re-run only the failing element to report its indexed path.
+                scratch.clear()
+                item_check(item, f"{path}[{index}]", errors)
+                if len(errors) >= MAX_ERRORS:
+                    break
+            elif new is not item:
+                if out is value:
+                    out = list(value)
+                out[index] = new
+        return out
+
+    return check
+
+
+def _combinator_check(schema: dict[str, Any]) -> _Check | None:
+    checks: list[_Check] = []
+    for keyword in ("allOf", "anyOf", "oneOf"):
+        branches = schema.get(keyword)
+        if not isinstance(branches, list) or not branches:
+            continue
+        compiled = [_compile(branch) for branch in branches]
+        if keyword == "allOf":
+            checks.extend(check for check in compiled if check)
+            continue
+        if any(check is None for check in compiled) and keyword == "anyOf":
+            continue  # an unconstrained branch accepts everything
+        checks.append(_alternatives(keyword, compiled))
+    return _sequence(checks)
+
+
+def _alternatives(keyword: str, branches: list[_Check | None]) -> _Check:
+    exactly_one = keyword == "oneOf"
+
+    def check(value: Any, path: str, errors: list) -> Any:
+        matched = 0
+        result = value
+        for branch in branches:
+            scratch: list[str] = []
+            new = branch(value, path, scratch) if branch else value
+            if not scratch:
+                if not matched:
+                    result = new
+                matched += 1
+                if not exactly_one:
+                    break
+        if matched == 0:
+            errors.append(f"{path}: does not match any {keyword} alternative")
+        elif exactly_one and matched > 1:
+            errors.append(f"{path}: matches {matched} oneOf alternatives, expected exactly one")
+        return result
+
+    return check
+
+
+def _sequence(checks: list[_Check]) -> _Check | None:
+    """Run checks in order, stopping at the first that reports a problem."""
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(value: Any, path: str, errors: list) -> Any:
+        before = len(errors)
+        for step in checks:
+            value = step(value, path, errors)
+            if len(errors) > before:
+                break
+        return value
+
+    return check
+
+
+def _compile(schema: Any) -> _Check | None:
+    """Compile one schema node; None means it accepts every value."""
+    if not isinstance(schema, dict):
+        return None
+    checks: list[_Check | None] = [_type_check(schema.get("type"))]
+    if isinstance(schema.get("enum"), list):
+        checks.append(_enum_check(schema["enum"]))
+    checks += [
+        _bounds_check(schema),
+        _length_check(schema),
+        _object_check(schema),
+        _array_check(schema.get("items")),
+        _combinator_check(schema),
+    ]
+    return _sequence([check for check in checks if check])
+
+
+class SchemaValidator:
+    """A compiled inputSchema: call it with a params dict."""
+
+    def __init__(self, schema: Any) -> None:
+        self.schema = schema
+        self._check = _compile(schema)
+
+    def __call__(self, params: Any) -> tuple[Any, list[str]]:
+        """Validate params.
+
+        Returns:
+            (params, errors): params with lossless coercions applied (the input
+            object itself when nothing changed), and at most MAX_ERRORS messages
+            such as "params.period: expected integer, got str".
+        """
+        if self._check is None:
+            return params, []
+        errors: list[str] = []
+        params = self._check(params, "params", errors)
+        return params, errors[:MAX_ERRORS]
+
+
+_VALIDATORS: dict[str, SchemaValidator] = {}
+
+
+def compile_schema(schema: Any) -> SchemaValidator:
+    """Validator for a schema, shared between skills with identical schemas."""
+    key = canonical_key(schema)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        validator = _VALIDATORS.setdefault(key, SchemaValidator(schema))
+    return validator
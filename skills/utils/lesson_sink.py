@@ -0,0 +1,171 @@
+"""Queue-backed, non-blocking writer for logs/lessons.md.
+
+Callers enqueue a line and return immediately; a daemon thread drains the queue
+in batches, appends them with one write per batch, and rotates the file by size.
+When the queue is full the line is dropped and counted rather than blocking the
+request path.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from skills.utils.append_log import rotate_numbered
+
+logger = logging.getLogger("snowdrop.skills")
+
+DEFAULT_LESSONS_PATH = Path(os.environ.get("SNOWDROP_LESSONS_PATH", "logs/lessons.md"))
+
+
+class LessonSink:
+    """Background batching writer with size-based rotation and drop counters."""
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_LESSONS_PATH,
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        max_bytes: int = 5 * 1024 * 1024,
+        backup_count: int = 3,
+    ) -> None:
+        """
+        Args:
+            path: Lessons file to append to.
+            max_queue: Pending lines held in memory before new lines are dropped.
+            batch_size: Maximum lines written per file append.
+            flush_interval: Seconds the writer waits for more lines before writing.
+            max_bytes: Rotate once the file reaches this size (0 disables rotation).
+            backup_count: Rotated files kept as <path>.1 ... <path>.N.
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._queue: queue.Queue[str | None] = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self.written = 0
+        self.dropped = 0
+        self.rotations = 0
+        self.write_errors = 0
+        self._thread = threading.Thread(target=self._run, name="snowdrop-lesson-sink", daemon=True)
+        self._thread.start()
+
+    def submit(self, line: str) -> bool:
+        """Enqueue one line (newline added if missing). Never blocks.
+
+        Returns:
+            False if the line was dropped because the queue is full or closed.
+        """
+        if self._closed:
+            self.dropped += 1
+            return False
+        if not line.endswith("\n"):
+            line += "\n"
+        try:
+            self._queue.put_nowait(line)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything enqueued so far is written (for shutdown and tests).
+
+        Returns:
+            True if the queue drained within timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending lines and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for monitoring."""
+        return {
+            "pending": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "rotations": self.rotations,
+            "write_errors": self.write_errors,
+        }
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch: list[str] = []
+            if first is None:
+                stop = True
+            else:
+                batch.append(first)
+            while len(batch) < self.batch_size and not stop:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+            try:
+                if batch:
+                    self._write(batch)
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self._queue.task_done()
+
+    def _write(self, batch: list[str]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.max_bytes and self.path.exists() and self.path.stat().st_size >= self.max_bytes:
+                self._rotate()
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write("".join(batch))
+            self.written += len(batch)
+        except OSError as exc:
+            self.write_errors += 1
+            self.dropped += len(batch)
+            logger.error(f"LessonSink failed to write {len(batch)} lesson(s): {exc}")
+
+    def _rotate(self) -> None:
+        rotate_numbered(self.path, self.backup_count)
+        self.rotations += 1
+
+
+_SINK: LessonSink | None = None
+_SINK_LOCK = threading.Lock()
+
+
+def get_lesson_sink() -> LessonSink:
+    """Process-wide sink, started on first use and flushed at interpreter exit."""
+    global _SINK
+    with _SINK_LOCK:
+        if _SINK is None:
+            _SINK = LessonSink()
+            atexit.register(_SINK.close)
+        return _SINK
@@ -1,19 +1,22 @@
 import json
 import logging
+from skills.utils.lesson_sink import get_lesson_sink
 from skills.utils.time import get_iso_timestamp
 
 logger = logging.getLogger("snowdrop.skills")
 
 
 def log_lesson(message: str) -> None:
-    """Append a timestamped error lesson to logs/lessons.md.
+    """Queue a timestamped error lesson for logs/lessons.md.
+
+    The write happens on the lesson sink's background thread, so this never
+    blocks on file I/O; lines are dropped (and counted) if the sink is saturated.
 
     Args:
         message: Human-readable description of what went wrong.
     """
     try:
-        with open("logs/lessons.md", "a", encoding="utf-8") as handle:
-            handle.write(f"- [{get_iso_timestamp()}] {message}\n")
+        get_lesson_sink().submit(f"- [{get_iso_timestamp()}] {message}")
     except Exception as e:
         logger.error(f"Failed to log lesson: {e}")
 
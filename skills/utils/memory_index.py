@@ -0,0 +1,252 @@
+"""Indexed append-only JSONL store behind memory.long_term_memory_store.
+
+The on-disk format stays one JSON record per line, so existing memory files
+load unchanged. The file is scanned once; after that only bytes appended since
+the last call are indexed, including appends from other processes. The
+in-memory index holds:
+
+* a key index mapping each key to its live record ids, in append order;
+* a tag inverted index mapping each tag to record ids in append (timestamp)
+  order, so tag search is a union of posting lists rather than a file scan;
+* the byte offset and length of every record, so values are read back with
+  one seek each instead of being held in memory.
+
+Deletes append a tombstone line instead of rewriting the file. Once dead
+lines pass a threshold, a background compaction rewrites the live records
+and rebuilds the index. Appends and compaction serialise on a ``.lock``
+sidecar file, so several processes can share one store.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger("snowdrop.skills")
+
+
+class MemoryIndex:
+    """Append-only JSONL records with key/tag indexes, tombstones and compaction."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        compact_min_dead: int = 1000,
+        compact_ratio: float = 0.5,
+        background_compaction: bool = True,
+    ) -> None:
+        """
+        Args:
+            path: JSONL file; created (with parents) on first write.
+            compact_min_dead: Dead lines (deleted records and tombstones) needed
+                before compaction is considered.
+            compact_ratio: Compact once dead lines exceed this share of the file.
+            background_compaction: Compact on a daemon thread rather than inline.
+        """
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.compact_min_dead = compact_min_dead
+        self.compact_ratio = compact_ratio
+        self.background_compaction = background_compaction
+        self._lock = threading.RLock()
+        self._compacting = False
+        self.compactions = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._offsets: list[int] = []
+        self._lengths: list[int] = []
+        self._live = bytearray()
+        self._by_key: dict[str, list[int]] = {}
+        self._by_tag: dict[str, list[int]] = {}
+        self._live_count = 0
+        self._dead_lines = 0
+        self._indexed_to = 0
+        self._inode: int | None = None
+
+    # -- indexing -------------------------------------------------------------
+
+    def _sync(self) -> None:
+        """Index whatever was appended since the last call; rebuild if the file was replaced."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            if self._inode is not None:
+                self._reset()
+            return
+        if self._inode != stat.st_ino or stat.st_size < self._indexed_to:
+            self._reset()
+            self._inode = stat.st_ino
+        if stat.st_size == self._indexed_to:
+            return
+        with open(self.path, "rb") as handle:
+            handle.seek(self._indexed_to)
+            chunk = handle.read(stat.st_size - self._indexed_to)
+        end = chunk.rfind(b"\n") + 1  # leave a half-written last line for the next sync
+        position = self._indexed_to
+        for raw in chunk[:end].splitlines(keepends=True):
+            self._index_line(position, raw)
+            position += len(raw)
+        self._indexed_to = position
+
+    def _index_line(self, offset: int, raw: bytes) -> None:
+        try:
+            record = json.loads(raw)
+        except ValueError:
+            return
+        if not isinstance(record, dict):
+            return
+        key = record.get("key")
+        if record.get("deleted") is True:
+            self._dead_lines += 1
+            for rid in self._by_key.pop(key, ()):
+                self._live[rid] = 0
+                self._live_count -= 1
+                self._dead_lines += 1
+            return
+        rid = len(self._offsets)
+        self._offsets.append(offset)
+        self._lengths.append(len(raw))
+        self._live.append(1)
+        self._live_count += 1
+        self._by_key.setdefault(key, []).append(rid)
+        for tag in dict.fromkeys(record.get("tags") or ()):
+            if isinstance(tag, str):
+                self._by_tag.setdefault(tag, []).append(rid)
+
+    def _read(self, rids: Iterable[int]) -> list[dict[str, Any]]:
+        records = []
+        with open(self.path, "rb") as handle:
+            for rid in rids:
+                handle.seek(self._offsets[rid])
+                records.append(json.loads(handle.read(self._lengths[rid])))
+        return records
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _append(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record) + "\n"
+        with self._file_lock():
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(line)
+            self._sync()
+
+    # -- operations -----------------------------------------------------------
+
+    def write(self, key: str, value: Any, tags: list[str] | None = None) -> dict[str, Any]:
+        record = {
+            "key": key,
+            "value": value,
+            "tags": list(tags or []),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        with self._lock:
+            self._append(record)
+        return record
+
+    def read(self, key: str) -> list[dict[str, Any]]:
+        """Every live record written under ``key``, oldest first."""
+        with self._lock:
+            self._sync()
+            return self._read(self._by_key.get(key, ()))
+
+    def delete(self, key: str) -> int:
+        """Tombstone every record under ``key``; returns how many were removed."""
+        with self._lock:
+            self._sync()
+            removed = len(self._by_key.get(key, ()))
+            if removed:
+                self._append({"key": key, "deleted": True, "timestamp": datetime.now(timezone.utc).isoformat()})
+                self._maybe_compact()
+            return removed
+
+    def search(
+        self,
+        tags: Iterable[str],
+        *,
+        offset: int = 0,
+        limit: int | None = 100,
+        newest_first: bool = False,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Records carrying any of ``tags``, in timestamp order.
+
+        Returns:
+            (page of records, total number of matches).
+        """
+        with self._lock:
+            self._sync()
+            matched: set[int] = set()
+            for tag in set(tags):
+                matched.update(self._by_tag.get(tag, ()))
+            rids = sorted((rid for rid in matched if self._live[rid]), reverse=newest_first)
+            end = None if limit is None else offset + limit
+            return self._read(rids[offset:end]), len(rids)
+
+    # -- compaction -----------------------------------------------------------
+
+    def _maybe_compact(self) -> None:
+        lines = self._live_count + self._dead_lines
+        if self._compacting or self._dead_lines < self.compact_min_dead or self._dead_lines < lines * self.compact_ratio:
+            return
+        self._compacting = True
+        if self.background_compaction:
+            threading.Thread(target=self.compact, name="snowdrop-memory-compaction", daemon=True).start()
+        else:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the file with live records only and rebuild the index."""
+        try:
+            with self._lock, self._file_lock():
+                self._sync()
+                if not self.path.exists():
+                    return
+                tmp = self.path.with_name(self.path.name + ".compact")
+                with open(self.path, "rb") as source, open(tmp, "wb") as target:
+                    for rid, live in enumerate(self._live):
+                        if live:
+                            source.seek(self._offsets[rid])
+                            target.write(source.read(self._lengths[rid]))
+                    target.flush()
+                    os.fsync(target.fileno())
+                os.replace(tmp, self.path)
+                self._reset()
+                self._sync()
+                self.compactions += 1
+        except OSError as exc:
+            logger.warning(f"memory_index: compaction failed: {exc}")
+        finally:
+            self._compacting = False
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            self._sync()
+            return {
+                "live_records": self._live_count,
+                "dead_lines": self._dead_lines,
+                "keys": len(self._by_key),
+                "tags": len(self._by_tag),
+                "bytes": self._indexed_to,
+                "compactions": self.compactions,
+            }
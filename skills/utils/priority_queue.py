@@ -0,0 +1,158 @@
+"""Durable multi-class priority queue with aging.
+
+Each (queue, priority class) pair is an index range ordered by enqueue time,
+so enqueue and dequeue cost O(log n). Dequeue compares only the head of each
+class. Waiting promotes an item by one class per ``aging_seconds``, so lower
+classes cannot starve behind a steady stream of higher-priority work.
+
+The SQLite database (WAL mode) is the only copy of the queue, so several
+processes can share one file: dequeue picks and deletes the head inside one
+``BEGIN IMMEDIATE`` transaction, and no item is ever handed out twice.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue_items (
+    id TEXT PRIMARY KEY,
+    queue TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    queued_at REAL NOT NULL,
+    seq INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS queue_items_head ON queue_items (queue, priority, queued_at, seq);
+"""
+
+
+class PersistentPriorityQueue:
+    """Priority queue held in SQLite; safe to share between threads and processes."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        priorities: dict[str, int],
+        *,
+        default_priority: str,
+        aging_seconds: float | None = 300.0,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Args:
+            path: SQLite database; parent directories are created.
+            priorities: Class name to rank (0 is served first).
+            default_priority: Class used when an item has none or an unknown one.
+            aging_seconds: Wait that promotes an item by one class; None disables aging.
+            timeout: Seconds to wait for another process's write transaction.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.priorities = dict(priorities)
+        self.default_priority = default_priority
+        self.aging_seconds = aging_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _priority(self, value: Any) -> str:
+        return value if value in self.priorities else self.default_priority
+
+    def enqueue(self, item: dict[str, Any], queue: str = "default") -> dict[str, Any]:
+        """Add an item; returns it with ``id``, ``priority`` and ``queued_at`` filled in."""
+        now = time.time()
+        priority = self._priority(item.get("priority"))
+        item_id = str(item.get("id") or uuid.uuid4().hex)
+        stored = {
+            **item,
+            "id": item_id,
+            "priority": priority,
+            "queued_at": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+        }
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT INTO queue_items (id, queue, priority, queued_at, seq, payload) "
+                    "VALUES (?, ?, ?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM queue_items), ?)",
+                    (item_id, queue, priority, now, json.dumps(stored, default=str)),
+                )
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Request id '{item_id}' is already queued") from None
+        return stored
+
+    def _head(self, queue: str, now: float) -> tuple[str, str] | None:
+        """(id, payload) of the item to serve next, comparing the head of each class."""
+        best: tuple[float, float, int] | None = None
+        head = None
+        for priority, rank in self.priorities.items():
+            row = self._conn.execute(
+                "SELECT id, queued_at, seq, payload FROM queue_items WHERE queue = ? AND priority = ? "
+                "ORDER BY queued_at, seq LIMIT 1",
+                (queue, priority),
+            ).fetchone()
+            if row is None:
+                continue
+            item_id, queued_at, seq, payload = row
+            effective = rank
+            if self.aging_seconds:
+                effective = max(0, rank - int((now - queued_at) // self.aging_seconds))
+            candidate = (effective, queued_at, seq)
+            if best is None or candidate < best:
+                best, head = candidate, (item_id, payload)
+        return head
+
+    def peek(self, queue: str = "default") -> dict[str, Any] | None:
+        with self._lock:
+            head = self._head(queue, time.time())
+        return json.loads(head[1]) if head else None
+
+    def dequeue(self, queue: str = "default") -> dict[str, Any] | None:
+        """Remove and return the next item; concurrent callers in any process never share one."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                head = self._head(queue, time.time())
+                if head is not None:
+                    self._conn.execute("DELETE FROM queue_items WHERE id = ?", (head[0],))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return json.loads(head[1]) if head else None
+
+    def stats(self, queue: str = "default", seconds_per_item: float = 30.0) -> dict[str, Any]:
+        """Depth, per-class counts, oldest wait and a naive wait estimate."""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT priority, COUNT(*), MIN(queued_at) FROM queue_items WHERE queue = ? GROUP BY priority",
+                (queue,),
+            ).fetchall()
+        counts = {priority: 0 for priority in self.priorities}
+        heads = []
+        for priority, count, oldest in rows:
+            counts[priority] = counts.get(priority, 0) + count
+            heads.append(oldest)
+        return {
+            "depth": sum(counts.values()),
+            "counts": counts,
+            "oldest_wait_seconds": round(now - min(heads), 3) if heads else None,
+            "estimated_wait_seconds": {priority: count * seconds_per_item for priority, count in counts.items()},
+        }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM queue_items").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,269 @@
+"""Server-resident token-bucket rate limiter.
+
+Buckets live in process memory keyed by agent (or any other key) and refill
+on the monotonic clock, so callers no longer round-trip bucket state and
+timestamps, and concurrent callers share one bucket instead of racing on
+private copies. Buckets can optionally be snapshotted to a JSON file (at exit
+and every ``persist_interval`` seconds); on load the wall-clock time since the
+snapshot is credited as refill.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+logger = logging.getLogger("snowdrop.skills")
+
+# Default bucket size (burst) and refill rate for keys without their own limits.
+_CAPACITY: float = float(os.environ.get("SNOWDROP_RATE_LIMIT_CAPACITY", "60"))
+_REFILL_PER_SEC: float = float(os.environ.get("SNOWDROP_RATE_LIMIT_REFILL_PER_SEC", "1"))
+# Snapshot file for buckets; empty keeps them in memory only.
+_STATE_PATH: str = os.environ.get("SNOWDROP_RATE_LIMIT_STATE_PATH", "")
+# Maximum buckets held; the least recently used are dropped (they restart full).
+_MAX_BUCKETS: int = int(os.environ.get("SNOWDROP_RATE_LIMIT_MAX_BUCKETS", "100000"))
+# Buckets that may be created per second (and in a burst). Keys are caller
+# supplied, so without this cap a client rotating keys would get a fresh full
+# bucket every call and evict everyone else's; over the cap, unknown keys are
+# denied instead of given a bucket. A rate of 0 turns the cap off.
+_NEW_KEYS_PER_SEC: float = float(os.environ.get("SNOWDROP_RATE_LIMIT_NEW_KEYS_PER_SEC", "10"))
+_NEW_KEYS_BURST: float = float(os.environ.get("SNOWDROP_RATE_LIMIT_NEW_KEYS_BURST", "100"))
+
+
+class TokenBucket:
+    __slots__ = ("capacity", "refill_rate", "tokens", "updated")
+
+    def __init__(self, capacity: float, refill_rate: float, tokens: float | None = None, updated: float | None = None):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity if tokens is None else min(tokens, capacity)
+        self.updated = time.monotonic() if updated is None else updated
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self.updated, 0.0)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.updated = now
+
+    def acquire(self, cost: float, now: float) -> tuple[bool, float | None]:
+        """Take ``cost`` tokens if available; otherwise return the seconds until they would be.
+
+        A non-positive (or NaN) cost is treated as free: it never adds tokens.
+        """
+        self._refill(now)
+        if not cost > 0:
+            return True, None
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return True, None
+        if self.refill_rate <= 0:
+            return False, None
+        return False, round((cost - self.tokens) / self.refill_rate, 3)
+
+
+class RateLimiter:
+    """Thread-safe registry of token buckets with per-key limits."""
+
+    def __init__(
+        self,
+        *,
+        capacity: float = _CAPACITY,
+        refill_rate: float = _REFILL_PER_SEC,
+        state_path: str | Path | None = None,
+        persist_interval: float = 30.0,
+        max_buckets: int = _MAX_BUCKETS,
+        new_keys_per_sec: float = _NEW_KEYS_PER_SEC,
+        new_keys_burst: float = _NEW_KEYS_BURST,
+    ) -> None:
+        """
+        Args:
+            capacity: Default bucket size (maximum burst).
+            refill_rate: Default tokens added per second.
+            state_path: Optional JSON snapshot file; None keeps buckets in memory.
+            persist_interval: Seconds between snapshots when state_path is set.
+            max_buckets: Buckets kept before the least recently used are dropped.
+            new_keys_per_sec: Buckets created per second at most; 0 for no cap.
+            new_keys_burst: Buckets that may be created at once before that rate applies.
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.state_path = Path(state_path) if state_path else None
+        self.max_buckets = max_buckets
+        self._buckets: dict[str, TokenBucket] = {}
+        self._new_keys = TokenBucket(new_keys_burst, new_keys_per_sec) if new_keys_per_sec > 0 else None
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.denied = 0
+        self.new_keys_denied = 0
+        self._stop = threading.Event()
+        if self.state_path is not None:
+            self._load()
+            threading.Thread(
+                target=self._persist_loop, args=(persist_interval,), name="snowdrop-rate-limiter", daemon=True,
+            ).start()
+
+    def _bucket(self, key: str, capacity: float | None, refill_rate: float | None) -> TokenBucket:
+        bucket = self._buckets.pop(key, None)
+        if bucket is None:
+            bucket = TokenBucket(capacity or self.capacity, self.refill_rate if refill_rate is None else refill_rate)
+            while len(self._buckets) >= self.max_buckets:
+                self._buckets.pop(next(iter(self._buckets)))
+        else:
+            if capacity is not None:
+                bucket.capacity = capacity
+            if refill_rate is not None:
+                bucket.refill_rate = refill_rate
+        self._buckets[key] = bucket  # re-insert: dict order doubles as LRU order
+        return bucket
+
+    def check(
+        self,
+        key: str,
+        cost: float = 1.0,
+        *,
+        capacity: float | None = None,
+        refill_rate: float | None = None,
+    ) -> dict[str, Any]:
+        """Consume ``cost`` tokens from ``key``'s bucket if possible.
+
+        Args:
+            key: Bucket key, typically the agent id.
+            cost: Tokens this request needs.
+            capacity: Override (and remember) this bucket's size.
+            refill_rate: Override (and remember) this bucket's tokens per second.
+
+        Returns:
+            {"key", "allowed", "tokens_remaining", "retry_after_sec", "capacity", "refill_rate_per_sec"}.
+            An unknown key is denied without a bucket while the new-key cap is exhausted.
+        """
+        with self._lock:
+            return self._decide(key, cost, time.monotonic(), capacity, refill_rate)
+
+    def check_many(self, keys: Iterable[str], cost: float = 1.0) -> list[dict[str, Any]]:
+        """check() for several keys under one lock acquisition, in input order."""
+        now = time.monotonic()
+        with self._lock:
+            return [self._decide(key, cost, now, None, None) for key in keys]
+
+    def _decide(
+        self, key: str, cost: float, now: float, capacity: float | None, refill_rate: float | None,
+    ) -> dict[str, Any]:
+        if key not in self._buckets and self._new_keys is not None:
+            admitted, retry_after = self._new_keys.acquire(1, now)
+            if not admitted:
+                self.denied += 1
+                self.new_keys_denied += 1
+                return {
+                    "key": key,
+                    "allowed": False,
+                    "tokens_remaining": 0.0,
+                    "retry_after_sec": retry_after,
+                    "capacity": capacity or self.capacity,
+                    "refill_rate_per_sec": self.refill_rate if refill_rate is None else refill_rate,
+                }
+        bucket = self._bucket(key, capacity, refill_rate)
+        allowed, retry_after = bucket.acquire(cost, now)
+        if allowed:
+            self.allowed += 1
+        else:
+            self.denied += 1
+        return {
+            "key": key,
+            "allowed": allowed,
+            "tokens_remaining": round(bucket.tokens, 4),
+            "retry_after_sec": retry_after,
+            "capacity": bucket.capacity,
+            "refill_rate_per_sec": bucket.refill_rate,
+        }
+
+    def reset(self, key: str) -> bool:
+        with self._lock:
+            return self._buckets.pop(key, None) is not None
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Bucket state with refill applied up to now, keyed by bucket key."""
+        now = time.monotonic()
+        with self._lock:
+            for bucket in self._buckets.values():
+                bucket._refill(now)
+            return {
+                key: {"tokens": bucket.tokens, "capacity": bucket.capacity, "refill_rate": bucket.refill_rate}
+                for key, bucket in self._buckets.items()
+            }
+
+    def save(self) -> None:
+        if self.state_path is None:
+            return
+        payload = {"saved_at": time.time(), "buckets": self.snapshot()}
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.state_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, self.state_path)
+        except OSError as exc:
+            logger.warning(f"rate_limiter: could not save buckets: {exc}")
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning(f"rate_limiter: ignoring unreadable bucket snapshot: {exc}")
+            return
+        elapsed = max(time.time() - float(payload.get("saved_at", time.time())), 0.0)
+        now = time.monotonic()
+        for key, state in payload.get("buckets", {}).items():
+            bucket = TokenBucket(float(state["capacity"]), float(state["refill_rate"]), float(state["tokens"]), now)
+            bucket.tokens = min(bucket.capacity, bucket.tokens + elapsed * bucket.refill_rate)
+            self._buckets[key] = bucket
+
+    def _persist_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.save()
+
+    def close(self) -> None:
+        self._stop.set()
+        self.save()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "buckets": len(self._buckets),
+                "allowed": self.allowed,
+                "denied": self.denied,
+                "new_keys_denied": self.new_keys_denied,
+                "persisted": self.state_path is not None,
+            }
+
+
+# Name of the limiter whose buckets snowdrop_execute enforces.
+DISPATCHER = "dispatcher"
+
+_LIMITERS: dict[str, RateLimiter] = {}
+_LIMITER_LOCK = threading.Lock()
+
+
+def get_rate_limiter(name: str = DISPATCHER) -> RateLimiter:
+    """Process-wide limiter by name, created on first use with the configured default limits.
+
+    Only the dispatcher limiter is snapshotted (at exit, when configured);
+    other names, such as the request_rate_limiter skill's, keep separate
+    in-memory buckets that cannot affect dispatcher enforcement.
+    """
+    with _LIMITER_LOCK:
+        limiter = _LIMITERS.get(name)
+        if limiter is None:
+            limiter = _LIMITERS[name] = RateLimiter(state_path=(_STATE_PATH or None) if name == DISPATCHER else None)
+            atexit.register(limiter.close)
+        return limiter
+
+
+def rate_limiter_stats() -> dict[str, Any] | None:
+    """Stats for the dispatcher limiter, or None if nothing has used it yet."""
+    limiter = _LIMITERS.get(DISPATCHER)
+    return limiter.stats() if limiter is not None else None
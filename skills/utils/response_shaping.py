@@ -0,0 +1,211 @@
+"""Trim, round and serialise skill responses for the dispatcher.
+
+Large skills return whole series and schedules while clients usually want a
+summary. shape_response() keeps only the requested ``fields`` of the data
+payload, cuts every list to its last ``tail`` items and rounds floats, without
+touching the (possibly cached) original. dumps() encodes each dispatcher
+response exactly once, for the client and for size metrics: orjson when installed, otherwise
+pydantic_core, and both write NaN/Infinity as null. What shaping saves is
+estimated from a sample of calls, so the unshaped result is rarely encoded.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any
+
+import pydantic_core
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None  # type: ignore[assignment]
+
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+# Every Nth shaped call per skill also encodes the unshaped result, to estimate
+# the bytes shaping saves.
+_SIZE_SAMPLE_EVERY: int = int(os.environ.get("SNOWDROP_MCP_SHAPING_SAMPLE_EVERY", "20"))
+
+# Marks a projected key whose whole value is kept.
+_ALL = object()
+
+
+def dumps(value: Any) -> bytes:
+    """Compact JSON bytes; objects JSON cannot represent are written via str()."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return pydantic_core.to_json(value, fallback=str)
+
+
+def project(data: dict[str, Any], fields: list[str]) -> tuple[dict[str, Any], list[str]]:
+    """Keep only the given dotted paths (e.g. "summary.total") of a payload.
+
+    Returns:
+        (projected, missing): the nested subset in the payload's own key order,
+        and the requested paths that do not exist.
+    """
+    wanted: dict[str, Any] = {}
+    missing: list[str] = []
+    for path in fields:
+        node: Any = data
+        parts = path.split(".")
+        for part in parts:
+            if not isinstance(node, dict) or part not in node:
+                missing.append(path)
+                break
+            node = node[part]
+        else:
+            tree = wanted
+            for part in parts[:-1]:
+                branch = tree.get(part)
+                if branch is _ALL:
+                    break
+                tree = tree.setdefault(part, {})
+            else:
+                tree[parts[-1]] = _ALL
+    return _select(data, wanted), missing
+
+
+def _select(data: dict[str, Any], wanted: dict[str, Any]) -> dict[str, Any]:
+    out = {}
+    for key, value in data.items():
+        if key in wanted:
+            sub = wanted[key]
+            out[key] = value if sub is _ALL else _select(value, sub)
+    return out
+
+
+def tail_lists(value: Any, n: int, path: str, truncated: dict[str, int]) -> Any:
+    """Copy of value with every list longer than n cut to its last n items.
+
+    Original lengths of cut lists are recorded in ``truncated`` by path.
+    """
+    if isinstance(value, dict):
+        return {key: tail_lists(item, n, f"{path}.{key}", truncated) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if len(value) > n:
+            truncated[path] = len(value)
+            value = value[len(value) - n:] if n else value[:0]
+        return [tail_lists(item, n, f"{path}[]", truncated) for item in value]
+    return value
+
+
+def round_floats(value: Any, digits: int) -> Any:
+    """Copy of value with every finite float rounded to ``digits`` decimals."""
+    if isinstance(value, float):
+        return round(value, digits) if value - value == 0 else value
+    if isinstance(value, dict):
+        return {key: round_floats(item, digits) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [round_floats(item, digits) for item in value]
+    return value
+
+
+def shape_response(
+    result: dict[str, Any],
+    fields: list[str] | None = None,
+    tail: int | None = None,
+    float_precision: int | None = None,
+) -> dict[str, Any]:
+    """Apply projection, tailing and rounding to a skill envelope's ``data``.
+
+    The input is left untouched. When anything was dropped or cut, a
+    "projection" entry describes it: {"fields", "missing_fields",
+    "tail", "truncated": {path: original_length}}.
+    """
+    data = result.get("data")
+    if not isinstance(data, dict) or (fields is None and tail is None and float_precision is None):
+        return result
+    note: dict[str, Any] = {}
+    if fields is not None:
+        data, missing = project(data, fields)
+        note["fields"] = list(fields)
+        if missing:
+            note["missing_fields"] = missing
+    if tail is not None:
+        truncated: dict[str, int] = {}
+        data = tail_lists(data, tail, "data", truncated)
+        if truncated:
+            note.update(tail=tail, truncated=truncated)
+    if float_precision is not None:
+        data = round_floats(data, float_precision)
+    shaped = {**result, "data": data}
+    if note:
+        shaped["projection"] = note
+    return shaped
+
+
+class ResponseSizeMetrics:
+    """Per-skill serialized response sizes (bytes), with an estimate of what shaping saved.
+
+    The first and then every ``sample_every``-th shaped call of a skill also
+    encodes the unshaped result; the sampled unshaped/shaped ratio is applied
+    to all of that skill's shaped bytes.
+    """
+
+    def __init__(self, sample_every: int = _SIZE_SAMPLE_EVERY) -> None:
+        self.sample_every = max(1, sample_every)
+        self._lock = threading.Lock()
+        self._skills: dict[str, dict[str, int]] = {}
+
+    def record(self, skill: str, sent_bytes: int, unshaped: Any = None) -> None:
+        """Count one response; pass ``unshaped`` (the result before shaping) for shaped calls."""
+        with self._lock:
+            entry = self._skills.setdefault(skill, {
+                "calls": 0, "bytes_sent": 0, "max_bytes": 0, "last_bytes": 0,
+                "shaped_calls": 0, "shaped_bytes": 0, "sampled_sent": 0, "sampled_raw": 0,
+            })
+            entry["calls"] += 1
+            entry["bytes_sent"] += sent_bytes
+            entry["max_bytes"] = max(entry["max_bytes"], sent_bytes)
+            entry["last_bytes"] = sent_bytes
+            sample = False
+            if unshaped is not None:
+                sample = entry["shaped_calls"] % self.sample_every == 0
+                entry["shaped_calls"] += 1
+                entry["shaped_bytes"] += sent_bytes
+        if sample:
+            raw_bytes = len(dumps(unshaped))
+            with self._lock:
+                entry["sampled_sent"] += sent_bytes
+                entry["sampled_raw"] += raw_bytes
+
+    @staticmethod
+    def _saved(entry: dict[str, int]) -> int:
+        if not entry["sampled_sent"]:
+            return 0
+        return int(entry["shaped_bytes"] * (entry["sampled_raw"] / entry["sampled_sent"] - 1))
+
+    def get(self, skill: str) -> dict[str, int] | None:
+        with self._lock:
+            entry = self._skills.get(skill)
+            return dict(entry) if entry else None
+
+    def stats(self, top: int = 10) -> dict[str, Any]:
+        """Totals plus the ``top`` skills by bytes sent."""
+        with self._lock:
+            skills = {name: dict(entry) for name, entry in self._skills.items()}
+        sent = sum(entry["bytes_sent"] for entry in skills.values())
+        largest = sorted(skills.items(), key=lambda item: -item[1]["bytes_sent"])[:top]
+        return {
+            "serializer": "orjson" if orjson is not None else "pydantic_core",
+            "skills": len(skills),
+            "bytes_sent": sent,
+            "bytes_saved_by_shaping": sum(self._saved(entry) for entry in skills.values()),
+            "largest": {
+                name: {
+                    "calls": entry["calls"],
+                    "bytes_sent": entry["bytes_sent"],
+                    "avg_bytes": entry["bytes_sent"] // entry["calls"],
+                    "max_bytes": entry["max_bytes"],
+                    "last_bytes": entry["last_bytes"],
+                    "shaped_calls": entry["shaped_calls"],
+                    "bytes_saved_by_shaping": self._saved(entry),
+                }
+                for name, entry in largest
+            },
+        }
@@ -0,0 +1,224 @@
+"""In-process inverted index with BM25F ranking for skill metadata search."""
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Iterable
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Field boosts: a hit in the skill name outranks one buried in a description.
+DEFAULT_FIELD_WEIGHTS: dict[str, float] = {
+    "name": 3.0,
+    "category": 2.0,
+    "description": 1.0,
+    "input_fields": 1.0,
+}
+
+# Score multipliers for expanded (non-exact) query terms.
+PREFIX_PENALTY = 0.7
+TYPO_PENALTY = 0.5
+
+# Query terms shorter than these are only matched exactly.
+MIN_PREFIX_LEN = 3
+MIN_TYPO_LEN = 4
+
+# Cap on vocabulary terms a single prefix may expand to.
+MAX_PREFIX_EXPANSIONS = 64
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase and split on anything that is not a letter or digit.
+
+    Underscores split too, so "rsi_calculator" yields ["rsi", "calculator"].
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _deletes(term: str) -> set[str]:
+    """The term plus every variant with one character removed."""
+    return {term} | {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """True when a and b differ by at most one insert, delete, substitute or transpose."""
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la == lb:
+        diffs = [i for i in range(la) if a[i] != b[i]]
+        if len(diffs) == 1:
+            return True
+        return (
+            len(diffs) == 2
+            and diffs[1] == diffs[0] + 1
+            and a[diffs[0]] == b[diffs[1]]
+            and a[diffs[1]] == b[diffs[0]]
+        )
+    if la > lb:
+        a, b = b, a
+    for i in range(len(a)):
+        if a[i] != b[i]:
+            return a[i:] == b[i + 1:]
+    return True
+
+
+class SkillSearchIndex:
+    """Inverted index over skill name, description, category and input field names.
+
+    Postings store a precomputed BM25F pseudo-frequency per (term, skill), so a
+    query costs O(matching postings) rather than O(catalog). Query terms are
+    OR-ed; unmatched terms fall back to prefix expansion and then to
+    single-edit typo correction, each with a score penalty.
+    """
+
+    def __init__(
+        self,
+        documents: Iterable[dict[str, Any]],
+        *,
+        field_weights: dict[str, float] | None = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            documents: Dicts with "name" plus optional "description", "category"
+                (strings) and "input_fields" (list of parameter names).
+            field_weights: Per-field boosts; defaults to DEFAULT_FIELD_WEIGHTS.
+            k1: BM25 term-frequency saturation.
+            b: BM25 length normalisation strength.
+        """
+        weights = field_weights or DEFAULT_FIELD_WEIGHTS
+        self._names: list[str] = []
+
+        field_tokens: list[dict[str, list[str]]] = []
+        totals: dict[str, int] = defaultdict(int)
+        for doc in documents:
+            self._names.append(doc["name"])
+            tokens = {
+                "name": tokenize(doc.get("name", "")),
+                "description": tokenize(doc.get("description", "") or ""),
+                "category": tokenize(doc.get("category", "") or ""),
+                "input_fields": tokenize(" ".join(doc.get("input_fields", []) or [])),
+            }
+            for field, toks in tokens.items():
+                totals[field] += len(toks)
+            field_tokens.append(tokens)
+
+        n_docs = len(self._names)
+        avg_len = {field: (totals[field] / n_docs if n_docs else 0.0) or 1.0 for field in weights}
+
+        pseudo_tf: dict[str, dict[int, float]] = defaultdict(dict)
+        for doc_id, tokens in enumerate(field_tokens):
+            doc_tf: dict[str, float] = defaultdict(float)
+            for field, weight in weights.items():
+                toks = tokens.get(field, [])
+                if not toks:
+                    continue
+                norm = 1 - b + b * len(toks) / avg_len[field]
+                for term in toks:
+                    doc_tf[term] += weight / norm
+            for term, tf in doc_tf.items():
+                pseudo_tf[term][doc_id] = tf
+
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        for term, docs in pseudo_tf.items():
+            idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            self._postings[term] = [
+                (doc_id, idf * tf * (k1 + 1) / (tf + k1)) for doc_id, tf in docs.items()
+            ]
+
+        self._vocab: list[str] = sorted(self._postings)
+        self._delete_map: dict[str, list[str]] = defaultdict(list)
+        for term in self._vocab:
+            if len(term) >= MIN_TYPO_LEN:
+                for variant in _deletes(term):
+                    self._delete_map[variant].append(term)
+
+    @classmethod
+    def from_catalog(cls, catalog: dict[str, dict[str, Any]]) -> "SkillSearchIndex":
+        """Build from an mcp_server-style catalog (name -> {"meta", "category", ...})."""
+        documents = []
+        for name, record in catalog.items():
+            meta = record.get("meta", {})
+            schema = meta.get("inputSchema") or meta.get("parameters") or {}
+            properties = schema.get("properties", {}) if isinstance(schema, dict) else {}
+            documents.append({
+                "name": name,
+                "description": meta.get("description", ""),
+                "category": record.get("category", ""),
+                "input_fields": list(properties) if isinstance(properties, dict) else [],
+            })
+        return cls(documents)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _expand(self, term: str) -> list[tuple[str, float]]:
+        """Map a query term to (vocabulary term, penalty) pairs."""
+        if term in self._postings:
+            expansions = [(term, 1.0)]
+        else:
+            expansions = []
+
+        if len(term) >= MIN_PREFIX_LEN:
+            start = bisect_left(self._vocab, term)
+            for candidate in self._vocab[start:start + MAX_PREFIX_EXPANSIONS + 1]:
+                if not candidate.startswith(term):
+                    break
+                if candidate != term:
+                    expansions.append((candidate, PREFIX_PENALTY))
+
+        if not expansions and len(term) >= MIN_TYPO_LEN:
+            seen: set[str] = set()
+            for variant in _deletes(term):
+                for candidate in self._delete_map.get(variant, ()):
+                    if candidate not in seen and _within_one_edit(term, candidate):
+                        seen.add(candidate)
+                        expansions.append((candidate, TYPO_PENALTY))
+        return expansions
+
+    def search_positions(
+        self, query: str, *, limit: int = 20, offset: int = 0
+    ) -> tuple[int, list[tuple[int, float]]]:
+        """Rank documents for a free-text query.
+
+        Args:
+            query: Free text; tokenised like the indexed fields.
+            limit: Maximum results to return (<= 0 returns every match).
+            offset: Number of top-ranked results to skip (pagination).
+
+        Returns:
+            (total_matches, [(document_position, score), ...]) best first, where
+            document_position is the index into the documents given at build time.
+        """
+        scores: dict[int, float] = defaultdict(float)
+        for term in dict.fromkeys(tokenize(query)):
+            best: dict[int, float] = {}
+            for vocab_term, penalty in self._expand(term):
+                for doc_id, weight in self._postings[vocab_term]:
+                    value = weight * penalty
+                    if value > best.get(doc_id, 0.0):
+                        best[doc_id] = value
+            for doc_id, value in best.items():
+                scores[doc_id] += value
+
+        total = len(scores)
+        offset = max(offset, 0)
+        key = lambda item: (item[1], -item[0])  # noqa: E731 — ties resolve by document order
+        if limit > 0:
+            ranked = heapq.nlargest(offset + limit, scores.items(), key=key)[offset:]
+        else:
+            ranked = sorted(scores.items(), key=key, reverse=True)[offset:]
+        return total, [(doc_id, round(score, 4)) for doc_id, score in ranked]
+
+    def search(self, query: str, *, limit: int = 20, offset: int = 0) -> tuple[int, list[tuple[str, float]]]:
+        """Like search_positions(), but returns (skill_name, score) pairs."""
+        total, ranked = self.search_positions(query, limit=limit, offset=offset)
+        return total, [(self._names[doc_id], score) for doc_id, score in ranked]
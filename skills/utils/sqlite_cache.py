@@ -0,0 +1,223 @@
+"""SQLite-backed key/value cache with TTLs, LRU eviction and a background sweeper.
+
+Entries live in one table indexed by key, so get/set cost is independent of
+cache size. The database runs in WAL mode with a busy timeout: readers never
+block the writer, and concurrent threads or processes no longer overwrite each
+other's writes as they did with a whole-file JSON rewrite. A trigger-maintained
+row count keeps the size check O(1). When a write pushes the cache past
+max_entries, the least recently read entries are evicted.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+logger = logging.getLogger("snowdrop.skills")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at) WHERE expires_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('count', 0);
+CREATE TRIGGER IF NOT EXISTS entries_count_insert AFTER INSERT ON entries
+BEGIN UPDATE meta SET value = value + 1 WHERE name = 'count'; END;
+CREATE TRIGGER IF NOT EXISTS entries_count_delete AFTER DELETE ON entries
+BEGIN UPDATE meta SET value = value - 1 WHERE name = 'count'; END;
+"""
+
+_UPSERT = """
+INSERT INTO entries (key, value, stored_at, expires_at, last_access) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    value = excluded.value,
+    stored_at = excluded.stored_at,
+    expires_at = excluded.expires_at,
+    last_access = excluded.last_access
+"""
+
+
+class CacheEntry:
+    __slots__ = ("value", "stored_at", "expires_at")
+
+    def __init__(self, value: Any, stored_at: float, expires_at: float | None) -> None:
+        self.value = value
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+
+    def age(self, now: float | None = None) -> float:
+        return (time.time() if now is None else now) - self.stored_at
+
+    def expired(self, now: float | None = None) -> bool:
+        return self.expires_at is not None and self.expires_at <= (time.time() if now is None else now)
+
+
+class SQLiteCache:
+    """Thread- and process-safe persistent cache (one connection per thread)."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_entries: int = 10_000,
+        sweep_interval: float | None = 60.0,
+        busy_timeout: float = 5.0,
+    ) -> None:
+        """
+        Args:
+            path: Database file; parent directories are created.
+            max_entries: Entries kept before least recently read ones are evicted.
+            sweep_interval: Seconds between background purges of expired
+                entries; None disables the sweeper thread.
+            busy_timeout: Seconds a writer waits for another writer's lock.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.sweep_interval = sweep_interval
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sweeper: threading.Thread | None = None
+        self.evictions = 0
+        self.expirations = 0
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        self._start_sweeper()
+        return conn
+
+    def _start_sweeper(self) -> None:
+        if self.sweep_interval is None or self._sweeper is not None:
+            return
+        with self._lock:
+            if self._sweeper is None and not self._stop.is_set():
+                self._sweeper = threading.Thread(target=self._sweep_loop, name="snowdrop-cache-sweeper", daemon=True)
+                self._sweeper.start()
+
+    def _sweep_loop(self) -> None:
+        while not self._stop.wait(self.sweep_interval):
+            try:
+                self.sweep()
+            except sqlite3.Error as exc:
+                logger.warning(f"sqlite_cache: sweep failed: {exc}")
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Entry for ``key`` (possibly expired, so callers can report its age), or None."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Entries for every key present; expired ones are returned and deleted."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        now = time.time()
+        conn = self._connect()
+        found: dict[str, CacheEntry] = {}
+        with conn:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, value, stored_at, expires_at FROM entries WHERE key IN ({marks})", chunk,
+                ).fetchall()
+                for key, value, stored_at, expires_at in rows:
+                    found[key] = CacheEntry(json.loads(value), stored_at, expires_at)
+            expired = [key for key, entry in found.items() if entry.expired(now)]
+            live = [key for key, entry in found.items() if not entry.expired(now)]
+            if expired:
+                conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in expired])
+                self.expirations += len(expired)
+            if live:
+                conn.executemany("UPDATE entries SET last_access = ? WHERE key = ?", [(now, key) for key in live])
+        return found
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, items: dict[str, Any], ttl: float | None = None) -> None:
+        """Store several values in one transaction, then evict down to max_entries."""
+        if not items:
+            return
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        rows = [
+            (key, json.dumps(value, separators=(",", ":"), default=str), now, expires_at, now)
+            for key, value in items.items()
+        ]
+        conn = self._connect()
+        with conn:
+            conn.executemany(_UPSERT, rows)
+            excess = self._count(conn) - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY last_access LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
+
+    def delete(self, key: str) -> bool:
+        conn = self._connect()
+        with conn:
+            return conn.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount > 0
+
+    def sweep(self) -> int:
+        """Delete expired entries now; returns how many were removed."""
+        conn = self._connect()
+        with conn:
+            removed = conn.execute(
+                "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),),
+            ).rowcount
+        self.expirations += removed
+        return removed
+
+    def clear(self) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM entries")
+
+    @staticmethod
+    def _count(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT value FROM meta WHERE name = 'count'").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._count(self._connect())
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def close(self) -> None:
+        """Stop the sweeper and close every thread's connection."""
+        self._stop.set()
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
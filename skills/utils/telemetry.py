@@ -6,6 +6,7 @@ from pathlib import Path
 from time import perf_counter
 from typing import Any
 
+from skills.utils.append_log import get_append_log
 from skills.utils.logging import logger
 from skills.utils.time import get_iso_timestamp
 
@@ -13,17 +14,14 @@ TELEMETRY_LOG_PATH = Path("logs/skill_telemetry.jsonl")
 
 
 def emit_skill_telemetry(sample: dict[str, Any], log_path: Path | None = None) -> None:
-    """Write a telemetry sample to disk.
+    """Queue a telemetry sample for the buffered telemetry log.
 
     Args:
         sample: Dictionary containing telemetry details.
         log_path: Optional override for the log destination.
     """
-    log_file = log_path or TELEMETRY_LOG_PATH
     try:
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        with log_file.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(_sanitize_sample(sample)) + "\n")
+        get_append_log(log_path or TELEMETRY_LOG_PATH).append(json.dumps(_sanitize_sample(sample)))
     except Exception as exc:  # noqa: BLE001
         logger.warning(f"emit_skill_telemetry failed: {exc}")
 
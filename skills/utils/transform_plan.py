@@ -0,0 +1,385 @@
+"""Compiled transformation plans for etl.data_transformer.
+
+A list of rename/cast/compute/drop/default operations is compiled once into a
+plan: compute expressions become code objects, casters and parameters are
+resolved, and every operation becomes a small closure. Plans are cached by
+their canonical JSON, so repeated calls with the same transformations skip
+compilation entirely.
+
+Two execution modes produce the same values:
+
+* row mode fuses all operations into a single pass, copying each row once,
+  and works on any iterable (so file input can be streamed);
+* columnar mode groups the batch by each row's exact key sequence, turns
+  every group into one list per field and applies each operation to a whole
+  column, so each row keeps the key order row mode gives it. Purely arithmetic compute expressions over
+  numeric columns are evaluated once on NumPy arrays; anything else (or any
+  numeric edge case such as division by zero) falls back to per-row
+  evaluation, so results and errors match row mode.
+"""
+from __future__ import annotations
+
+import ast
+import csv
+import json
+import os
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from types import CodeType
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+
+from skills.utils.cache import LRUCache, canonical_key
+
+# read_rows/write_rows only touch files inside this directory; relative paths resolve against it.
+_DATA_DIR: Path = Path(os.environ.get("SNOWDROP_DATA_DIR", "/tmp/snowdrop/data"))
+
+_NO_BUILTINS: dict[str, Any] = {}
+_EMPTY = frozenset({None, ""})
+
+CASTERS: dict[str, Callable[[Any], Any]] = {
+    "string": str,
+    "int": lambda value: int(float(value)),
+    "float": float,
+    "bool": lambda value: str(value).lower() in {"true", "1", "yes"},
+}
+
+# Expression nodes that behave identically on NumPy arrays and on scalars.
+_VECTOR_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+
+def _caster(name: str) -> Callable[[Any], Any]:
+    if name not in CASTERS:
+        raise ValueError(f"Unsupported cast type: {name}")
+    return CASTERS[name]
+
+
+def _code_names(code: CodeType) -> set[str]:
+    """Every global name a code object (or a nested comprehension) can look up."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _vectorizable(tree: ast.Expression) -> bool:
+    for node in ast.walk(tree):
+        if not isinstance(node, _VECTOR_NODES):
+            return False
+        if isinstance(node, ast.Compare) and len(node.ops) != 1:
+            return False
+        if isinstance(node, ast.Constant) and (isinstance(node.value, bool) or not isinstance(node.value, (int, float))):
+            return False
+    return True
+
+
+class _Compute:
+    """A compute expression compiled once, evaluable per row or per column."""
+
+    def __init__(self, expression: str) -> None:
+        tree = ast.parse(expression, mode="eval")
+        self.code = compile(tree, "<compute>", "eval")
+        self.names = _code_names(self.code)
+        self.vectorizable = _vectorizable(tree)
+
+    def row(self, row: dict[str, Any]) -> Any:
+        namespace = dict(row)
+        namespace["__builtins__"] = _NO_BUILTINS
+        return eval(self.code, namespace, {})  # noqa: S307 - no builtins, row values only
+
+    def column(self, columns: dict[str, list[Any]], num_rows: int) -> list[Any]:
+        if num_rows == 0:
+            return []
+        vectors = self._vectors(columns) if self.vectorizable else None
+        if vectors is not None:
+            try:
+                with np.errstate(all="raise"):
+                    result = eval(self.code, {"__builtins__": _NO_BUILTINS, **vectors}, {})  # noqa: S307
+            except (ArithmeticError, FloatingPointError, TypeError, ValueError):
+                result = None
+            if isinstance(result, np.ndarray) and result.shape == (num_rows,):
+                return result.tolist()
+        referenced = [name for name in self.names if name in columns]
+        values = [columns[name] for name in referenced]
+        out = []
+        for cells in zip(*values) if values else ((),) * num_rows:
+            namespace = dict(zip(referenced, cells))
+            namespace["__builtins__"] = _NO_BUILTINS
+            out.append(eval(self.code, namespace, {}))  # noqa: S307
+        return out
+
+    def _vectors(self, columns: dict[str, list[Any]]) -> dict[str, np.ndarray] | None:
+        """Referenced columns as arrays, or None if any is absent or non-numeric.
+
+        All-float columns become float64 arrays; anything involving ints uses
+        object arrays so Python int semantics (no overflow) are kept.
+        """
+        if not self.names or not self.names <= columns.keys():
+            return None
+        all_float = True
+        for name in self.names:
+            for value in columns[name]:
+                kind = type(value)
+                if kind is float:
+                    continue
+                if kind is int:
+                    all_float = False
+                    continue
+                return None
+        dtype = float if all_float else object
+        return {name: np.array(columns[name], dtype=dtype) for name in self.names}
+
+
+class TransformPlan:
+    """Compiled form of a data_transformer transformation list."""
+
+    def __init__(self, transformations: list[dict[str, Any]]) -> None:
+        self.log: list[str] = []
+        self._row_steps: list[Callable[[dict[str, Any]], None]] = []
+        self._column_steps: list[Callable[[dict[str, list[Any]], int], None]] = []
+        for transform in transformations:
+            self._compile(transform)
+
+    def _compile(self, transform: dict[str, Any]) -> None:
+        op = transform.get("operation")
+        field = transform.get("field")
+        params = transform.get("params", {})
+        if op == "rename":
+            new_name = params.get("new_name")
+            if not new_name:
+                raise ValueError("rename requires params.new_name")
+            self._add(_rename_row(field, new_name), _rename_column(field, new_name))
+            self.log.append(f"rename {field} -> {new_name}")
+        elif op == "cast":
+            cast_type = params.get("type", "string")
+            caster = _caster(cast_type)
+            self._add(_cast_row(field, caster), _cast_column(field, caster))
+            self.log.append(f"cast {field} to {cast_type}")
+        elif op == "compute":
+            expression = params.get("expression")
+            if not expression:
+                raise ValueError("compute requires params.expression")
+            compute = _Compute(expression)
+            self._add(_compute_row(field, compute), _compute_column(field, compute))
+            self.log.append(f"compute {field} = {expression}")
+        elif op == "drop":
+            self._add(_drop_row(field), _drop_column(field))
+            self.log.append(f"drop {field}")
+        elif op == "default":
+            value = params.get("value")
+            self._add(_default_row(field, value), _default_column(field, value))
+            self.log.append(f"default {field} -> {value}")
+        else:
+            raise ValueError(f"Unsupported operation: {op}")
+
+    def _add(self, row_step: Callable, column_step: Callable) -> None:
+        self._row_steps.append(row_step)
+        self._column_steps.append(column_step)
+
+    def apply(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Transformed copy of one row (the input is not modified)."""
+        out = row.copy()
+        for step in self._row_steps:
+            step(out)
+        return out
+
+    def transform_rows(self, rows: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Apply every operation to each row in a single pass, lazily."""
+        steps = self._row_steps
+        for row in rows:
+            out = row.copy()
+            for step in steps:
+                step(out)
+            yield out
+
+    def transform_columnar(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Apply the plan column by column; returns new rows in input order.
+
+        Rows are processed in groups sharing the same key sequence, so every
+        output row has the same keys, in the same order, as in row mode.
+        """
+        groups: dict[tuple[Any, ...], list[int]] = {}
+        for index, row in enumerate(rows):
+            groups.setdefault(tuple(row), []).append(index)
+        if len(groups) <= 1:
+            return self._transform_group(rows)
+        out: list[dict[str, Any]] = [{}] * len(rows)
+        for indices in groups.values():
+            for index, record in zip(indices, self._transform_group([rows[i] for i in indices])):
+                out[index] = record
+        return out
+
+    def _transform_group(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Columnar pass over rows that all have the same keys in the same order."""
+        num_rows = len(rows)
+        columns = {field: list(map(itemgetter(field), rows)) for field in rows[0]} if rows else {}
+        for step in self._column_steps:
+            step(columns, num_rows)
+        if not columns:
+            return [{} for _ in range(num_rows)]
+        names = list(columns)
+        return [dict(zip(names, cells)) for cells in zip(*columns.values())]
+
+    def transform_batches(self, rows: Iterable[dict[str, Any]], batch_size: int) -> Iterator[dict[str, Any]]:
+        """Columnar execution over consecutive batches of a (possibly streamed) row iterable."""
+        iterator = iter(rows)
+        while batch := list(islice(iterator, batch_size)):
+            yield from self.transform_columnar(batch)
+
+
+# -- row steps ----------------------------------------------------------------
+
+def _rename_row(field: Any, new_name: str) -> Callable[[dict[str, Any]], None]:
+    def step(row: dict[str, Any]) -> None:
+        row[new_name] = row.pop(field, None)
+    return step
+
+
+def _cast_row(field: Any, caster: Callable[[Any], Any]) -> Callable[[dict[str, Any]], None]:
+    def step(row: dict[str, Any]) -> None:
+        if field in row and row[field] is not None:
+            row[field] = caster(row[field])
+    return step
+
+
+def _compute_row(field: Any, compute: _Compute) -> Callable[[dict[str, Any]], None]:
+    def step(row: dict[str, Any]) -> None:
+        row[field] = compute.row(row)
+    return step
+
+
+def _drop_row(field: Any) -> Callable[[dict[str, Any]], None]:
+    def step(row: dict[str, Any]) -> None:
+        row.pop(field, None)
+    return step
+
+
+def _default_row(field: Any, value: Any) -> Callable[[dict[str, Any]], None]:
+    def step(row: dict[str, Any]) -> None:
+        if row.get(field) in _EMPTY:
+            row[field] = value
+    return step
+
+
+# -- column steps -------------------------------------------------------------
+
+def _rename_column(field: Any, new_name: str) -> Callable[[dict[str, list[Any]], int], None]:
+    def step(columns: dict[str, list[Any]], num_rows: int) -> None:
+        column = columns.pop(field, None)
+        columns[new_name] = [None] * num_rows if column is None else column
+    return step
+
+
+def _cast_column(field: Any, caster: Callable[[Any], Any]) -> Callable[[dict[str, list[Any]], int], None]:
+    def step(columns: dict[str, list[Any]], num_rows: int) -> None:
+        column = columns.get(field)
+        if column is not None:
+            columns[field] = [value if value is None else caster(value) for value in column]
+    return step
+
+
+def _compute_column(field: Any, compute: _Compute) -> Callable[[dict[str, list[Any]], int], None]:
+    def step(columns: dict[str, list[Any]], num_rows: int) -> None:
+        columns[field] = compute.column(columns, num_rows)
+    return step
+
+
+def _drop_column(field: Any) -> Callable[[dict[str, list[Any]], int], None]:
+    def step(columns: dict[str, list[Any]], num_rows: int) -> None:
+        columns.pop(field, None)
+    return step
+
+
+def _default_column(field: Any, default: Any) -> Callable[[dict[str, list[Any]], int], None]:
+    def step(columns: dict[str, list[Any]], num_rows: int) -> None:
+        column = columns.get(field)
+        if column is None:
+            columns[field] = [default] * num_rows
+        else:
+            columns[field] = [default if value in _EMPTY else value for value in column]
+    return step
+
+
+# -- plan cache and file streaming ------------------------------------------
+
+_PLANS = LRUCache(maxsize=256)
+
+
+def compile_plan(transformations: list[dict[str, Any]]) -> TransformPlan:
+    """Compiled plan for a transformation list, reused across calls with equal lists."""
+    key = canonical_key(transformations)
+    hit, plan = _PLANS.get(key)
+    if hit:
+        return plan
+    plan = TransformPlan(transformations)
+    _PLANS.set(key, plan)
+    return plan
+
+
+def resolve_data_path(path: str | Path) -> Path:
+    """Resolved path of a data file, which must lie inside the data directory.
+
+    Raises:
+        ValueError: If the path, after resolving "..", symlinks and absolute
+            paths, points outside SNOWDROP_DATA_DIR.
+    """
+    root = _DATA_DIR.resolve()
+    resolved = (root / path).resolve()
+    if resolved == root or not resolved.is_relative_to(root):
+        raise ValueError(f"Path '{path}' is outside the data directory {root}")
+    return resolved
+
+
+def read_rows(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Stream rows from a .csv file (header row) or JSON Lines (any other suffix).
+
+    Raises:
+        ValueError: If the path is outside the data directory.
+    """
+    path = resolve_data_path(path)
+    with open(path, newline="", encoding="utf-8") as handle:
+        if path.suffix.lower() == ".csv":
+            yield from csv.DictReader(handle)
+        else:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def write_rows(path: str | Path, rows: Iterable[dict[str, Any]]) -> int:
+    """Write rows to .csv (header from the first row) or JSON Lines; returns the count.
+
+    The file is written beside the target and moved into place when complete.
+
+    Raises:
+        ValueError: If the path is outside the data directory.
+    """
+    path = resolve_data_path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    count = 0
+    try:
+        with open(tmp, "w", newline="", encoding="utf-8") as handle:
+            if path.suffix.lower() == ".csv":
+                writer: csv.DictWriter | None = None
+                for row in rows:
+                    if writer is None:
+                        writer = csv.DictWriter(handle, fieldnames=list(row))
+                        writer.writeheader()
+                    writer.writerow(row)
+                    count += 1
+            else:
+                for row in rows:
+                    handle.write(json.dumps(row, default=str) + "\n")
+                    count += 1
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return count
@@ -0,0 +1,187 @@
+"""Vectorised historical and parametric VaR core.
+
+Shared by the quantitative risk skills. Every function takes a weight matrix
+of shape (portfolios, assets), so a whole book of sub-portfolios is valued
+against one shared scenario or covariance matrix in a single matrix product
+instead of one Python loop per portfolio and scenario row. Tail selection uses
+np.argpartition / np.partition, so only the tail (never the whole loss
+series) is sorted.
+"""
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+
+import numpy as np
+
+# Decay factor for age-weighted (BRW) historical simulation.
+AGE_DECAY = 0.97
+
+
+def stack_portfolios(
+    portfolio_weights: Sequence[float] | None = None,
+    portfolio_book: Mapping[str, Sequence[float]] | None = None,
+) -> tuple[list[str] | None, np.ndarray]:
+    """Weight matrix for a single portfolio or a named book of portfolios.
+
+    Returns:
+        (portfolio names, or None for a single weight vector; 2-D weight matrix
+        with one row per portfolio).
+
+    Raises:
+        ValueError: If neither input is given or the weight vectors differ in length.
+    """
+    if portfolio_book:
+        names = [str(name) for name in portfolio_book]
+        rows = [list(weights) for weights in portfolio_book.values()]
+    elif portfolio_weights:
+        names, rows = None, [list(portfolio_weights)]
+    else:
+        raise ValueError("portfolio_weights or portfolio_book required")
+    if len({len(row) for row in rows}) != 1 or not rows[0]:
+        raise ValueError("every portfolio needs the same non-zero number of weights")
+    return names, np.asarray(rows, dtype=float)
+
+
+def scenario_losses(scenarios: Sequence[Sequence[float]] | np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Portfolio losses per scenario, shape (portfolios, scenarios).
+
+    Raises:
+        ValueError: If the scenario matrix is ragged or its width does not match the weights.
+    """
+    try:
+        returns = np.asarray(scenarios, dtype=float)
+    except ValueError as exc:
+        raise ValueError("each historical row must match number of weights") from exc
+    if returns.ndim != 2 or returns.shape[1] != weights.shape[1]:
+        raise ValueError("each historical row must match number of weights")
+    return -(weights @ returns.T)
+
+
+def age_weights(num_obs: int, decay: float = AGE_DECAY) -> np.ndarray:
+    """Normalised exponential age weights, the newest observation (last row) weighted highest."""
+    weights = decay ** np.arange(num_obs - 1, -1, -1, dtype=float)
+    return weights / weights.sum()
+
+
+def tail_statistics(
+    losses: np.ndarray,
+    confidence_level: float,
+    obs_weights: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Row-wise VaR, expected shortfall and VaR exceedances.
+
+    VaR is the smallest loss whose cumulative (observation-weighted) probability
+    reaches confidence_level; ES is the weighted mean of losses at or above it.
+    With equal weights that is a single np.partition per row. With observation
+    weights only the candidate tail (the fewest top losses that could hold the
+    quantile) is selected with np.argpartition and sorted.
+
+    Args:
+        losses: Array of shape (portfolios, observations).
+        confidence_level: Quantile in (0, 1).
+        obs_weights: Optional weights per observation; None means equal weights.
+
+    Returns:
+        (var, expected_shortfall, violations), each of shape (portfolios,).
+    """
+    rows, n = losses.shape
+    if obs_weights is None:
+        # Sequential cumsum of equal weights, matching a plain running total.
+        cumulative = np.cumsum(np.full(n, 1.0 / n))
+        index = min(int(np.searchsorted(cumulative, confidence_level * cumulative[-1])), n - 1)
+        var = np.partition(losses, index, axis=1)[:, index]
+        in_tail = losses >= var[:, None]
+        es = np.where(in_tail, losses, 0.0).sum(axis=1) / in_tail.sum(axis=1)
+    else:
+        total = float(obs_weights.sum())
+        # At most `beyond` observations can sit strictly above the quantile.
+        beyond = int(np.searchsorted(np.cumsum(np.sort(obs_weights)), (1 - confidence_level) * total, side="right"))
+        size = min(n, beyond + 2)
+        top = np.argpartition(losses, n - size, axis=1)[:, n - size:]
+        top_losses = np.take_along_axis(losses, top, axis=1)
+        order = np.argsort(top_losses, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_losses = np.take_along_axis(top_losses, order, axis=1)
+        top_weights = obs_weights[top]
+        cumulative = (total - top_weights.sum(axis=1))[:, None] + np.cumsum(top_weights, axis=1)
+        position = np.argmax(cumulative >= confidence_level * total, axis=1)
+        var = top_losses[np.arange(rows), position]
+        in_tail = losses >= var[:, None]
+        tail_weight = np.where(in_tail, obs_weights, 0.0)
+        es = (tail_weight * losses).sum(axis=1) / tail_weight.sum(axis=1)
+    violations = (losses > var[:, None]).sum(axis=1)
+    return var, es, violations
+
+
+def kupiec_p_values(num_obs: int, confidence_level: float, violations: np.ndarray) -> np.ndarray:
+    """P(X >= violations) for X ~ Binomial(num_obs, 1 - confidence_level), per portfolio.
+
+    Computed in log space, so long histories do not overflow.
+    """
+    prob = 1 - confidence_level
+    k = np.arange(num_obs + 1)
+    log_factorial = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, num_obs + 1)))))
+    log_pmf = (
+        log_factorial[num_obs] - log_factorial[k] - log_factorial[num_obs - k]
+        + k * np.log(prob) + (num_obs - k) * np.log1p(-prob)
+    )
+    survival = np.cumsum(np.exp(log_pmf)[::-1])[::-1]
+    return np.minimum(survival[np.asarray(violations, dtype=int)], 1.0)
+
+
+def tail_indices(losses: np.ndarray, confidence_level: float) -> np.ndarray:
+    """Indices of the losses at or beyond the empirical confidence_level order statistic.
+
+    Mirrors a full ascending sort followed by ``sorted[cutoff - 1:]`` with
+    cutoff = clamp(int(confidence_level * n), 1, n), using np.argpartition.
+    """
+    n = losses.shape[0]
+    cutoff = min(max(int(confidence_level * n), 1), n)
+    return np.argpartition(losses, cutoff - 1)[cutoff - 1:]
+
+
+def parametric_var(
+    weights: np.ndarray,
+    covariance: Sequence[Sequence[float]] | np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Variance-covariance risk for each row of ``weights``.
+
+    Returns:
+        {"variance", "sigma"} of shape (portfolios,) and {"marginal",
+        "component", "incremental_sigma"} of shape (portfolios, assets), where
+        marginal = (cov @ w) / sigma, component = w * marginal and
+        incremental_sigma is the portfolio sigma with that asset removed.
+
+    Raises:
+        ValueError: If the covariance matrix does not match the weights or a
+            portfolio variance is not positive.
+    """
+    try:
+        cov = np.asarray(covariance, dtype=float)
+    except ValueError as exc:
+        raise ValueError("covariance_matrix must be square") from exc
+    num_assets = weights.shape[1]
+    if cov.ndim != 2 or cov.shape[0] != num_assets:
+        raise ValueError("covariance_matrix dimension mismatch")
+    if cov.shape[1] != num_assets:
+        raise ValueError("covariance_matrix must be square")
+    cov_times_w = weights @ cov.T
+    variance = np.einsum("pi,pi->p", weights, cov_times_w)
+    if np.any(variance <= 0):
+        raise ValueError("portfolio variance must be positive")
+    sigma = np.sqrt(variance)
+    marginal = cov_times_w / sigma[:, None]
+    # Zeroing asset i removes its row and column from w' cov w.
+    reduced = (
+        variance[:, None]
+        - weights * cov_times_w
+        - weights * (weights @ cov)
+        + weights ** 2 * np.diag(cov)
+    )
+    return {
+        "variance": variance,
+        "sigma": sigma,
+        "marginal": marginal,
+        "component": weights * marginal,
+        "incremental_sigma": np.sqrt(np.maximum(reduced, 0.0)),
+    }
@@ -44,6 +44,7 @@ from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 
 from config.models import resolve_model
+from skills.utils.http_client import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -145,7 +146,7 @@ def _generate_content(
             "temperature": temperature,
         },
     }
-    resp = requests.post(
+    resp = get_session().post(
         url,
         headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
         json=payload,
@@ -176,7 +177,7 @@ def _embed_text(project_id: str, region: str, text: str) -> dict:
         f"/locations/{region}/publishers/google/models/{model}:predict"
     )
     payload = {"instances": [{"content": text}]}
-    resp = requests.post(
+    resp = get_session().post(
         url,
         headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
         json=payload,
@@ -34,6 +34,8 @@ import os
 import datetime
 import requests
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "weather_lookup",
     "description": (
@@ -102,7 +104,7 @@ def _resolve_location(location: str, api_key: str) -> dict:
             pass
 
     geo_url = "https://maps.googleapis.com/maps/api/geocode/json"
-    resp = requests.get(geo_url, params={"address": location, "key": api_key}, timeout=10)
+    resp = get_session().get(geo_url, params={"address": location, "key": api_key}, timeout=10)
     resp.raise_for_status()
     results = resp.json().get("results", [])
     if not results:
@@ -161,7 +163,7 @@ def weather_lookup(action: str, location: str, days: int = 3, hours: int = 24, u
 
     try:
         if action == "current":
-            resp = requests.post(
+            resp = get_session().post(
                 base_url,
                 params={"key": api_key},
                 json={"location": coords, "days": 1, "unitsSystem": unit_system},
@@ -189,7 +191,7 @@ def weather_lookup(action: str, location: str, days: int = 3, hours: int = 24, u
             }
 
         elif action == "forecast":
-            resp = requests.post(
+            resp = get_session().post(
                 base_url,
                 params={"key": api_key},
                 json={"location": coords, "days": min(days, 10), "unitsSystem": unit_system},
@@ -222,7 +224,7 @@ def weather_lookup(action: str, location: str, days: int = 3, hours: int = 24, u
             hist_url = "https://weather.googleapis.com/v1/history:lookup"
             end_time = datetime.datetime.utcnow()
             start_time = end_time - datetime.timedelta(hours=hours)
-            resp = requests.post(
+            resp = get_session().post(
                 hist_url,
                 params={"key": api_key},
                 json={
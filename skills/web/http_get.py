@@ -12,6 +12,8 @@ from datetime import datetime
 
 import requests
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "http_get",
     "description": (
@@ -93,7 +95,7 @@ def http_get(
         request_headers.update(headers)
 
     try:
-        resp = requests.get(url, headers=request_headers, timeout=timeout)
+        resp = get_session().get(url, headers=request_headers, timeout=timeout)
     except requests.exceptions.Timeout:
         return {
             "status": "error",
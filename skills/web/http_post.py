@@ -11,6 +11,8 @@ from datetime import datetime
 
 import requests
 
+from skills.utils.http_client import get_session
+
 TOOL_META = {
     "name": "http_post",
     "description": (
@@ -97,7 +99,7 @@ def http_post(
         request_headers["Content-Type"] = "application/json"
 
     try:
-        resp = requests.post(url, json=body, headers=request_headers, timeout=timeout)
+        resp = get_session().post(url, json=body, headers=request_headers, timeout=timeout)
     except requests.exceptions.Timeout:
         return {
             "status": "error",
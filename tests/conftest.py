@@ -0,0 +1,23 @@
+"""Shared fixtures: keep lesson logging from the skills under test out of the repo."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from skills.utils import lesson_sink
+
+
+@pytest.fixture(autouse=True)
+def lessons_outside_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Point the lesson sink at tmp_path and run from it.
+
+    Error paths call log_lesson (the shared sink) or, in older skills, append
+    to a relative logs/lessons.md; neither should land in the checkout.
+    """
+    (tmp_path / "logs").mkdir()
+    sink = lesson_sink.LessonSink(tmp_path / "logs" / "lessons.md")
+    monkeypatch.setattr(lesson_sink, "_SINK", sink)
+    monkeypatch.chdir(tmp_path)
+    yield sink
+    sink.close()
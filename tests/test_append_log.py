@@ -0,0 +1,84 @@
+"""Tests for skills/utils/append_log.py (group-committed JSONL writer)."""
+from __future__ import annotations
+
+import json
+from datetime import date
+from pathlib import Path
+
+from skills.utils import append_log
+from skills.utils.append_log import AppendLog
+
+
+def test_lines_are_group_committed_in_order(tmp_path: Path):
+    path = tmp_path / "logs" / "events.jsonl"
+    log = AppendLog(path, flush_lines=100, flush_interval=60, fsync="always")
+    for i in range(250):
+        log.append(json.dumps({"seq": i}))
+    assert log.stats()["flushes"] == 2 and log.stats()["pending"] == 50
+    log.close()
+    assert [json.loads(line)["seq"] for line in path.read_text().splitlines()] == list(range(250))
+    assert log.stats() | {"path": None} == {
+        "path": None, "pending": 0, "written": 250, "flushes": 3, "fsyncs": 3,
+        "rotations": 0, "write_errors": 0, "dropped": 0,
+    }
+    log.append("late")  # written through after close
+    assert path.read_text().splitlines()[-1] == "late"
+
+
+def test_rotation_by_size_and_date(tmp_path: Path, monkeypatch):
+    path = tmp_path / "audit.log"
+    log = AppendLog(path, flush_lines=1, fsync="never", max_bytes=40, backup_count=2)
+    for i in range(8):
+        log.append(f"entry number {i:02d}")
+    log.close()
+    assert log.rotations >= 2 and not (tmp_path / "audit.log.3").exists()
+    assert path.read_text().splitlines()[-1] == "entry number 07"
+
+    daily = tmp_path / "daily.log"
+    log = AppendLog(daily, flush_lines=1, fsync="never", rotate="daily")
+    monkeypatch.setattr(append_log, "_today", lambda: date(2026, 1, 1))
+    log.append("day one")
+    monkeypatch.setattr(append_log, "_today", lambda: date(2026, 1, 2))
+    log.append("day two")
+    log.close()
+    assert (tmp_path / "daily.log.2026-01-01").read_text() == "day one\n"
+    assert daily.read_text() == "day two\n"
+
+
+def test_audit_and_telemetry_use_shared_logs(tmp_path: Path, monkeypatch):
+    from skills.utils import emit_skill_telemetry, record_submission_event
+
+    audit = tmp_path / "compliance_audit.log"
+    monkeypatch.setenv("COMPLIANCE_AUDIT_LOG_PATH", str(audit))
+    monkeypatch.setattr(append_log, "_LOGS", {})
+    monkeypatch.setattr(append_log, "_ALIASES", {})
+    telemetry = tmp_path / "telemetry.jsonl"
+    entries = [record_submission_event("gst", "return", status="success", payload={"n": i}) for i in range(3)]
+    for i in range(3):
+        emit_skill_telemetry({"skill_name": "gst", "seq": i, "path": Path("x")}, log_path=telemetry)
+    assert append_log.get_append_log(audit) is append_log.get_append_log(str(audit))
+    written = [json.loads(line) for line in audit.read_text().splitlines()]  # write-through, no flush needed
+    assert [entry["reference_id"] for entry in written] == [entry["reference_id"] for entry in entries]
+    assert not telemetry.exists()
+    append_log.flush_all()
+    assert [json.loads(line) for line in telemetry.read_text().splitlines()][2] == {
+        "skill_name": "gst", "seq": 2, "path": "x",
+    }
+    assert set(append_log.append_log_stats()) == {str(audit), str(telemetry)}
+    for log in append_log._LOGS.values():
+        log.close()
+
+
+def test_audit_write_errors_reach_the_caller(tmp_path: Path, monkeypatch):
+    from skills.utils import compliance_audit
+
+    blocked = tmp_path / "not_a_dir"
+    blocked.write_text("")
+    monkeypatch.setenv("COMPLIANCE_AUDIT_LOG_PATH", str(blocked / "audit.log"))
+    monkeypatch.setattr(append_log, "_LOGS", {})
+    monkeypatch.setattr(append_log, "_ALIASES", {})
+    lessons = []
+    monkeypatch.setattr(compliance_audit, "log_lesson", lessons.append)
+    compliance_audit.record_submission_event("gst", "return", status="success")
+    assert len(lessons) == 1 and "failed to write audit entry for gst" in lessons[0]
+    assert append_log.get_append_log(blocked / "audit.log").stats()["dropped"] == 1
@@ -0,0 +1,93 @@
+"""Tests for skills/utils/black_scholes.py and the option skills built on it."""
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from skills.fx_trading.fx_option_pricer import fx_option_pricer  # noqa: E402
+from skills.quant.implied_volatility_solver import implied_volatility_solver  # noqa: E402
+from skills.utils import black_scholes as bs  # noqa: E402
+
+
+def _chain(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(60, 140, n),
+        rng.uniform(0.05, 2.0, n),
+        rng.uniform(0.05, 1.2, n),
+        np.where(rng.random(n) < 0.5, "call", "put"),
+    )
+
+
+def test_greeks_match_finite_differences():
+    strike, expiry, vol, kinds = _chain(50)
+    args = (100.0, strike, expiry, 0.03, vol, kinds, 0.01)
+    g = bs.greeks(*args)
+    h = 1e-5
+
+    def bump(index, delta):
+        bumped = list(args)
+        bumped[index] = bumped[index] + delta
+        return bs.price(*bumped)
+
+    np.testing.assert_allclose(g["price"], bs.price(*args))
+    np.testing.assert_allclose(g["delta"], (bump(0, h) - bump(0, -h)) / (2 * h), atol=1e-6)
+    np.testing.assert_allclose(g["vega"], (bump(4, h) - bump(4, -h)) / (2 * h), atol=1e-5)
+    np.testing.assert_allclose(g["rho"], (bump(3, h) - bump(3, -h)) / (2 * h), atol=1e-5)
+    np.testing.assert_allclose(g["theta"], -(bump(2, h) - bump(2, -h)) / (2 * h), atol=1e-4)
+    calls = bs.price(100.0, strike, expiry, 0.03, vol, "call", 0.01)
+    puts = bs.price(100.0, strike, expiry, 0.03, vol, "put", 0.01)
+    np.testing.assert_allclose(calls - puts, 100 * np.exp(-0.01 * expiry) - strike * np.exp(-0.03 * expiry))
+
+
+def test_batched_implied_vol_recovers_chain():
+    strike, expiry, vol, kinds = _chain(5000, seed=1)
+    prices = bs.price(100.0, strike, expiry, 0.02, vol, kinds)
+    solved = bs.implied_volatility(prices, 100.0, strike, expiry, 0.02, kinds)
+    assert solved["converged"].all()
+    assert solved["iterations"].max() < 40
+    np.testing.assert_allclose(solved["pricing_error"], 0.0, atol=1e-9)
+    vega = bs.greeks(100.0, strike, expiry, 0.02, vol, kinds)["vega"]
+    identifiable = vega > 1e-3
+    np.testing.assert_allclose(solved["vol"][identifiable], vol[identifiable], atol=1e-7)
+
+
+def test_skill_solves_quotes_and_reports_bad_ones():
+    quotes = [
+        {"option_price": 10.4506, "strike": 100},
+        {"option_price": 5.5735, "strike": 100, "option_type": "put"},
+        {"option_price": 101.0, "strike": 50},
+        {"strike": 100},
+    ]
+    data = implied_volatility_solver(spot=100, risk_free_rate=0.05, time_to_expiry=1, option_type="call", quotes=quotes)["data"]
+    assert (data["solved"], data["failed"]) == (2, 2)
+    assert data["results"][0]["implied_vol_decimal"] == pytest.approx(0.2, abs=1e-5)
+    assert data["results"][1]["implied_vol_decimal"] == pytest.approx(0.2, abs=1e-5)
+    assert "no-arbitrage" in data["results"][2]["error"]
+    assert "error" in data["results"][3]
+    single = implied_volatility_solver(10.4506, 100, 100, 1, 0.05, "call")["data"]
+    assert single["implied_vol_decimal"] == data["results"][0]["implied_vol_decimal"]
+
+
+def test_chain_without_top_level_spot_and_rate():
+    from skills.quant.implied_volatility_solver import TOOL_META
+    from skills.utils.input_schema import compile_schema
+
+    quotes = [
+        {"option_price": 10.4506, "strike": 100, "spot": 100, "risk_free_rate": 0.05},
+        {"option_price": 10.4506, "strike": 100, "spot": 100},
+    ]
+    params = {"time_to_expiry": 1, "option_type": "call", "quotes": quotes}
+    assert compile_schema(TOOL_META["inputSchema"])(params)[1] == []
+    results = implied_volatility_solver(**params)["data"]["results"]
+    assert results[0]["implied_vol_decimal"] == pytest.approx(0.2, abs=1e-5)
+    assert results[1]["error"].startswith("missing risk_free_rate")
+
+
+def test_fx_put_theta_is_time_decay():
+    args = dict(spot_rate=1.1, strike=1.12, domestic_rate=0.04, foreign_rate=0.02, volatility=0.1, option_type="put", notional=1)
+    h = 1e-5
+    theta = fx_option_pricer(time_to_expiry_years=0.5, **args)["data"]["theta"]
+    price = bs.price(1.1, 1.12, [0.5 + h, 0.5 - h], 0.04, 0.1, "put", 0.02)
+    assert theta == pytest.approx(-(price[0] - price[1]) / (2 * h), abs=1e-4)
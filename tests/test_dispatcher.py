@@ -0,0 +1,372 @@
+"""
+Tests for the snowdrop_execute / snowdrop_execute_batch dispatcher: thread and
+process offload, coroutine skills, per-call timeouts, batching and the result
+cache.
+
+Skills are synthetic modules written under tmp_path and registered in a patched
+_SKILL_CATALOG, so the real skills/ tree is never imported.
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastmcp")
+
+from fastmcp.server.auth import AccessToken  # noqa: E402
+import mcp_server  # noqa: E402
+from skills.utils import lesson_sink  # noqa: E402
+from skills.utils.cache import LRUCache  # noqa: E402
+from skills.utils.rate_limiter import RateLimiter  # noqa: E402
+
+_SKILLS = {
+    "sync_skill": """
+        import threading
+
+        TOOL_META = {"name": "sync_skill", "description": "Echo the worker thread."}
+
+        def sync_skill(x: int) -> dict:
+            return {"status": "success", "data": {"x": x, "thread": threading.current_thread().name}}
+    """,
+    "async_skill": """
+        import asyncio
+
+        TOOL_META = {"name": "async_skill", "description": "Awaited natively.", "timeout_seconds": 0.2}
+
+        async def async_skill(delay: float) -> dict:
+            await asyncio.sleep(delay)
+            return {"status": "success", "data": {"delay": delay}}
+    """,
+    "slow_skill": """
+        import time
+
+        TOOL_META = {"name": "slow_skill", "description": "Blocks.", "timeout_seconds": 0.1}
+
+        def slow_skill() -> dict:
+            time.sleep(0.5)
+            return {"status": "success", "data": {}}
+    """,
+    "cpu_skill": """
+        import os
+
+        TOOL_META = {"name": "cpu_skill", "description": "Runs in a worker process.", "executor": "process"}
+
+        def cpu_skill(n: int) -> dict:
+            return {"status": "success", "data": {"total": sum(range(n)), "pid": os.getpid()}}
+    """,
+    "hung_skill": """
+        import time
+
+        TOOL_META = {"name": "hung_skill", "description": "Never returns in time.", "executor": "process", "timeout_seconds": 1}
+
+        def hung_skill() -> dict:
+            time.sleep(60)
+            return {"status": "success", "data": {}}
+    """,
+    "pure_skill": """
+        import uuid
+
+        TOOL_META = {"name": "pure_skill", "description": "Cached.", "deterministic": True}
+
+        def pure_skill(x: int, opts: dict | None = None) -> dict:
+            return {"status": "success", "data": {"x": x, "nonce": uuid.uuid4().hex}, "timestamp": "t"}
+    """,
+    "typed_skill": """
+        TOOL_META = {
+            "name": "typed_skill",
+            "description": "Schema-checked.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "prices": {"type": "array", "items": {"type": "number"}},
+                    "period": {"type": "integer", "minimum": 2},
+                },
+                "required": ["prices", "period"],
+            },
+        }
+
+        CALLS = []
+
+        def typed_skill(prices: list, period: int) -> dict:
+            CALLS.append(period)
+            return {"status": "success", "data": {"period": period, "type": type(period).__name__}}
+    """,
+    "series_skill": """
+        TOOL_META = {"name": "series_skill", "description": "Large output.", "deterministic": True}
+
+        def series_skill(n: int) -> dict:
+            series = [i / 3 for i in range(n)]
+            return {
+                "status": "success",
+                "data": {"series": series, "summary": {"last": series[-1], "count": n}, "rows": [{"v": x} for x in series]},
+                "timestamp": "t",
+            }
+    """,
+    "failing_skill": """
+        TOOL_META = {"name": "failing_skill", "description": "Raises."}
+
+        def failing_skill() -> dict:
+            raise ValueError("bad input")
+    """,
+}
+
+
+@pytest.fixture
+def catalog(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict:
+    skills_dir = tmp_path / "skills"
+    skills_dir.mkdir()
+    records = {}
+    for name, source in _SKILLS.items():
+        py_file = skills_dir / f"{name}.py"
+        py_file.write_text(textwrap.dedent(source))
+        module = mcp_server._import_skill_module(py_file, f"skills.{name}")
+        records[name] = {
+            "meta": module.TOOL_META,
+            "callable": None,
+            "module_path": str(py_file),
+            "module_name": f"skills.{name}",
+            "category": "root",
+        }
+    monkeypatch.setattr(mcp_server, "_SKILLS_DIR", skills_dir)
+    monkeypatch.setattr(mcp_server, "_SKILL_CATALOG", records)
+    monkeypatch.setattr(mcp_server, "_RESULT_CACHE", LRUCache(maxsize=16, default_ttl=60))
+    monkeypatch.setattr(lesson_sink, "_SINK", lesson_sink.LessonSink(tmp_path / "lessons.md"))
+    yield records
+    for name in _SKILLS:
+        sys.modules.pop(f"skills.{name}", None)
+
+
+def _execute(skill: str, params: dict | None = None, **kwargs) -> dict:
+    return asyncio.run(mcp_server.snowdrop_execute(skill, params, **kwargs))
+
+
+class TestExecute:
+
+    def test_sync_skill_runs_in_thread_pool(self, catalog):
+        result = _execute("sync_skill", {"x": 3})
+        assert result["data"]["x"] == 3
+        assert result["data"]["thread"].startswith("snowdrop-skill")
+
+    def test_coroutine_skill_is_awaited(self, catalog):
+        assert _execute("async_skill", {"delay": 0})["data"]["delay"] == 0
+
+    def test_coroutine_skill_timeout(self, catalog):
+        result = _execute("async_skill", {"delay": 5})
+        assert result["status"] == "error"
+        assert result["data"]["error"].startswith("TimeoutError")
+
+    def test_sync_skill_timeout(self, catalog):
+        result = _execute("slow_skill")
+        assert result["status"] == "error"
+        assert "exceeded 0.1s" in result["data"]["error"]
+
+    def test_process_executor(self, catalog):
+        import os
+
+        result = _execute("cpu_skill", {"n": 10})
+        assert result["data"]["total"] == 45
+        assert result["data"]["pid"] != os.getpid()
+
+    def test_process_timeout_kills_and_replaces_the_pool(self, catalog, monkeypatch):
+        monkeypatch.setattr(mcp_server, "_PROCESS_POOL", None)
+        monkeypatch.setattr(mcp_server, "_IMPORT_METRICS", {})
+        first = _execute("cpu_skill", {"n": 3})["data"]["pid"]
+        assert mcp_server._IMPORT_METRICS["cpu_skill"] > 0  # timed in the worker
+        workers = list(mcp_server._PROCESS_POOL._processes.values())
+        result = _execute("hung_skill")
+        assert "exceeded 1s" in result["data"]["error"]
+        assert mcp_server._PROCESS_POOL is None
+        for worker in workers:
+            worker.join(5)
+            assert not worker.is_alive()
+        assert _execute("cpu_skill", {"n": 3})["data"]["pid"] != first
+        mcp_server._reset_process_pool(mcp_server._PROCESS_POOL)
+
+    def test_skill_exception_becomes_error_envelope(self, catalog, tmp_path):
+        result = _execute("failing_skill")
+        assert result == {
+            "status": "error",
+            "data": {"error": "ValueError: bad input"},
+            "timestamp": result["timestamp"],
+        }
+        lesson_sink.get_lesson_sink().flush()
+        assert "failing_skill: ValueError: bad input" in (tmp_path / "lessons.md").read_text()
+
+    def test_unknown_skill(self, catalog):
+        assert _execute("nope")["status"] == "error"
+
+
+class TestExecuteBatch:
+
+    def test_results_in_order_with_status_and_latency(self, catalog):
+        items = [
+            {"skill": "sync_skill", "params": {"x": i}} for i in range(5)
+        ] + [{"skill": "failing_skill"}, {"skill": "nope"}, {"params": {}}]
+        response = asyncio.run(mcp_server.snowdrop_execute_batch(items, parallelism=3))
+
+        data = response["data"]
+        assert response["status"] == "ok"
+        assert [r["index"] for r in data["results"]] == list(range(8))
+        assert [r["result"]["data"]["x"] for r in data["results"][:5]] == [0, 1, 2, 3, 4]
+        assert [r["status"] for r in data["results"][5:]] == ["error", "error", "error"]
+        assert data["succeeded"] == 5 and data["failed"] == 3
+        assert all(r["latency_ms"] >= 0 for r in data["results"])
+
+    def test_items_run_concurrently(self, catalog):
+        items = [{"skill": "async_skill", "params": {"delay": 0.1}} for _ in range(4)]
+        data = asyncio.run(mcp_server.snowdrop_execute_batch(items, parallelism=4))["data"]
+        assert data["succeeded"] == 4
+        assert data["elapsed_ms"] < 350
+
+    def test_rejects_empty_and_oversized_batches(self, catalog, monkeypatch):
+        assert asyncio.run(mcp_server.snowdrop_execute_batch([]))["status"] == "error"
+        monkeypatch.setattr(mcp_server, "_BATCH_MAX_ITEMS", 2)
+        items = [{"skill": "sync_skill", "params": {"x": 1}}] * 3
+        assert asyncio.run(mcp_server.snowdrop_execute_batch(items))["status"] == "error"
+
+
+class TestRateLimit:
+
+    def test_limits_apply_per_agent_before_execution(self, catalog, monkeypatch):
+        limiter = RateLimiter(capacity=2, refill_rate=0)
+        monkeypatch.setattr(mcp_server, "_RATE_LIMIT_ENABLED", True)
+        monkeypatch.setattr(mcp_server, "get_rate_limiter", lambda: limiter)
+        assert _execute("sync_skill", {"x": 1}, agent_id="a")["status"] == "success"
+        assert _execute("sync_skill", {"x": 1}, agent_id="a")["status"] == "success"
+        denied = _execute("sync_skill", {"x": 1}, agent_id="a")
+        assert denied["status"] == "error" and "Rate limit exceeded" in denied["data"]["error"]
+        assert _execute("sync_skill", {"x": 1}, agent_id="b")["status"] == "success"
+        assert limiter.stats()["denied"] == 1
+
+    def test_authenticated_client_outranks_agent_id(self, catalog, monkeypatch):
+        limiter = RateLimiter(capacity=1, refill_rate=0)
+        monkeypatch.setattr(mcp_server, "_RATE_LIMIT_ENABLED", True)
+        monkeypatch.setattr(mcp_server, "get_rate_limiter", lambda: limiter)
+        token = AccessToken(token="t", client_id="acme", scopes=[])
+        monkeypatch.setattr(mcp_server, "get_access_token", lambda: token)
+        assert _execute("sync_skill", {"x": 1}, agent_id="a")["status"] == "success"
+        denied = _execute("sync_skill", {"x": 1}, agent_id="b")
+        assert denied["data"]["error"] == "Rate limit exceeded for 'client:acme'."
+
+    def test_disabled_by_default(self, catalog):
+        assert mcp_server._RATE_LIMIT_ENABLED is False
+
+
+class TestInputValidation:
+
+    def test_warn_is_the_default(self):
+        assert mcp_server._INPUT_VALIDATION == "warn"
+
+    def test_malformed_params_never_reach_the_skill(self, catalog, monkeypatch):
+        monkeypatch.setattr(mcp_server, "_INPUT_VALIDATION", "enforce")
+        result = _execute("typed_skill", {"prices": [1.0, "x"], "period": 1})
+        assert result["status"] == "error"
+        assert result["data"]["validation_errors"] == [
+            "params.prices[1]: expected number, got str",
+            "params.period: 1 must be >= 2",
+        ]
+        assert result["data"]["error"].startswith("Invalid params for 'typed_skill'")
+        assert sys.modules["skills.typed_skill"].CALLS == []
+        assert mcp_server._VALIDATION_STATS["rejected"] >= 1
+
+    def test_valid_params_are_coerced_losslessly(self, catalog):
+        result = _execute("typed_skill", {"prices": [1, 2.5], "period": 14.0})
+        assert result["data"] == {"period": 14, "type": "int"}
+
+    def test_warn_mode_and_per_skill_opt_out(self, catalog, monkeypatch):
+        monkeypatch.setattr(mcp_server, "_INPUT_VALIDATION", "warn")
+        assert _execute("typed_skill", {"prices": [], "period": 1})["data"]["period"] == 1
+        monkeypatch.setattr(mcp_server, "_INPUT_VALIDATION", "enforce")
+        catalog["typed_skill"]["meta"]["validate_input"] = False
+        catalog["typed_skill"].pop("validator", None)
+        assert _execute("typed_skill", {"prices": [], "period": 1})["status"] == "success"
+
+
+class TestResponseShaping:
+
+    def test_fields_tail_and_rounding(self, catalog):
+        result = _execute("series_skill", {"n": 10}, fields=["series", "summary.last", "nope.x"], tail=2, float_precision=2)
+        assert result["data"] == {"series": [2.67, 3.0], "summary": {"last": 3.0}}
+        assert result["projection"] == {
+            "fields": ["series", "summary.last", "nope.x"],
+            "missing_fields": ["nope.x"],
+            "tail": 2,
+            "truncated": {"data.series": 10},
+        }
+        full = _execute("series_skill", {"n": 10})
+        assert len(full["data"]["rows"]) == 10 and full["data"]["series"][-1] == 3.0
+        assert mcp_server._RESULT_CACHE.stats()["hits"] == 1
+
+    def test_bad_shaping_arguments_rejected_before_running(self, catalog):
+        assert "tail" in _execute("series_skill", {"n": 3}, tail=-1)["data"]["error"]
+        assert "fields" in _execute("series_skill", {"n": 3}, fields="series")["data"]["error"]
+        assert len(mcp_server._RESULT_CACHE) == 0
+
+    def test_results_are_returned_as_one_text_block(self, catalog, monkeypatch):
+        import json
+
+        from skills.utils import response_shaping
+
+        encoded = []
+        monkeypatch.setattr(mcp_server, "dumps", lambda value: encoded.append(value) or response_shaping.dumps(value))
+        for n in (3, 500):
+            result = asyncio.run(mcp_server._snowdrop_execute_tool("series_skill", {"n": n}))
+            assert result.structured_content is None and len(result.content) == 1
+            assert json.loads(result.content[0].text)["data"]["summary"]["count"] == n
+        assert len(encoded) == 2  # once per unshaped response
+
+    def test_shaping_savings_are_sampled(self, catalog, monkeypatch):
+        from skills.utils import response_shaping
+
+        sizes = response_shaping.ResponseSizeMetrics(sample_every=3)
+        monkeypatch.setattr(mcp_server, "_RESPONSE_SIZES", sizes)
+        sampled = []
+        monkeypatch.setattr(response_shaping, "dumps", lambda value: sampled.append(value) or b"x" * 10_000)
+        for _ in range(4):
+            shaped = asyncio.run(mcp_server._snowdrop_execute_tool("series_skill", {"n": 500}, tail=2))
+        assert len(sampled) == 2  # shaped calls 1 and 4 also encode the unshaped result
+        entry = sizes.get("series_skill")
+        assert entry["calls"] == 4 and entry["last_bytes"] == len(shaped.content[0].text)
+        saved = sizes.stats()["bytes_saved_by_shaping"]
+        assert saved == pytest.approx(4 * (10_000 - entry["last_bytes"]), rel=0.1)
+
+
+class TestResultCache:
+
+    def test_deterministic_skill_is_cached_by_canonical_params(self, catalog):
+        first = _execute("pure_skill", {"x": 1, "opts": {"a": 1, "b": 2}})
+        second = _execute("pure_skill", {"opts": {"b": 2, "a": 1}, "x": 1})
+        assert first["data"]["nonce"] == second["data"]["nonce"]
+        assert second["timestamp"] != "t"
+        stats = mcp_server._RESULT_CACHE.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_different_params_miss(self, catalog):
+        assert _execute("pure_skill", {"x": 1})["data"]["nonce"] != _execute("pure_skill", {"x": 2})["data"]["nonce"]
+
+    def test_bypass_recomputes_and_refreshes(self, catalog):
+        first = _execute("pure_skill", {"x": 1})
+        fresh = _execute("pure_skill", {"x": 1}, use_cache=False)
+        assert fresh["data"]["nonce"] != first["data"]["nonce"]
+        assert _execute("pure_skill", {"x": 1})["data"]["nonce"] == fresh["data"]["nonce"]
+
+    def test_non_deterministic_and_errors_not_cached(self, catalog):
+        _execute("sync_skill", {"x": 1})
+        _execute("failing_skill")
+        assert len(mcp_server._RESULT_CACHE) == 0
+
+    def test_lru_eviction_and_ttl(self, monkeypatch):
+        cache = LRUCache(maxsize=2, default_ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        cache.set("d", 4, ttl=0)
+        assert cache.get("d") == (False, None)
+        assert cache.stats()["evictions"] == 2 and cache.stats()["expirations"] == 1
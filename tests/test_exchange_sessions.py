@@ -0,0 +1,76 @@
+"""Tests for skills/utils/exchange_sessions.py using an in-process fake exchange."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from skills.utils import exchange_sessions
+from skills.utils.exchange_sessions import QUOTE_CACHE, ExchangeSession, fan_out
+
+
+class _FakeExchange:
+    id = "fake"
+
+    def __init__(self, batch: bool = True) -> None:
+        self.has = {"fetchTickers": batch}
+        self.markets = None
+        self.currencies = None
+        self.calls: list[tuple] = []
+
+    def load_markets(self, reload: bool = False) -> dict:
+        self.calls.append(("load_markets",))
+        self.markets = {"TON/USD": {}, "SOL/USD": {}}
+        return self.markets
+
+    def set_markets(self, markets: dict, currencies: dict | None = None) -> None:
+        self.markets = markets
+
+    def fetch_tickers(self, symbols: list[str]) -> dict:
+        self.calls.append(("fetch_tickers", tuple(symbols)))
+        return {symbol: {"symbol": symbol, "last": 1.0} for symbol in symbols}
+
+    def fetch_ticker(self, symbol: str) -> dict:
+        self.calls.append(("fetch_ticker", symbol))
+        return {"symbol": symbol, "last": 1.0}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(exchange_sessions, "_MARKETS", {})
+    QUOTE_CACHE.clear()
+    yield
+    QUOTE_CACHE.clear()
+
+
+def test_tickers_are_batched_and_cached():
+    fake = _FakeExchange()
+    session = ExchangeSession(fake)
+    session.fetch_tickers(["TON/USD", "SOL/USD"])
+    session.fetch_ticker("TON/USD")
+    assert fake.calls == [("load_markets",), ("fetch_tickers", ("TON/USD", "SOL/USD"))]
+
+
+def test_falls_back_to_single_tickers():
+    fake = _FakeExchange(batch=False)
+    ExchangeSession(fake).fetch_tickers(["TON/USD", "SOL/USD"])
+    assert [call[0] for call in fake.calls[1:]] == ["fetch_ticker", "fetch_ticker"]
+
+
+def test_markets_shared_between_sessions():
+    first, second = _FakeExchange(), _FakeExchange()
+    ExchangeSession(first).load_markets()
+    ExchangeSession(second).load_markets()
+    assert first.calls == [("load_markets",)]
+    assert second.calls == [] and second.markets is first.markets
+
+
+def test_fan_out_runs_concurrently_and_captures_errors():
+    def boom():
+        raise RuntimeError("down")
+
+    started = time.perf_counter()
+    results = fan_out({"a": lambda: time.sleep(0.2) or 1, "b": lambda: time.sleep(0.2) or 2, "c": boom})
+    assert time.perf_counter() - started < 0.35
+    assert results["a"] == 1 and results["b"] == 2
+    assert isinstance(results["c"], RuntimeError)
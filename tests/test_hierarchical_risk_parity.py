@@ -0,0 +1,63 @@
+"""Tests for the nearest-neighbour-chain linkage in hierarchical_risk_parity."""
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from skills.portfolio_construction import hierarchical_risk_parity as hrp  # noqa: E402
+
+
+def _brute_force(points: np.ndarray, method: str) -> list[tuple[frozenset, float]]:
+    """Greedy closest-pair clustering straight from each criterion's definition."""
+    dist = np.linalg.norm(points[:, None] - points[None, :], axis=2)
+
+    def linkage(a, b):
+        pairs = [dist[i, j] for i in a for j in b]
+        if method == "single":
+            return min(pairs)
+        if method == "complete":
+            return max(pairs)
+        if method == "average":
+            return sum(pairs) / len(pairs)
+        centroid_gap = points[list(a)].mean(axis=0) - points[list(b)].mean(axis=0)
+        return np.sqrt(2 * len(a) * len(b) / (len(a) + len(b))) * np.linalg.norm(centroid_gap)
+
+    clusters = [frozenset([i]) for i in range(len(points))]
+    merges = []
+    while len(clusters) > 1:
+        a, b = min(itertools.combinations(clusters, 2), key=lambda pair: linkage(*pair))
+        merges.append((a | b, linkage(a, b)))
+        clusters = [c for c in clusters if c not in (a, b)] + [a | b]
+    return merges
+
+
+@pytest.mark.parametrize("method", hrp._LINKAGES)
+def test_linkage_matches_definition(method):
+    points = np.random.default_rng(5).normal(size=(25, 3))
+    dist = np.linalg.norm(points[:, None] - points[None, :], axis=2)
+    tree, clusters = hrp._hierarchical_linkage(dist, method)
+    expected = _brute_force(points, method)
+    assert [frozenset(clusters[node["parent"]]) for node in tree] == [members for members, _ in expected]
+    np.testing.assert_allclose([node["distance"] for node in tree], [d for _, d in expected])
+    assert all(node["left"] < node["right"] < node["parent"] for node in tree)
+
+
+def test_skill_runs_every_linkage_on_large_universe():
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0, 0.01, (400, 120)) + rng.normal(0, 0.01, (6, 120))[rng.integers(0, 6, 400)]
+    asset_returns = {f"a{i}": row.tolist() for i, row in enumerate(returns)}
+    for method in hrp._LINKAGES:
+        data = hrp.hierarchical_risk_parity(asset_returns, linkage=method)["data"]
+        weights = [item["weight"] for item in data["hrp_weights"]]
+        assert sum(weights) == pytest.approx(1.0, abs=1e-3)
+        assert len(data["dendrogram"]) == 399
+        assert sorted(data["ordering"]) == sorted(asset_returns)
+        members = data["cluster_risk"][-1]["cluster"]
+        idx = [int(label[1:]) for label in members]
+        cov = np.cov(returns)[np.ix_(idx, idx)]
+        inv = 1 / np.diag(cov)
+        w = inv / inv.sum()
+        assert data["cluster_risk"][-1]["variance"] == pytest.approx(w @ cov @ w, abs=1e-8)
@@ -0,0 +1,173 @@
+"""Tests for skills/utils/http_cache.py against a local stub HTTP server."""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import httpx
+import pytest
+
+from skills.utils.http_cache import HTTPResponseCache, stale_age
+from skills.utils.http_client import PooledHTTPClient, _BoundClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        server = self.server
+        server.requests.append(dict(self.headers))
+        if server.status != 200:
+            self.send_response(server.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = f'"v{server.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = f'{{"version": {server.version}}}'.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server() -> Iterator[ThreadingHTTPServer]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.requests = []
+    server.version = 1
+    server.status = 200
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _bound(cache: HTTPResponseCache, source: str = "fred") -> tuple[PooledHTTPClient, _BoundClient]:
+    client = PooledHTTPClient(retries=0, http2=False)
+    return client, _BoundClient(client, 5.0, source, cache)
+
+
+def _backdate(cache: HTTPResponseCache, url: str, seconds: float) -> None:
+    key = cache.key("GET", url)
+    cache._save(key, replace(cache._load(key), stored_at=time.time() - seconds))
+
+
+def _url(server: ThreadingHTTPServer) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/series"
+
+
+def test_fresh_entries_skip_the_network(stub_server, tmp_path: Path):
+    cache = HTTPResponseCache(tmp_path, ttls={"fred": 3600})
+    client, bound = _bound(cache)
+    first = bound.get(_url(stub_server), params={"series_id": "CPI"})
+    second = bound.get(_url(stub_server), params={"series_id": "CPI"})
+    other = bound.get(_url(stub_server), params={"series_id": "GDP"})
+    assert first.json() == second.json() == other.json() == {"version": 1}
+    assert len(stub_server.requests) == 2
+    assert cache.stats()["hits"] == 1
+    client.close()
+
+
+def test_expired_entry_revalidates_with_etag(stub_server, tmp_path: Path):
+    cache = HTTPResponseCache(tmp_path, ttls={"fred": 0}, stale_window=0)
+    client, bound = _bound(cache)
+    bound.get(_url(stub_server))
+    response = bound.get(_url(stub_server))
+    assert response.status_code == 200 and response.json() == {"version": 1}
+    assert stub_server.requests[-1]["If-None-Match"] == '"v1"'
+    assert cache.stats()["revalidated"] == 1
+    client.close()
+
+
+def test_stale_entry_is_served_while_refreshing(stub_server, tmp_path: Path):
+    cache = HTTPResponseCache(tmp_path, ttls={"fred": 0}, stale_window=3600)
+    client, bound = _bound(cache)
+    bound.get(_url(stub_server))
+    stub_server.version = 2
+    stale = bound.get(_url(stub_server))
+    assert stale.json() == {"version": 1} and stale_age(stale) is not None
+    assert cache.wait_for_refreshes()
+    assert bound.get(_url(stub_server)).json() == {"version": 2}
+    assert cache.stats()["stale_hits"] == 2
+    cache.close()
+    client.close()
+
+
+def test_entries_persist_across_instances(stub_server, tmp_path: Path):
+    client, bound = _bound(HTTPResponseCache(tmp_path, ttls={"fred": 3600}))
+    bound.get(_url(stub_server))
+    _, reloaded = _bound(HTTPResponseCache(tmp_path, ttls={"fred": 3600}))
+    assert reloaded.get(_url(stub_server)).json() == {"version": 1}
+    assert len(stub_server.requests) == 1
+    assert not any("series" in path.read_text() for path in tmp_path.glob("*/*.json"))
+    client.close()
+
+
+def test_stored_entry_served_when_source_is_down(stub_server, tmp_path: Path):
+    cache = HTTPResponseCache(tmp_path, ttls={"fred": 10}, stale_window=10)
+    client, bound = _bound(cache)
+    url = _url(stub_server)
+    bound.get(url)
+    stub_server.shutdown()
+    stub_server.server_close()
+    _backdate(cache, url, 25)
+    response = bound.get(url)
+    assert response.json() == {"version": 1} and stale_age(response) >= 25
+    _backdate(cache, url, 35)  # past TTL + 2 x stale window
+    with pytest.raises(httpx.TransportError):
+        bound.get(url)
+    with pytest.raises(httpx.TransportError):
+        bound.get(url, params={"series_id": "uncached"})
+    assert cache.stats()["errors"] == 3
+    client.close()
+
+
+def test_stored_entry_served_on_429_and_5xx(stub_server, tmp_path: Path):
+    cache = HTTPResponseCache(tmp_path, ttls={"fred": 10}, stale_window=10)
+    client, bound = _bound(cache)
+    url = _url(stub_server)
+    assert stale_age(bound.get(url)) is None
+    for status in (429, 503):
+        stub_server.status = status
+        _backdate(cache, url, 25)
+        assert bound.get(url).json() == {"version": 1}
+    assert bound.get(url, params={"series_id": "uncached"}).status_code == 503
+    assert cache.stats()["errors"] == 2
+    client.close()
+
+
+def test_quote_sources_never_fall_back(stub_server, tmp_path: Path):
+    cache = HTTPResponseCache(tmp_path, ttls={"fx": 10})
+    client, bound = _bound(cache, "fx")
+    url = _url(stub_server)
+    bound.get(url)
+    _backdate(cache, url, 11)
+    stub_server.status = 503
+    assert bound.get(url).status_code == 503
+    stub_server.shutdown()
+    stub_server.server_close()
+    with pytest.raises(httpx.TransportError):
+        bound.get(url)
+    client.close()
+
+
+def test_stale_window_scales_with_ttl_and_skips_quotes(tmp_path: Path):
+    cache = HTTPResponseCache(tmp_path)
+    assert cache.stale_window_for("fred") == 4 * cache.ttl_for("fred")
+    assert cache.stale_window_for("fx") == cache.stale_window_for("metals") == 0
+    assert cache.fallback_age_for("fred") == 9 * cache.ttl_for("fred")
+    assert cache.fallback_age_for("fx") == 0
+    assert HTTPResponseCache(tmp_path, stale_window=60).stale_window_for("metals") == 0
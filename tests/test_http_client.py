@@ -0,0 +1,131 @@
+"""Tests for skills/utils/http_client.py (shared pooled HTTP clients)."""
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from skills.utils.http_client import PooledHTTPClient, _BoundClient, _build_session
+
+
+def _client(handler, **kwargs) -> PooledHTTPClient:
+    return PooledHTTPClient(transport=httpx.MockTransport(handler), backoff_seconds=0, http2=False, **kwargs)
+
+
+def test_idempotent_requests_retry_on_503():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(503 if len(calls) < 3 else 200, json={"ok": True})
+
+    client = _client(handler, retries=2)
+    response = client.get("https://api.example.com/data")
+    assert response.status_code == 200
+    assert calls == ["GET", "GET", "GET"]
+    host = client.stats()["hosts"]["api.example.com"]
+    assert host["requests"] == 3 and host["retries"] == 2 and host["in_flight"] == 0
+    client.close()
+
+
+def test_post_is_not_retried_on_status():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(503)
+
+    client = _client(handler, retries=2)
+    assert client.post("https://api.example.com/submit", json={}).status_code == 503
+    assert calls == ["POST"]
+    client.close()
+
+
+def test_transport_errors_raise_after_retries():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    client = _client(handler, retries=1)
+    with pytest.raises(httpx.ConnectError):
+        client.post("https://down.example.com/")
+    host = client.stats()["hosts"]["down.example.com"]
+    assert host["requests"] == 2 and host["errors"] == 1
+    client.close()
+
+
+def test_bound_client_applies_default_timeout():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200)
+
+    client = _client(handler)
+    bound = _BoundClient(client, timeout=3.0)
+    bound.patch("https://api.example.com/item")
+    bound.get("https://api.example.com/item", timeout=7.0)
+    assert seen == [3.0, 7.0]
+    client.close()
+
+
+def test_post_is_not_resent_after_a_read_timeout():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        raise httpx.ReadTimeout("no response", request=request)
+
+    client = _client(handler, retries=2)
+    with pytest.raises(httpx.ReadTimeout):
+        client.post("https://api.example.com/send", json={"text": "hi"})
+    with pytest.raises(httpx.ReadTimeout):
+        client.get("https://api.example.com/data")
+    assert calls == ["POST", "GET", "GET", "GET"]
+    client.close()
+
+
+def test_pooled_client_keeps_no_cookies_and_no_redirects():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("cookie"))
+        if request.url.path == "/login":
+            return httpx.Response(200, headers={"Set-Cookie": "session=agent-a; Path=/"})
+        return httpx.Response(302, headers={"Location": "https://api.example.com/login"})
+
+    client = _client(handler)
+    client.get("https://api.example.com/login")
+    assert client.get("https://api.example.com/moved").status_code == 302
+    assert client.get("https://api.example.com/login", headers={"Cookie": "explicit=1"}).status_code == 200
+    assert seen == [None, None, "explicit=1"]
+    client.close()
+
+
+class _CookieHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        self.server.cookies.append(self.headers.get("Cookie"))
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=agent-a; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_session_keeps_no_cookies():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CookieHandler)
+    server.cookies = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    session = _build_session()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    try:
+        session.get(url, timeout=5)
+        session.get(url, timeout=5)
+        assert server.cookies == [None, None] and len(session.cookies) == 0
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
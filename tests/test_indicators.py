@@ -0,0 +1,161 @@
+"""
+Tests for skills/utils/indicators.py: batch kernels against plain-Python
+reference loops, streaming states and the composite indicator suite against
+the single-indicator skills they mirror.
+"""
+from __future__ import annotations
+
+import json
+import math
+
+import numpy as np
+import pytest
+
+from skills.technical_analysis.atr_calculator import atr_calculator
+from skills.technical_analysis.bollinger_bands import bollinger_bands
+from skills.technical_analysis.indicator_state_update import indicator_state_update
+from skills.technical_analysis.macd_calculator import macd_calculator
+from skills.technical_analysis.rsi_calculator import rsi_calculator
+from skills.technical_analysis.technical_indicator_suite import technical_indicator_suite
+from skills.utils import indicators as ind
+
+
+def _ohlc(n: int, seed: int = 3) -> tuple[list[float], list[float], list[float]]:
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    highs = closes * (1 + np.abs(rng.normal(0, 0.005, n)))
+    lows = closes * (1 - np.abs(rng.normal(0, 0.005, n)))
+    return highs.tolist(), lows.tolist(), closes.tolist()
+
+
+def _reference_ema(values: list[float], period: int) -> list[float]:
+    alpha = 2 / (period + 1)
+    out = [math.nan] * len(values)
+    prev = sum(values[:period]) / period
+    out[period - 1] = prev
+    for idx in range(period, len(values)):
+        prev = alpha * values[idx] + (1 - alpha) * prev
+        out[idx] = prev
+    return out
+
+
+class TestBatch:
+
+    @pytest.mark.parametrize("period", [2, 14, 200])
+    def test_ema_matches_recursion(self, period: int):
+        _, _, closes = _ohlc(1000)
+        np.testing.assert_allclose(ind.ema(closes, period), _reference_ema(closes, period), rtol=1e-12)
+
+    def test_ema_skips_nan(self):
+        _, _, closes = _ohlc(50)
+        padded = [math.nan] * 5 + closes
+        result = ind.ema(padded, 10)
+        assert np.isnan(result[:14]).all()
+        np.testing.assert_allclose(result[5:], _reference_ema(closes, 10), rtol=1e-12)
+
+    def test_ema_first_seed(self):
+        np.testing.assert_allclose(ind.ema([1.0, 2.0, 3.0], 3, seed="first"), [1.0, 1.5, 2.25])
+
+    def test_rolling_and_true_range(self):
+        np.testing.assert_allclose(ind.sma([1, 2, 3, 4], 2), [math.nan, 1.5, 2.5, 3.5])
+        np.testing.assert_allclose(ind.rolling_std([1, 3, 5], 2), [math.nan, 1.0, 1.0])
+        np.testing.assert_allclose(ind.true_range([3, 4, 10], [1, 2, 6], [2, 3, 7]), [2, 2, 7])
+        np.testing.assert_allclose(ind.typical_price([3], [1], [2]), [2.0])
+
+
+class TestStreaming:
+
+    def test_rsi_matches_batch(self):
+        _, _, closes = _ohlc(120)
+        state = ind.RSIState.from_history(closes[:60], 14)
+        for price in closes[60:]:
+            value = state.update(price)
+        assert value == pytest.approx(rsi_calculator(prices=closes, period=14)["data"]["current_rsi"], rel=1e-10)
+
+    def test_macd_matches_batch(self):
+        _, _, closes = _ohlc(120)
+        state = ind.MACDState.from_history(closes[:40], 12, 26, 9)
+        for price in closes[40:]:
+            value = state.update(price)
+        batch = macd_calculator(prices=closes, fast_period=12, slow_period=26, signal_period=9)["data"]
+        assert value["macd"] == pytest.approx(batch["macd_line"][-1], rel=1e-10)
+        assert value["signal"] == pytest.approx(batch["signal_line"][-1], rel=1e-10)
+
+    def test_atr_matches_batch(self):
+        highs, lows, closes = _ohlc(120)
+        state = ind.ATRState.from_history(highs[:30], lows[:30], closes[:30], 14)
+        for bar in zip(highs[30:], lows[30:], closes[30:]):
+            value = state.update(*bar)
+        batch = atr_calculator(highs=highs, lows=lows, closes=closes, period=14)["data"]
+        assert value == pytest.approx(batch["current_atr"], rel=1e-10)
+
+    def test_bollinger_matches_batch(self):
+        _, _, closes = _ohlc(500)
+        state = ind.BollingerState.from_history(closes[:20], 20, 2)
+        for price in closes[20:]:
+            value = state.update(price)
+        batch = bollinger_bands(prices=closes, period=20, num_std=2)["data"]
+        assert value["upper"] == pytest.approx(batch["upper_band"], rel=1e-9)
+        assert value["lower"] == pytest.approx(batch["lower_band"], rel=1e-9)
+
+    def test_skill_round_trips_state(self):
+        _, _, closes = _ohlc(80)
+        first = indicator_state_update(indicator="rsi", history={"prices": closes[:40]}, bars=closes[40:60])
+        assert first["status"] == "success"
+        second = indicator_state_update(indicator="rsi", state=first["data"]["state"], bars=closes[60:])
+        full = rsi_calculator(prices=closes, period=14)["data"]
+        assert second["data"]["current"] == pytest.approx(full["current_rsi"], rel=1e-10)
+        assert second["data"]["bars_processed"] == 20
+
+    def test_skill_rejects_bad_state(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        result = indicator_state_update(indicator="atr", state={"period": 14})
+        assert result["status"] == "error"
+
+
+class TestSuite:
+
+    def test_matches_single_indicator_skills(self):
+        highs, lows, closes = _ohlc(300)
+        result = technical_indicator_suite(
+            closes=closes, highs=highs, lows=lows,
+            indicators=[{"indicator": "rsi"}, {"indicator": "atr", "period": 10, "key": "atr"}, {"indicator": "macd"}],
+        )
+        assert result["status"] == "success"
+        indicators = result["data"]["indicators"]
+        np.testing.assert_allclose(
+            np.array(indicators["rsi_14"]["series"]["rsi"], dtype=float),
+            rsi_calculator(prices=closes, period=14)["data"]["rsi_series"],
+        )
+        np.testing.assert_allclose(
+            np.array(indicators["atr"]["series"]["atr"], dtype=float),
+            atr_calculator(highs=highs, lows=lows, closes=closes, period=10)["data"]["atr_series"],
+        )
+        macd = macd_calculator(prices=closes, fast_period=12, slow_period=26, signal_period=9)["data"]
+        assert indicators["macd_12_26_9"]["current"]["signal"] == pytest.approx(macd["signal_line"][-1])
+
+    def test_outputs_and_tail_trim_response(self):
+        _, _, closes = _ohlc(100)
+        result = technical_indicator_suite(
+            closes=closes, tail=5, indicators=[{"indicator": "bollinger", "outputs": ["upper", "lower"]}],
+        )
+        entry = result["data"]["indicators"]["bollinger_20_2.0"]
+        assert set(entry["current"]) == {"upper", "lower"}
+        assert all(len(series) == 5 for series in entry["series"].values())
+
+    def test_warm_up_bars_are_null_not_nan(self):
+        highs, lows, closes = _ohlc(60)
+        result = technical_indicator_suite(
+            closes=closes, highs=highs, lows=lows,
+            indicators=[{"indicator": name} for name in ("rsi", "atr", "macd", "bollinger")],
+        )
+        json.dumps(result, allow_nan=False)
+        rsi = result["data"]["indicators"]["rsi_14"]["series"]["rsi"]
+        assert rsi[0] is None and isinstance(rsi[-1], float)
+
+    def test_missing_highs_is_an_error(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        _, _, closes = _ohlc(50)
+        result = technical_indicator_suite(closes=closes, indicators=[{"indicator": "atr"}])
+        assert result["status"] == "error"
+        assert "requires highs and lows" in result["error"]
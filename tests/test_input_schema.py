@@ -0,0 +1,47 @@
+"""Tests for the compiled inputSchema validators in skills/utils/input_schema.py."""
+from __future__ import annotations
+
+from skills.utils.input_schema import compile_schema
+
+_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "mode": {"type": "string", "enum": ["fast", "full"]},
+        "rate": {"type": ["number", "null"], "exclusiveMinimum": 0},
+        "legs": {
+            "type": "array",
+            "minItems": 1,
+            "items": {"type": "object", "properties": {"qty": {"type": "integer"}}, "required": ["qty"]},
+        },
+        "target": {"oneOf": [{"type": "string"}, {"type": "object"}]},
+        "limit": {"type": "integer"},
+    },
+    "required": ["legs"],
+    "additionalProperties": False,
+}
+
+
+def test_reports_every_problem_with_its_path():
+    _, errors = compile_schema(_SCHEMA)(
+        {"mode": "slow", "rate": 0, "legs": [{"qty": 1}, {}, {"qty": True}], "target": 3, "extra": 1}
+    )
+    assert errors == [
+        "params.mode: 'slow' is not one of ['fast', 'full']",
+        "params.rate: 0 must be > 0",
+        "params.legs[1]: missing required property 'qty'",
+        "params.legs[2].qty: expected integer, got bool",
+        "params.target: does not match any oneOf alternative",
+        "params: unexpected property 'extra'",
+    ]
+    assert compile_schema(_SCHEMA)({"legs": []})[1] == ["params.legs: needs at least 1 items, got 0"]
+
+
+def test_coerces_without_mutating_input():
+    params = {"legs": ({"qty": 2.0}, {"qty": 3}), "rate": None, "limit": None, "target": {"a": 1}}
+    checked, errors = compile_schema(_SCHEMA)(params)
+    assert errors == []
+    assert checked["legs"] == [{"qty": 2}, {"qty": 3}] and type(checked["legs"][0]["qty"]) is int
+    assert params["legs"][0]["qty"] == 2.0 and isinstance(params["legs"], tuple)
+    untouched = {"legs": [{"qty": 1}]}
+    assert compile_schema(_SCHEMA)(untouched)[0] is untouched
+    assert compile_schema(dict(_SCHEMA)) is compile_schema(_SCHEMA)
@@ -0,0 +1,51 @@
+"""Tests for skills/utils/lesson_sink.py (buffered lessons.md writer)."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from skills.utils import lesson_sink
+from skills.utils.lesson_sink import LessonSink
+
+
+def test_lines_are_written_in_order(tmp_path: Path):
+    sink = LessonSink(tmp_path / "logs" / "lessons.md", flush_interval=0.01)
+    for i in range(500):
+        assert sink.submit(f"- lesson {i}")
+    assert sink.flush()
+    lines = (tmp_path / "logs" / "lessons.md").read_text().splitlines()
+    assert lines == [f"- lesson {i}" for i in range(500)]
+    assert sink.stats()["written"] == 500
+    sink.close()
+
+
+def test_rotation_by_size(tmp_path: Path):
+    path = tmp_path / "lessons.md"
+    sink = LessonSink(path, flush_interval=0.01, batch_size=1, max_bytes=50, backup_count=2)
+    for i in range(12):
+        sink.submit(f"- lesson number {i:02d}")
+        sink.flush()
+    sink.close()
+    assert sink.rotations >= 2
+    assert (tmp_path / "lessons.md.1").exists() and (tmp_path / "lessons.md.2").exists()
+    assert not (tmp_path / "lessons.md.3").exists()
+    assert path.read_text().splitlines()[-1] == "- lesson number 11"
+
+
+def test_submit_after_close_is_dropped(tmp_path: Path):
+    sink = LessonSink(tmp_path / "lessons.md", flush_interval=0.01)
+    sink.submit("- kept")
+    sink.close()
+    assert not sink.submit("- late")
+    assert sink.stats()["dropped"] == 1
+    assert (tmp_path / "lessons.md").read_text() == "- kept\n"
+
+
+def test_log_lesson_routes_through_sink(tmp_path: Path, monkeypatch):
+    from skills.utils import _log_lesson
+
+    sink = LessonSink(tmp_path / "lessons.md", flush_interval=0.01)
+    monkeypatch.setattr(lesson_sink, "_SINK", sink)
+    _log_lesson("some_skill", "ValueError: bad")
+    sink.flush()
+    assert (tmp_path / "lessons.md").read_text().rstrip().endswith("some_skill: ValueError: bad")
+    sink.close()
@@ -0,0 +1,70 @@
+"""Tests for checkpointed hash-chain verification in skills/log_integrity.py."""
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from skills import log_integrity as li  # noqa: E402
+
+
+@pytest.fixture
+def chain(tmp_path, monkeypatch):
+    log = tmp_path / "invocations.jsonl"
+    monkeypatch.setattr(li, "_INVOCATION_LOG", log)
+    monkeypatch.setattr(li, "_INTEGRITY_DIR", tmp_path / "integrity")
+    monkeypatch.setattr(li, "_SEGMENT_BYTES", 2000)
+    state = {"prev": "genesis", "seq": 0}
+
+    def append(count: int) -> None:
+        with open(log, "a") as fh:
+            for _ in range(count):
+                state["seq"] += 1
+                line = json.dumps({"seq": state["seq"], "skill": "rsi_calculator", "prev_hash": state["prev"]})
+                fh.write(line + "\n")
+                state["prev"] = hashlib.sha256(line.encode()).hexdigest()
+
+    return log, append
+
+
+def _tamper(log, line_no: int) -> None:
+    lines = log.read_text().splitlines(keepends=True)
+    lines[line_no - 1] = lines[line_no - 1].replace("rsi_calculator", "rsi_calculatoR")
+    log.write_text("".join(lines))
+
+
+def test_incremental_resumes_from_checkpoint(chain):
+    log, append = chain
+    append(100)
+    first = li._verify_chain()
+    assert (first["status"], first["mode"], first["lines_checked"]) == ("ok", "full", 100)
+    append(5)
+    second = li._verify_chain()
+    assert (second["mode"], second["lines_checked"]) == ("incremental", 105)
+    assert second["resumed_from_offset"] == first["resumed_from_offset"] + first["bytes_read"]
+    assert second["bytes_read"] == log.stat().st_size - second["resumed_from_offset"]
+
+    _tamper(log, 105)
+    assert li._verify_chain("incremental")["reason"].startswith("Last verified line was modified")
+    log.write_text(log.read_text()[:-40])
+    assert li._verify_chain("incremental")["reason"].startswith("Log is shorter")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_full_verify_rechecks_stored_segments(chain, workers):
+    log, append = chain
+    append(200)
+    assert li._verify_chain("full")["status"] == "ok"
+    segments = json.loads((li._INTEGRITY_DIR / "checkpoint.json").read_text())["segments"]
+    assert len(segments) > 3
+    assert li._verify_chain("full", workers=workers)["segments_verified"] == len(segments)
+
+    _tamper(log, 50)
+    assert li._verify_chain("incremental")["status"] == "ok"  # middle edits need a full verify
+    result = li._verify_chain("full", workers=workers)
+    assert result["status"] == "suspicious"
+    assert result["lines_checked"] == 51
+    assert segments[result["segment"]["index"]]["lines_before"] < 51 <= segments[result["segment"]["index"]]["lines"]
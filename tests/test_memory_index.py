@@ -0,0 +1,64 @@
+"""Tests for skills/utils/memory_index.py and long_term_memory_store on top of it."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from skills.memory import long_term_memory_store as ltm
+from skills.utils.memory_index import MemoryIndex
+
+
+def test_read_search_and_tombstone_delete(tmp_path: Path):
+    index = MemoryIndex(tmp_path / "m.jsonl")
+    index.write("a", 1, ["x"])
+    index.write("b", 2, ["x", "y"])
+    index.write("a", 3, ["y"])
+    assert [r["value"] for r in index.read("a")] == [1, 3]
+    page, total = index.search(["x", "y"], limit=2)
+    assert total == 3 and [r["value"] for r in page] == [1, 2]
+    page, _ = index.search(["x", "y"], offset=2, limit=2)
+    assert [r["value"] for r in page] == [3]
+    assert [r["value"] for r in index.search(["y"], newest_first=True)[0]] == [3, 2]
+
+    assert index.delete("a") == 2
+    assert index.read("a") == []
+    assert index.search(["x"])[1] == 1
+    lines = (tmp_path / "m.jsonl").read_text().splitlines()
+    assert len(lines) == 4 and json.loads(lines[-1])["deleted"] is True
+
+
+def test_other_writers_and_legacy_files_are_indexed(tmp_path: Path):
+    path = tmp_path / "m.jsonl"
+    path.write_text(json.dumps({"key": "old", "value": 0, "tags": ["t"], "timestamp": "2025-01-01"}) + "\n")
+    first, second = MemoryIndex(path), MemoryIndex(path)
+    assert first.read("old")[0]["value"] == 0
+    second.write("new", 1, ["t"])
+    assert first.search(["t"])[1] == 2
+    second.delete("old")
+    assert first.read("old") == []
+
+
+def test_compaction_drops_dead_lines(tmp_path: Path):
+    path = tmp_path / "m.jsonl"
+    index = MemoryIndex(path, compact_min_dead=4, background_compaction=False)
+    for i in range(4):
+        index.write(f"k{i}", i, ["t"])
+    index.delete("k0")
+    index.delete("k1")
+    assert index.compactions == 1
+    assert len(path.read_text().splitlines()) == 2
+    assert [r["value"] for r in index.search(["t"])[0]] == [2, 3]
+    assert MemoryIndex(path).stats()["live_records"] == 2
+
+
+def test_skill_paginates_search(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(tmp_path)
+    for i in range(5):
+        ltm.long_term_memory_store("write", key=f"k{i}", value=i, tags=["t"])
+    page = ltm.long_term_memory_store("search", tags=["t"], limit=2, offset=2)["data"]
+    assert [m["value"] for m in page["matches"]] == [2, 3]
+    assert page["total"] == 5 and page["next_offset"] == 4
+    assert ltm.long_term_memory_store("delete", key="k1")["data"] == {"removed": 1}
+    assert ltm.long_term_memory_store("read", key="k1")["data"] == {"matches": []}
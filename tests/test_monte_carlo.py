@@ -0,0 +1,64 @@
+"""Tests for skills/utils/monte_carlo.py and the monte_carlo_var skill built on it."""
+from __future__ import annotations
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from skills.quantitative_risk.monte_carlo_var import monte_carlo_var  # noqa: E402
+from skills.utils.monte_carlo import loss_statistics, simulate_portfolio_losses  # noqa: E402
+
+_MU = [0.0005, 0.0002, -0.0001]
+_COV = [
+    [0.0004, 0.0001, 0.00005],
+    [0.0001, 0.0003, 0.00002],
+    [0.00005, 0.00002, 0.0002],
+]
+
+
+def _analytic_var(confidence_z: float, horizon: int) -> float:
+    sd = math.sqrt(sum(sum(row) for row in _COV) * horizon)
+    return -sum(_MU) * horizon + confidence_z * sd
+
+
+@pytest.mark.parametrize("options", [{}, {"antithetic": True}, {"quasi_random": True}])
+def test_var_converges_to_analytic(options):
+    losses = simulate_portfolio_losses(_MU, _COV, 200_000, 10, seed=1, **options)
+    stats = loss_statistics(losses, 0.99)
+    assert stats["value_at_risk"] == pytest.approx(_analytic_var(2.3263, 10), rel=0.02)
+    assert stats["expected_shortfall"] > stats["value_at_risk"]
+
+
+def test_seeded_runs_are_reproducible_and_chunk_invariant():
+    a = simulate_portfolio_losses(_MU, _COV, 10_000, 5, seed=42)
+    b = simulate_portfolio_losses(_MU, _COV, 10_000, 5, seed=42, chunk_size=777)
+    np.testing.assert_allclose(a, b)
+
+
+def test_loss_statistics_match_full_sort():
+    losses = np.random.default_rng(3).normal(size=5_001)
+    stats = loss_statistics(losses, 0.975)
+    ordered = np.sort(losses)
+    index = int(0.975 * len(losses)) - 1
+    assert stats["value_at_risk"] == ordered[index]
+    assert stats["expected_shortfall"] == pytest.approx(ordered[index:].mean())
+    assert stats["percentiles"]["99"] == ordered[int(0.99 * len(losses)) - 1]
+    assert stats["worst_case_loss"] == ordered[-1]
+
+
+def test_skill_schema_unchanged():
+    result = monte_carlo_var(_MU, _COV, 5_000, 1, 0.99, seed=7)
+    assert result["status"] == "success"
+    assert set(result["data"]) == {
+        "value_at_risk", "expected_shortfall", "simulation_percentiles",
+        "worst_case_loss", "num_simulations", "confidence_level",
+    }
+    assert set(result["data"]["simulation_percentiles"]) == {"95", "97", "99"}
+
+
+def test_skill_rejects_non_positive_definite():
+    result = monte_carlo_var([0.0], [[-1.0]], 10, 1, 0.9)
+    assert result["status"] == "error"
+    assert "positive definite" in result["error"]
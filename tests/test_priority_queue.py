@@ -0,0 +1,84 @@
+"""Tests for skills/utils/priority_queue.py and the server-side request_queue_manager mode."""
+from __future__ import annotations
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from skills.gateway import request_queue_manager as rqm
+from skills.utils.priority_queue import PersistentPriorityQueue
+
+PRIORITIES = {"critical": 0, "standard": 1, "free": 2}
+
+
+def _queue(path: Path, aging: float | None = None) -> PersistentPriorityQueue:
+    return PersistentPriorityQueue(path, PRIORITIES, default_priority="standard", aging_seconds=aging)
+
+
+def test_dequeues_by_class_then_fifo(tmp_path: Path):
+    queue = _queue(tmp_path / "q.db")
+    for name, priority in [("a", "free"), ("b", "standard"), ("c", "critical"), ("d", "standard"), ("e", "bogus")]:
+        queue.enqueue({"id": name, "priority": priority})
+    assert [queue.dequeue()["id"] for _ in range(5)] == ["c", "b", "d", "e", "a"]
+    assert queue.dequeue() is None
+
+
+def test_queues_are_durable(tmp_path: Path):
+    queue = _queue(tmp_path / "q.db")
+    queue.enqueue({"id": "a", "priority": "free"})
+    queue.enqueue({"id": "b", "priority": "critical"})
+    queue.dequeue()
+    queue.close()
+    reopened = _queue(tmp_path / "q.db")
+    assert len(reopened) == 1
+    assert reopened.peek()["id"] == "a"
+    with pytest.raises(ValueError):
+        reopened.enqueue({"id": "a"})
+
+
+def _drain(path: str) -> list[str]:
+    queue = _queue(Path(path))
+    taken = []
+    while (item := queue.dequeue()) is not None:
+        taken.append(item["id"])
+    queue.close()
+    return taken
+
+
+def test_processes_sharing_a_database_never_take_the_same_item(tmp_path: Path):
+    queue = _queue(tmp_path / "q.db")
+    other = _queue(tmp_path / "q.db")
+    for i in range(200):
+        queue.enqueue({"id": str(i), "priority": ("critical", "standard", "free")[i % 3]})
+    assert other.peek()["id"] == "0" and len(other) == 200
+    with ProcessPoolExecutor(4) as pool:
+        taken = [item for batch in pool.map(_drain, [str(tmp_path / "q.db")] * 4) for item in batch]
+    assert sorted(taken, key=int) == [str(i) for i in range(200)]
+    assert queue.dequeue() is None and len(other) == 0
+
+
+def test_aging_prevents_starvation(tmp_path: Path):
+    queue = _queue(tmp_path / "q.db", aging=0.05)
+    queue.enqueue({"id": "old", "priority": "free"})
+    time.sleep(0.12)
+    queue.enqueue({"id": "new", "priority": "critical"})
+    assert queue.dequeue()["id"] == "old"
+
+
+def test_skill_returns_item_and_stats_only(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(rqm, "QUEUE_PATH", str(tmp_path / "queue.db"))
+    rqm.request_queue_manager("enqueue", request={"id": "r1", "priority": "free"}, queue_name="q")
+    result = rqm.request_queue_manager("enqueue", request={"id": "r2", "priority": "premium"}, queue_name="q")
+    assert "queue_state" not in result["data"]
+    assert result["data"]["stats"]["depth"] == 2
+    assert rqm.request_queue_manager("dequeue", queue_name="q")["data"]["dequeued"]["id"] == "r2"
+    assert rqm.request_queue_manager("stats", queue_name="other")["data"]["stats"]["depth"] == 0
+
+
+def test_skill_keeps_stateless_mode():
+    result = rqm.request_queue_manager("dequeue", queue_state=[{"priority": "free"}, {"priority": "critical"}])
+    assert result["data"]["dequeued"] == {"priority": "critical"}
+    assert result["data"]["queue_state"] == [{"priority": "free"}]
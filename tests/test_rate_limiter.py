@@ -0,0 +1,112 @@
+"""Tests for skills/utils/rate_limiter.py and the server-side request_rate_limiter mode."""
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from skills.gateway import request_rate_limiter as rrl
+from skills.utils.rate_limiter import RateLimiter
+
+
+def test_bucket_drains_and_refills():
+    limiter = RateLimiter(capacity=2, refill_rate=20)
+    assert [limiter.check("a")["allowed"] for _ in range(3)] == [True, True, False]
+    assert 0 < limiter.check("a")["retry_after_sec"] <= 0.05
+    time.sleep(0.06)
+    assert limiter.check("a")["allowed"]
+
+
+def test_concurrent_callers_share_one_bucket():
+    limiter = RateLimiter(capacity=50, refill_rate=0)
+    allowed = []
+
+    def worker() -> None:
+        allowed.extend(limiter.check("shared")["allowed"] for _ in range(20))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(allowed) == 50
+
+
+def test_check_many_and_overrides():
+    limiter = RateLimiter(capacity=1, refill_rate=0)
+    limiter.check("big", capacity=5)
+    decisions = limiter.check_many(["big", "small", "small"])
+    assert [d["allowed"] for d in decisions] == [True, True, False]
+    assert decisions[0]["capacity"] == 5
+
+
+def test_snapshot_round_trip(tmp_path: Path):
+    path = tmp_path / "buckets.json"
+    limiter = RateLimiter(capacity=3, refill_rate=0, state_path=path)
+    limiter.check("a", cost=3)
+    limiter.close()
+    restored = RateLimiter(capacity=3, refill_rate=0, state_path=path)
+    assert restored.check("a")["allowed"] is False
+    restored.close()
+
+
+def test_skill_uses_server_side_buckets(monkeypatch: pytest.MonkeyPatch):
+    limiter = RateLimiter(capacity=1, refill_rate=0)
+    monkeypatch.setattr(rrl, "get_rate_limiter", lambda name: limiter)
+    assert rrl.request_rate_limiter(agent_id="x")["data"]["allowed"] is True
+    assert rrl.request_rate_limiter(agent_id="x")["data"]["allowed"] is False
+    batch = rrl.request_rate_limiter(agent_ids=["y", "x"])["data"]["decisions"]
+    assert [d["allowed"] for d in batch] == [True, False]
+
+
+def test_skill_cannot_touch_dispatcher_buckets(monkeypatch: pytest.MonkeyPatch):
+    from skills.utils import rate_limiter
+
+    monkeypatch.setattr(rate_limiter, "_LIMITERS", {})
+    dispatcher = rate_limiter.get_rate_limiter()
+    dispatcher.check("agent", cost=dispatcher.capacity)
+    result = rrl.request_rate_limiter(agent_id="agent", max_tokens=1e9, refill_rate_per_sec=1e9)
+    assert result["data"]["allowed"] is True
+    assert result["data"]["max_tokens"] == dispatcher.capacity
+    assert dispatcher.check("agent")["allowed"] is False
+    assert rate_limiter.get_rate_limiter("request_rate_limiter") is not dispatcher
+
+
+def test_skill_keeps_stateless_mode():
+    result = rrl.request_rate_limiter(
+        agent_id="x",
+        bucket_state={"tokens": 0, "max_tokens": 5, "refill_rate_per_sec": 1, "last_refill": "2026-01-01T00:00:00+00:00"},
+        current_time="2026-01-01T00:00:02+00:00",
+    )
+    assert result["data"]["allowed"] is True
+    assert result["data"]["updated_bucket"]["tokens"] == 1.0
+
+
+def test_non_positive_cost_never_adds_tokens():
+    limiter = RateLimiter(capacity=2, refill_rate=0)
+    limiter.check("a", cost=2)
+    for cost in (0, -5, float("nan")):
+        assert limiter.check("a", cost=cost)["tokens_remaining"] == 0
+    assert limiter.check("a")["allowed"] is False
+
+
+@pytest.mark.parametrize("cost", [0, -1, float("nan"), float("inf")])
+def test_skill_rejects_non_positive_cost(monkeypatch: pytest.MonkeyPatch, cost: float):
+    limiter = RateLimiter(capacity=1, refill_rate=0)
+    monkeypatch.setattr(rrl, "get_rate_limiter", lambda name: limiter)
+    result = rrl.request_rate_limiter(agent_id="x", cost=cost)
+    assert result["status"] == "error" and "cost" in result["data"]["error"]
+    assert limiter.stats()["buckets"] == 0
+
+
+def test_new_keys_are_capped_without_evicting_buckets():
+    limiter = RateLimiter(capacity=1, refill_rate=0, max_buckets=3, new_keys_per_sec=0.001, new_keys_burst=2)
+    assert limiter.check("real")["allowed"]
+    assert limiter.check("rotated-1")["allowed"]
+    flood = [limiter.check(f"rotated-{i}") for i in range(2, 50)]
+    assert not any(d["allowed"] for d in flood) and flood[0]["retry_after_sec"] > 0
+    assert limiter.check("real")["allowed"] is False  # still drained, not evicted and refilled
+    assert limiter.stats()["buckets"] == 2 and limiter.stats()["new_keys_denied"] == 48
+    assert RateLimiter(new_keys_per_sec=0).check("any")["allowed"]
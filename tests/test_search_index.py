@@ -0,0 +1,46 @@
+"""Tests for skills/utils/search_index.py (the snowdrop_search_skills engine)."""
+from __future__ import annotations
+
+from skills.utils.search_index import SkillSearchIndex, tokenize
+
+_DOCS = [
+    {"name": "rsi_calculator", "description": "Relative Strength Index momentum oscillator.",
+     "category": "technical_analysis", "input_fields": ["prices", "period"]},
+    {"name": "historical_volatility", "description": "Annualised close-to-close volatility.",
+     "category": "technical_analysis", "input_fields": ["prices", "window"]},
+    {"name": "black_scholes_pricer", "description": "Price European options; implied volatility input.",
+     "category": "quant", "input_fields": ["spot", "strike", "volatility"]},
+    {"name": "ebitda_calculator", "description": "EBITDA from net income.",
+     "category": "accounting", "input_fields": ["net_income"]},
+]
+
+
+def test_tokenize_splits_snake_case():
+    assert tokenize("RSI_Calculator v2") == ["rsi", "calculator", "v2"]
+
+
+def test_name_match_outranks_description_match():
+    total, ranked = SkillSearchIndex(_DOCS).search("volatility")
+    assert total == 2
+    assert ranked[0][0] == "historical_volatility"
+
+
+def test_prefix_and_typo_matching():
+    index = SkillSearchIndex(_DOCS)
+    assert index.search("volat")[1][0][0] == "historical_volatility"
+    assert index.search("volatilty")[1][0][0] == "historical_volatility"
+    assert index.search("zzzz") == (0, [])
+
+
+def test_input_field_names_are_searchable():
+    _, ranked = SkillSearchIndex(_DOCS).search("strike")
+    assert [name for name, _ in ranked] == ["black_scholes_pricer"]
+
+
+def test_pagination():
+    index = SkillSearchIndex(_DOCS)
+    total, first = index.search("calculator prices", limit=1)
+    _, second = index.search("calculator prices", limit=1, offset=1)
+    _, everything = index.search("calculator prices", limit=0)
+    assert total == len(everything) == 3
+    assert first + second == everything[:2]
@@ -0,0 +1,185 @@
+"""
+Tests for the dispatcher catalog: snapshot manifest, hash invalidation and lazy import.
+
+A throwaway skills/ tree is built under tmp_path and mcp_server._SKILLS_DIR is
+patched to point at it, so the real ~1,900 skills are never imported.
+"""
+from __future__ import annotations
+
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastmcp")
+
+import mcp_server  # noqa: E402
+
+
+_SKILL_SOURCE = textwrap.dedent("""\
+    TOOL_META = {
+        "name": "{name}",
+        "description": "Synthetic skill {name}.",
+        "inputSchema": {"type": "object", "properties": {"x": {"type": "number"}}, "required": ["x"]},
+    }
+
+    def {name}(x: float) -> dict:
+        return {"status": "success", "data": {"double": x * 2}, "timestamp": ""}
+""")
+
+
+@pytest.fixture
+def skills_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create skills/<category>/<name>.py files and point mcp_server at them."""
+    skills_dir = tmp_path / "skills"
+    for category, name in (("alpha", "alpha_skill"), ("beta", "beta_skill")):
+        (skills_dir / category).mkdir(parents=True)
+        (skills_dir / category / f"{name}.py").write_text(
+            _SKILL_SOURCE.replace("{name}", name)
+        )
+    (skills_dir / "broken.py").write_text("raise RuntimeError('boom')\n")
+
+    monkeypatch.setattr(mcp_server, "_SKILLS_DIR", skills_dir)
+    monkeypatch.setattr(mcp_server, "_IMPORT_METRICS", {})
+    yield skills_dir
+    for mod in [m for m in sys.modules if m.startswith(("skills.alpha", "skills.beta", "skills.broken"))]:
+        sys.modules.pop(mod, None)
+
+
+def _drop_synthetic_modules() -> None:
+    for mod in [m for m in sys.modules if m.startswith(("skills.alpha", "skills.beta"))]:
+        sys.modules.pop(mod)
+
+
+class TestManifest:
+
+    def test_full_scan_writes_snapshot(self, skills_tree: Path, tmp_path: Path):
+        manifest = tmp_path / "manifest.json"
+        catalog = mcp_server._refresh_catalog(manifest)
+
+        assert set(catalog) == {"alpha_skill", "beta_skill"}
+        assert mcp_server._CATALOG_STATE["source"] == "scan"
+        snapshot = mcp_server._read_manifest(manifest)
+        assert snapshot["skills"]["alpha_skill"]["category"] == "alpha"
+        assert snapshot["files"]["broken.py"]["error"].startswith("broken.py: RuntimeError")
+        assert len(snapshot["failed_imports"]) == 1
+
+    def test_unchanged_snapshot_is_lazy(self, skills_tree: Path, tmp_path: Path):
+        manifest = tmp_path / "manifest.json"
+        mcp_server._refresh_catalog(manifest)
+        _drop_synthetic_modules()
+
+        catalog = mcp_server._refresh_catalog(manifest)
+        assert mcp_server._CATALOG_STATE["source"] == "snapshot"
+        assert mcp_server._CATALOG_STATE["reimported_files"] == 0
+        assert all(record["callable"] is None for record in catalog.values())
+        assert "skills.alpha.alpha_skill" not in sys.modules
+        assert len(mcp_server._discover_skills._failed_imports) == 1
+
+        fn = mcp_server._resolve_callable("alpha_skill", catalog["alpha_skill"])
+        assert fn(x=2)["data"]["double"] == 4
+        assert "alpha_skill" in mcp_server._IMPORT_METRICS
+        assert catalog["beta_skill"]["callable"] is None
+
+    def test_changed_file_is_reimported(self, skills_tree: Path, tmp_path: Path):
+        manifest = tmp_path / "manifest.json"
+        mcp_server._refresh_catalog(manifest)
+        target = skills_tree / "beta" / "beta_skill.py"
+        target.write_text(target.read_text().replace("Synthetic skill", "Edited skill"))
+        (skills_tree / "alpha" / "alpha_skill.py").unlink()
+        _drop_synthetic_modules()
+
+        catalog = mcp_server._refresh_catalog(manifest)
+        assert set(catalog) == {"beta_skill"}
+        assert catalog["beta_skill"]["callable"] is not None
+        assert catalog["beta_skill"]["meta"]["description"].startswith("Edited skill")
+        assert mcp_server._CATALOG_STATE["reimported_files"] == 1
+        assert mcp_server._CATALOG_STATE["removed_files"] == 1
+        assert "alpha/alpha_skill.py" not in mcp_server._read_manifest(manifest)["files"]
+
+    def test_missing_manifest_returns_none(self, tmp_path: Path):
+        assert mcp_server._read_manifest(tmp_path / "absent.json") is None
+
+    def test_version_mismatch_returns_none(self, tmp_path: Path):
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text('{"version": -1, "skills": {}}')
+        assert mcp_server._read_manifest(manifest) is None
+
+
+class TestSignatureRequired:
+
+    def test_required_is_trimmed_to_the_function_signature(self, skills_tree: Path, tmp_path: Path):
+        (skills_tree / "alpha" / "nested_skill.py").write_text(textwrap.dedent("""\
+            TOOL_META = {
+                "name": "nested_skill",
+                "description": "Reads its inputs from one dict.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {"principal_usd": {"type": "number"}, "days": {"type": "integer"}},
+                    "required": ["principal_usd", "days", "metrics"],
+                },
+            }
+
+            def nested_skill(metrics: dict, days: int = 30) -> dict:
+                return {"status": "success", "data": metrics, "timestamp": ""}
+        """))
+        manifest = tmp_path / "manifest.json"
+        mcp_server._refresh_catalog(manifest)
+        _drop_synthetic_modules()
+        record = mcp_server._refresh_catalog(manifest)["nested_skill"]
+        assert record["callable"] is None and record["required_params"] == ["metrics"]
+
+        validator = mcp_server._input_validator(record)
+        assert validator({"metrics": {"principal_usd": 1}}) == ({"metrics": {"principal_usd": 1}}, [])
+        assert validator({"metrics": {}, "days": "x"})[1] == ["params.days: expected integer, got str"]
+        assert validator({})[1] == ["params: missing required property 'metrics'"]
+        assert record["relaxed_required"] == ["principal_usd", "days"]
+        assert "skills.alpha.nested_skill" not in sys.modules
+
+
+def _sample(schema: object) -> object:
+    """A value a schema-following caller could send: enum/default first, minimal otherwise."""
+    if not isinstance(schema, dict):
+        return {}
+    if schema.get("enum"):
+        return schema["enum"][0]
+    if schema.get("default") is not None:
+        return schema["default"]
+    branches = schema.get("oneOf") or schema.get("anyOf") or schema.get("allOf") or [{}]
+    if "type" not in schema and "properties" not in schema and len(branches[0]) > 0:
+        return _sample(branches[0])
+    kind = schema.get("type", "object")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+    if kind == "object":
+        properties = schema.get("properties") or {}
+        names = list(schema.get("required") or []) + list(branches[0].get("required") or [])
+        return {name: _sample(properties.get(name)) for name in names}
+    if kind == "array":
+        return [_sample(schema.get("items"))] * schema.get("minItems", 1)
+    if kind in ("number", "integer"):
+        low = schema.get("minimum", schema.get("exclusiveMinimum"))
+        value = (low if isinstance(low, (int, float)) and not isinstance(low, bool) else 0) + 1
+        return int(value) if kind == "integer" else float(value)
+    if kind == "string":
+        return "x" * max(1, schema.get("minLength", 1))
+    return {"boolean": True, "null": None}.get(kind, {})
+
+
+def test_every_skill_accepts_its_baseline_call():
+    """Imports the real skills/ tree: a call passing just the arguments each
+    function requires (typed per its schema) must pass that skill's validator."""
+    catalog = mcp_server._discover_skills()
+    rejected = {}
+    for name, record in catalog.items():
+        validator = mcp_server._input_validator(record)
+        if validator is None or record["required_params"] is None:
+            continue
+        schema = record["meta"]["inputSchema"]
+        params = _sample({**schema, "required": record["required_params"]})
+        errors = validator(params)[1]
+        if errors:
+            rejected[name] = errors
+    assert len(catalog) > 1000
+    assert rejected == {}
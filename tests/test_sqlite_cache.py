@@ -0,0 +1,75 @@
+"""Tests for skills/utils/sqlite_cache.py and the response_cache_manager skill on top of it."""
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from skills.gateway import response_cache_manager as rcm
+from skills.utils.sqlite_cache import SQLiteCache
+
+
+def test_set_get_and_ttl(tmp_path: Path):
+    cache = SQLiteCache(tmp_path / "c.db", sweep_interval=None)
+    cache.set("a", {"x": 1}, ttl=60)
+    cache.set("b", {"x": 2}, ttl=-1)
+    assert cache.get("a").value == {"x": 1}
+    assert cache.get("b").expired()
+    assert cache.get("b") is None
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_lru_eviction_keeps_recently_read(tmp_path: Path):
+    cache = SQLiteCache(tmp_path / "c.db", max_entries=3, sweep_interval=None)
+    for key in "abc":
+        cache.set(key, key)
+        time.sleep(0.002)
+    cache.get("a")
+    cache.set("d", "d")
+    assert sorted(cache.get_many("abcd")) == ["a", "c", "d"]
+    assert cache.stats()["evictions"] == 1
+    cache.close()
+
+
+def test_background_sweeper_purges_expired(tmp_path: Path):
+    cache = SQLiteCache(tmp_path / "c.db", sweep_interval=0.02)
+    cache.set_many({"a": 1, "b": 2}, ttl=0.01)
+    cache.set("keep", 3)
+    deadline = time.monotonic() + 2
+    while len(cache) > 1 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_concurrent_writers_do_not_lose_entries(tmp_path: Path):
+    cache = SQLiteCache(tmp_path / "c.db", sweep_interval=None)
+
+    def writer(prefix: str) -> None:
+        for i in range(50):
+            cache.set(f"{prefix}{i}", i)
+
+    threads = [threading.Thread(target=writer, args=(p,)) for p in "wxyz"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    other = SQLiteCache(tmp_path / "c.db", sweep_interval=None)
+    assert len(other) == 200
+    cache.close()
+    other.close()
+
+
+def test_skill_batch_operations(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(rcm, "CACHE_PATH", str(tmp_path / "logs" / "cache.db"))
+    stored = rcm.response_cache_manager("set_many", entries={"a": {"v": 1}, "b": {"v": 2}}, ttl_seconds=60)
+    assert stored["data"] == {"stored": 2}
+    result = rcm.response_cache_manager("get_many", cache_keys=["a", "missing"])
+    assert result["data"]["entries"]["a"]["data"] == {"v": 1}
+    assert result["data"]["entries"]["missing"]["hit"] is False
+    assert rcm.response_cache_manager("invalidate", cache_key="a")["data"] == {"invalidated": True}
+    assert rcm.response_cache_manager("get", cache_key="a")["data"]["hit"] is False
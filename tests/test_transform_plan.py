@@ -0,0 +1,112 @@
+"""Tests for the compiled transformation plans behind etl.data_transformer."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from skills.etl.data_transformer import data_transformer  # noqa: E402
+from skills.utils import transform_plan  # noqa: E402
+from skills.utils.transform_plan import compile_plan  # noqa: E402
+
+_TRANSFORMS = [
+    {"operation": "compute", "field": "total", "params": {"expression": "qty * price"}},
+    {"operation": "default", "field": "name", "params": {"value": "n/a"}},
+    {"operation": "cast", "field": "flag", "params": {"type": "bool"}},
+    {"operation": "rename", "field": "price", "params": {"new_name": "unit_price"}},
+    {"operation": "compute", "field": "big", "params": {"expression": "unit_price / qty > 1"}},
+    {"operation": "drop", "field": "qty"},
+]
+
+
+def _rows():
+    rows = [
+        {"qty": 2, "price": 1.5, "name": "a", "flag": "yes"},
+        {"qty": 4.0, "price": 2.0, "name": "", "flag": "0"},
+        {"qty": 10**20, "price": 3, "flag": None},
+        {"qty": 1.0, "price": 0.5, "name": None},
+    ]
+    return rows * 5
+
+
+def _legacy(rows, transforms):
+    """The original per-operation implementation, for reference."""
+    records = [row.copy() for row in rows]
+    for transform in transforms:
+        op, field, params = transform["operation"], transform["field"], transform.get("params", {})
+        for row in records:
+            if op == "compute":
+                row[field] = eval(params["expression"], {**row, "__builtins__": {}}, {})
+            elif op == "default" and row.get(field) in {None, ""}:
+                row[field] = params["value"]
+            elif op == "cast" and row.get(field) is not None:
+                row[field] = str(row[field]).lower() in {"true", "1", "yes"}
+            elif op == "rename":
+                row[params["new_name"]] = row.pop(field, None)
+            elif op == "drop":
+                row.pop(field, None)
+    return records
+
+
+@pytest.mark.parametrize("mode", ["row", "columnar"])
+def test_modes_match_sequential_semantics(mode):
+    rows = _rows()
+    result = data_transformer(data=rows, transformations=_TRANSFORMS, mode=mode)
+    assert result["status"] == "success"
+    assert result["data"]["records"] == _legacy(rows, _TRANSFORMS)
+    assert result["data"]["transformation_log"][0] == "compute total = qty * price"
+    assert rows == _rows()
+
+
+def test_columnar_falls_back_to_row_errors():
+    transforms = [{"operation": "compute", "field": "r", "params": {"expression": "a / b"}}]
+    rows = [{"a": 1.0, "b": 2.0}, {"a": 1.0, "b": 0.0}]
+    for mode in ("row", "columnar"):
+        result = data_transformer(data=rows, transformations=transforms, mode=mode)
+        assert result["status"] == "error"
+        assert "division by zero" in result["data"]["error"]
+    assert compile_plan(transforms) is compile_plan(json.loads(json.dumps(transforms)))
+
+
+def test_columnar_keeps_each_rows_key_order():
+    transforms = [
+        {"operation": "default", "field": "c", "params": {"value": 0}},
+        {"operation": "compute", "field": "a", "params": {"expression": "a * 2"}},
+    ]
+    rows = [{"a": 1, "b": 2}, {"b": 3, "a": 4}, {"c": 5, "a": 6}, {"a": 7, "b": 8}]
+    expected = data_transformer(data=rows, transformations=transforms)["data"]["records"]
+    columnar = data_transformer(data=rows, transformations=transforms, mode="columnar")["data"]["records"]
+    assert [list(row.items()) for row in columnar] == [list(row.items()) for row in expected]
+
+
+def test_streams_files_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(transform_plan, "_DATA_DIR", tmp_path)
+    source = tmp_path / "in.jsonl"
+    source.write_text("".join(json.dumps(row) + "\n" for row in _rows()), encoding="utf-8")
+    target = tmp_path / "out.jsonl"
+    result = data_transformer(
+        transformations=_TRANSFORMS, input_path=str(source), output_path=str(target), mode="columnar", chunk_size=3
+    )
+    assert result["data"]["rows_written"] == len(_rows())
+    written = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+    assert written == _legacy(_rows(), _TRANSFORMS)
+
+
+def test_file_paths_are_confined_to_the_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(transform_plan, "_DATA_DIR", tmp_path / "data")
+    (tmp_path / "data").mkdir()
+    (tmp_path / "secret.jsonl").write_text('{"a": 1}\n', encoding="utf-8")
+    (tmp_path / "data" / "link.jsonl").symlink_to(tmp_path / "secret.jsonl")
+    for kwargs in (
+        {"input_path": str(tmp_path / "secret.jsonl")},
+        {"input_path": "../secret.jsonl"},
+        {"input_path": "link.jsonl"},
+        {"data": [{"a": 1}], "output_path": str(tmp_path / "out.jsonl")},
+    ):
+        result = data_transformer(transformations=_TRANSFORMS[:1], **kwargs)
+        assert result["status"] == "error" and "outside the data directory" in result["data"]["error"]
+    assert not (tmp_path / "out.jsonl").exists()
+    result = data_transformer(data=[{"qty": 1, "price": 2}], transformations=_TRANSFORMS[:1], output_path="out/r.jsonl")
+    assert result["data"]["rows_written"] == 1 and (tmp_path / "data" / "out" / "r.jsonl").exists()
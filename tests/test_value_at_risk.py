@@ -0,0 +1,65 @@
+"""Tests for skills/utils/value_at_risk.py and the VaR skills built on it."""
+from __future__ import annotations
+
+from math import comb
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from skills.quantitative_risk.historical_var_calculator import historical_var_calculator  # noqa: E402
+from skills.quantitative_risk.parametric_var_calculator import parametric_var_calculator  # noqa: E402
+from skills.utils.value_at_risk import age_weights, kupiec_p_values, parametric_var, tail_statistics  # noqa: E402
+
+
+def _sorted_quantile(losses, weights, confidence):
+    order = np.argsort(losses, kind="stable")
+    cumulative = np.cumsum(weights[order])
+    return losses[order][np.argmax(cumulative >= confidence * weights.sum())]
+
+
+@pytest.mark.parametrize("scheme", ["equal", "age"])
+def test_tail_statistics_match_full_sort(scheme):
+    losses = np.random.default_rng(0).normal(size=(4, 997))
+    weights = age_weights(997) if scheme == "age" else None
+    var, es, violations = tail_statistics(losses, 0.99, weights)
+    full = np.full(997, 1 / 997) if weights is None else weights
+    for row in range(4):
+        expected = _sorted_quantile(losses[row], full, 0.99)
+        tail = losses[row] >= expected
+        assert var[row] == expected
+        assert es[row] == pytest.approx((losses[row] * full)[tail].sum() / full[tail].sum())
+        assert violations[row] == (losses[row] > expected).sum()
+
+
+def test_kupiec_matches_exact_binomial_tail():
+    n, prob = 250, 0.01
+    exact = [sum(comb(n, k) * prob ** k * (1 - prob) ** (n - k) for k in range(v, n + 1)) for v in (0, 2, 7)]
+    np.testing.assert_allclose(kupiec_p_values(n, 0.99, np.array([0, 2, 7])), exact, rtol=1e-9)
+
+
+def test_parametric_incremental_sigma_matches_removal():
+    cov = np.array([[0.04, 0.01, 0.0], [0.01, 0.09, 0.02], [0.0, 0.02, 0.16]])
+    weights = np.array([[0.5, 0.3, 0.2], [1.0, -1.0, 0.5]])
+    risk = parametric_var(weights, cov)
+    for row in range(2):
+        for asset in range(3):
+            reduced = weights[row].copy()
+            reduced[asset] = 0.0
+            assert risk["incremental_sigma"][row, asset] == pytest.approx(np.sqrt(reduced @ cov @ reduced))
+
+
+def test_book_matches_single_portfolio_calls():
+    returns = np.random.default_rng(1).normal(0, 0.01, size=(500, 3)).tolist()
+    book = {"rates": [1.0, 0.0, 0.0], "mixed": [0.4, 0.4, 0.2]}
+    batched = historical_var_calculator(returns, 0.975, 10, portfolio_book=book, weighting_scheme="age")
+    assert batched["data"]["observations"] == 500
+    for name, weights in book.items():
+        single = historical_var_calculator(returns, 0.975, 10, weights, weighting_scheme="age")["data"]
+        assert batched["data"]["portfolios"][name] == {key: single[key] for key in batched["data"]["portfolios"][name]}
+
+    cov = [[0.04, 0.01, 0.0], [0.01, 0.09, 0.02], [0.0, 0.02, 0.16]]
+    batched = parametric_var_calculator(covariance_matrix=cov, confidence_level=0.99, horizon_days=1, portfolio_book=book)
+    single = parametric_var_calculator(book["mixed"], cov, 0.99, 1)["data"]
+    assert batched["data"]["portfolios"]["mixed"]["value_at_risk"] == single["value_at_risk"]
+    assert historical_var_calculator(returns, 0.99, 1)["status"] == "error"